@@ -10,6 +10,11 @@ from __future__ import annotations
 
 from gruponos_meltano_native.cli.handlers.health import HealthHandler
 from gruponos_meltano_native.cli.handlers.list_pipelines import ListPipelinesHandler
+from gruponos_meltano_native.cli.handlers.quarantine import (
+    QuarantineInspectHandler,
+    QuarantineListHandler,
+    QuarantineReplayHandler,
+)
 from gruponos_meltano_native.cli.handlers.run import RunHandler
 from gruponos_meltano_native.cli.handlers.run_with_retry import RunWithRetryHandler
 from gruponos_meltano_native.cli.handlers.show_config import ShowConfigHandler
@@ -18,6 +23,9 @@ from gruponos_meltano_native.cli.handlers.validate import ValidateHandler
 __all__ = [
     "HealthHandler",
     "ListPipelinesHandler",
+    "QuarantineInspectHandler",
+    "QuarantineListHandler",
+    "QuarantineReplayHandler",
     "RunHandler",
     "RunWithRetryHandler",
     "ShowConfigHandler",
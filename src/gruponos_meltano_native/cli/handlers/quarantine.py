@@ -0,0 +1,135 @@
+"""Quarantine Handlers - GrupoNOS Meltano Native CLI.
+
+Handlers for listing, inspecting and replaying quarantined records.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections.abc import Callable
+
+from flext_core import FlextResult, FlextTypes as t
+
+from gruponos_meltano_native.validators.data_validator import DataValidator
+from gruponos_meltano_native.validators.quarantine import (
+    GruponosMeltanoQuarantineStore,
+)
+
+RecordSink = Callable[[str, dict[str, t.GeneralValueType]], None]
+SchemaSink = Callable[[dict[str, t.GeneralValueType]], None]
+
+
+def singer_stdout_sink(stream: str, record: dict[str, t.GeneralValueType]) -> None:
+    """Write a Singer RECORD message to stdout (pipe into the target)."""
+    message = {"type": "RECORD", "stream": stream, "record": record}
+    sys.stdout.write(json.dumps(message, separators=(",", ":"), default=str) + "\n")
+
+
+def singer_stdout_schema_sink(message: dict[str, t.GeneralValueType]) -> None:
+    """Write a stored Singer SCHEMA message to stdout."""
+    sys.stdout.write(json.dumps(message, separators=(",", ":"), default=str) + "\n")
+
+
+class QuarantineListHandler:
+    """Handler for quarantine list command."""
+
+    _store: GruponosMeltanoQuarantineStore
+
+    def __init__(self, store: GruponosMeltanoQuarantineStore) -> None:
+        """Initialize the quarantine list handler."""
+        self._store = store
+
+    def execute(
+        self, stream: str | None = None
+    ) -> FlextResult[list[dict[str, t.GeneralValueType]]]:
+        """Execute quarantine list command (one summary per stream)."""
+        streams = [stream] if stream else self._store.streams()
+        return FlextResult[list[dict[str, t.GeneralValueType]]].ok([
+            self._store.summary(name) for name in streams
+        ])
+
+
+class QuarantineInspectHandler:
+    """Handler for quarantine inspect command."""
+
+    _store: GruponosMeltanoQuarantineStore
+
+    def __init__(self, store: GruponosMeltanoQuarantineStore) -> None:
+        """Initialize the quarantine inspect handler."""
+        self._store = store
+
+    def execute(
+        self, stream: str, entry_id: int
+    ) -> FlextResult[dict[str, t.GeneralValueType]]:
+        """Execute quarantine inspect command."""
+        record_result = self._store.get(stream, entry_id)
+        if record_result.is_failure:
+            return FlextResult[dict[str, t.GeneralValueType]].fail(
+                f"Quarantine inspect failed: {record_result.error}"
+            )
+        return FlextResult[dict[str, t.GeneralValueType]].ok(
+            record_result.value.to_dict()
+        )
+
+
+class QuarantineReplayHandler:
+    """Handler for quarantine replay command."""
+
+    _store: GruponosMeltanoQuarantineStore
+    _validator: DataValidator
+    _sink: RecordSink
+    _schema_sink: SchemaSink
+
+    def __init__(
+        self,
+        store: GruponosMeltanoQuarantineStore,
+        validator: DataValidator,
+        sink: RecordSink = singer_stdout_sink,
+        schema_sink: SchemaSink = singer_stdout_schema_sink,
+    ) -> None:
+        """Initialize the quarantine replay handler."""
+        self._store = store
+        self._validator = validator
+        self._sink = sink
+        self._schema_sink = schema_sink
+
+    def execute(
+        self,
+        stream: str,
+        *,
+        dry_run: bool = False,
+        limit: int | None = None,
+    ) -> FlextResult[dict[str, str | int | bool]]:
+        """Execute quarantine replay command.
+
+        Pending records are re-validated; records that now pass are sent to
+        the sink and marked as replayed, the rest stay quarantined. The
+        stream's stored SCHEMA message goes to the schema sink before the
+        first replayed record.
+        """
+        replayed: list[int] = []
+        still_failing = 0
+        schema = None if dry_run else self._store.schema(stream)
+        for quarantined in self._store.iter_records(stream):
+            if limit is not None and len(replayed) + still_failing >= limit:
+                break
+            if self._validator.collect_failures(quarantined.record):
+                still_failing += 1
+                continue
+            if not dry_run:
+                if schema is not None:
+                    self._schema_sink(schema)
+                    schema = None
+                self._sink(stream, quarantined.record)
+            replayed.append(quarantined.entry_id)
+
+        if not dry_run:
+            self._store.mark_replayed(stream, replayed)
+
+        return FlextResult[dict[str, str | int | bool]].ok({
+            "stream": stream,
+            "replayed": len(replayed),
+            "still_failing": still_failing,
+            "dry_run": dry_run,
+        })
@@ -68,6 +68,33 @@ class GruponosMeltanoNativeConstants(FlextConstants):
             MAX_USERNAME_LENGTH: Final[int] = 128
             MAX_PASSWORD_LENGTH: Final[int] = 128
 
+            # Entity primary keys (mirrors config/wms_integration.yml)
+            ENTITY_PRIMARY_KEYS: Final[dict[str, tuple[str, ...]]] = {
+                "allocation": ("allocation_id",),
+                "order_hdr": ("order_id",),
+                "order_dtl": ("order_id", "line_number"),
+            }
+
+            # Foreign keys: (child stream, child field, parent stream, parent field)
+            ENTITY_RELATIONSHIPS: Final[tuple[tuple[str, str, str, str], ...]] = (
+                ("order_dtl", "order_id", "order_hdr", "order_id"),
+                ("allocation", "order_id", "order_hdr", "order_id"),
+                ("allocation", "item_id", "item_master", "item_id"),
+                ("allocation", "location_id", "location", "location_id"),
+            )
+
+            # Accepted column values (mirrors transform/dbt_project.yml vars)
+            ACCEPTED_VALUES: Final[dict[str, dict[str, tuple[str, ...]]]] = {
+                "allocation": {
+                    "allocation_status": (
+                        "ALLOCATED",
+                        "RESERVED",
+                        "PICKED",
+                        "SHIPPED",
+                    ),
+                },
+            }
+
         # Enhanced Meltano Pipeline Configuration
         class MeltanoPipeline:
             """Meltano pipeline specific constants with comprehensive settings."""
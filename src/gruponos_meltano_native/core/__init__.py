@@ -8,9 +8,130 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+from gruponos_meltano_native.core.backfill import (
+    BackfillManifest,
+    BackfillSummary,
+    BackfillWindow,
+    GruponosBackfillRunner,
+    plan_backfill_windows,
+)
+from gruponos_meltano_native.core.catalog_cache import (
+    CatalogResolution,
+    GruponosMeltanoCatalogCache,
+    SchemaChange,
+    SchemaChangeKind,
+    diff_catalogs,
+    schema_fingerprint,
+)
+from gruponos_meltano_native.core.column_projection import ColumnProjection
 from gruponos_meltano_native.core.external_command import (
     ExternalCommandResult,
+    ExternalProcess,
     run_external_command,
 )
+from gruponos_meltano_native.core.facility_matrix import (
+    FacilityMatrixSummary,
+    FacilityTarget,
+    GruponosFairShareScheduler,
+    parse_facility_matrix,
+)
+from gruponos_meltano_native.core.http_cache import (
+    GruponosWmsResponseCache,
+    ResponseCacheStats,
+)
+from gruponos_meltano_native.core.overlap_dedup import (
+    GruponosOverlapDeduplicator,
+    OverlapKeyIndex,
+    StreamKeys,
+)
+from gruponos_meltano_native.core.rate_limiter import (
+    GruponosAdaptiveRateLimiter,
+    RateLimitPolicy,
+)
+from gruponos_meltano_native.core.row_hash import (
+    GruponosRowHashFilter,
+    RowHashStats,
+)
+from gruponos_meltano_native.core.singer_codec import (
+    SingerCodec,
+    SingerLineSplitter,
+    SingerMessage,
+    SingerMessageType,
+)
+from gruponos_meltano_native.core.singer_proxy import (
+    SingerProxyStage,
+    SingerProxyStats,
+)
+from gruponos_meltano_native.core.spill_buffer import (
+    SpillBuffer,
+    SpillBufferMetrics,
+    SpillBufferWriter,
+)
+from gruponos_meltano_native.core.state_store import (
+    GruponosStateStore,
+    StateCheckpointer,
+    StateSnapshot,
+)
+from gruponos_meltano_native.core.sync_planner import (
+    EntityPlan,
+    GruponosSyncPlanner,
+    LoadCostModel,
+    SyncMode,
+)
+from gruponos_meltano_native.core.wms_extractor import (
+    GruponosWmsExtractor,
+    WmsEntity,
+    WmsExtractionStats,
+    WmsExtractorConfig,
+)
 
-__all__ = ["ExternalCommandResult", "run_external_command"]
+__all__ = [
+    "BackfillManifest",
+    "BackfillSummary",
+    "BackfillWindow",
+    "CatalogResolution",
+    "ColumnProjection",
+    "EntityPlan",
+    "ExternalCommandResult",
+    "ExternalProcess",
+    "FacilityMatrixSummary",
+    "FacilityTarget",
+    "GruponosAdaptiveRateLimiter",
+    "GruponosBackfillRunner",
+    "GruponosFairShareScheduler",
+    "GruponosMeltanoCatalogCache",
+    "GruponosOverlapDeduplicator",
+    "GruponosRowHashFilter",
+    "GruponosStateStore",
+    "GruponosSyncPlanner",
+    "GruponosWmsExtractor",
+    "GruponosWmsResponseCache",
+    "LoadCostModel",
+    "OverlapKeyIndex",
+    "RateLimitPolicy",
+    "ResponseCacheStats",
+    "RowHashStats",
+    "SchemaChange",
+    "SchemaChangeKind",
+    "SingerCodec",
+    "SingerLineSplitter",
+    "SingerMessage",
+    "SingerMessageType",
+    "SingerProxyStage",
+    "SingerProxyStats",
+    "SpillBuffer",
+    "SpillBufferMetrics",
+    "SpillBufferWriter",
+    "StateCheckpointer",
+    "StateSnapshot",
+    "StreamKeys",
+    "SyncMode",
+    "WmsEntity",
+    "WmsExtractionStats",
+    "WmsExtractorConfig",
+    "diff_catalogs",
+    "parse_facility_matrix",
+    "plan_backfill_windows",
+    "run_external_command",
+    "schema_fingerprint",
+]
@@ -0,0 +1,369 @@
+"""Time-window backfill planner with a resumable manifest.
+
+A full reload scans ``[start_date, now)`` sequentially and restarts from zero
+when it fails near the end. This module shards the range instead:
+
+    - Windows are sized by row density (rows per bucket of history), so busy
+      periods get short windows and quiet ones long windows
+    - Windows run in parallel under a concurrency cap, largest first
+    - Every finished window is checkpointed in a JSON manifest; a re-run with
+      the same plan only executes the windows that are still missing
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from pathlib import Path
+from typing import Final
+
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+
+logger = FlextLogger(__name__)
+
+DEFAULT_TARGET_ROWS: Final[int] = 250_000
+DEFAULT_MIN_WINDOW: Final[timedelta] = timedelta(hours=1)
+DEFAULT_MAX_WINDOW: Final[timedelta] = timedelta(days=7)
+DEFAULT_MAX_CONCURRENCY: Final[int] = 4
+
+# (bucket start, bucket end, rows in bucket)
+DensityBucket = tuple[datetime, datetime, int]
+WindowRunner = Callable[["BackfillWindow"], FlextResult[int]]
+
+
+@dataclass(frozen=True, slots=True)
+class BackfillWindow:
+    """Half-open time window ``[start, end)`` with its expected row count."""
+
+    start: datetime
+    end: datetime
+    estimated_rows: int = 0
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used in the manifest."""
+        return f"{self.start.isoformat()}/{self.end.isoformat()}"
+
+    def as_filters(self, replication_key: str) -> dict[str, str]:
+        """LGF query filters selecting the window on ``replication_key``."""
+        return {
+            f"{replication_key}__gte": self.start.isoformat(),
+            f"{replication_key}__lt": self.end.isoformat(),
+        }
+
+
+def probe_density(
+    count: Callable[[BackfillWindow], int],
+    start: datetime,
+    end: datetime,
+    bucket: timedelta = timedelta(days=30),
+) -> list[DensityBucket]:
+    """Row counts per bucket of ``[start, end)`` from a cheap counting call."""
+    buckets: list[DensityBucket] = []
+    cursor = start
+    while cursor < end:
+        bucket_end = min(cursor + bucket, end)
+        buckets.append((cursor, bucket_end, count(BackfillWindow(cursor, bucket_end))))
+        cursor = bucket_end
+    return buckets
+
+
+def _rate_segments(
+    start: datetime, end: datetime, density: Sequence[DensityBucket]
+) -> list[tuple[datetime, datetime, float]]:
+    """Contiguous ``[start, end)`` segments with a rows-per-second rate.
+
+    Gaps not covered by ``density`` get the average rate of covered time.
+    """
+    clipped = sorted(
+        (max(b_start, start), min(b_end, end), rows / (b_end - b_start).total_seconds())
+        for b_start, b_end, rows in density
+        if b_end > b_start and b_end > start and b_start < end
+    )
+    covered = covered_rows = 0.0
+    for s_start, s_end, rate in clipped:
+        seconds = (s_end - s_start).total_seconds()
+        covered += seconds
+        covered_rows += rate * seconds
+    average = covered_rows / covered if covered else 0.0
+    segments: list[tuple[datetime, datetime, float]] = []
+    cursor = start
+    for s_start, s_end, rate in clipped:
+        if s_start > cursor:
+            segments.append((cursor, s_start, average))
+        begin = max(s_start, cursor)
+        if s_end > begin:
+            segments.append((begin, s_end, rate))
+            cursor = s_end
+    if cursor < end:
+        segments.append((cursor, end, average))
+    return segments
+
+
+def plan_backfill_windows(
+    start: datetime,
+    end: datetime,
+    *,
+    density: Sequence[DensityBucket] = (),
+    target_rows: int = DEFAULT_TARGET_ROWS,
+    min_window: timedelta = DEFAULT_MIN_WINDOW,
+    max_window: timedelta = DEFAULT_MAX_WINDOW,
+) -> list[BackfillWindow]:
+    """Split ``[start, end)`` into windows of about ``target_rows`` rows.
+
+    Windows never exceed ``max_window`` nor (except the last) fall below
+    ``min_window``. Without density, windows are ``max_window`` long.
+    """
+    windows: list[BackfillWindow] = []
+    window_start = start
+    rows = 0.0
+    for seg_start, seg_end, rate in _rate_segments(start, end, density):
+        cursor = seg_start
+        while cursor < seg_end:
+            limit = min(seg_end, window_start + max_window)
+            if rate > 0:
+                reach = cursor + timedelta(seconds=(target_rows - rows) / rate)
+                limit = min(limit, max(reach, window_start + min_window))
+            rows += rate * (limit - cursor).total_seconds()
+            cursor = limit
+            if rows >= target_rows or cursor - window_start >= max_window:
+                windows.append(BackfillWindow(window_start, cursor, round(rows)))
+                window_start, rows = cursor, 0.0
+    if window_start < end:
+        if windows and end - window_start < min_window:
+            last = windows.pop()
+            windows.append(
+                BackfillWindow(last.start, end, last.estimated_rows + round(rows))
+            )
+        else:
+            windows.append(BackfillWindow(window_start, end, round(rows)))
+    return windows
+
+
+class WindowStatus(StrEnum):
+    """Manifest status of a window."""
+
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class BackfillManifest:
+    """JSON checkpoint of a backfill plan and its window statuses.
+
+    A manifest is bound to a plan id (entity and start of range); a run with
+    the same id resumes the stored windows until all of them are done.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize a manifest stored at ``path``."""
+        self.path = path
+        self.plan_id: str | None = None
+        self.windows: list[BackfillWindow] = []
+        self.entries: dict[str, dict[str, t.GeneralValueType]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def plan_identifier(name: str, start: datetime) -> str:
+        """Identifier of a plan (what is backfilled and from when)."""
+        raw = f"{name}|{start.isoformat()}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+    def resume(self, plan_id: str) -> bool:
+        """Load the stored plan if it has ``plan_id`` and unfinished windows.
+
+        The stored windows (and end of range) are kept, so a resumed run
+        does not re-plan up to a new "now".
+        """
+        stored = self._read()
+        if stored is None or stored.get("plan_id") != plan_id:
+            return False
+        entries = {
+            str(entry["key"]): entry
+            for entry in stored.get("windows", [])
+            if isinstance(entry, dict) and "key" in entry
+        }
+        if all(e.get("status") == WindowStatus.DONE for e in entries.values()):
+            return False
+        self.plan_id = plan_id
+        self.entries = entries
+        self.windows = [
+            BackfillWindow(
+                datetime.fromisoformat(str(entry["start"])),
+                datetime.fromisoformat(str(entry["end"])),
+                int(entry.get("estimated_rows") or 0),
+            )
+            for entry in entries.values()
+        ]
+        return True
+
+    def create(self, plan_id: str, windows: Sequence[BackfillWindow]) -> None:
+        """Store a new plan with all windows pending."""
+        self.plan_id = plan_id
+        self.windows = list(windows)
+        self.entries = {
+            window.key: {
+                "key": window.key,
+                "start": window.start.isoformat(),
+                "end": window.end.isoformat(),
+                "estimated_rows": window.estimated_rows,
+                "status": WindowStatus.PENDING.value,
+            }
+            for window in self.windows
+        }
+        with self._lock:
+            self._write()
+
+    def pending(self) -> list[BackfillWindow]:
+        """Windows not finished yet, largest estimate first."""
+        with self._lock:
+            todo = [
+                window
+                for window in self.windows
+                if self.entries[window.key].get("status") != WindowStatus.DONE
+            ]
+        return sorted(todo, key=lambda window: window.estimated_rows, reverse=True)
+
+    def mark(
+        self,
+        window: BackfillWindow,
+        status: WindowStatus,
+        *,
+        records: int | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Record the outcome of a window and persist the manifest."""
+        with self._lock:
+            entry = self.entries[window.key]
+            entry["status"] = status.value
+            entry["finished_at"] = datetime.now(UTC).isoformat()
+            entry["records"] = records
+            entry["error"] = error
+            self._write()
+
+    def _read(self) -> dict[str, t.GeneralValueType] | None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _write(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        data = {"plan_id": self.plan_id, "windows": list(self.entries.values())}
+        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+@dataclass(slots=True)
+class BackfillSummary:
+    """Outcome of a backfill run."""
+
+    windows: int = 0
+    skipped: int = 0
+    completed: int = 0
+    failed: int = 0
+    records: int = 0
+    elapsed_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        """Summary as a plain dict."""
+        return {
+            "windows": self.windows,
+            "skipped": self.skipped,
+            "completed": self.completed,
+            "failed": self.failed,
+            "records": self.records,
+            "elapsed_seconds": round(self.elapsed_seconds, 6),
+        }
+
+
+class GruponosBackfillRunner:
+    """Run the pending windows of a manifest with a concurrency cap.
+
+    ``run_window`` extracts and loads one window and returns the record
+    count; failed windows stay pending for the next run.
+    """
+
+    def __init__(
+        self,
+        manifest: BackfillManifest,
+        run_window: WindowRunner,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        """Initialize the runner."""
+        self.manifest = manifest
+        self.run_window = run_window
+        self.max_concurrency = max(1, max_concurrency)
+
+    def _run_one(self, window: BackfillWindow) -> FlextResult[int]:
+        try:
+            return self.run_window(window)
+        except Exception as e:  # noqa: BLE001 - a window must not kill the run
+            return FlextResult[int].fail(f"Window {window.key} raised: {e}")
+
+    def run(self) -> FlextResult[BackfillSummary]:
+        """Execute the missing windows; fails if any window failed."""
+        started = time.perf_counter()
+        pending = self.manifest.pending()
+        summary = BackfillSummary(
+            windows=len(self.manifest.windows),
+            skipped=len(self.manifest.windows) - len(pending),
+        )
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="backfill"
+        ) as pool:
+            futures = {pool.submit(self._run_one, window): window for window in pending}
+            for future in as_completed(futures):
+                window = futures[future]
+                result = future.result()
+                if result.is_success:
+                    self.manifest.mark(window, WindowStatus.DONE, records=result.value)
+                    summary.completed += 1
+                    summary.records += result.value
+                else:
+                    logger.error(
+                        "Backfill window %s failed: %s", window.key, result.error
+                    )
+                    self.manifest.mark(window, WindowStatus.FAILED, error=result.error)
+                    summary.failed += 1
+        summary.elapsed_seconds = time.perf_counter() - started
+        if summary.failed:
+            return FlextResult[BackfillSummary].fail(
+                f"{summary.failed} of {len(pending)} backfill windows failed; "
+                "re-run to resume the missing windows"
+            )
+        logger.info(
+            "Backfill finished: %s windows run, %s skipped, %s records",
+            summary.completed,
+            summary.skipped,
+            summary.records,
+        )
+        return FlextResult[BackfillSummary].ok(summary)
+
+
+__all__: list[str] = [
+    "DEFAULT_MAX_CONCURRENCY",
+    "DEFAULT_TARGET_ROWS",
+    "BackfillManifest",
+    "BackfillSummary",
+    "BackfillWindow",
+    "DensityBucket",
+    "GruponosBackfillRunner",
+    "WindowRunner",
+    "WindowStatus",
+    "plan_backfill_windows",
+    "probe_density",
+]
@@ -0,0 +1,206 @@
+"""Backfill run: a historical range loaded in parallel, resumable time windows.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import replace
+from datetime import UTC, datetime
+from pathlib import Path
+
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+
+from gruponos_meltano_native.core.backfill import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_TARGET_ROWS,
+    BackfillManifest,
+    BackfillWindow,
+    GruponosBackfillRunner,
+    plan_backfill_windows,
+    probe_density,
+)
+from gruponos_meltano_native.core.native_run import GruponosNativeRun
+from gruponos_meltano_native.core.run_context import (
+    GruponosRunContext,
+    PipelineResult,
+    build_pipeline_result,
+)
+from gruponos_meltano_native.core.state_store import GruponosStateStore
+from gruponos_meltano_native.core.wms_extractor import (
+    GruponosWmsExtractor,
+    WmsEntity,
+    WmsExtractorConfig,
+)
+
+logger = FlextLogger(__name__)
+
+
+def window_resume_point(
+    store: GruponosStateStore,
+    state_job: str,
+    entity: WmsEntity,
+    window: BackfillWindow,
+) -> str | None:
+    """Bookmark a failed attempt of ``window`` reached, if inside it."""
+    bookmark = store.get(state_job, entity.name)
+    value = bookmark.value.get("replication_key_value") if bookmark else None
+    if not isinstance(value, str):
+        return None
+    try:
+        reached = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if (reached.tzinfo is None) != (window.start.tzinfo is None):
+        reached = reached.replace(tzinfo=window.start.tzinfo)
+    if not window.start < reached < window.end:
+        return None
+    return value
+
+
+class GruponosBackfillRun:
+    """Backfill one entity over ``[start, end)`` in parallel time windows.
+
+    Example:
+        result = GruponosBackfillRun(context).run(
+            "target-oracle-full", entity, start=datetime(2024, 1, 1, tzinfo=UTC)
+        )
+
+    """
+
+    def __init__(
+        self,
+        context: GruponosRunContext,
+        native: GruponosNativeRun | None = None,
+    ) -> None:
+        """Initialize the strategy; windows run through ``native``."""
+        self.context = context
+        self.native = native or GruponosNativeRun(context)
+
+    def run(
+        self,
+        loader: str,
+        entity: WmsEntity,
+        *,
+        start: datetime,
+        end: datetime | None = None,
+        extractor_config: Mapping[str, t.GeneralValueType] | None = None,
+        target_rows: int = DEFAULT_TARGET_ROWS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        manifest_path: Path | None = None,
+    ) -> FlextResult[PipelineResult]:
+        """Backfill ``[start, end)`` of ``entity`` into ``loader``, resumably.
+
+        Row density is probed per 30-day bucket (``result_count`` queries)
+        and ``[start, end)`` is split into windows of about ``target_rows``
+        rows. Each window is a native run filtered on the entity's
+        replication key; finished windows are checkpointed in a manifest
+        (``.meltano/backfill/<entity>.json``) and a re-run for the same entity
+        and start only runs the windows still missing. Each window keeps its
+        own bookmark in the state store (job ``wms-backfill-<entity>-<window>``),
+        so a retried window restarts from its last loaded page. Concurrent
+        windows multiply with ``max_parallel_pages`` in the WMS request count.
+
+        Args:
+            loader: Meltano loader name (e.g. ``target-oracle-full``).
+            entity: Entity to backfill (needs a replication key).
+            start: Start of the range (e.g. the tap's ``start_date``).
+            end: End of the range (now by default; ignored when resuming).
+            extractor_config: Tap-style config (defaults to the settings).
+            target_rows: Desired rows per window.
+            max_concurrency: Windows running at the same time.
+            manifest_path: Override of the manifest location.
+
+        Returns:
+            FlextResult[PipelineResult]: Result with the backfill summary.
+
+        """
+        context = self.context
+        if entity.replication_key is None:
+            return FlextResult.fail(
+                f"Backfill of {entity.name} needs a replication key"
+            )
+        replication_key = entity.replication_key
+        raw_config = context.extractor_config(extractor_config)
+        try:
+            loader_name = context.validate_job_name(loader)
+            config = WmsExtractorConfig.from_mapping(raw_config)
+        except ValueError as e:
+            return FlextResult.fail(str(e))
+
+        start_time = datetime.now(tz=UTC)
+        manifest = BackfillManifest(
+            manifest_path
+            or context.project_root / ".meltano" / "backfill" / f"{entity.name}.json"
+        )
+        plan_id = BackfillManifest.plan_identifier(entity.name, start)
+        resumed = manifest.resume(plan_id)
+        if not resumed:
+            range_end = end or start_time
+
+            def count(window: BackfillWindow) -> int:
+                filters = {**entity.filters, **window.as_filters(replication_key)}
+                return extractor.count_rows(replace(entity, filters=filters))
+
+            with GruponosWmsExtractor(config) as extractor:
+                try:
+                    density = probe_density(count, start, range_end)
+                except (OSError, ValueError) as e:
+                    return FlextResult.fail(f"Backfill density probe failed: {e}")
+            manifest.create(
+                plan_id,
+                plan_backfill_windows(
+                    start, range_end, density=density, target_rows=target_rows
+                ),
+            )
+        logger.info(
+            "Backfill of %s: %s windows, %s pending%s",
+            entity.name,
+            len(manifest.windows),
+            len(manifest.pending()),
+            " (resumed)" if resumed else "",
+        )
+
+        store = context.state_store()
+
+        def run_window(window: BackfillWindow) -> FlextResult[int]:
+            state_job = f"wms-backfill-{entity.name}-{window.key}"
+            filters = {**entity.filters, **window.as_filters(replication_key)}
+            resume_from = window_resume_point(store, state_job, entity, window)
+            if resume_from is not None:
+                filters[f"{replication_key}__gte"] = resume_from
+            result = self.native.run(
+                loader_name,
+                [replace(entity, filters=filters)],
+                extractor_config=raw_config,
+                state_job=state_job,
+            )
+            if result.is_failure:
+                return FlextResult[int].fail(result.error or "window failed")
+            # The manifest now records the window as done
+            store.delete(state_job)
+            return FlextResult[int].ok(result.value.records_loaded)
+
+        outcome = GruponosBackfillRunner(
+            manifest, run_window, max_concurrency=max_concurrency
+        ).run()
+        if outcome.is_failure:
+            return FlextResult.fail(outcome.error)
+
+        summary = outcome.value
+        pipeline_result = build_pipeline_result(
+            f"wms-backfill-{entity.name}-{loader_name}",
+            start_time,
+            records_extracted=summary.records,
+            records_loaded=summary.records,
+        )
+        pipeline_result.metadata["backfill"] = {
+            **summary.as_dict(),
+            "resumed": resumed,
+            "manifest": str(manifest.path),
+        }
+        return FlextResult.ok(pipeline_result)
+
+
+__all__: list[str] = ["GruponosBackfillRun", "window_resume_point"]
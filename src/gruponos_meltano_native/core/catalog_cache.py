@@ -0,0 +1,330 @@
+"""Singer catalog cache with schema-change detection.
+
+Discovery (``infer_schema_from_samples`` on the tap side) is repeated on every
+run although the WMS schema rarely changes. This module caches the discovered
+catalog inside the Meltano project, keyed by a hash of the tap configuration:
+
+    - A run reuses the cached catalog while the config hash matches and the
+      optional source fingerprint (sample page shape, schema version) is
+      unchanged
+    - Re-discovery produces a structural diff against the previous catalog,
+      which can be recorded in the run ledger
+    - The catalog is materialized as a JSON file Meltano can be pointed at
+      through the extractor's ``catalog`` extra
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import StrEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+
+if TYPE_CHECKING:
+    from gruponos_meltano_native.monitoring.run_ledger import (
+        GruponosMeltanoRunLedger,
+    )
+
+logger = FlextLogger(__name__)
+
+DEFAULT_CATALOG_CACHE_DIR: Final[str] = ".meltano/catalog_cache"
+
+# Settings that do not influence discovered schemas
+_IGNORED_CONFIG_KEYS: Final[frozenset[str]] = frozenset({
+    "client_secret",
+    "max_retries",
+    "password",
+    "start_date",
+    "timeout",
+})
+
+CatalogDiscovery = Callable[[], FlextResult[dict[str, t.GeneralValueType]]]
+
+
+def catalog_config_hash(config: Mapping[str, t.GeneralValueType]) -> str:
+    """Stable hash of the discovery-relevant tap configuration."""
+    relevant = {
+        key: value for key, value in config.items() if key not in _IGNORED_CONFIG_KEYS
+    }
+    canonical = json.dumps(relevant, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def schema_fingerprint(records: Iterable[Mapping[str, t.GeneralValueType]]) -> str:
+    """Fingerprint of the shape of sample records (field names and types).
+
+    Values are ignored, so new data does not trigger re-discovery; a new,
+    removed or re-typed field does.
+    """
+    shape = sorted({
+        (name, type(value).__name__)
+        for record in records
+        for name, value in record.items()
+    })
+    return hashlib.blake2b(
+        json.dumps(shape, separators=(",", ":")).encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+class SchemaChangeKind(StrEnum):
+    """Kinds of structural catalog changes."""
+
+    STREAM_ADDED = "stream_added"
+    STREAM_REMOVED = "stream_removed"
+    COLUMN_ADDED = "column_added"
+    COLUMN_REMOVED = "column_removed"
+    TYPE_CHANGED = "type_changed"
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaChange:
+    """One structural difference between two catalogs."""
+
+    kind: SchemaChangeKind
+    stream: str
+    column: str | None = None
+    before: t.GeneralValueType = None
+    after: t.GeneralValueType = None
+
+    def to_dict(self) -> dict[str, t.GeneralValueType]:
+        """Serialize for the run ledger."""
+        return {
+            "kind": self.kind.value,
+            "stream": self.stream,
+            "column": self.column,
+            "before": self.before,
+            "after": self.after,
+        }
+
+
+def _stream_properties(
+    catalog: Mapping[str, t.GeneralValueType],
+) -> dict[str, dict[str, t.GeneralValueType]]:
+    streams = catalog.get("streams")
+    result: dict[str, dict[str, t.GeneralValueType]] = {}
+    if not isinstance(streams, list):
+        return result
+    for stream in streams:
+        if not isinstance(stream, dict):
+            continue
+        name = stream.get("tap_stream_id") or stream.get("stream")
+        schema = stream.get("schema")
+        properties = schema.get("properties") if isinstance(schema, dict) else None
+        if isinstance(name, str):
+            result[name] = properties if isinstance(properties, dict) else {}
+    return result
+
+
+def _column_type(column_schema: t.GeneralValueType) -> t.GeneralValueType:
+    if not isinstance(column_schema, dict):
+        return None
+    column_type = column_schema.get("type")
+    if isinstance(column_type, list):
+        return sorted(str(kind) for kind in column_type)
+    return column_type
+
+
+def diff_catalogs(
+    previous: Mapping[str, t.GeneralValueType],
+    current: Mapping[str, t.GeneralValueType],
+) -> list[SchemaChange]:
+    """Structural differences (streams, columns, column types) between catalogs."""
+    before = _stream_properties(previous)
+    after = _stream_properties(current)
+    changes: list[SchemaChange] = [
+        SchemaChange(SchemaChangeKind.STREAM_ADDED, name)
+        for name in sorted(after.keys() - before.keys())
+    ]
+    changes.extend(
+        SchemaChange(SchemaChangeKind.STREAM_REMOVED, name)
+        for name in sorted(before.keys() - after.keys())
+    )
+    for name in sorted(before.keys() & after.keys()):
+        old_columns, new_columns = before[name], after[name]
+        changes.extend(
+            SchemaChange(SchemaChangeKind.COLUMN_ADDED, name, column)
+            for column in sorted(new_columns.keys() - old_columns.keys())
+        )
+        changes.extend(
+            SchemaChange(SchemaChangeKind.COLUMN_REMOVED, name, column)
+            for column in sorted(old_columns.keys() - new_columns.keys())
+        )
+        for column in sorted(old_columns.keys() & new_columns.keys()):
+            old_type = _column_type(old_columns[column])
+            new_type = _column_type(new_columns[column])
+            if old_type != new_type:
+                changes.append(
+                    SchemaChange(
+                        SchemaChangeKind.TYPE_CHANGED, name, column, old_type, new_type
+                    )
+                )
+    return changes
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogResolution:
+    """Outcome of ``GruponosMeltanoCatalogCache.resolve``."""
+
+    catalog: dict[str, t.GeneralValueType]
+    catalog_path: Path
+    config_hash: str
+    cache_hit: bool
+    changes: tuple[SchemaChange, ...] = ()
+
+
+class GruponosMeltanoCatalogCache:
+    """On-disk cache of discovered catalogs, keyed by tap config hash.
+
+    Entries live in ``<root>/<extractor>/<hash>.json``; the catalog handed
+    to Meltano is written to ``<root>/<extractor>.catalog.json``.
+
+    Attributes:
+      root: Cache directory inside the Meltano project.
+      ledger: Optional run ledger receiving schema changes.
+
+    """
+
+    def __init__(
+        self, root: Path, *, ledger: GruponosMeltanoRunLedger | None = None
+    ) -> None:
+        """Initialize the cache in ``root``."""
+        self.root = root
+        self.ledger = ledger
+
+    def _entry_path(self, extractor: str, config_hash: str) -> Path:
+        return self.root / extractor / f"{config_hash[:16]}.json"
+
+    def catalog_path(self, extractor: str) -> Path:
+        """Path of the materialized catalog for ``extractor``."""
+        return self.root / f"{extractor}.catalog.json"
+
+    def _read_json(self, path: Path) -> dict[str, t.GeneralValueType] | None:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _write_json(self, path: Path, data: Mapping[str, t.GeneralValueType]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def load(
+        self, extractor: str, config_hash: str
+    ) -> dict[str, t.GeneralValueType] | None:
+        """Cached entry for the extractor and config hash, if any."""
+        entry = self._read_json(self._entry_path(extractor, config_hash))
+        if entry is None or entry.get("config_hash") != config_hash:
+            return None
+        return entry
+
+    def _latest_entry(self, extractor: str) -> dict[str, t.GeneralValueType] | None:
+        candidates = sorted(
+            (self.root / extractor).glob("*.json"),
+            key=lambda path: path.stat().st_mtime_ns,
+        )
+        return self._read_json(candidates[-1]) if candidates else None
+
+    def resolve(
+        self,
+        extractor: str,
+        config: Mapping[str, t.GeneralValueType],
+        discover: CatalogDiscovery,
+        *,
+        fingerprint: str | None = None,
+        run_id: str | None = None,
+    ) -> FlextResult[CatalogResolution]:
+        """Return the cached catalog or run ``discover`` when it is stale.
+
+        Args:
+            extractor: Meltano extractor name.
+            config: Tap configuration (secrets are ignored for the hash).
+            discover: Callable running discovery.
+            fingerprint: Cheap source fingerprint; a mismatch forces
+                re-discovery even when the config is unchanged.
+            run_id: Run identifier for ledger entries.
+
+        """
+        config_hash = catalog_config_hash(config)
+        entry = self.load(extractor, config_hash)
+        if entry is not None and (
+            fingerprint is None or entry.get("fingerprint") == fingerprint
+        ):
+            catalog = entry.get("catalog")
+            if isinstance(catalog, dict):
+                path = self.catalog_path(extractor)
+                if self._read_json(path) != catalog:
+                    self._write_json(path, catalog)
+                logger.info("Catalog cache hit for %s", extractor)
+                return FlextResult[CatalogResolution].ok(
+                    CatalogResolution(catalog, path, config_hash, cache_hit=True)
+                )
+
+        previous = entry or self._latest_entry(extractor)
+        discovered = discover()
+        if discovered.is_failure:
+            return FlextResult[CatalogResolution].fail(
+                f"Catalog discovery failed for {extractor}: {discovered.error}"
+            )
+        catalog = discovered.value
+        previous_catalog = previous.get("catalog") if previous else None
+        changes = (
+            diff_catalogs(previous_catalog, catalog)
+            if isinstance(previous_catalog, dict)
+            else []
+        )
+        try:
+            self._write_json(
+                self._entry_path(extractor, config_hash),
+                {
+                    "extractor": extractor,
+                    "config_hash": config_hash,
+                    "fingerprint": fingerprint,
+                    "discovered_at": datetime.now(UTC).isoformat(),
+                    "catalog": catalog,
+                },
+            )
+            path = self.catalog_path(extractor)
+            self._write_json(path, catalog)
+        except OSError as e:
+            return FlextResult[CatalogResolution].fail(
+                f"Catalog cache write failed: {e}"
+            )
+
+        if changes:
+            logger.warning(
+                "Schema changes detected for %s: %d changes", extractor, len(changes)
+            )
+            if self.ledger is not None:
+                self.ledger.record_schema_changes(
+                    changes, run_id=run_id or config_hash[:16], job_name=extractor
+                )
+        return FlextResult[CatalogResolution].ok(
+            CatalogResolution(
+                catalog, path, config_hash, cache_hit=False, changes=tuple(changes)
+            )
+        )
+
+
+__all__: list[str] = [
+    "DEFAULT_CATALOG_CACHE_DIR",
+    "CatalogDiscovery",
+    "CatalogResolution",
+    "GruponosMeltanoCatalogCache",
+    "SchemaChange",
+    "SchemaChangeKind",
+    "catalog_config_hash",
+    "diff_catalogs",
+    "schema_fingerprint",
+]
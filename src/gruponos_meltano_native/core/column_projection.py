@@ -0,0 +1,256 @@
+"""Column projection planner driven by dbt models.
+
+The staging models read a known subset of each WMS entity, yet the tap
+extracts every flattened field. This module computes the columns that are
+actually used downstream and turns them into Singer catalog ``selected``
+metadata (or Meltano ``select`` patterns), so the rest is dropped at the tap:
+
+    - Identifiers referenced by every model that reads ``source('wms_raw', X)``
+      are intersected with the catalog columns of ``X``
+    - Columns declared in the dbt sources YAML (tested contract) and declared
+      projections are always kept, as are key and replication-key columns
+    - Smaller payloads mean less JSON to parse and narrower Oracle rows
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import copy
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+import yaml
+from flext_core import FlextLogger, FlextTypes as t
+
+logger = FlextLogger(__name__)
+
+DEFAULT_DBT_MODELS_DIR: Final[Path] = Path("transform/models")
+DEFAULT_SOURCE_NAME: Final[str] = "wms_raw"
+
+_SOURCE_RE: Final[re.Pattern[str]] = re.compile(
+    r"source\(\s*['\"](\w+)['\"]\s*,\s*['\"](\w+)['\"]\s*\)"
+)
+_JINJA_RE: Final[re.Pattern[str]] = re.compile(r"\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\}", re.S)
+_COMMENT_RE: Final[re.Pattern[str]] = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRING_RE: Final[re.Pattern[str]] = re.compile(r"'(?:[^']|'')*'")
+_IDENTIFIER_RE: Final[re.Pattern[str]] = re.compile(r"\b[A-Za-z_][A-Za-z0-9_$#]*\b")
+
+
+@dataclass(frozen=True, slots=True)
+class ModelColumnUsage:
+    """Sources read by a dbt model and the identifiers it references."""
+
+    model: str
+    sources: frozenset[str]
+    identifiers: frozenset[str]
+
+
+def parse_dbt_model(
+    path: Path, source_name: str = DEFAULT_SOURCE_NAME
+) -> ModelColumnUsage:
+    """Extract source entities and referenced identifiers from a model file.
+
+    Identifiers are lower-cased; Jinja blocks, comments and string literals
+    are ignored. The result over-approximates column usage (aliases and
+    function names are included), which is safe for projection.
+    """
+    sql = path.read_text(encoding="utf-8")
+    sources = frozenset(
+        entity for name, entity in _SOURCE_RE.findall(sql) if name == source_name
+    )
+    body = _STRING_RE.sub(" ", _COMMENT_RE.sub(" ", _JINJA_RE.sub(" ", sql)))
+    identifiers = frozenset(match.lower() for match in _IDENTIFIER_RE.findall(body))
+    return ModelColumnUsage(path.stem, sources, identifiers)
+
+
+def load_declared_source_columns(
+    models_dir: Path, source_name: str = DEFAULT_SOURCE_NAME
+) -> dict[str, set[str]]:
+    """Columns declared per table in dbt sources YAML files."""
+    declared: dict[str, set[str]] = {}
+    for path in sorted(models_dir.rglob("*.yml")):
+        try:
+            document = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        except (OSError, yaml.YAMLError):
+            logger.warning("Skipping unreadable dbt YAML %s", path)
+            continue
+        for source in document.get("sources") or []:
+            if not isinstance(source, dict) or source.get("name") != source_name:
+                continue
+            for table in source.get("tables") or []:
+                columns = declared.setdefault(str(table.get("name")), set())
+                columns.update(
+                    str(column["name"]).lower()
+                    for column in table.get("columns") or []
+                    if isinstance(column, dict) and "name" in column
+                )
+    return declared
+
+
+def _streams(
+    catalog: Mapping[str, t.GeneralValueType],
+) -> list[dict[str, t.GeneralValueType]]:
+    streams = catalog.get("streams")
+    if not isinstance(streams, list):
+        return []
+    return [stream for stream in streams if isinstance(stream, dict)]
+
+
+def _stream_name(stream: Mapping[str, t.GeneralValueType]) -> str:
+    return str(stream.get("tap_stream_id") or stream.get("stream") or "")
+
+
+def _stream_columns(stream: Mapping[str, t.GeneralValueType]) -> list[str]:
+    schema = stream.get("schema")
+    properties = schema.get("properties") if isinstance(schema, dict) else None
+    return list(properties) if isinstance(properties, dict) else []
+
+
+def _required_columns(stream: Mapping[str, t.GeneralValueType]) -> set[str]:
+    """Key and replication-key columns that must never be deselected."""
+    required: set[str] = set()
+    key_properties = stream.get("key_properties")
+    if isinstance(key_properties, list):
+        required.update(str(column) for column in key_properties)
+    replication_key = stream.get("replication_key")
+    if isinstance(replication_key, str):
+        required.add(replication_key)
+    for entry in stream.get("metadata") or []:
+        if not isinstance(entry, dict) or entry.get("breadcrumb") != []:
+            continue
+        stream_metadata = entry.get("metadata") or {}
+        for key in ("table-key-properties", "valid-replication-keys"):
+            value = stream_metadata.get(key)
+            if isinstance(value, list):
+                required.update(str(column) for column in value)
+        replication_key = stream_metadata.get("replication-key")
+        if isinstance(replication_key, str):
+            required.add(replication_key)
+    return required
+
+
+class ColumnProjection:
+    """Needed columns per entity, applicable to a Singer catalog.
+
+    Entities without a projection are left untouched by ``apply``.
+
+    Attributes:
+      columns: Candidate (lower-case) column names per entity; names that
+        are not catalog columns are ignored.
+
+    """
+
+    def __init__(self, columns: Mapping[str, Iterable[str]] | None = None) -> None:
+        """Initialize with a declared projection."""
+        self.columns: dict[str, frozenset[str]] = {
+            entity: frozenset(column.lower() for column in names)
+            for entity, names in (columns or {}).items()
+        }
+
+    @classmethod
+    def from_dbt_models(
+        cls,
+        models_dir: Path = DEFAULT_DBT_MODELS_DIR,
+        *,
+        source_name: str = DEFAULT_SOURCE_NAME,
+        declared: Mapping[str, Iterable[str]] | None = None,
+    ) -> ColumnProjection:
+        """Plan the projection from dbt models, sources YAML and declarations.
+
+        Every identifier of a model counts for each source entity it reads;
+        the catalog narrows these candidates to real columns when applied.
+
+        Args:
+            models_dir: dbt ``models`` directory.
+            source_name: dbt source name of the raw WMS tables.
+            declared: Extra columns per entity (e.g. used by validators).
+
+        """
+        needed: dict[str, set[str]] = {}
+        for path in sorted(models_dir.rglob("*.sql")):
+            usage = parse_dbt_model(path, source_name)
+            for entity in usage.sources:
+                needed.setdefault(entity, set()).update(usage.identifiers)
+        for entity, columns in load_declared_source_columns(
+            models_dir, source_name
+        ).items():
+            if entity in needed:
+                needed[entity].update(columns)
+        for entity, columns in (declared or {}).items():
+            needed.setdefault(entity, set()).update(columns)
+        return cls(needed)
+
+    def selected_columns(self, stream: Mapping[str, t.GeneralValueType]) -> set[str]:
+        """Catalog column names (original case) kept for ``stream``."""
+        needed = self.columns.get(_stream_name(stream))
+        columns = _stream_columns(stream)
+        if needed is None:
+            return set(columns)
+        required = _required_columns(stream)
+        return {c for c in columns if c.lower() in needed or c in required}
+
+    def apply(
+        self, catalog: Mapping[str, t.GeneralValueType]
+    ) -> dict[str, t.GeneralValueType]:
+        """Copy of ``catalog`` with ``selected`` metadata for projected entities."""
+        projected = copy.deepcopy(dict(catalog))
+        for stream in _streams(projected):
+            if _stream_name(stream) not in self.columns:
+                continue
+            selected = self.selected_columns(stream)
+            metadata = [
+                entry
+                for entry in stream.get("metadata") or []
+                if isinstance(entry, dict)
+            ]
+            by_breadcrumb = {
+                tuple(entry.get("breadcrumb", [])): entry for entry in metadata
+            }
+            for breadcrumb, is_selected in [
+                ((), True),
+                *((("properties", c), c in selected) for c in _stream_columns(stream)),
+            ]:
+                entry = by_breadcrumb.get(breadcrumb)
+                if entry is None:
+                    entry = {"breadcrumb": list(breadcrumb), "metadata": {}}
+                    metadata.append(entry)
+                    by_breadcrumb[breadcrumb] = entry
+                entry.setdefault("metadata", {})["selected"] = is_selected
+            stream["metadata"] = metadata
+        return projected
+
+    def select_patterns(self, catalog: Mapping[str, t.GeneralValueType]) -> list[str]:
+        """Equivalent Meltano ``select`` extra patterns (``entity.column``)."""
+        return [
+            f"{_stream_name(stream)}.{column}"
+            for stream in _streams(catalog)
+            if _stream_name(stream) in self.columns
+            for column in sorted(self.selected_columns(stream))
+        ]
+
+    def summary(
+        self, catalog: Mapping[str, t.GeneralValueType]
+    ) -> dict[str, dict[str, int]]:
+        """Selected versus total columns per projected entity."""
+        return {
+            _stream_name(stream): {
+                "total": len(_stream_columns(stream)),
+                "selected": len(self.selected_columns(stream)),
+            }
+            for stream in _streams(catalog)
+            if _stream_name(stream) in self.columns
+        }
+
+
+__all__: list[str] = [
+    "DEFAULT_DBT_MODELS_DIR",
+    "DEFAULT_SOURCE_NAME",
+    "ColumnProjection",
+    "ModelColumnUsage",
+    "load_declared_source_columns",
+    "parse_dbt_model",
+]
@@ -9,11 +9,19 @@ Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Propriet
 
 from __future__ import annotations
 
+import contextlib
+import os
+import signal
 import subprocess  # noqa: S404 - Required for external command execution
+import tempfile
 from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Final
 
 from flext_core import FlextResult
 
+STDERR_TAIL_BYTES: Final[int] = 4096
+
 
 @dataclass(frozen=True)
 class ExternalCommandResult:
@@ -88,4 +96,103 @@ def run_external_command(
         )
 
 
-__all__ = ["ExternalCommandResult", "run_external_command"]
+class ExternalProcess:
+    """Long-running child process streaming through its stdin and stdout.
+
+    Stderr goes to an anonymous temporary file, so a chatty child never
+    blocks on a full pipe and its last lines can be quoted in error
+    messages. The child leads its own process group: ``meltano invoke``
+    runs the plugin as a grandchild, and killing the group stops both.
+
+    ``close`` kills whatever is still running, reaps it and releases the
+    pipes; call it from a ``finally`` block.
+    """
+
+    def __init__(
+        self,
+        cmd: list[str],
+        *,
+        env: dict[str, str] | None = None,
+        cwd: str | Path | None = None,
+        stdin: bool = False,
+    ) -> None:
+        """Start ``cmd``.
+
+        Args:
+            cmd: Command and arguments as a list of strings
+            env: Environment variables for the subprocess
+            cwd: Working directory for command execution
+            stdin: Open a pipe to the child's stdin
+
+        Raises:
+            OSError: If the command cannot be started (e.g. not found).
+
+        """
+        self.stderr_tail = ""
+        self._stderr = tempfile.TemporaryFile()  # noqa: SIM115 - closed in close()
+        try:
+            self._process = subprocess.Popen(  # noqa: S603 - intentional
+                cmd,
+                cwd=cwd,
+                env=env,
+                stdin=subprocess.PIPE if stdin else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=self._stderr,
+                start_new_session=True,
+            )
+        except BaseException:
+            self._stderr.close()
+            raise
+
+    @property
+    def stdin(self) -> IO[bytes]:
+        """Pipe to the child's stdin."""
+        if self._process.stdin is None:
+            msg = "Process was started without a stdin pipe"
+            raise ValueError(msg)
+        return self._process.stdin
+
+    @property
+    def stdout(self) -> IO[bytes]:
+        """Pipe from the child's stdout."""
+        if self._process.stdout is None:
+            msg = "Process stdout is not a pipe"
+            raise ValueError(msg)
+        return self._process.stdout
+
+    def close_stdin(self) -> None:
+        """Signal end of input; a child that already exited is not an error."""
+        if self._process.stdin is not None:
+            with contextlib.suppress(BrokenPipeError):
+                self._process.stdin.close()
+
+    def wait(self, timeout: float) -> int | None:
+        """Exit code of the child, or ``None`` if it was killed on timeout."""
+        try:
+            return self._process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.kill()
+            return None
+
+    def kill(self) -> None:
+        """Kill the child's process group if it is still running and reap it."""
+        if self._process.poll() is None:
+            with contextlib.suppress(ProcessLookupError):
+                os.killpg(self._process.pid, signal.SIGKILL)
+        self._process.wait()
+
+    def close(self) -> None:
+        """Kill and reap the child, close its pipes and keep its stderr tail."""
+        self.kill()
+        self.close_stdin()
+        if self._process.stdout is not None:
+            self._process.stdout.close()
+        if self._stderr.closed:
+            return
+        size = self._stderr.seek(0, os.SEEK_END)
+        self._stderr.seek(max(0, size - STDERR_TAIL_BYTES))
+        self.stderr_tail = self._stderr.read().decode(errors="replace").strip()
+        self._stderr.close()
+
+
+__all__ = ["ExternalCommandResult", "ExternalProcess", "run_external_command"]
@@ -0,0 +1,281 @@
+"""Multi-facility fan-out with fair-share scheduling.
+
+``wms_company_code`` and ``wms_facility_code`` select one warehouse; covering
+all of them used to mean one project copy per facility. The facility matrix
+runs every job once per (company, facility) pair from one controller:
+
+    - A job is expanded into one unit per facility and entity, each with its
+      own state id, so facilities never share bookmarks
+    - Units run under a global concurrency cap and a per-facility cap
+    - Free slots go to the facility that has used the least run time so far
+      (finished plus running units), so a facility with many or slow
+      entities cannot starve the others
+    - Outcomes are aggregated per facility; one failing facility does not
+      stop the rest
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Final, Self
+
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+
+if TYPE_CHECKING:
+    from gruponos_meltano_native.core.wms_extractor import WmsEntity
+
+logger = FlextLogger(__name__)
+
+DEFAULT_MATRIX_CONCURRENCY: Final[int] = 4
+DEFAULT_MAX_PER_FACILITY: Final[int] = 1
+
+
+@dataclass(frozen=True, slots=True)
+class FacilityTarget:
+    """One (company, facility) pair of the matrix."""
+
+    company_code: str
+    facility_code: str
+
+    @property
+    def key(self) -> str:
+        """Identifier used in state ids and results (``COMPANY-FACILITY``)."""
+        return f"{self.company_code}-{self.facility_code}"
+
+    @classmethod
+    def parse(cls, spec: str) -> Self:
+        """Parse ``COMPANY:FACILITY``."""
+        company, sep, facility = spec.strip().partition(":")
+        if not sep or not company.strip() or not facility.strip():
+            msg = f"Invalid facility {spec!r}: expected COMPANY:FACILITY"
+            raise ValueError(msg)
+        return cls(company.strip(), facility.strip())
+
+    def apply(
+        self, config: Mapping[str, t.GeneralValueType]
+    ) -> dict[str, t.GeneralValueType]:
+        """Tap-style config pointed at this facility."""
+        return {
+            **config,
+            "company_code": self.company_code,
+            "facility_code": self.facility_code,
+        }
+
+
+def parse_facility_matrix(
+    spec: str | Sequence[str | tuple[str, str]],
+) -> list[FacilityTarget]:
+    """Facilities from ``"C1:F1,C1:F2"`` or a sequence of specs or pairs.
+
+    Raises:
+        ValueError: On a malformed entry, a duplicate or an empty matrix.
+
+    """
+    items = spec.split(",") if isinstance(spec, str) else spec
+    facilities: list[FacilityTarget] = []
+    for item in items:
+        if isinstance(item, str):
+            if not item.strip():
+                continue
+            facility = FacilityTarget.parse(item)
+        else:
+            facility = FacilityTarget(*item)
+        if facility in facilities:
+            msg = f"Duplicate facility {facility.key} in the facility matrix"
+            raise ValueError(msg)
+        facilities.append(facility)
+    if not facilities:
+        msg = "Facility matrix is empty"
+        raise ValueError(msg)
+    return facilities
+
+
+@dataclass(frozen=True, slots=True)
+class FacilityUnit:
+    """One entity of one facility."""
+
+    facility: FacilityTarget
+    entity: WmsEntity
+
+
+# Runs one unit and returns its loaded record count
+UnitRunner = Callable[[FacilityUnit], FlextResult[int]]
+
+
+@dataclass(slots=True)
+class FacilityRunStats:
+    """Outcome of one facility's units."""
+
+    units: int = 0
+    completed: int = 0
+    failed: int = 0
+    records: int = 0
+    busy_seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, t.GeneralValueType]:
+        """Counters as a plain dict (for pipeline metadata)."""
+        return {
+            "units": self.units,
+            "completed": self.completed,
+            "failed": self.failed,
+            "records": self.records,
+            "busy_seconds": round(self.busy_seconds, 6),
+            "errors": list(self.errors),
+        }
+
+
+@dataclass(slots=True)
+class FacilityMatrixSummary:
+    """Outcome of a matrix run, per facility."""
+
+    facilities: dict[str, FacilityRunStats] = field(default_factory=dict)
+    max_in_flight: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def records(self) -> int:
+        """Records loaded by all facilities."""
+        return sum(s.records for s in self.facilities.values())
+
+    @property
+    def failed_facilities(self) -> list[str]:
+        """Facilities with at least one failed unit."""
+        return [key for key, s in self.facilities.items() if s.failed]
+
+    def as_dict(self) -> dict[str, t.GeneralValueType]:
+        """Summary as a plain dict (for pipeline metadata)."""
+        return {
+            "records": self.records,
+            "failed_facilities": self.failed_facilities,
+            "max_in_flight": self.max_in_flight,
+            "elapsed_seconds": round(self.elapsed_seconds, 6),
+            "facilities": {k: s.as_dict() for k, s in self.facilities.items()},
+        }
+
+
+class GruponosFairShareScheduler:
+    """Run facility units with bounded concurrency and fair-share slots.
+
+    Each free slot goes to the facility with pending units, below
+    ``max_per_facility`` running units, that has consumed the least run time
+    (finished units plus the elapsed time of running ones); ties go to the
+    facility with fewer running units, then to matrix order.
+    """
+
+    def __init__(
+        self,
+        run_unit: UnitRunner,
+        *,
+        max_concurrency: int = DEFAULT_MATRIX_CONCURRENCY,
+        max_per_facility: int = DEFAULT_MAX_PER_FACILITY,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.run_unit = run_unit
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_per_facility = max(1, max_per_facility)
+        self._clock = clock
+
+    def _run_one(self, unit: FacilityUnit) -> FlextResult[int]:
+        try:
+            return self.run_unit(unit)
+        except Exception as e:  # noqa: BLE001 - a unit must not kill the matrix
+            return FlextResult[int].fail(
+                f"{unit.facility.key}/{unit.entity.name} raised: {e}"
+            )
+
+    def run(self, units: Sequence[FacilityUnit]) -> FacilityMatrixSummary:
+        """Execute every unit; failures are recorded per facility."""
+        started = self._clock()
+        summary = FacilityMatrixSummary()
+        pending: dict[str, deque[FacilityUnit]] = {}
+        for unit in units:
+            pending.setdefault(unit.facility.key, deque()).append(unit)
+            stats = summary.facilities.setdefault(
+                unit.facility.key, FacilityRunStats()
+            )
+            stats.units += 1
+        order = {key: index for index, key in enumerate(pending)}
+        running: dict[Future[FlextResult[int]], tuple[FacilityUnit, float]] = {}
+
+        def next_facility(now: float) -> str | None:
+            share = {key: s.busy_seconds for key, s in summary.facilities.items()}
+            active = dict.fromkeys(pending, 0)
+            for unit, unit_start in running.values():
+                share[unit.facility.key] += now - unit_start
+                active[unit.facility.key] += 1
+            eligible = [
+                key
+                for key, queue in pending.items()
+                if queue and active[key] < self.max_per_facility
+            ]
+            if not eligible:
+                return None
+            return min(eligible, key=lambda k: (share[k], active[k], order[k]))
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="facility"
+        ) as pool:
+            while True:
+                while len(running) < self.max_concurrency:
+                    now = self._clock()
+                    key = next_facility(now)
+                    if key is None:
+                        break
+                    unit = pending[key].popleft()
+                    running[pool.submit(self._run_one, unit)] = (unit, now)
+                summary.max_in_flight = max(summary.max_in_flight, len(running))
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                now = self._clock()
+                for future in done:
+                    unit, unit_start = running.pop(future)
+                    stats = summary.facilities[unit.facility.key]
+                    stats.busy_seconds += now - unit_start
+                    self._record(stats, unit, future.result())
+        summary.elapsed_seconds = self._clock() - started
+        logger.info(
+            "Facility matrix finished: %s facilities, %s records, %s failed",
+            len(summary.facilities),
+            summary.records,
+            len(summary.failed_facilities),
+        )
+        return summary
+
+    @staticmethod
+    def _record(
+        stats: FacilityRunStats, unit: FacilityUnit, result: FlextResult[int]
+    ) -> None:
+        if result.is_success:
+            stats.completed += 1
+            stats.records += result.value
+            return
+        logger.error(
+            "Facility %s, entity %s failed: %s",
+            unit.facility.key,
+            unit.entity.name,
+            result.error,
+        )
+        stats.failed += 1
+        stats.errors.append(f"{unit.entity.name}: {result.error}")
+
+
+__all__: list[str] = [
+    "DEFAULT_MATRIX_CONCURRENCY",
+    "DEFAULT_MAX_PER_FACILITY",
+    "FacilityMatrixSummary",
+    "FacilityRunStats",
+    "FacilityTarget",
+    "FacilityUnit",
+    "GruponosFairShareScheduler",
+    "UnitRunner",
+    "parse_facility_matrix",
+]
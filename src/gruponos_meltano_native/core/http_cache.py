@@ -0,0 +1,309 @@
+"""On-disk HTTP response cache for WMS API pages.
+
+Implements the ``cache_enabled`` / ``cache_ttl`` / ``cache_directory``
+settings of ``wms_integration.yml``, so re-runs after a failed load and
+dev/staging runs against the same facility do not download identical pages
+again:
+
+    - Bodies are stored zlib-compressed and content-addressed by sha256, so
+      identical pages under different URLs share one file
+    - A JSON index maps request keys (URL + params) to digest, ETag,
+      Last-Modified and validation time
+    - Expired entries are revalidated with ``If-None-Match`` /
+      ``If-Modified-Since``; a 304 reuses the stored body
+    - The total size of stored bodies is capped with LRU eviction
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Final, Self
+
+from flext_core import FlextLogger, FlextTypes as t
+
+logger = FlextLogger(__name__)
+
+DEFAULT_CACHE_DIRECTORY: Final[Path] = Path("./cache")
+DEFAULT_CACHE_TTL_SECONDS: Final[float] = 3600.0
+DEFAULT_CACHE_MAX_BYTES: Final[int] = 512 * 1024 * 1024
+_INDEX_FILENAME: Final[str] = "index.json"
+_INDEX_VERSION: Final[int] = 1
+
+
+def response_cache_key(url: str, params: Mapping[str, str | int] | None) -> str:
+    """Cache key of a GET request (URL and sorted query params)."""
+    canonical = json.dumps(
+        [url, sorted((str(k), str(v)) for k, v in (params or {}).items())],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """Index entry of a cached response."""
+
+    digest: str
+    size: int
+    stored_size: int
+    validated_at: float
+    last_access: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers for revalidating the entry."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(slots=True)
+class ResponseCacheStats:
+    """Counters of a response cache."""
+
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    bytes_served: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Counters as a plain dict."""
+        return asdict(self)
+
+
+class GruponosWmsResponseCache:
+    """Content-addressed, size-capped response cache with an LRU index.
+
+    Thread-safe; ``flush`` persists the index (also done by ``close``).
+
+    Attributes:
+      directory: Cache directory (index plus ``bodies/``).
+      ttl_seconds: Freshness lifetime of stored responses.
+      max_bytes: Cap on compressed bytes kept on disk.
+      stats: Hit/miss counters.
+
+    """
+
+    def __init__(
+        self,
+        directory: Path = DEFAULT_CACHE_DIRECTORY,
+        *,
+        ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
+        """Open (or create) the cache in ``directory``."""
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.stats = ResponseCacheStats()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries = self._load_index()
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, t.GeneralValueType]) -> Self | None:
+        """Cache from ``cache_*`` tap settings, or None when disabled."""
+        enabled = config.get("cache_enabled", False)
+        if isinstance(enabled, str):
+            enabled = enabled.strip().lower() in {"1", "true", "yes", "on"}
+        if not enabled:
+            return None
+        return cls(
+            Path(str(config.get("cache_directory") or DEFAULT_CACHE_DIRECTORY)),
+            ttl_seconds=float(config.get("cache_ttl") or DEFAULT_CACHE_TTL_SECONDS),
+            max_bytes=int(config.get("cache_max_bytes") or DEFAULT_CACHE_MAX_BYTES),
+        )
+
+    @property
+    def _index_path(self) -> Path:
+        return self.directory / _INDEX_FILENAME
+
+    def _body_path(self, digest: str) -> Path:
+        return self.directory / "bodies" / digest[:2] / f"{digest}.z"
+
+    def _load_index(self) -> dict[str, CachedResponse]:
+        try:
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return {}
+        entries: dict[str, CachedResponse] = {}
+        for key, raw in (data.get("entries") or {}).items():
+            try:
+                entries[key] = CachedResponse(**raw)
+            except TypeError:
+                continue
+        return entries
+
+    @property
+    def stored_bytes(self) -> int:
+        """Compressed bytes of all distinct bodies."""
+        with self._lock:
+            return self._stored_bytes()
+
+    def _stored_bytes(self) -> int:
+        sizes = {entry.digest: entry.stored_size for entry in self._entries.values()}
+        return sum(sizes.values())
+
+    def __len__(self) -> int:
+        """Number of cached requests."""
+        with self._lock:
+            return len(self._entries)
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Whether ``entry`` can be served without revalidation."""
+        return time.time() < entry.validated_at + self.ttl_seconds
+
+    def lookup(
+        self, url: str, params: Mapping[str, str | int] | None = None
+    ) -> CachedResponse | None:
+        """Index entry for a request, fresh or not (None when unknown)."""
+        with self._lock:
+            return self._entries.get(response_cache_key(url, params))
+
+    def read_body(self, entry: CachedResponse) -> bytes | None:
+        """Stored body of ``entry`` (None when missing or corrupt)."""
+        try:
+            body = zlib.decompress(self._body_path(entry.digest).read_bytes())
+        except (OSError, zlib.error):
+            body = None
+        if body is None or hashlib.sha256(body).hexdigest() != entry.digest:
+            logger.warning("Dropping unreadable cached body %s", entry.digest[:12])
+            with self._lock:
+                self._drop_digest(entry.digest)
+            return None
+        with self._lock:
+            entry.last_access = time.time()
+            self._dirty = True
+        return body
+
+    def record_hit(self, entry: CachedResponse, *, revalidated: bool) -> None:
+        """Count a served entry; a revalidation also renews its freshness."""
+        with self._lock:
+            if revalidated:
+                entry.validated_at = time.time()
+                self.stats.revalidated += 1
+                self._dirty = True
+            else:
+                self.stats.hits += 1
+            self.stats.bytes_served += entry.size
+
+    def record_miss(self) -> None:
+        """Count a request that had to be downloaded."""
+        with self._lock:
+            self.stats.misses += 1
+
+    def store(
+        self,
+        url: str,
+        params: Mapping[str, str | int] | None,
+        body: bytes,
+        headers: Mapping[str, str],
+    ) -> CachedResponse | None:
+        """Store a 200 response; ``Cache-Control: no-store`` is honoured."""
+        if "no-store" in headers.get("Cache-Control", "").lower():
+            return None
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._body_path(digest)
+        stored_size = 0
+        try:
+            if path.exists():
+                stored_size = path.stat().st_size
+            else:
+                compressed = zlib.compress(body, 6)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+                tmp.write_bytes(compressed)
+                os.replace(tmp, path)
+                stored_size = len(compressed)
+        except OSError as e:
+            logger.warning("Response cache write failed: %s", e)
+            return None
+        now = time.time()
+        entry = CachedResponse(
+            digest=digest,
+            size=len(body),
+            stored_size=stored_size,
+            validated_at=now,
+            last_access=now,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        with self._lock:
+            self._entries[response_cache_key(url, params)] = entry
+            self.stats.stores += 1
+            self._dirty = True
+            self._evict()
+        return entry
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond ``max_bytes``."""
+        total = self._stored_bytes()
+        if total <= self.max_bytes:
+            return
+        for key, entry in sorted(
+            self._entries.items(), key=lambda item: item[1].last_access
+        ):
+            if total <= self.max_bytes:
+                break
+            del self._entries[key]
+            self.stats.evictions += 1
+            if not any(e.digest == entry.digest for e in self._entries.values()):
+                self._body_path(entry.digest).unlink(missing_ok=True)
+                total -= entry.stored_size
+
+    def _drop_digest(self, digest: str) -> None:
+        for key in [k for k, e in self._entries.items() if e.digest == digest]:
+            del self._entries[key]
+        self._body_path(digest).unlink(missing_ok=True)
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Persist the index when it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": _INDEX_VERSION,
+                "entries": {key: asdict(e) for key, e in self._entries.items()},
+            }
+            self._dirty = False
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = self._index_path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self._index_path)
+        except OSError as e:
+            logger.warning("Response cache index write failed: %s", e)
+
+    def close(self) -> None:
+        """Persist the index."""
+        self.flush()
+
+
+__all__: list[str] = [
+    "DEFAULT_CACHE_DIRECTORY",
+    "DEFAULT_CACHE_MAX_BYTES",
+    "DEFAULT_CACHE_TTL_SECONDS",
+    "CachedResponse",
+    "GruponosWmsResponseCache",
+    "ResponseCacheStats",
+    "response_cache_key",
+]
@@ -0,0 +1,146 @@
+"""Indexed run: large loads with index maintenance deferred to parallel rebuilds.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+
+from gruponos_meltano_native.core.native_run import GruponosNativeRun
+from gruponos_meltano_native.core.run_context import (
+    GruponosRunContext,
+    PipelineResult,
+)
+from gruponos_meltano_native.core.wms_extractor import WmsEntity
+from gruponos_meltano_native.oracle.index_manager import (
+    GruponosMeltanoOracleIndexManager,
+    IndexStrategy,
+)
+from gruponos_meltano_native.oracle.shadow_swap import DEFAULT_PARALLEL_DEGREE
+
+logger = FlextLogger(__name__)
+
+
+class GruponosIndexedRun:
+    """Load entities with their non-unique indexes suspended and rebuilt.
+
+    Example:
+        result = GruponosIndexedRun(context).run(entities, state={})
+
+    """
+
+    def __init__(
+        self,
+        context: GruponosRunContext,
+        native: GruponosNativeRun | None = None,
+    ) -> None:
+        """Initialize the strategy; the load runs through ``native``."""
+        self.context = context
+        self.native = native or GruponosNativeRun(context)
+
+    def run(
+        self,
+        entities: Sequence[WmsEntity],
+        *,
+        loader: str = "target-oracle-full",
+        extractor_config: Mapping[str, t.GeneralValueType] | None = None,
+        state: Mapping[str, t.GeneralValueType] | None = None,
+        strategy: IndexStrategy = IndexStrategy.UNUSABLE,
+        parallel_degree: int = DEFAULT_PARALLEL_DEGREE,
+        expected_rows: Mapping[str, int] | None = None,
+        reconcile: bool = True,
+    ) -> FlextResult[PipelineResult]:
+        """Load ``entities`` through ``loader`` with deferred index maintenance.
+
+        The ``indexes`` declared per entity in ``config/wms_integration.yml``
+        are reconciled with the target tables (missing ones created), then
+        ``GruponosMeltanoOracleIndexManager`` suspends the non-unique indexes
+        of every table whose load is large enough, the native engine loads
+        all entities in one run, and the suspended indexes are rebuilt with
+        ``PARALLEL NOLOGGING``, also when the load fails. Reports go to
+        ``metadata["index_maintenance"]``.
+
+        Args:
+            entities: Entities to load.
+            loader: Meltano loader writing to ``oracle_schema``.
+            extractor_config: Tap-style config (defaults to the settings).
+            state: Singer state of the native run (``{}`` for a full reload).
+            strategy: Mark indexes ``UNUSABLE`` or drop and recreate them.
+            parallel_degree: Parallelism of index creation and rebuilds.
+            expected_rows: Rows expected per entity; tables whose load is
+                small compared to their size keep their indexes. Without
+                it every table is treated as a large load.
+            reconcile: Create declared indexes missing on the tables first.
+
+        Returns:
+            FlextResult[PipelineResult]: Load result with index reports.
+
+        """
+        context = self.context
+        schema = context.settings.oracle_schema
+        if not schema:
+            return FlextResult.fail("Indexed bulk load needs oracle_schema")
+        declared = context.table_declarations()
+
+        managers: dict[str, GruponosMeltanoOracleIndexManager] = {}
+        with context.oracle_session() as session:
+            if session.is_failure:
+                return FlextResult.fail(session.error)
+            try:
+                for entity in entities:
+                    declaration = declared.get(entity.name)
+                    try:
+                        manager = GruponosMeltanoOracleIndexManager(
+                            session.value,
+                            schema=schema,
+                            table=context.target_table(entity, declared),
+                            declared=declaration.indexes if declaration else (),
+                            strategy=strategy,
+                            parallel_degree=parallel_degree,
+                        )
+                    except ValueError as e:
+                        return FlextResult.fail(str(e))
+                    managers[entity.name] = manager
+                    if reconcile:
+                        reconciled = manager.reconcile()
+                        if reconciled.is_failure:
+                            return FlextResult.fail(reconciled.error)
+                    expected = (
+                        expected_rows.get(entity.name)
+                        if expected_rows is not None
+                        else None
+                    )
+                    if manager.should_suspend(expected):
+                        suspended = manager.suspend()
+                        if suspended.is_failure:
+                            return FlextResult.fail(suspended.error)
+                load = self.native.run(
+                    loader,
+                    entities,
+                    extractor_config=extractor_config,
+                    state=state,
+                )
+            finally:
+                rebuild_errors = [
+                    str(rebuilt.error)
+                    for rebuilt in (manager.rebuild() for manager in managers.values())
+                    if rebuilt.is_failure
+                ]
+
+        if load.is_failure:
+            return load
+        pipeline_result = load.value
+        pipeline_result.metadata["index_maintenance"] = {
+            name: manager.report.as_dict() for name, manager in managers.items()
+        }
+        if rebuild_errors:
+            pipeline_result.status = "FAILED"
+            pipeline_result.errors.extend(rebuild_errors)
+            logger.error("Index rebuild failed: %s", rebuild_errors)
+        return FlextResult.ok(pipeline_result)
+
+
+__all__: list[str] = ["GruponosIndexedRun"]
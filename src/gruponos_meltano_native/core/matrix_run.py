@@ -0,0 +1,148 @@
+"""Matrix run: one native job per facility, scheduled with fair shares.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+
+from gruponos_meltano_native.core.facility_matrix import (
+    DEFAULT_MATRIX_CONCURRENCY,
+    DEFAULT_MAX_PER_FACILITY,
+    FacilityTarget,
+    FacilityUnit,
+    GruponosFairShareScheduler,
+    parse_facility_matrix,
+)
+from gruponos_meltano_native.core.native_run import GruponosNativeRun
+from gruponos_meltano_native.core.run_context import (
+    GruponosRunContext,
+    PipelineResult,
+    build_pipeline_result,
+)
+from gruponos_meltano_native.core.wms_extractor import WmsEntity
+
+if TYPE_CHECKING:
+    from gruponos_meltano_native.config import GruponosMeltanoNativeConfig
+
+logger = FlextLogger(__name__)
+
+
+def configured_facilities(
+    settings: GruponosMeltanoNativeConfig,
+) -> list[FacilityTarget]:
+    """Facility matrix from the settings."""
+    if settings.wms_facilities:
+        return parse_facility_matrix(settings.wms_facilities)
+    if settings.wms_company_code and settings.wms_facility_code:
+        return [FacilityTarget(settings.wms_company_code, settings.wms_facility_code)]
+    msg = "No facilities configured: set wms_facilities or the facility code"
+    raise ValueError(msg)
+
+
+class GruponosMatrixRun:
+    """Run a native job for every facility of the matrix.
+
+    Example:
+        result = GruponosMatrixRun(context).run("target-oracle-full", entities)
+
+    """
+
+    def __init__(
+        self,
+        context: GruponosRunContext,
+        native: GruponosNativeRun | None = None,
+    ) -> None:
+        """Initialize the strategy; units run through ``native``."""
+        self.context = context
+        self.native = native or GruponosNativeRun(context)
+
+    def run(
+        self,
+        loader: str,
+        entities: Sequence[WmsEntity],
+        *,
+        facilities: Sequence[FacilityTarget] | None = None,
+        extractor_config: Mapping[str, t.GeneralValueType] | None = None,
+        max_concurrency: int = DEFAULT_MATRIX_CONCURRENCY,
+        max_per_facility: int = DEFAULT_MAX_PER_FACILITY,
+    ) -> FlextResult[PipelineResult]:
+        """Run ``entities`` into ``loader`` for every facility, fairly.
+
+        The job is expanded into one native run per facility and entity,
+        each with its own state id (``wms-native-<loader>@<COMPANY-FACILITY>``),
+        and run by ``GruponosFairShareScheduler``: at most ``max_concurrency``
+        units at once and ``max_per_facility`` per facility, free slots going
+        to the facility that used the least run time. All units share the
+        adaptive rate limiter, which budgets per facility. Outcomes are
+        aggregated per facility in ``metadata["facility_matrix"]``; when a
+        facility fails the others still run and the result status is
+        ``FAILED``.
+
+        Args:
+            loader: Meltano loader name (e.g. ``target-oracle-full``).
+            entities: Entities to extract in every facility.
+            facilities: Matrix override (defaults to ``wms_facilities`` or
+                the single ``wms_company_code``/``wms_facility_code``).
+            extractor_config: Tap-style config (defaults to the settings).
+            max_concurrency: Units running at the same time.
+            max_per_facility: Units of one facility running at the same time.
+
+        Returns:
+            FlextResult[PipelineResult]: Result with per-facility outcomes.
+
+        """
+        context = self.context
+        raw_config = context.extractor_config(extractor_config)
+        try:
+            loader_name = context.validate_job_name(loader)
+            matrix = list(facilities or configured_facilities(context.settings))
+        except ValueError as e:
+            return FlextResult.fail(str(e))
+
+        def run_unit(unit: FacilityUnit) -> FlextResult[int]:
+            result = self.native.run(
+                loader_name,
+                [unit.entity],
+                extractor_config=unit.facility.apply(raw_config),
+                state_job=f"wms-native-{loader_name}@{unit.facility.key}",
+            )
+            if result.is_failure:
+                return FlextResult[int].fail(result.error or "unit failed")
+            return FlextResult[int].ok(result.value.records_loaded)
+
+        start_time = datetime.now(tz=UTC)
+        logger.info(
+            "Starting facility matrix into %s: %s",
+            loader_name,
+            ", ".join(facility.key for facility in matrix),
+        )
+        summary = GruponosFairShareScheduler(
+            run_unit,
+            max_concurrency=max_concurrency,
+            max_per_facility=max_per_facility,
+        ).run([FacilityUnit(f, entity) for f in matrix for entity in entities])
+
+        failed = summary.failed_facilities
+        pipeline_result = build_pipeline_result(
+            f"wms-matrix-{loader_name}",
+            start_time,
+            records_extracted=summary.records,
+            records_loaded=summary.records,
+            status="FAILED" if failed else "SUCCESS",
+        )
+        pipeline_result.errors.extend(
+            f"{key}: {error}"
+            for key in failed
+            for error in summary.facilities[key].errors
+        )
+        pipeline_result.metadata["facility_matrix"] = summary.as_dict()
+        return FlextResult.ok(pipeline_result)
+
+
+__all__: list[str] = ["GruponosMatrixRun", "configured_facilities"]
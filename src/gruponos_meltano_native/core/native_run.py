@@ -0,0 +1,297 @@
+"""Native run: in-package WMS engine straight into a Meltano loader.
+
+No tap process is started: ``GruponosWmsExtractor`` fetches pages
+concurrently on one pooled session and writes Singer messages to the
+loader's stdin in page order. Bookmarks live in the embedded state store and
+are checkpointed as the loader echoes STATE, so a retry resumes from the last
+loaded page.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping, Sequence
+from dataclasses import replace
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+
+from gruponos_meltano_native.core.external_command import ExternalProcess
+from gruponos_meltano_native.core.http_cache import GruponosWmsResponseCache
+from gruponos_meltano_native.core.run_context import (
+    MELTANO_NOT_FOUND,
+    GruponosRunContext,
+    PipelineConfiguration,
+    PipelineResult,
+    build_pipeline_result,
+    commit_change_filters,
+    stderr_suffix,
+)
+from gruponos_meltano_native.core.singer_proxy import (
+    RecordTransform,
+    chain_transforms,
+)
+from gruponos_meltano_native.core.spill_buffer import SpillBufferWriter
+from gruponos_meltano_native.core.state_store import StateCheckpointer
+from gruponos_meltano_native.core.wms_extractor import (
+    GruponosWmsExtractor,
+    WmsEntity,
+    WmsExtractorConfig,
+    catalog_schemas,
+)
+from gruponos_meltano_native.validators.profiler import StreamProfiler
+from gruponos_meltano_native.validators.quality import DataQualityAccumulator
+
+if TYPE_CHECKING:
+    from gruponos_meltano_native.core.overlap_dedup import (
+        GruponosOverlapDeduplicator,
+    )
+    from gruponos_meltano_native.core.row_hash import GruponosRowHashFilter
+    from gruponos_meltano_native.core.spill_buffer import SpillBuffer
+    from gruponos_meltano_native.validators.data_validator import DataValidator
+
+logger = FlextLogger(__name__)
+
+
+def _run_observer(
+    validators: Mapping[str, DataValidator],
+    quality: Mapping[str, DataQualityAccumulator],
+    profiles: Mapping[str, StreamProfiler],
+) -> RecordTransform:
+    """Transform feeding each record to its stream's accumulator and profiler.
+
+    Records failing their stream's validator are still loaded (the native
+    path has no quarantine) but count as failed in the accuracy score.
+    """
+
+    def observe(
+        stream: str, record: dict[str, t.GeneralValueType]
+    ) -> dict[str, t.GeneralValueType]:
+        accumulator = quality.get(stream)
+        if accumulator is not None:
+            validator = validators.get(stream)
+            failed = validator is not None and bool(
+                validator.collect_failures(record)
+                or validator.check_duplicate_key(record, raise_on_failure=False)
+            )
+            accumulator.observe(record, failed=failed)
+        profiler = profiles.get(stream)
+        if profiler is not None:
+            profiler.observe(record)
+        return record
+
+    return observe
+
+
+class GruponosNativeRun:
+    """Extract with the in-package WMS engine straight into a Meltano loader.
+
+    Example:
+        result = GruponosNativeRun(context).run("target-oracle-full", entities)
+
+    """
+
+    def __init__(self, context: GruponosRunContext) -> None:
+        """Initialize the strategy on the orchestrator's shared ``context``."""
+        self.context = context
+
+    def run(
+        self,
+        loader: str,
+        entities: Sequence[WmsEntity],
+        *,
+        extractor_config: Mapping[str, t.GeneralValueType] | None = None,
+        state: Mapping[str, t.GeneralValueType] | None = None,
+        state_job: str | None = None,
+        buffer: SpillBuffer | None = None,
+        dedup: GruponosOverlapDeduplicator | None = None,
+        row_hashes: GruponosRowHashFilter | None = None,
+        catalog: Mapping[str, t.GeneralValueType] | None = None,
+        validators: Mapping[str, DataValidator] | None = None,
+        quality: Mapping[str, DataQualityAccumulator] | None = None,
+        profiles: Mapping[str, StreamProfiler] | None = None,
+        configuration: PipelineConfiguration | None = None,
+    ) -> FlextResult[PipelineResult]:
+        """Run ``entities`` into ``loader``.
+
+        Pages are fetched concurrently (``max_parallel_pages``) on one pooled
+        session and written to the target's stdin in page order; no tap
+        process is started. Extraction counters go to
+        ``metadata["wms_extraction"]`` and the final state to
+        ``metadata["state"]``.
+
+        Bookmarks live in the embedded state store
+        (``.meltano/state/native_state.sqlite``), one row per stream: every
+        STATE the target echoes is checkpointed with compare-and-swap, so a
+        retry after a failure resumes from the last loaded page and
+        concurrent runs on other entities never overwrite each other.
+
+        Args:
+            loader: Meltano loader name (e.g. ``target-oracle-full``).
+            entities: Entities to extract, in order.
+            extractor_config: Tap-style config (defaults to the settings'
+                ``wms_source_config``); ``cache_enabled``, ``cache_ttl`` and
+                ``cache_directory`` enable the on-disk response cache,
+                ``adaptive_rate_limit`` the shared adaptive rate limiter.
+            state: Singer state overriding the stored bookmarks; bookmarks
+                are moved back by ``incremental_overlap_minutes``.
+            state_job: Job id in the state store (defaults to
+                ``wms-native-<loader>``).
+            buffer: Optional backpressure buffer between engine and target.
+            dedup: Overlap-window deduplicator dropping rows the previous run
+                loaded unchanged; committed only when the run succeeds.
+            row_hashes: Row-hash filter skipping rows whose business fields
+                did not change; hashes are committed only on success. A full
+                reload (``state={}``) resets the entities' hashes first, so
+                every row is loaded and hashed again.
+            catalog: Singer catalog whose stream schemas are sent to the
+                loader (defaults to the catalog resolved for
+                ``extractor_config["name"]``); entities without a catalog
+                schema get one inferred from their records.
+            validators: Validator per entity name; records it rejects are
+                loaded but count as failed in the accuracy score.
+            quality: Quality accumulator per entity name, fed with every
+                record written to the loader; defaults to one per entity
+                checking its key properties.
+            profiles: Column profiler per entity name, fed with the same
+                records and recorded in the run ledger; defaults to one per
+                entity.
+            configuration: Pipeline configuration with the quality checks
+                switch and threshold (model defaults when omitted).
+
+        Returns:
+            FlextResult[PipelineResult]: Result with extraction statistics
+            and quality scores.
+
+        """
+        context = self.context
+        start_time = datetime.now(tz=UTC)
+        raw_config = context.extractor_config(extractor_config)
+        try:
+            loader_name = context.validate_job_name(loader)
+            config = WmsExtractorConfig.from_mapping(raw_config)
+        except ValueError as e:
+            return FlextResult.fail(str(e))
+        schemas = catalog_schemas(
+            catalog if catalog is not None else context.resolved_catalog(raw_config)
+        )
+        entities = [
+            replace(entity, schema=schemas[entity.name])
+            if entity.schema is None and entity.name in schemas
+            else entity
+            for entity in entities
+        ]
+        if quality is None:
+            quality = {
+                entity.name: DataQualityAccumulator(
+                    required_fields=entity.key_properties,
+                    key_fields=entity.key_properties,
+                )
+                for entity in entities
+            }
+        if profiles is None:
+            profiles = {
+                entity.name: StreamProfiler(entity.stream_name) for entity in entities
+            }
+        if row_hashes is not None and state is not None and not state:
+            for entity in entities:
+                row_hashes.reset(entity.name)
+        cache = GruponosWmsResponseCache.from_config(raw_config)
+        limiter = context.rate_limiter(raw_config)
+        store = context.state_store()
+        snapshot = store.snapshot(state_job or f"wms-native-{loader_name}")
+        checkpointer = StateCheckpointer(
+            store,
+            snapshot.job,
+            [entity.name for entity in entities],
+            snapshot.versions,
+        )
+
+        logger.info(
+            "Starting native WMS extraction into %s: %s",
+            loader_name,
+            ", ".join(entity.name for entity in entities),
+        )
+        try:
+            target = ExternalProcess(
+                ["meltano", "invoke", loader_name],
+                env=context.environment(),
+                cwd=context.project_root,
+                stdin=True,
+            )
+        except FileNotFoundError:
+            return FlextResult.fail(MELTANO_NOT_FOUND)
+        # STATE echoed by the target marks what is loaded: checkpoint it
+        drain = threading.Thread(
+            target=checkpointer.consume, args=(target.stdout,), daemon=True
+        )
+        drain.start()
+        try:
+            writer = (
+                SpillBufferWriter(target.stdin, buffer) if buffer is not None else None
+            )
+            with GruponosWmsExtractor(
+                config,
+                cache=cache,
+                limiter=limiter,
+                transform=chain_transforms(
+                    dedup,
+                    row_hashes,
+                    _run_observer(validators or {}, quality, profiles),
+                ),
+                state=snapshot.singer_state() if state is None else state,
+            ) as extractor:
+                extraction = extractor.run(entities, writer or target.stdin)
+            buffer_result = writer.close() if writer is not None else None
+            target.close_stdin()
+            target_code = target.wait(context.timeout)
+        finally:
+            target.close()
+            drain.join()
+
+        if target_code is None:
+            return FlextResult.fail(
+                f"Native run timed out: {loader_name} killed after "
+                f"{context.timeout}s{stderr_suffix(target)}"
+            )
+        if extraction.is_failure:
+            return FlextResult.fail(extraction.error)
+        if buffer_result is not None and buffer_result.is_failure:
+            return FlextResult.fail(buffer_result.error)
+        if target_code != 0:
+            return FlextResult.fail(
+                f"Native run failed: {loader_name} exited with {target_code}"
+                f"{stderr_suffix(target)}"
+            )
+
+        stats = extraction.value
+        pipeline_result = build_pipeline_result(
+            f"wms-native-{loader_name}",
+            start_time,
+            records_extracted=stats.records,
+            records_loaded=stats.records - stats.records_dropped,
+        )
+        pipeline_result.metadata["wms_extraction"] = stats.as_dict()
+        commit_change_filters(pipeline_result, dedup, row_hashes)
+        checkpointer.save(extractor.state)
+        pipeline_result.metadata["state"] = extractor.state
+        pipeline_result.metadata["state_store"] = checkpointer.as_dict()
+        if cache is not None:
+            pipeline_result.metadata["response_cache"] = cache.stats.as_dict()
+        if limiter is not None:
+            pipeline_result.metadata["rate_limiter"] = stats.rate_limits
+        if buffer_result is not None:
+            pipeline_result.metadata["spill_buffer"] = buffer_result.value.as_dict()
+        logger.info(
+            "Native run completed: %s records in %s pages, max %s pages in flight",
+            stats.records,
+            stats.pages,
+            stats.max_in_flight,
+        )
+        return context.finish(pipeline_result, quality, profiles, configuration)
+
+
+__all__: list[str] = ["GruponosNativeRun"]
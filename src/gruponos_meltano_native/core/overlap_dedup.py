@@ -0,0 +1,310 @@
+"""Overlap-window deduplication for incremental syncs.
+
+Incremental runs re-read the last ``incremental_overlap_minutes`` of data to
+catch late commits, so every row of that window is upserted into Oracle again
+on every run. This stage drops the rows the previous run already loaded:
+
+    - A row is identified by a 64-bit hash of its primary key values and its
+      replication key value; the same key with a newer ``mod_ts`` is a change
+      and passes through
+    - After a successful load, the hashes of the rows inside the new overlap
+      window (``max(replication_key) - overlap`` onwards) are persisted per
+      stream as a sorted array of unsigned 64-bit integers
+    - The next run looks every row up in that array (binary search) and drops
+      the hits before they reach the target
+
+The index is only replaced by ``commit``, so a failed load never hides rows
+from the next run.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Self
+
+from flext_core import FlextLogger, FlextTypes as t
+
+from gruponos_meltano_native.core.singer_proxy import chain_transforms
+
+if TYPE_CHECKING:
+    from gruponos_meltano_native.core.singer_proxy import RecordTransform
+    from gruponos_meltano_native.core.wms_extractor import WmsEntity
+
+logger = FlextLogger(__name__)
+
+DEFAULT_DEDUP_DIRECTORY: Final[Path] = Path(".meltano/dedup")
+DEFAULT_OVERLAP: Final[timedelta] = timedelta(minutes=30)
+_INDEX_MAGIC: Final[bytes] = b"GNOD"
+_INDEX_HEADER: Final[struct.Struct] = struct.Struct("<4sQ")
+# Candidates are pruned to the current window whenever they double
+_PRUNE_MIN: Final[int] = 65_536
+_UNSAFE_FILENAME: Final[re.Pattern[str]] = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def row_key_hash(
+    key_values: Iterable[t.GeneralValueType], replication_value: t.GeneralValueType
+) -> int:
+    """64-bit hash of a row's primary key values and replication key value."""
+    raw = "\x1f".join([*(str(value) for value in key_values), str(replication_value)])
+    digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class OverlapKeyIndex:
+    """Sorted array of 64-bit row hashes with binary-search lookup."""
+
+    __slots__ = ("_hashes",)
+
+    def __init__(self, hashes: Iterable[int] = ()) -> None:
+        """Build the index from ``hashes`` (deduplicated and sorted)."""
+        self._hashes = array("Q", sorted(set(hashes)))
+
+    def __contains__(self, value: object) -> bool:
+        """Whether ``value`` is one of the stored hashes."""
+        if not isinstance(value, int):
+            return False
+        hashes = self._hashes
+        pos = bisect_left(hashes, value)
+        return pos < len(hashes) and hashes[pos] == value
+
+    def __len__(self) -> int:
+        """Number of stored hashes."""
+        return len(self._hashes)
+
+    @classmethod
+    def load(cls, path: Path) -> Self:
+        """Read an index file; a missing or corrupt file is an empty index."""
+        index = cls()
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return index
+        if len(data) < _INDEX_HEADER.size:
+            return index
+        magic, count = _INDEX_HEADER.unpack_from(data)
+        body = data[_INDEX_HEADER.size :]
+        if magic != _INDEX_MAGIC or len(body) != count * 8:
+            logger.warning("Ignoring corrupt dedup index %s", path)
+            return index
+        hashes = array("Q")
+        hashes.frombytes(body)
+        if sys.byteorder != "little":
+            hashes.byteswap()
+        index._hashes = hashes
+        return index
+
+    def save(self, path: Path) -> None:
+        """Write the index atomically (little-endian)."""
+        hashes = array("Q", self._hashes)
+        if sys.byteorder != "little":
+            hashes.byteswap()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        header = _INDEX_HEADER.pack(_INDEX_MAGIC, len(hashes))
+        tmp.write_bytes(header + hashes.tobytes())
+        os.replace(tmp, path)
+
+
+@dataclass(frozen=True, slots=True)
+class StreamKeys:
+    """Primary key and replication key of a deduplicated stream."""
+
+    key_properties: tuple[str, ...]
+    replication_key: str
+
+
+@dataclass(slots=True)
+class OverlapDedupStats:
+    """Counters of a deduplication run."""
+
+    records: int = 0
+    dropped: int = 0
+    indexed: int = 0
+    dropped_per_stream: dict[str, int] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, t.GeneralValueType]:
+        """Counters as a plain dict (for pipeline metadata)."""
+        return {
+            "records": self.records,
+            "dropped": self.dropped,
+            "indexed": self.indexed,
+            "dropped_per_stream": dict(self.dropped_per_stream),
+        }
+
+
+@dataclass(slots=True)
+class _StreamWindow:
+    """Previous index and the candidates for the next one."""
+
+    previous: OverlapKeyIndex
+    candidates: list[tuple[str, int]] = field(default_factory=list)
+    max_value: str | None = None
+    prune_at: int = _PRUNE_MIN
+
+
+class GruponosOverlapDeduplicator:
+    """Drop rows already loaded by the previous run's overlap window.
+
+    Instances are ``RecordTransform`` callables for ``SingerProxyStage`` (as
+    its ``change_filter``, so quarantined rows never enter the index) and
+    ``GruponosWmsExtractor``; call ``commit`` once the target succeeded.
+
+    Example:
+        dedup = GruponosOverlapDeduplicator.for_entities(entities, overlap=...)
+        stage = SingerProxyStage(validators, change_filter=dedup)
+        if stage.run(tap.stdout, target.stdin).is_success:
+            dedup.commit()
+
+    Attributes:
+      directory: Directory of the per-stream index files.
+      streams: Key definition per stream; other streams pass through.
+      overlap: Length of the re-read window.
+      stats: Counters of the current run.
+
+    """
+
+    def __init__(
+        self,
+        streams: Mapping[str, StreamKeys],
+        *,
+        directory: Path = DEFAULT_DEDUP_DIRECTORY,
+        overlap: timedelta = DEFAULT_OVERLAP,
+    ) -> None:
+        """Initialize the deduplicator; indexes are loaded lazily per stream."""
+        self.streams = dict(streams)
+        self.directory = directory
+        self.overlap = overlap
+        self.stats = OverlapDedupStats()
+        self._windows: dict[str, _StreamWindow] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_entities(
+        cls,
+        entities: Sequence[WmsEntity],
+        *,
+        directory: Path = DEFAULT_DEDUP_DIRECTORY,
+        overlap: timedelta = DEFAULT_OVERLAP,
+    ) -> Self:
+        """Deduplicator for the incremental entities (key and replication key)."""
+        return cls(
+            {
+                entity.name: StreamKeys(entity.key_properties, entity.replication_key)
+                for entity in entities
+                if entity.key_properties and entity.replication_key
+            },
+            directory=directory,
+            overlap=overlap,
+        )
+
+    @staticmethod
+    def overlap_from_config(config: Mapping[str, t.GeneralValueType]) -> timedelta:
+        """Overlap window from ``incremental_overlap_minutes``."""
+        minutes = config.get("incremental_overlap_minutes")
+        if minutes in {None, ""}:
+            return DEFAULT_OVERLAP
+        return timedelta(minutes=float(str(minutes)))
+
+    def index_path(self, stream: str) -> Path:
+        """Index file of ``stream``."""
+        return self.directory / f"{_UNSAFE_FILENAME.sub('_', stream)}.idx"
+
+    def _window(self, stream: str) -> _StreamWindow:
+        window = self._windows.get(stream)
+        if window is None:
+            previous = OverlapKeyIndex.load(self.index_path(stream))
+            window = self._windows[stream] = _StreamWindow(previous)
+        return window
+
+    def __call__(
+        self, stream: str, record: dict[str, t.GeneralValueType]
+    ) -> dict[str, t.GeneralValueType] | None:
+        """Return ``record``, or None when the previous run loaded it unchanged."""
+        keys = self.streams.get(stream)
+        if keys is None:
+            return record
+        value = record.get(keys.replication_key)
+        if value is None:
+            return record
+        value = str(value)
+        digest = row_key_hash(
+            (record.get(name) for name in keys.key_properties), value
+        )
+        with self._lock:
+            self.stats.records += 1
+            window = self._window(stream)
+            window.candidates.append((value, digest))
+            if window.max_value is None or value > window.max_value:
+                window.max_value = value
+            if len(window.candidates) >= window.prune_at:
+                self._prune(window)
+            if digest in window.previous:
+                self.stats.dropped += 1
+                self.stats.dropped_per_stream[stream] = (
+                    self.stats.dropped_per_stream.get(stream, 0) + 1
+                )
+                return None
+        return record
+
+    def then(self, transform: RecordTransform | None) -> RecordTransform:
+        """Transform running deduplication first, then ``transform``."""
+        return chain_transforms(self, transform) or self
+
+    def _cutoff(self, max_value: str) -> str:
+        """Lowest replication value inside the overlap window."""
+        try:
+            latest = datetime.fromisoformat(max_value)
+        except ValueError:
+            # Not a timestamp: only the bookmark value itself is re-read
+            return max_value
+        return (latest - self.overlap).isoformat()
+
+    def _prune(self, window: _StreamWindow) -> None:
+        if window.max_value is not None:
+            cutoff = self._cutoff(window.max_value)
+            window.candidates = [c for c in window.candidates if c[0] >= cutoff]
+        window.prune_at = max(_PRUNE_MIN, 2 * len(window.candidates))
+
+    def commit(self) -> None:
+        """Persist the new overlap windows of the streams seen in this run."""
+        with self._lock:
+            for stream, window in self._windows.items():
+                if window.max_value is None:
+                    continue
+                self._prune(window)
+                index = OverlapKeyIndex(digest for _, digest in window.candidates)
+                index.save(self.index_path(stream))
+                self.stats.indexed += len(index)
+                window.previous = index
+                window.candidates = []
+                window.max_value = None
+        logger.info(
+            "Overlap dedup dropped %s of %s records; %s keys indexed",
+            self.stats.dropped,
+            self.stats.records,
+            self.stats.indexed,
+        )
+
+
+__all__: list[str] = [
+    "DEFAULT_DEDUP_DIRECTORY",
+    "DEFAULT_OVERLAP",
+    "GruponosOverlapDeduplicator",
+    "OverlapDedupStats",
+    "OverlapKeyIndex",
+    "StreamKeys",
+    "row_key_hash",
+]
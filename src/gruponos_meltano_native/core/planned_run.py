@@ -0,0 +1,168 @@
+"""Planned run: each entity synced in full or incrementally, whichever is cheaper.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from datetime import UTC, datetime
+
+from flext_core import FlextResult, FlextTypes as t
+
+from gruponos_meltano_native.core.native_run import GruponosNativeRun
+from gruponos_meltano_native.core.run_context import (
+    GruponosRunContext,
+    PipelineResult,
+    build_pipeline_result,
+)
+from gruponos_meltano_native.core.shadow_run import GruponosShadowRun
+from gruponos_meltano_native.core.sync_planner import (
+    GruponosSyncPlanner,
+    LoadCostModel,
+    SyncMode,
+)
+from gruponos_meltano_native.core.wms_extractor import (
+    GruponosWmsExtractor,
+    WmsEntity,
+    WmsExtractorConfig,
+)
+from gruponos_meltano_native.monitoring.run_ledger import (
+    create_gruponos_meltano_run_ledger,
+)
+
+
+def _records_loaded(run: PipelineResult, entity: str) -> int | None:
+    """Rows ``run`` loaded for ``entity`` (shadow or native metadata)."""
+    swap = run.metadata.get("shadow_swap")
+    if isinstance(swap, dict):
+        report = swap.get(entity)
+        return report.get("records_loaded") if isinstance(report, dict) else None
+    stats = run.metadata.get("wms_extraction")
+    if not isinstance(stats, dict):
+        return None
+    return stats.get("records_per_entity", {}).get(entity)
+
+
+class GruponosPlannedRun:
+    """Plan full or incremental per entity and run both groups.
+
+    Full entities are reloaded with the shadow full sync, so the append-only
+    full loader never writes into a table that still holds the old rows.
+
+    Example:
+        result = GruponosPlannedRun(context).run(entities)
+
+    """
+
+    def __init__(
+        self,
+        context: GruponosRunContext,
+        native: GruponosNativeRun | None = None,
+    ) -> None:
+        """Initialize the strategy; both groups load through ``native``."""
+        self.context = context
+        self.native = native or GruponosNativeRun(context)
+
+    def run(
+        self,
+        entities: Sequence[WmsEntity],
+        *,
+        full_loader: str = "target-oracle-full",
+        incremental_loader: str = "target-oracle-incremental",
+        extractor_config: Mapping[str, t.GeneralValueType] | None = None,
+        cost_model: LoadCostModel | None = None,
+    ) -> FlextResult[PipelineResult]:
+        """Sync ``entities``, each in the cheaper of full or incremental mode.
+
+        ``GruponosSyncPlanner`` probes the delta since each bookmark and the
+        table size, and predicts both load costs (``planner_*`` config keys
+        or ``cost_model``); entities planned as full are reloaded into shadow
+        tables through ``full_loader`` and swapped in (``GruponosShadowRun``,
+        needs ``oracle_schema``), the rest run incrementally through
+        ``incremental_loader``. Both share the incremental state id, so a
+        full reload also moves the bookmark. Plans go to
+        ``metadata["sync_plan"]`` and, with the loaded counts, to the run
+        ledger, where they serve as estimates when a probe fails.
+
+        Args:
+            entities: Entities to sync.
+            full_loader: Meltano loader appending into the shadow tables.
+            incremental_loader: Meltano loader upserting the delta.
+            extractor_config: Tap-style config (defaults to the settings).
+            cost_model: Cost model override.
+
+        Returns:
+            FlextResult[PipelineResult]: Result with the plan and both runs.
+
+        """
+        context = self.context
+        start_time = datetime.now(tz=UTC)
+        raw_config = context.extractor_config(extractor_config)
+        try:
+            full_name = context.validate_job_name(full_loader)
+            incremental_name = context.validate_job_name(incremental_loader)
+            config = WmsExtractorConfig.from_mapping(raw_config)
+            model = cost_model or LoadCostModel.from_config(raw_config)
+        except ValueError as e:
+            return FlextResult.fail(str(e))
+
+        state_job = f"wms-native-{incremental_name}"
+        snapshot = context.state_store().snapshot(state_job)
+        with GruponosWmsExtractor(
+            config, limiter=context.rate_limiter(raw_config)
+        ) as extractor:
+            planner = GruponosSyncPlanner(
+                extractor.count_rows,
+                cost_model=model,
+                ledger=create_gruponos_meltano_run_ledger(context.settings),
+                job_name=state_job,
+            )
+            plans = planner.plan(entities, snapshot.singer_state())
+        modes = {plan.entity: plan.mode for plan in plans}
+
+        runs: dict[str, PipelineResult] = {}
+        for mode in (SyncMode.FULL, SyncMode.INCREMENTAL):
+            selected = [e for e in entities if modes[e.name] is mode]
+            if not selected:
+                continue
+            if mode is SyncMode.FULL:
+                result = GruponosShadowRun(context, self.native).run(
+                    selected,
+                    loader=full_name,
+                    extractor_config=raw_config,
+                    state_job=state_job,
+                )
+            else:
+                result = self.native.run(
+                    incremental_name,
+                    selected,
+                    extractor_config=raw_config,
+                    state_job=state_job,
+                )
+            if result.is_failure:
+                return FlextResult.fail(f"{mode} sync failed: {result.error}")
+            runs[mode] = result.value
+
+        run_id = f"wms-planned-{start_time.isoformat()}"
+        for plan in plans:
+            planner.record(
+                plan,
+                run_id=run_id,
+                records_loaded=_records_loaded(runs[plan.mode], plan.entity),
+            )
+
+        pipeline_result = build_pipeline_result(
+            f"wms-planned-{incremental_name}",
+            start_time,
+            records_extracted=sum(r.records_extracted for r in runs.values()),
+            records_loaded=sum(r.records_loaded for r in runs.values()),
+        )
+        pipeline_result.metadata["sync_plan"] = [plan.as_dict() for plan in plans]
+        pipeline_result.metadata["runs"] = {
+            str(mode): run.metadata for mode, run in runs.items()
+        }
+        return FlextResult.ok(pipeline_result)
+
+
+__all__: list[str] = ["GruponosPlannedRun"]
@@ -0,0 +1,245 @@
+"""Proxied run: Meltano tap and target with the Singer proxy stage between.
+
+The tap's stdout is read by a ``SingerProxyStage`` (validation, conversion,
+quarantine, quality) and forwarded to the target's stdin, so no mapper plugin
+is involved. Both processes are reaped on every path and their stderr tails
+end up in failure messages. Bookmarks live in the embedded state store like
+those of native runs: the tap starts from them (``--state``) and every STATE
+the target echoes is checkpointed.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import deque
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Final
+
+from flext_core import FlextLogger, FlextResult
+
+from gruponos_meltano_native.core.external_command import ExternalProcess
+from gruponos_meltano_native.core.run_context import (
+    MELTANO_NOT_FOUND,
+    GruponosRunContext,
+    PipelineConfiguration,
+    PipelineResult,
+    build_pipeline_result,
+    commit_change_filters,
+    stderr_suffix,
+)
+from gruponos_meltano_native.core.spill_buffer import SpillBufferWriter
+from gruponos_meltano_native.core.state_store import (
+    DEFAULT_STATE_PATH,
+    StateCheckpointer,
+)
+
+if TYPE_CHECKING:
+    from gruponos_meltano_native.core.overlap_dedup import (
+        GruponosOverlapDeduplicator,
+    )
+    from gruponos_meltano_native.core.row_hash import GruponosRowHashFilter
+    from gruponos_meltano_native.core.singer_proxy import SingerProxyStage
+    from gruponos_meltano_native.core.spill_buffer import SpillBuffer
+
+logger = FlextLogger(__name__)
+
+# State files handed to taps, next to the state store
+STATE_FILE_DIR: Final = DEFAULT_STATE_PATH.parent / "proxied"
+
+
+class GruponosProxiedRun:
+    """Run a Meltano extractor and loader with a proxy stage between them.
+
+    Example:
+        result = GruponosProxiedRun(context).run(
+            "tap-oracle-wms-full", "target-oracle-full", stage
+        )
+
+    """
+
+    def __init__(self, context: GruponosRunContext) -> None:
+        """Initialize the strategy on the orchestrator's shared ``context``."""
+        self.context = context
+
+    def run(
+        self,
+        extractor: str,
+        loader: str,
+        stage: SingerProxyStage,
+        buffer: SpillBuffer | None = None,
+        dedup: GruponosOverlapDeduplicator | None = None,
+        row_hashes: GruponosRowHashFilter | None = None,
+        state_job: str | None = None,
+        configuration: PipelineConfiguration | None = None,
+    ) -> FlextResult[PipelineResult]:
+        """Run ``extractor`` into ``loader`` through ``stage``.
+
+        Proxy counters go to ``metadata["proxy_stage"]`` and the last STATE
+        emitted by the target to ``metadata["last_state"]``. The stage's
+        quality accumulators fill the quality scores.
+
+        The tap gets the job's stored bookmarks as ``--state`` and every
+        STATE the target echoes is checkpointed into the state store with
+        compare-and-swap, so a retry after a failure resumes from the last
+        loaded bookmark; counters go to ``metadata["state_store"]``.
+
+        With ``buffer``, output for the target is queued in a spill-to-disk
+        buffer drained by its own thread, so a slow target does not stall
+        extraction; buffer metrics go to ``metadata["spill_buffer"]``.
+
+        Args:
+            extractor: Meltano extractor name (e.g. ``tap-oracle-wms-full``).
+            loader: Meltano loader name (e.g. ``target-oracle-full``).
+            stage: Configured proxy stage; ``dedup`` and ``row_hashes`` run
+                in a copy of it, so the caller's stage is not modified.
+                They only see the records the stage forwards.
+            buffer: Optional backpressure buffer between stage and target.
+            dedup: Overlap-window deduplicator run after validation; its
+                index is committed only when the run succeeds.
+            row_hashes: Row-hash filter skipping rows whose business fields
+                did not change; hashes are committed only on success.
+            state_job: Job id in the state store (defaults to
+                ``proxied-<extractor>-<loader>``).
+            configuration: Pipeline configuration with the quality checks
+                switch and threshold (model defaults when omitted).
+
+        Returns:
+            FlextResult[PipelineResult]: Result with proxy statistics.
+
+        """
+        context = self.context
+        start_time = datetime.now(tz=UTC)
+        try:
+            extractor_name = context.validate_job_name(extractor)
+            loader_name = context.validate_job_name(loader)
+        except ValueError as e:
+            return FlextResult.fail(str(e))
+
+        job_name = f"{extractor_name}-{loader_name}"
+        store = context.state_store()
+        snapshot = store.snapshot(state_job or f"proxied-{job_name}")
+        checkpointer = StateCheckpointer(store, snapshot.job, None, snapshot.versions)
+        tap_command = ["meltano", "invoke", extractor_name]
+        if snapshot.bookmarks:
+            state_file = context.project_root / STATE_FILE_DIR / f"{snapshot.job}.json"
+            try:
+                state_file.parent.mkdir(parents=True, exist_ok=True)
+                state_file.write_text(
+                    json.dumps(snapshot.singer_state()), encoding="utf-8"
+                )
+            except OSError as e:
+                return FlextResult.fail(f"State file write failed: {e}")
+            tap_command += ["--state", str(state_file)]
+
+        env = context.environment()
+        logger.info("Starting proxied run: %s -> %s", extractor_name, loader_name)
+        timeout = context.timeout
+        try:
+            tap = ExternalProcess(
+                tap_command,
+                env=env,
+                cwd=context.project_root,
+            )
+        except FileNotFoundError:
+            return FlextResult.fail(MELTANO_NOT_FOUND)
+        try:
+            target = ExternalProcess(
+                ["meltano", "invoke", loader_name],
+                env=env,
+                cwd=context.project_root,
+                stdin=True,
+            )
+        except FileNotFoundError:
+            tap.close()
+            return FlextResult.fail(MELTANO_NOT_FOUND)
+
+        # Drain the target's STATE output concurrently so it never blocks;
+        # what it echoes is loaded, so it is checkpointed right away
+        last_state: deque[bytes] = deque(maxlen=1)
+
+        def drain_state() -> None:
+            for line in target.stdout:
+                if line.startswith(b"{"):
+                    last_state.append(line)
+                    checkpointer.consume((line,))
+
+        drain = threading.Thread(target=drain_state, daemon=True)
+        drain.start()
+        # Overlap filters apply to this run only; the caller's stage is kept
+        run_stage = stage.with_change_filters(dedup, row_hashes)
+        try:
+            writer = (
+                SpillBufferWriter(target.stdin, buffer) if buffer is not None else None
+            )
+            proxy_result = run_stage.run(tap.stdout, writer or target.stdin)
+            if proxy_result.is_failure:
+                tap.kill()
+            buffer_result = writer.close() if writer is not None else None
+            target.close_stdin()
+            tap_code = tap.wait(timeout)
+            target_code = target.wait(timeout)
+        except Exception as e:
+            unexpected_error = f"Unexpected error during proxied run: {e}"
+            logger.exception(unexpected_error)
+            return FlextResult.fail(unexpected_error)
+        finally:
+            tap.close()
+            target.close()
+            drain.join()
+            # Quarantined records must be readable (list, replay) once we return
+            if run_stage.quarantine is not None:
+                run_stage.quarantine.flush()
+
+        if tap_code is None or target_code is None:
+            return FlextResult.fail(
+                f"Proxied run timed out: {extractor_name} -> {loader_name} "
+                f"killed after {timeout}s"
+                f"{stderr_suffix(tap if tap_code is None else target)}"
+            )
+        if proxy_result.is_failure:
+            return FlextResult.fail(proxy_result.error)
+        if buffer_result is not None and buffer_result.is_failure:
+            return FlextResult.fail(buffer_result.error)
+        if tap_code != 0 or target_code != 0:
+            failed = tap if tap_code != 0 else target
+            return FlextResult.fail(
+                f"Proxied run failed: {extractor_name} exited with {tap_code}, "
+                f"{loader_name} exited with {target_code}{stderr_suffix(failed)}"
+            )
+
+        stats = proxy_result.value
+        pipeline_result = build_pipeline_result(
+            job_name,
+            start_time,
+            records_extracted=stats.records,
+            records_loaded=stats.records_forwarded,
+            records_failed=stats.records_invalid,
+            pipeline_id=f"proxied-{job_name}-{start_time.isoformat()}",
+        )
+        pipeline_result.metadata["proxy_stage"] = stats.as_dict()
+        commit_change_filters(pipeline_result, dedup, row_hashes)
+        if buffer_result is not None:
+            pipeline_result.metadata["spill_buffer"] = buffer_result.value.as_dict()
+        if last_state:
+            pipeline_result.metadata["last_state"] = last_state[0].decode().strip()
+        pipeline_result.metadata["state_store"] = checkpointer.as_dict()
+        logger.info(
+            "Proxied run completed: %s/%s records forwarded, %.1f us/record",
+            stats.records_forwarded,
+            stats.records,
+            stats.overhead_per_record_us,
+        )
+        profiles = {
+            stream: validator.profiler
+            for stream, validator in run_stage.validators.items()
+            if validator.profiler is not None
+        }
+        return context.finish(
+            pipeline_result, run_stage.quality, profiles, configuration
+        )
+
+
+__all__: list[str] = ["GruponosProxiedRun"]
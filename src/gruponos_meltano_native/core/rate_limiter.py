@@ -0,0 +1,394 @@
+"""Adaptive rate limiting for WMS API calls.
+
+A fixed ``max_parallel_pages`` is either throttled by the WMS (HTTP 429/503)
+or leaves capacity unused. This module probes for the sustainable rate
+instead:
+
+    - Each budget (per host, per facility) is a token bucket for the request
+      rate plus a concurrency window
+    - Both grow additively on healthy responses and shrink multiplicatively
+      on throttling, server errors, an error rate above threshold or latency
+      inflation (AIMD): the smoothed latency (EWMA) must exceed both an
+      absolute floor and ``latency_tolerance`` x the median of the recent
+      samples, so ordinary jitter never counts and the baseline follows
+      the server as it recovers
+    - ``Retry-After`` pauses every caller of the budget until it expires
+    - Per-budget metrics (current/peak rate, ceiling where throttling began,
+      waits, decreases) are exported for the run
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from types import TracebackType
+from typing import Final, Self
+from urllib.parse import urlsplit
+
+from flext_core import FlextLogger, FlextTypes as t
+
+logger = FlextLogger(__name__)
+
+_THROTTLE_STATUSES: Final[frozenset[int]] = frozenset({429, 503})
+_SERVER_ERROR: Final[int] = 500
+_MAX_RETRY_AFTER_SECONDS: Final[float] = 300.0
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        seconds = (when - datetime.now(UTC)).total_seconds()
+    return min(max(seconds, 0.0), _MAX_RETRY_AFTER_SECONDS)
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitPolicy:
+    """Bounds and AIMD parameters of an adaptive budget."""
+
+    initial_rate: float = 5.0
+    min_rate: float = 0.5
+    max_rate: float = 50.0
+    rate_increase: float = 1.0
+    burst: float = 5.0
+    initial_concurrency: float = 2.0
+    min_concurrency: float = 1.0
+    max_concurrency: float = 16.0
+    concurrency_increase: float = 1.0
+    decrease_factor: float = 0.5
+    latency_tolerance: float = 2.0
+    latency_smoothing: float = 0.2
+    latency_window: int = 50
+    latency_min_samples: int = 20
+    latency_floor_seconds: float = 0.25
+    error_rate_threshold: float = 0.2
+    error_window: int = 20
+    cooldown_seconds: float = 1.0
+
+
+@dataclass(slots=True)
+class BudgetMetrics:
+    """Counters of one adaptive budget."""
+
+    requests: int = 0
+    successes: int = 0
+    throttled: int = 0
+    errors: int = 0
+    increases: int = 0
+    decreases: int = 0
+    wait_seconds: float = 0.0
+    retry_after_seconds: float = 0.0
+    peak_rate: float = 0.0
+    ceiling_rate: float | None = None
+    peak_in_flight: int = 0
+
+
+class AdaptiveBudget:
+    """Token bucket plus AIMD concurrency window for one key.
+
+    Attributes:
+      name: Budget key (e.g. ``host:wms.example.com``).
+      policy: Bounds and AIMD parameters.
+      rate: Current request rate (requests/second).
+      limit: Current concurrency limit.
+      metrics: Counters for the run.
+
+    """
+
+    def __init__(self, name: str, policy: RateLimitPolicy) -> None:
+        """Initialize the budget at the policy's initial rate and window."""
+        self.name = name
+        self.policy = policy
+        self.rate = policy.initial_rate
+        self.limit = policy.initial_concurrency
+        self.in_flight = 0
+        self.metrics = BudgetMetrics(peak_rate=self.rate)
+        self._tokens = min(policy.burst, max(1.0, self.rate))
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._smoothed_latency: float | None = None
+        self._latencies: deque[float] = deque(maxlen=policy.latency_window)
+        self._outcomes: deque[bool] = deque(maxlen=policy.error_window)
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self.policy.burst, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def _wait_time(self, now: float) -> float:
+        """Seconds until a request may start (0 when it may start now)."""
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.in_flight >= max(1, int(self.limit)):
+            return -1.0  # woken by release
+        self._refill(now)
+        if self._tokens < 1.0:
+            return (1.0 - self._tokens) / self.rate
+        return 0.0
+
+    def acquire(self) -> float:
+        """Block until a request may start; returns the seconds waited."""
+        started = time.monotonic()
+        with self._cond:
+            while (wait := self._wait_time(time.monotonic())) != 0.0:
+                self._cond.wait(None if wait < 0 else wait)
+            self._tokens -= 1.0
+            self.in_flight += 1
+            waited = time.monotonic() - started
+            self.metrics.requests += 1
+            self.metrics.wait_seconds += waited
+            self.metrics.peak_in_flight = max(
+                self.metrics.peak_in_flight, self.in_flight
+            )
+        return waited
+
+    def release(
+        self,
+        *,
+        latency: float,
+        status: int | None,
+        retry_after: float | None = None,
+    ) -> None:
+        """Feed back the outcome of a request started with ``acquire``.
+
+        Args:
+            latency: Seconds until the response (headers) arrived.
+            status: HTTP status, or None for connection errors/timeouts.
+            retry_after: Parsed ``Retry-After`` seconds, if sent.
+
+        """
+        now = time.monotonic()
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            throttled = status in _THROTTLE_STATUSES
+            failed = status is None or status >= _SERVER_ERROR
+            self._outcomes.append(failed)
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+                self.metrics.retry_after_seconds += retry_after
+            if throttled:
+                self.metrics.throttled += 1
+            elif failed:
+                self.metrics.errors += 1
+            else:
+                self.metrics.successes += 1
+            congested = not failed and self._latency_inflated(latency)
+            error_rate = sum(self._outcomes) / len(self._outcomes)
+            if throttled or congested or (
+                failed and error_rate > self.policy.error_rate_threshold
+            ):
+                self._decrease(now)
+            elif not failed:
+                self._increase()
+            self._cond.notify_all()
+
+    def _latency_inflated(self, latency: float) -> bool:
+        policy = self.policy
+        smoothed = self._smoothed_latency
+        smoothed = (
+            latency
+            if smoothed is None
+            else smoothed + (latency - smoothed) * policy.latency_smoothing
+        )
+        self._smoothed_latency = smoothed
+        samples = self._latencies
+        # The baseline is the median of the samples before this one, so it
+        # follows the server back down after a congestion episode
+        inflated = (
+            len(samples) >= policy.latency_min_samples
+            and smoothed > policy.latency_floor_seconds
+            and smoothed > statistics.median(samples) * policy.latency_tolerance
+        )
+        samples.append(latency)
+        return inflated
+
+    def _increase(self) -> None:
+        policy = self.policy
+        self.limit = min(
+            policy.max_concurrency,
+            self.limit + policy.concurrency_increase / max(self.limit, 1.0),
+        )
+        self.rate = min(
+            policy.max_rate, self.rate + policy.rate_increase / max(self.rate, 1.0)
+        )
+        self.metrics.increases += 1
+        self.metrics.peak_rate = max(self.metrics.peak_rate, self.rate)
+
+    def _decrease(self, now: float) -> None:
+        # One congestion event usually produces several signals at once
+        if now - self._last_decrease < self.policy.cooldown_seconds:
+            return
+        policy = self.policy
+        self.metrics.ceiling_rate = self.rate
+        self.limit = max(policy.min_concurrency, self.limit * policy.decrease_factor)
+        self.rate = max(policy.min_rate, self.rate * policy.decrease_factor)
+        self._tokens = min(self._tokens, 0.0)
+        self._last_decrease = now
+        self.metrics.decreases += 1
+        logger.info(
+            "Rate limit %s decreased to %.2f req/s, %d in flight",
+            self.name,
+            self.rate,
+            int(self.limit),
+        )
+
+    def snapshot(self) -> dict[str, t.GeneralValueType]:
+        """Current state and counters as a plain dict."""
+        with self._cond:
+            metrics = self.metrics
+            return {
+                "rate": round(self.rate, 3),
+                "concurrency_limit": int(self.limit),
+                "requests": metrics.requests,
+                "successes": metrics.successes,
+                "throttled": metrics.throttled,
+                "errors": metrics.errors,
+                "increases": metrics.increases,
+                "decreases": metrics.decreases,
+                "wait_seconds": round(metrics.wait_seconds, 6),
+                "retry_after_seconds": round(metrics.retry_after_seconds, 3),
+                "peak_rate": round(metrics.peak_rate, 3),
+                "ceiling_rate": round(metrics.ceiling_rate, 3)
+                if metrics.ceiling_rate is not None
+                else None,
+                "peak_in_flight": metrics.peak_in_flight,
+            }
+
+
+@dataclass(slots=True)
+class RatePermit:
+    """Permission to send one request, held on one or more budgets."""
+
+    budgets: tuple[AdaptiveBudget, ...]
+    started: float = field(default_factory=time.monotonic)
+    released: bool = False
+
+    def release(self, status: int | None, retry_after: float | None = None) -> None:
+        """Report the outcome to every budget (idempotent)."""
+        if self.released:
+            return
+        self.released = True
+        latency = time.monotonic() - self.started
+        for budget in reversed(self.budgets):
+            budget.release(latency=latency, status=status, retry_after=retry_after)
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Release as a failed request when the outcome was not reported."""
+        self.release(None)
+
+
+class GruponosAdaptiveRateLimiter:
+    """Registry of adaptive budgets per host and per facility.
+
+    A request acquires its host budget, then its facility budget (always in
+    that order), so facilities on one WMS host share the host's capacity.
+
+    Example:
+        limiter = GruponosAdaptiveRateLimiter(RateLimitPolicy(max_rate=20))
+        permit = limiter.acquire(url, "FAC1")
+        response = session.get(url)
+        permit.release(response.status_code, parse_retry_after(...))
+
+    """
+
+    def __init__(
+        self,
+        policy: RateLimitPolicy | None = None,
+        *,
+        facility_policy: RateLimitPolicy | None = None,
+    ) -> None:
+        """Initialize with the host policy (and an optional facility policy)."""
+        self.policy = policy or RateLimitPolicy()
+        self.facility_policy = facility_policy or self.policy
+        self._budgets: dict[str, AdaptiveBudget] = {}
+        self._lock = threading.Lock()
+
+    def budget(self, key: str) -> AdaptiveBudget:
+        """Budget for ``host:<netloc>`` or ``facility:<code>`` keys."""
+        with self._lock:
+            budget = self._budgets.get(key)
+            if budget is None:
+                policy = (
+                    self.facility_policy
+                    if key.startswith("facility:")
+                    else self.policy
+                )
+                budget = self._budgets[key] = AdaptiveBudget(key, policy)
+            return budget
+
+    def acquire(self, url: str, facility: str | None = None) -> RatePermit:
+        """Wait for the host (and facility) budget of ``url``."""
+        budgets = [self.budget(f"host:{urlsplit(url).netloc}")]
+        if facility:
+            budgets.append(self.budget(f"facility:{facility}"))
+        for budget in budgets:
+            budget.acquire()
+        return RatePermit(tuple(budgets))
+
+    def metrics(self) -> dict[str, dict[str, t.GeneralValueType]]:
+        """Snapshot of every budget."""
+        with self._lock:
+            budgets = list(self._budgets.values())
+        return {budget.name: budget.snapshot() for budget in budgets}
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, t.GeneralValueType]) -> Self | None:
+        """Limiter from tap settings, or None when ``adaptive_rate_limit`` is off."""
+        enabled = config.get("adaptive_rate_limit", False)
+        if isinstance(enabled, str):
+            enabled = enabled.strip().lower() in {"1", "true", "yes", "on"}
+        if not enabled:
+            return None
+        defaults = RateLimitPolicy()
+        max_rate = float(config.get("max_requests_per_second") or defaults.max_rate)
+        max_concurrency = float(
+            config.get("max_parallel_pages") or defaults.max_concurrency
+        )
+        return cls(
+            RateLimitPolicy(
+                max_rate=max_rate,
+                initial_rate=min(defaults.initial_rate, max_rate),
+                max_concurrency=max_concurrency,
+                initial_concurrency=min(defaults.initial_concurrency, max_concurrency),
+            )
+        )
+
+
+__all__: list[str] = [
+    "AdaptiveBudget",
+    "BudgetMetrics",
+    "GruponosAdaptiveRateLimiter",
+    "RateLimitPolicy",
+    "RatePermit",
+    "parse_retry_after",
+]
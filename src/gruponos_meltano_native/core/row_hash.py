@@ -0,0 +1,295 @@
+"""Row-hash change detection to skip no-op upserts.
+
+WMS entities are often re-emitted with a new ``mod_ts`` although no business
+field changed; each of those rows still costs a MERGE (and its redo) in
+Oracle. This stage keeps a side table of the last loaded row hash per primary
+key and only lets changed rows through to the target:
+
+    - The hash is blake2b over the canonical JSON of the business fields
+      (sorted keys, audit fields such as the replication key excluded), so
+      field order and ``mod_ts`` churn do not count as changes
+    - The side table is a SQLite file (one table, keyed by stream and primary
+      key, ``WITHOUT ROWID``) so lookups stay indexed at millions of rows
+    - New hashes are kept pending and written in one transaction by
+      ``commit``, after the target succeeded, so a failed load never marks
+      rows as loaded
+    - Skip ratio is reported per stream
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Self
+
+from flext_core import FlextLogger, FlextTypes as t
+
+from gruponos_meltano_native.core.overlap_dedup import StreamKeys
+
+if TYPE_CHECKING:
+    from gruponos_meltano_native.core.wms_extractor import WmsEntity
+
+logger = FlextLogger(__name__)
+
+DEFAULT_ROW_HASH_PATH: Final[Path] = Path(".meltano/row_hashes.sqlite")
+# LGF audit columns that change without a business change
+DEFAULT_IGNORED_FIELDS: Final[frozenset[str]] = frozenset({
+    "mod_ts",
+    "mod_user",
+    "create_ts",
+    "create_user",
+})
+_SINGER_METADATA_PREFIX: Final[str] = "_sdc_"
+# Built once: ``json.dumps`` with options creates an encoder per call. Always
+# stdlib json (not orjson), so stored hashes do not depend on the backend
+_CANONICAL: Final[json.JSONEncoder] = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+)
+_COMPACT: Final[json.JSONEncoder] = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, default=str
+)
+_SCHEMA: Final[str] = """
+CREATE TABLE IF NOT EXISTS row_hash (
+    stream TEXT NOT NULL,
+    pk TEXT NOT NULL,
+    hash BLOB NOT NULL,
+    PRIMARY KEY (stream, pk)
+) WITHOUT ROWID
+"""
+
+
+def canonical_row_hash(
+    record: Mapping[str, t.GeneralValueType], ignored: frozenset[str] = frozenset()
+) -> bytes:
+    """128-bit blake2b of the record's business fields in canonical form."""
+    business = {
+        name: value
+        for name, value in record.items()
+        if name not in ignored and not name.startswith(_SINGER_METADATA_PREFIX)
+    }
+    raw = _CANONICAL.encode(business)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+
+def primary_key_text(
+    record: Mapping[str, t.GeneralValueType], key_properties: Sequence[str]
+) -> str:
+    """Primary key values of ``record`` as a compact JSON array."""
+    return _COMPACT.encode([record.get(name) for name in key_properties])
+
+
+@dataclass(slots=True)
+class RowHashStreamStats:
+    """Change counts of one stream."""
+
+    new: int = 0
+    changed: int = 0
+    unchanged: int = 0
+
+    @property
+    def skip_ratio(self) -> float:
+        """Share of rows skipped as unchanged."""
+        total = self.new + self.changed + self.unchanged
+        return self.unchanged / total if total else 0.0
+
+
+@dataclass(slots=True)
+class RowHashStats:
+    """Change counts of a run, per stream."""
+
+    streams: dict[str, RowHashStreamStats] = field(default_factory=dict)
+    committed: int = 0
+
+    @property
+    def skipped(self) -> int:
+        """Rows skipped in all streams."""
+        return sum(s.unchanged for s in self.streams.values())
+
+    def as_dict(self) -> dict[str, t.GeneralValueType]:
+        """Counters and skip ratios as a plain dict (for pipeline metadata)."""
+        total = sum(s.new + s.changed + s.unchanged for s in self.streams.values())
+        return {
+            "records": total,
+            "skipped": self.skipped,
+            "skip_ratio": round(self.skipped / total, 4) if total else 0.0,
+            "committed": self.committed,
+            "streams": {
+                name: {
+                    "new": s.new,
+                    "changed": s.changed,
+                    "unchanged": s.unchanged,
+                    "skip_ratio": round(s.skip_ratio, 4),
+                }
+                for name, s in self.streams.items()
+            },
+        }
+
+
+class GruponosRowHashFilter:
+    """Drop rows whose business fields equal the last loaded version.
+
+    Instances are ``RecordTransform`` callables for ``SingerProxyStage`` (as
+    its ``change_filter``, so quarantined rows are never hashed) and
+    ``GruponosWmsExtractor``; call ``commit`` once the target succeeded.
+    After a table is truncated or recreated outside the pipeline, ``reset``
+    its stream so every row is loaded again.
+
+    Example:
+        row_hashes = GruponosRowHashFilter.for_entities(entities)
+        stage = SingerProxyStage(validators, change_filter=row_hashes)
+        if stage.run(tap.stdout, target.stdin).is_success:
+            row_hashes.commit()
+
+    Attributes:
+      path: SQLite side table file.
+      streams: Key definition per stream; other streams pass through.
+      ignored_fields: Fields left out of the hash (plus the replication key).
+      stats: Counters of the current run.
+
+    """
+
+    def __init__(
+        self,
+        streams: Mapping[str, StreamKeys],
+        *,
+        path: Path = DEFAULT_ROW_HASH_PATH,
+        ignored_fields: Iterable[str] = DEFAULT_IGNORED_FIELDS,
+    ) -> None:
+        """Open (or create) the side table at ``path``."""
+        self.streams = dict(streams)
+        self.path = path
+        self.ignored_fields = frozenset(ignored_fields)
+        self.stats = RowHashStats()
+        self._ignored = {
+            name: self.ignored_fields | {keys.replication_key}
+            for name, keys in self.streams.items()
+        }
+        self._pending: dict[tuple[str, str], bytes] = {}
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Called from the proxy writer or extractor thread; guarded by _lock
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+
+    @classmethod
+    def for_entities(
+        cls,
+        entities: Sequence[WmsEntity],
+        *,
+        path: Path = DEFAULT_ROW_HASH_PATH,
+        ignored_fields: Iterable[str] = DEFAULT_IGNORED_FIELDS,
+    ) -> Self:
+        """Filter for the entities that have a primary key."""
+        return cls(
+            {
+                entity.name: StreamKeys(
+                    entity.key_properties, entity.replication_key or ""
+                )
+                for entity in entities
+                if entity.key_properties
+            },
+            path=path,
+            ignored_fields=ignored_fields,
+        )
+
+    def __call__(
+        self, stream: str, record: dict[str, t.GeneralValueType]
+    ) -> dict[str, t.GeneralValueType] | None:
+        """Return ``record`` when new or changed, None when unchanged."""
+        keys = self.streams.get(stream)
+        if keys is None:
+            return record
+        pk = primary_key_text(record, keys.key_properties)
+        digest = canonical_row_hash(record, self._ignored[stream])
+        with self._lock:
+            counts = self.stats.streams.get(stream)
+            if counts is None:
+                counts = self.stats.streams[stream] = RowHashStreamStats()
+            pending = self._pending.get((stream, pk))
+            if pending is not None:
+                stored: bytes | None = pending
+            else:
+                row = self._db.execute(
+                    "SELECT hash FROM row_hash WHERE stream = ? AND pk = ?",
+                    (stream, pk),
+                ).fetchone()
+                stored = row[0] if row is not None else None
+            if stored == digest:
+                counts.unchanged += 1
+                return None
+            if stored is None:
+                counts.new += 1
+            else:
+                counts.changed += 1
+            self._pending[stream, pk] = digest
+        return record
+
+    def commit(self) -> None:
+        """Store the hashes of the rows forwarded in this run."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO row_hash (stream, pk, hash) "
+                    "VALUES (?, ?, ?)",
+                    ((stream, pk, digest) for (stream, pk), digest in pending.items()),
+                )
+            self.stats.committed += len(pending)
+        logger.info(
+            "Row hash filter skipped %s unchanged rows; %s hashes stored",
+            self.stats.skipped,
+            len(pending),
+        )
+
+    def discard(self) -> None:
+        """Forget the pending hashes (the load failed)."""
+        with self._lock:
+            self._pending.clear()
+
+    def reset(self, stream: str) -> None:
+        """Forget every stored hash of ``stream`` (e.g. after a full reload)."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM row_hash WHERE stream = ?", (stream,))
+
+    def stored_count(self, stream: str) -> int:
+        """Number of primary keys with a stored hash."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT COUNT(*) FROM row_hash WHERE stream = ?", (stream,)
+            ).fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        """Close the side table (pending hashes are discarded)."""
+        with self._lock:
+            self._pending.clear()
+            self._db.close()
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Context manager exit: close the side table."""
+        self.close()
+
+
+__all__: list[str] = [
+    "DEFAULT_IGNORED_FIELDS",
+    "DEFAULT_ROW_HASH_PATH",
+    "GruponosRowHashFilter",
+    "RowHashStats",
+    "RowHashStreamStats",
+    "canonical_row_hash",
+    "primary_key_text",
+]
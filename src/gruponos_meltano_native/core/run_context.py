@@ -0,0 +1,285 @@
+"""Shared services and result building for the run strategies.
+
+Each way of loading WMS data lives in its own strategy module under ``core``:
+
+    - ``native_run``: in-package WMS engine straight into a Meltano loader
+    - ``proxied_run``: Meltano tap and target with the Singer proxy between
+    - ``backfill_run``, ``matrix_run``: native runs fanned out over time
+      windows or facilities
+    - ``shadow_run``, ``indexed_run``: native runs wrapped in Oracle DDL
+      (shadow table swap, deferred index maintenance)
+    - ``planned_run``: full or incremental per entity, whichever is cheaper
+
+``GruponosRunContext`` carries what they share inside one orchestrator: the
+settings, the Meltano environment, the embedded state store, the adaptive
+rate limiter, resolved catalogs and Oracle sessions. ``build_pipeline_result``
+builds the ``PipelineResult`` every strategy returns.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Protocol
+
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+from flext_db_oracle import FlextDbOracleApi
+
+from gruponos_meltano_native.core.rate_limiter import GruponosAdaptiveRateLimiter
+from gruponos_meltano_native.core.state_store import (
+    DEFAULT_STATE_PATH,
+    GruponosStateStore,
+)
+from gruponos_meltano_native.models import GruponosMeltanoNativeModels as m
+from gruponos_meltano_native.oracle.connection_manager_enhanced import (
+    create_gruponos_meltano_oracle_connection_manager,
+)
+from gruponos_meltano_native.oracle.index_manager import (
+    DEFAULT_INTEGRATION_CONFIG,
+    EntityIndexes,
+    load_declared_indexes,
+)
+
+if TYPE_CHECKING:
+    from gruponos_meltano_native.config import GruponosMeltanoNativeConfig
+    from gruponos_meltano_native.core.external_command import ExternalProcess
+    from gruponos_meltano_native.core.overlap_dedup import (
+        GruponosOverlapDeduplicator,
+    )
+    from gruponos_meltano_native.core.row_hash import GruponosRowHashFilter
+    from gruponos_meltano_native.core.wms_extractor import WmsEntity
+    from gruponos_meltano_native.validators.profiler import StreamProfiler
+    from gruponos_meltano_native.validators.quality import DataQualityAccumulator
+
+logger = FlextLogger(__name__)
+
+PipelineResult = m.PipelineResult
+PipelineConfiguration = m.PipelineConfiguration
+
+MELTANO_NOT_FOUND: Final[str] = (
+    "Meltano executable not found. Ensure Meltano is installed and in PATH."
+)
+
+
+class RunFinisher(Protocol):
+    """Scores and records a finished run."""
+
+    def __call__(
+        self,
+        pipeline_result: PipelineResult,
+        quality: Mapping[str, DataQualityAccumulator] | None,
+        profiles: Mapping[str, StreamProfiler] | None,
+        configuration: PipelineConfiguration | None = None,
+    ) -> FlextResult[PipelineResult]:
+        """Fill quality scores and drift findings of ``pipeline_result``."""
+        ...
+
+
+def build_pipeline_result(
+    job_name: str,
+    start_time: datetime,
+    *,
+    records_extracted: int,
+    records_loaded: int,
+    records_failed: int = 0,
+    status: str = "SUCCESS",
+    pipeline_id: str | None = None,
+) -> PipelineResult:
+    """Result of a run of ``job_name`` that started at ``start_time`` and ends now.
+
+    The pipeline id defaults to ``<job_name>-<start time>``.
+    """
+    end_time = datetime.now(tz=UTC)
+    return PipelineResult(
+        pipeline_id=pipeline_id or f"{job_name}-{start_time.isoformat()}",
+        pipeline_name=job_name,
+        status=status,
+        start_time=start_time,
+        end_time=end_time,
+        duration_seconds=(end_time - start_time).total_seconds(),
+        job_name=job_name,
+        records_extracted=records_extracted,
+        records_loaded=records_loaded,
+        records_failed=records_failed,
+    )
+
+
+def commit_change_filters(
+    pipeline_result: PipelineResult,
+    dedup: GruponosOverlapDeduplicator | None,
+    row_hashes: GruponosRowHashFilter | None,
+) -> None:
+    """Persist what a successful load made known and report it."""
+    if dedup is not None:
+        dedup.commit()
+        pipeline_result.metadata["overlap_dedup"] = dedup.stats.as_dict()
+    if row_hashes is not None:
+        row_hashes.commit()
+        pipeline_result.metadata["row_hash"] = row_hashes.stats.as_dict()
+
+
+def stderr_suffix(process: ExternalProcess) -> str:
+    """Last stderr lines of a finished process, for failure messages."""
+    return f": {process.stderr_tail}" if process.stderr_tail else ""
+
+
+class GruponosRunContext:
+    """Settings and services shared by the run strategies of one orchestrator.
+
+    The state store and the rate limiter are created on first use and then
+    shared, so concurrent runs (backfill windows, facility units) checkpoint
+    into one store and draw from the same request budgets.
+
+    Example:
+        context = GruponosRunContext(
+            settings,
+            environment=build_env,
+            validate_job_name=validate,
+            finish=score_run,
+        )
+        result = GruponosNativeRun(context).run("target-oracle-full", entities)
+
+    Attributes:
+      settings: Project settings.
+      environment: Builds the environment of Meltano processes.
+      validate_job_name: Sanitizes a plugin or job name (ValueError if unsafe).
+      finish: Scores and records a finished run.
+      catalog_overrides: Catalog file per extractor resolved for this
+        orchestrator.
+
+    """
+
+    def __init__(
+        self,
+        settings: GruponosMeltanoNativeConfig,
+        *,
+        environment: Callable[[], dict[str, str]],
+        validate_job_name: Callable[[str], str],
+        finish: RunFinisher,
+    ) -> None:
+        """Initialize the context; shared services are opened lazily."""
+        self.settings = settings
+        self.environment = environment
+        self.validate_job_name = validate_job_name
+        self.finish = finish
+        self.catalog_overrides: dict[str, Path] = {}
+        self._rate_limiter: GruponosAdaptiveRateLimiter | None = None
+        self._rate_limiter_lock = threading.Lock()
+        self._state_store: GruponosStateStore | None = None
+        self._state_store_lock = threading.Lock()
+
+    @property
+    def project_root(self) -> Path:
+        """Meltano project directory."""
+        return Path(self.settings.meltano_project_root or ".")
+
+    @property
+    def timeout(self) -> int:
+        """Seconds a Meltano process may run before it is killed."""
+        return self.settings.pipeline_timeout_seconds
+
+    def extractor_config(
+        self, override: Mapping[str, t.GeneralValueType] | None = None
+    ) -> dict[str, t.GeneralValueType]:
+        """Tap-style config of the native engine (``override`` or the settings')."""
+        return dict(override or self.settings.wms_source_config)
+
+    def state_store(self) -> GruponosStateStore:
+        """State store of the native runs, opened on first use."""
+        with self._state_store_lock:
+            if self._state_store is None:
+                self._state_store = GruponosStateStore(
+                    self.project_root / DEFAULT_STATE_PATH
+                )
+            return self._state_store
+
+    def rate_limiter(
+        self, raw_config: Mapping[str, t.GeneralValueType]
+    ) -> GruponosAdaptiveRateLimiter | None:
+        """Adaptive rate limiter shared by every native run of this context.
+
+        Concurrent runs (e.g. backfill windows) against the same WMS host draw
+        from the same budgets instead of each probing the rate on its own.
+        """
+        with self._rate_limiter_lock:
+            if self._rate_limiter is None:
+                self._rate_limiter = GruponosAdaptiveRateLimiter.from_config(raw_config)
+            return self._rate_limiter
+
+    def resolved_catalog(
+        self, raw_config: Mapping[str, t.GeneralValueType]
+    ) -> dict[str, t.GeneralValueType]:
+        """Catalog resolved earlier for the extractor named in ``raw_config``."""
+        path = self.catalog_overrides.get(str(raw_config.get("name") or ""))
+        if path is None:
+            return {}
+        try:
+            catalog = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Resolved catalog unreadable: %s", path)
+            return {}
+        return catalog if isinstance(catalog, dict) else {}
+
+    def table_declarations(self) -> dict[str, EntityIndexes]:
+        """Target table and declared indexes per entity (``wms_integration.yml``)."""
+        return load_declared_indexes(self.project_root / DEFAULT_INTEGRATION_CONFIG)
+
+    def target_table(
+        self,
+        entity: WmsEntity,
+        declarations: Mapping[str, EntityIndexes] | None = None,
+    ) -> str:
+        """Oracle table loaded for ``entity``.
+
+        Its declared ``target_table_name`` if any, else the entity name; pass
+        ``declarations`` to resolve many entities from one read.
+        """
+        if declarations is None:
+            declarations = self.table_declarations()
+        declaration = declarations.get(entity.name)
+        return declaration.table if declaration is not None else entity.name
+
+    @contextmanager
+    def oracle_session(self) -> Iterator[FlextResult[FlextDbOracleApi]]:
+        """Connected Oracle API for the block, disconnected when it ends.
+
+        Yields a failed result instead of raising when the connection cannot
+        be created or opened.
+        """
+        connection = create_gruponos_meltano_oracle_connection_manager(
+            self.settings
+        ).get_connection()
+        if connection.is_failure:
+            yield FlextResult[FlextDbOracleApi].fail(
+                connection.error or "Oracle connection failed"
+            )
+            return
+        api = connection.value
+        connected = api.connect()
+        if connected.is_failure:
+            yield FlextResult[FlextDbOracleApi].fail(
+                f"Oracle connection failed: {connected.error}"
+            )
+            return
+        try:
+            yield FlextResult[FlextDbOracleApi].ok(api)
+        finally:
+            api.disconnect()
+
+
+__all__: list[str] = [
+    "MELTANO_NOT_FOUND",
+    "GruponosRunContext",
+    "PipelineConfiguration",
+    "PipelineResult",
+    "RunFinisher",
+    "build_pipeline_result",
+    "commit_change_filters",
+    "stderr_suffix",
+]
@@ -0,0 +1,164 @@
+"""Shadow run: full reloads into shadow tables swapped in once complete.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import replace
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from flext_core import FlextResult, FlextTypes as t
+
+from gruponos_meltano_native.core.native_run import GruponosNativeRun
+from gruponos_meltano_native.core.run_context import (
+    GruponosRunContext,
+    PipelineResult,
+    build_pipeline_result,
+)
+from gruponos_meltano_native.core.wms_extractor import WmsEntity
+from gruponos_meltano_native.oracle.shadow_swap import (
+    DEFAULT_PARALLEL_DEGREE,
+    GruponosMeltanoOracleShadowSwap,
+    SwapMethod,
+)
+
+if TYPE_CHECKING:
+    from gruponos_meltano_native.core.row_hash import GruponosRowHashFilter
+
+
+class GruponosShadowRun:
+    """Reload entities into shadow tables and swap them with the live ones.
+
+    Example:
+        result = GruponosShadowRun(context).run(entities)
+
+    """
+
+    def __init__(
+        self,
+        context: GruponosRunContext,
+        native: GruponosNativeRun | None = None,
+    ) -> None:
+        """Initialize the strategy; shadow tables are loaded through ``native``."""
+        self.context = context
+        self.native = native or GruponosNativeRun(context)
+
+    def run(
+        self,
+        entities: Sequence[WmsEntity],
+        *,
+        loader: str = "target-oracle-full",
+        extractor_config: Mapping[str, t.GeneralValueType] | None = None,
+        method: SwapMethod = SwapMethod.RENAME,
+        partition: str | None = None,
+        parallel_degree: int = DEFAULT_PARALLEL_DEGREE,
+        keep_previous: bool = True,
+        row_hashes: GruponosRowHashFilter | None = None,
+        state_job: str | None = None,
+    ) -> FlextResult[PipelineResult]:
+        """Full sync of ``entities`` into shadow tables, swapped in when loaded.
+
+        Per entity, ``GruponosMeltanoOracleShadowSwap`` creates
+        ``<TABLE>_SHD`` (NOLOGGING, no indexes), the native engine loads it
+        through ``loader`` (stream renamed to the shadow table), then indexes
+        are built in parallel, statistics gathered and the shadow swapped
+        with the live table. Readers never see a half-loaded table; a failed
+        load drops the shadow and leaves the live table untouched. Swap
+        reports, with the rows loaded per table, go to
+        ``metadata["shadow_swap"]``.
+
+        Args:
+            entities: Entities to reload into their target tables
+                (``GruponosRunContext.target_table``).
+            loader: Meltano loader writing to ``oracle_schema``.
+            extractor_config: Tap-style config (defaults to the settings).
+            method: Swap by rename or by partition exchange.
+            partition: Partition exchanged (``SwapMethod.EXCHANGE``).
+            parallel_degree: Parallelism of index builds and statistics.
+            keep_previous: Keep the replaced data as ``<TABLE>_OLD``.
+            row_hashes: Row-hash filter of the incremental loads; the hashes
+                of every swapped table are reset, since its new rows never
+                went through the filter.
+            state_job: Job id in the state store whose bookmarks the reload
+                moves (defaults to the native run's).
+
+        Returns:
+            FlextResult[PipelineResult]: Result with per-table swap reports.
+
+        """
+        context = self.context
+        start_time = datetime.now(tz=UTC)
+        schema = context.settings.oracle_schema
+        if not schema:
+            return FlextResult.fail("Shadow full sync needs oracle_schema")
+        try:
+            loader_name = context.validate_job_name(loader)
+        except ValueError as e:
+            return FlextResult.fail(str(e))
+
+        declarations = context.table_declarations()
+        reports: dict[str, t.GeneralValueType] = {}
+        records_extracted = records_loaded = 0
+        with context.oracle_session() as session:
+            if session.is_failure:
+                return FlextResult.fail(session.error)
+            for entity in entities:
+                try:
+                    swap = GruponosMeltanoOracleShadowSwap(
+                        session.value,
+                        schema=schema,
+                        table=context.target_table(entity, declarations),
+                        method=method,
+                        partition=partition,
+                        parallel_degree=parallel_degree,
+                        keep_previous=keep_previous,
+                    )
+                except ValueError as e:
+                    return FlextResult.fail(str(e))
+                prepared = swap.prepare()
+                if prepared.is_failure:
+                    return FlextResult.fail(prepared.error)
+                load = self.native.run(
+                    loader_name,
+                    [replace(entity, stream=prepared.value.lower())],
+                    extractor_config=extractor_config,
+                    state={},
+                    state_job=state_job,
+                )
+                if load.is_failure:
+                    swap.discard()
+                    return FlextResult.fail(
+                        f"Shadow load of {entity.name} failed: {load.error}"
+                    )
+                swapped = swap.finalize()
+                if swapped.is_failure:
+                    # Before the swap step the live table is untouched
+                    if swap.failed_step != "swap":
+                        swap.discard()
+                    elif row_hashes is not None:
+                        # A failed swap may have replaced the live table
+                        row_hashes.reset(entity.name)
+                    return FlextResult.fail(swapped.error)
+                if row_hashes is not None:
+                    row_hashes.reset(entity.name)
+                reports[entity.name] = {
+                    **swapped.value.as_dict(),
+                    "records_loaded": load.value.records_loaded,
+                }
+                records_extracted += load.value.records_extracted
+                records_loaded += load.value.records_loaded
+
+        pipeline_result = build_pipeline_result(
+            f"wms-shadow-{loader_name}",
+            start_time,
+            records_extracted=records_extracted,
+            records_loaded=records_loaded,
+        )
+        pipeline_result.metadata["shadow_swap"] = reports
+        return FlextResult.ok(pipeline_result)
+
+
+__all__: list[str] = ["GruponosShadowRun"]
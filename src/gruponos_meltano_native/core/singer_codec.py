@@ -0,0 +1,294 @@
+"""Singer message codec for GrupoNOS Meltano Native.
+
+Reads and writes the Singer tap→target byte stream in-process so records can
+be validated, profiled or quarantined without leaving Python:
+
+    - Line splitting over one reusable ``bytearray`` (``memoryview`` slices,
+      no per-chunk concatenation)
+    - Decoding with ``orjson`` when installed, falling back to ``json``
+    - Pass-through of the original bytes for messages that were not modified,
+      so only touched records pay for re-encoding
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import IO, Final, Protocol
+
+from flext_core import FlextResult, FlextTypes as t
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+DEFAULT_READ_SIZE: Final[int] = 64 * 1024
+_NEWLINE: Final[int] = 0x0A
+
+JsonDecoder = Callable[[bytes | memoryview], object]
+JsonEncoder = Callable[[object], bytes]
+
+
+class ReadIntoSource(Protocol):
+    """Binary source supporting ``readinto`` (files, pipes, ``BytesIO``)."""
+
+    def readinto(self, buffer: memoryview, /) -> int | None:
+        """Read into ``buffer`` and return the number of bytes read."""
+        ...
+
+
+def _json_loads(data: bytes | memoryview) -> object:
+    return json.loads(data.tobytes() if isinstance(data, memoryview) else data)
+
+
+def _json_dumps(obj: object) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8")
+
+
+if orjson is not None:
+    JSON_BACKEND: Final[str] = "orjson"
+
+    def _orjson_dumps(obj: object) -> bytes:
+        return orjson.dumps(obj, default=str)
+
+    loads: JsonDecoder = orjson.loads
+    dumps: JsonEncoder = _orjson_dumps
+else:  # pragma: no cover - depends on the environment
+    JSON_BACKEND = "json"
+    loads = _json_loads
+    dumps = _json_dumps
+
+
+class SingerMessageType(StrEnum):
+    """Singer message types."""
+
+    RECORD = "RECORD"
+    SCHEMA = "SCHEMA"
+    STATE = "STATE"
+    ACTIVATE_VERSION = "ACTIVATE_VERSION"
+    BATCH = "BATCH"
+
+
+class SingerMessage:
+    """Decoded Singer message that keeps its original bytes.
+
+    ``encode`` returns the original line untouched unless the payload was
+    replaced through ``set_record`` or flagged with ``mark_modified``.
+    """
+
+    __slots__ = ("_modified", "payload", "raw")
+
+    def __init__(
+        self, payload: dict[str, t.GeneralValueType], raw: bytes | None = None
+    ) -> None:
+        """Initialize the message from its decoded payload and raw line."""
+        self.payload = payload
+        self.raw = raw
+        self._modified = raw is None
+
+    @property
+    def type(self) -> str:
+        """Message type (``RECORD``, ``SCHEMA``, ``STATE``...)."""
+        return str(self.payload.get("type", ""))
+
+    @property
+    def stream(self) -> str | None:
+        """Stream name, if the message type carries one."""
+        stream = self.payload.get("stream")
+        return stream if isinstance(stream, str) else None
+
+    @property
+    def record(self) -> dict[str, t.GeneralValueType]:
+        """Record body of a RECORD message (empty for other types)."""
+        record = self.payload.get("record")
+        return record if isinstance(record, dict) else {}
+
+    @property
+    def modified(self) -> bool:
+        """Whether ``encode`` will re-serialize the payload."""
+        return self._modified
+
+    def set_record(self, record: dict[str, t.GeneralValueType]) -> None:
+        """Replace the record body and mark the message for re-encoding."""
+        self.payload["record"] = record
+        self._modified = True
+
+    def mark_modified(self) -> None:
+        """Flag an in-place change to ``payload``."""
+        self._modified = True
+
+    def encode(self) -> bytes:
+        """Serialize the message as one newline-terminated line."""
+        if not self._modified and self.raw is not None:
+            return self.raw + b"\n"
+        return dumps(self.payload) + b"\n"
+
+    @classmethod
+    def record_message(
+        cls, stream: str, record: dict[str, t.GeneralValueType]
+    ) -> SingerMessage:
+        """Build a new RECORD message."""
+        return cls({
+            "type": SingerMessageType.RECORD.value,
+            "stream": stream,
+            "record": record,
+        })
+
+
+@dataclass(slots=True)
+class SingerCodecStats:
+    """Counters for one codec instance."""
+
+    lines: int = 0
+    bytes_read: int = 0
+    messages_written: int = 0
+    passthrough: int = 0
+    reencoded: int = 0
+    decode_errors: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Counters as a plain dict."""
+        return {
+            "lines": self.lines,
+            "bytes_read": self.bytes_read,
+            "messages_written": self.messages_written,
+            "passthrough": self.passthrough,
+            "reencoded": self.reencoded,
+            "decode_errors": self.decode_errors,
+        }
+
+
+class SingerLineSplitter:
+    """Split a binary stream into lines using one reusable buffer.
+
+    Data is read with ``readinto`` straight into a ``bytearray``; lines are
+    yielded as ``memoryview`` slices of that buffer. A slice is only valid
+    until the next line is requested, so callers that keep a line must copy
+    it (``bytes(view)``). The buffer doubles when a single line outgrows it.
+    """
+
+    def __init__(self, read_size: int = DEFAULT_READ_SIZE) -> None:
+        """Initialize the splitter with an initial buffer of ``read_size``."""
+        self._buffer = bytearray(read_size)
+        self.bytes_read = 0
+
+    def iter_lines(self, source: ReadIntoSource) -> Iterator[memoryview]:
+        """Yield each line of ``source`` without its newline (blank lines skipped)."""
+        buffer = self._buffer
+        start = 0
+        end = 0
+        while True:
+            if end == len(buffer):
+                if start > 0:
+                    # Move the partial line to the front (same size, no realloc)
+                    buffer[: end - start] = buffer[start:end]
+                    end -= start
+                    start = 0
+                else:
+                    buffer.extend(bytes(len(buffer)))
+            with memoryview(buffer) as window:
+                count = source.readinto(window[end:])
+            if not count:
+                break
+            self.bytes_read += count
+            scan = end
+            end += count
+            while (newline := buffer.find(_NEWLINE, scan, end)) >= 0:
+                if newline > start:
+                    yield from self._emit(buffer, start, newline)
+                start = scan = newline + 1
+            if start == end:
+                start = end = 0
+        if end > start:
+            yield from self._emit(buffer, start, end)
+
+    @staticmethod
+    def _emit(buffer: bytearray, start: int, stop: int) -> Iterator[memoryview]:
+        # Release the slice once the caller moves on so the buffer can grow
+        with memoryview(buffer) as window, window[start:stop] as line:
+            yield line
+
+
+class SingerCodec:
+    """Decode and encode Singer messages over binary streams.
+
+    Example:
+        codec = SingerCodec()
+        with open("tap.out", "rb") as src, open("target.in", "wb") as dst:
+            codec.write(dst, codec.iter_messages(src))
+
+    """
+
+    def __init__(self, read_size: int = DEFAULT_READ_SIZE) -> None:
+        """Initialize the codec."""
+        self._splitter = SingerLineSplitter(read_size)
+        self.stats = SingerCodecStats()
+
+    def decode_line(self, line: bytes | memoryview) -> FlextResult[SingerMessage]:
+        """Decode one line, keeping a copy of its bytes for pass-through."""
+        raw = bytes(line)
+        try:
+            payload = loads(raw)
+        except ValueError as e:
+            self.stats.decode_errors += 1
+            return FlextResult[SingerMessage].fail(f"Invalid Singer message: {e}")
+        if not isinstance(payload, dict) or "type" not in payload:
+            self.stats.decode_errors += 1
+            return FlextResult[SingerMessage].fail(
+                "Invalid Singer message: missing 'type'"
+            )
+        return FlextResult[SingerMessage].ok(SingerMessage(payload, raw))
+
+    def iter_messages(
+        self, source: ReadIntoSource, *, skip_invalid: bool = False
+    ) -> Iterator[SingerMessage]:
+        """Yield decoded messages from ``source``.
+
+        Raises:
+            ValueError: On an undecodable line unless ``skip_invalid``.
+
+        """
+        for line in self._splitter.iter_lines(source):
+            self.stats.lines += 1
+            result = self.decode_line(line)
+            if result.is_failure:
+                if skip_invalid:
+                    continue
+                raise ValueError(result.error)
+            yield result.value
+        self.stats.bytes_read = self._splitter.bytes_read
+
+    def encode(self, message: SingerMessage) -> bytes:
+        """Encode one message, reusing its original bytes when unmodified."""
+        self.stats.messages_written += 1
+        if message.modified:
+            self.stats.reencoded += 1
+        else:
+            self.stats.passthrough += 1
+        return message.encode()
+
+    def write(self, sink: IO[bytes], messages: Iterable[SingerMessage]) -> int:
+        """Write messages to ``sink``; returns the number written."""
+        written = 0
+        for message in messages:
+            sink.write(self.encode(message))
+            written += 1
+        return written
+
+
+__all__: list[str] = [
+    "JSON_BACKEND",
+    "ReadIntoSource",
+    "SingerCodec",
+    "SingerCodecStats",
+    "SingerLineSplitter",
+    "SingerMessage",
+    "SingerMessageType",
+    "dumps",
+    "loads",
+]
@@ -0,0 +1,439 @@
+"""Inline Singer proxy stage between tap and target.
+
+Sits on the tap's stdout and the target's stdin and runs validation, type
+conversion, quality scoring and quarantine on the record stream itself, so no
+extra Meltano mapper plugin is needed:
+
+    - A reader thread decodes messages into batches and hands them over a
+      bounded queue (the tap blocks once ``max_pending_batches`` are waiting)
+    - Batches are processed and written in arrival order; STATE messages are
+      forwarded byte-for-byte and close the current batch so checkpoints are
+      not delayed
+    - Conversions are compiled once per SCHEMA message; records are only
+      re-encoded when a conversion changed a value
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, Protocol
+
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+
+from gruponos_meltano_native.core.singer_codec import (
+    ReadIntoSource,
+    SingerCodec,
+    SingerMessage,
+    SingerMessageType,
+)
+
+if TYPE_CHECKING:
+    from gruponos_meltano_native.validators.data_validator import DataValidator
+    from gruponos_meltano_native.validators.error_model import ValidationFailure
+    from gruponos_meltano_native.validators.quality import DataQualityAccumulator
+    from gruponos_meltano_native.validators.quarantine import (
+        GruponosMeltanoQuarantineStore,
+    )
+
+logger = FlextLogger(__name__)
+
+DEFAULT_BATCH_SIZE: Final[int] = 500
+DEFAULT_MAX_PENDING_BATCHES: Final[int] = 8
+_QUEUE_POLL_SECONDS: Final[float] = 0.1
+
+
+class ByteSink(Protocol):
+    """Destination for proxied bytes (target stdin, ``SpillBufferWriter``)."""
+
+    def write(self, data: bytes, /) -> int:
+        """Write ``data``."""
+        ...
+
+    def flush(self) -> None:
+        """Flush buffered data."""
+        ...
+
+
+RecordTransform = Callable[
+    [str, dict[str, t.GeneralValueType]], dict[str, t.GeneralValueType] | None
+]
+
+
+def chain_transforms(*transforms: RecordTransform | None) -> RecordTransform | None:
+    """Run ``transforms`` in order; the first one returning None drops the record."""
+    steps = [transform for transform in transforms if transform is not None]
+    if len(steps) <= 1:
+        return steps[0] if steps else None
+
+    def chained(
+        stream: str, record: dict[str, t.GeneralValueType]
+    ) -> dict[str, t.GeneralValueType] | None:
+        current: dict[str, t.GeneralValueType] | None = record
+        for step in steps:
+            current = step(stream, current)
+            if current is None:
+                return None
+        return current
+
+    return chained
+
+
+@dataclass(slots=True)
+class SingerProxyStats:
+    """Counters and timings for one proxy run."""
+
+    messages: int = 0
+    records: int = 0
+    records_forwarded: int = 0
+    records_converted: int = 0
+    records_invalid: int = 0
+    records_quarantined: int = 0
+    records_dropped: int = 0
+    state_messages: int = 0
+    batches: int = 0
+    max_pending_batches: int = 0
+    bytes_read: int = 0
+    elapsed_seconds: float = 0.0
+    processing_seconds: float = 0.0
+
+    @property
+    def overhead_per_record_us(self) -> float:
+        """Processing time per record in microseconds."""
+        if not self.records:
+            return 0.0
+        return self.processing_seconds / self.records * 1_000_000
+
+    def as_dict(self) -> dict[str, int | float]:
+        """Counters as a plain dict (for pipeline metadata)."""
+        return {
+            "messages": self.messages,
+            "records": self.records,
+            "records_forwarded": self.records_forwarded,
+            "records_converted": self.records_converted,
+            "records_invalid": self.records_invalid,
+            "records_quarantined": self.records_quarantined,
+            "records_dropped": self.records_dropped,
+            "state_messages": self.state_messages,
+            "batches": self.batches,
+            "max_pending_batches": self.max_pending_batches,
+            "bytes_read": self.bytes_read,
+            "elapsed_seconds": round(self.elapsed_seconds, 6),
+            "processing_seconds": round(self.processing_seconds, 6),
+            "overhead_per_record_us": round(self.overhead_per_record_us, 3),
+        }
+
+
+class _ReaderFailed:
+    """Queue sentinel carrying a reader-side error."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: str) -> None:
+        self.error = error
+
+
+_END: Final[object] = object()
+
+
+class SingerProxyStage:
+    """Validate, convert and quarantine Singer records in flight.
+
+    Validators are looked up by stream name; streams without a validator are
+    forwarded untouched. Invalid records go to the quarantine store when one
+    is configured, otherwise they are forwarded and only counted.
+
+    Example:
+        stage = SingerProxyStage({"allocation": validator}, quarantine=store)
+        result = stage.run(tap.stdout, target.stdin)
+
+    """
+
+    def __init__(
+        self,
+        validators: Mapping[str, DataValidator] | None = None,
+        *,
+        quarantine: GruponosMeltanoQuarantineStore | None = None,
+        quality: Mapping[str, DataQualityAccumulator] | None = None,
+        transform: RecordTransform | None = None,
+        change_filter: RecordTransform | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_pending_batches: int = DEFAULT_MAX_PENDING_BATCHES,
+        run_id: str | None = None,
+    ) -> None:
+        """Initialize the proxy stage.
+
+        Args:
+            validators: Validator per stream name.
+            quarantine: Store for rejected records (drops them from the flow).
+            quality: Quality accumulator per stream name.
+            transform: Optional ``(stream, record) -> record | None`` hook run
+                before validation; returning None drops the record.
+            change_filter: Same kind of hook run only on records about to
+                be forwarded (after validation and quarantine), for filters
+                that remember what was loaded (overlap dedup, row hashes).
+            batch_size: Messages per batch handed from reader to writer.
+            max_pending_batches: Bound on batches buffered between threads.
+            run_id: Run identifier stored with quarantined records.
+
+        """
+        self.validators = dict(validators or {})
+        self.quarantine = quarantine
+        self.quality = dict(quality or {})
+        self.transform = transform
+        self.change_filter = change_filter
+        self.batch_size = max(1, batch_size)
+        self.max_pending_batches = max(1, max_pending_batches)
+        self.run_id = run_id
+        self.stats = SingerProxyStats()
+        self._conversions: dict[str, dict[str, dict[str, t.GeneralValueType]]] = {}
+        # Last SCHEMA per stream, and the one stored with its quarantined rows
+        self._schemas: dict[str, dict[str, t.GeneralValueType]] = {}
+        self._quarantined_schemas: dict[str, dict[str, t.GeneralValueType]] = {}
+
+    def with_transforms(self, *transforms: RecordTransform | None) -> SingerProxyStage:
+        """Copy of this stage running ``transforms`` before its own transform.
+
+        The copy shares validators, quarantine store and quality accumulators
+        but counts into fresh stats, so the stage it came from is unchanged.
+        """
+        return self._copy(
+            chain_transforms(*transforms, self.transform), self.change_filter
+        )
+
+    def with_change_filters(self, *filters: RecordTransform | None) -> SingerProxyStage:
+        """Copy of this stage running ``filters`` before its own change filter.
+
+        Like ``with_transforms``, but the filters only see records that are
+        forwarded, so a quarantined record is never recorded as loaded.
+        """
+        return self._copy(
+            self.transform, chain_transforms(*filters, self.change_filter)
+        )
+
+    def _copy(
+        self,
+        transform: RecordTransform | None,
+        change_filter: RecordTransform | None,
+    ) -> SingerProxyStage:
+        """Copy sharing everything but the hooks and the stats."""
+        return SingerProxyStage(
+            self.validators,
+            quarantine=self.quarantine,
+            quality=self.quality,
+            transform=transform,
+            change_filter=change_filter,
+            batch_size=self.batch_size,
+            max_pending_batches=self.max_pending_batches,
+            run_id=self.run_id,
+        )
+
+    def run(
+        self, source: ReadIntoSource, sink: ByteSink
+    ) -> FlextResult[SingerProxyStats]:
+        """Proxy ``source`` into ``sink`` until the source is exhausted."""
+        codec = SingerCodec()
+        batches: queue.Queue[object] = queue.Queue(maxsize=self.max_pending_batches)
+        stop = threading.Event()
+        reader = threading.Thread(
+            target=self._read,
+            args=(codec, source, batches, stop),
+            name="singer-proxy-reader",
+            daemon=True,
+        )
+        started = time.perf_counter()
+        reader.start()
+        error: str | None = None
+        drained = False
+        try:
+            while True:
+                item = batches.get()
+                if item is _END:
+                    drained = True
+                    break
+                if isinstance(item, _ReaderFailed):
+                    error = item.error
+                    break
+                if isinstance(item, list):
+                    self._process_batch(codec, item, sink)
+        except (OSError, ValueError) as e:
+            error = f"Singer proxy write failed: {e}"
+        finally:
+            stop.set()
+            # On a write error (or an exception raised by a transform) the
+            # reader may be blocked on the tap's pipe; the caller terminates
+            # the processes, so do not wait for it
+            reader.join(timeout=None if drained else _QUEUE_POLL_SECONDS)
+            self.stats.bytes_read = codec.stats.bytes_read
+            self.stats.elapsed_seconds = time.perf_counter() - started
+
+        if error is not None:
+            logger.error("Singer proxy stage failed: %s", error)
+            return FlextResult[SingerProxyStats].fail(error)
+        logger.info(
+            "Singer proxy forwarded %s/%s records (%.1f us/record)",
+            self.stats.records_forwarded,
+            self.stats.records,
+            self.stats.overhead_per_record_us,
+        )
+        return FlextResult[SingerProxyStats].ok(self.stats)
+
+    def _read(
+        self,
+        codec: SingerCodec,
+        source: ReadIntoSource,
+        batches: queue.Queue[object],
+        stop: threading.Event,
+    ) -> None:
+        """Reader thread: decode messages and enqueue them in batches."""
+        batch: list[SingerMessage] = []
+        try:
+            for message in codec.iter_messages(source):
+                batch.append(message)
+                if (
+                    len(batch) >= self.batch_size
+                    or message.type == SingerMessageType.STATE
+                ):
+                    if not self._enqueue(batches, batch, stop):
+                        return
+                    batch = []
+            if batch and not self._enqueue(batches, batch, stop):
+                return
+            self._enqueue(batches, _END, stop)
+        except (OSError, ValueError) as e:
+            failed = _ReaderFailed(f"Singer proxy read failed: {e}")
+            self._enqueue(batches, failed, stop)
+
+    def _enqueue(
+        self,
+        batches: queue.Queue[object],
+        item: object,
+        stop: threading.Event,
+    ) -> bool:
+        """Put with backpressure; gives up when the writer side stopped."""
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=_QUEUE_POLL_SECONDS)
+            except queue.Full:
+                continue
+            self.stats.max_pending_batches = max(
+                self.stats.max_pending_batches, batches.qsize()
+            )
+            return True
+        return False
+
+    def _process_batch(
+        self, codec: SingerCodec, batch: list[SingerMessage], sink: ByteSink
+    ) -> None:
+        """Process one batch in order and write it with a single call."""
+        started = time.perf_counter()
+        out: list[bytes] = []
+        touched: dict[str, DataValidator] = {}
+        for message in batch:
+            self.stats.messages += 1
+            kind = message.type
+            if kind == SingerMessageType.RECORD:
+                if self._process_record(message, touched):
+                    out.append(codec.encode(message))
+                continue
+            if kind == SingerMessageType.SCHEMA:
+                self._compile_schema(message)
+            elif kind == SingerMessageType.STATE:
+                self.stats.state_messages += 1
+            out.append(codec.encode(message))
+        for stream, validator in touched.items():
+            validator.error_aggregator.flush_batch(stream)
+        self.stats.batches += 1
+        self.stats.processing_seconds += time.perf_counter() - started
+        sink.write(b"".join(out))
+        sink.flush()
+
+    def _compile_schema(self, message: SingerMessage) -> None:
+        """Compile conversions for the stream announced by a SCHEMA message."""
+        stream = message.stream
+        if stream is not None:
+            self._schemas[stream] = message.payload
+        validator = self.validators.get(stream or "")
+        schema = message.payload.get("schema")
+        if stream is None or validator is None or not isinstance(schema, dict):
+            return
+        self._conversions[stream] = validator.compile_conversions(schema)
+
+    def _process_record(
+        self, message: SingerMessage, touched: dict[str, DataValidator]
+    ) -> bool:
+        """Apply transform, conversions, validation and change filter.
+
+        Returns:
+            bool: True when the record is forwarded.
+
+        """
+        self.stats.records += 1
+        stream = message.stream or ""
+        record = message.record
+        if self.transform is not None:
+            transformed = self.transform(stream, record)
+            if transformed is None:
+                self.stats.records_dropped += 1
+                return False
+            if transformed is not record:
+                message.set_record(transformed)
+                record = transformed
+
+        validator = self.validators.get(stream)
+        failures: list[ValidationFailure] = []
+        if validator is not None:
+            touched[stream] = validator
+            conversions = self._conversions.get(stream)
+            if conversions and validator.apply_conversions(
+                record, conversions, failures
+            ):
+                message.mark_modified()
+                self.stats.records_converted += 1
+            failures.extend(validator.collect_failures(record))
+            if not failures:
+                failures.extend(
+                    validator.check_duplicate_key(record, raise_on_failure=False)
+                )
+
+        accumulator = self.quality.get(stream)
+        if accumulator is not None:
+            accumulator.observe(record, failed=bool(failures))
+
+        if failures:
+            self.stats.records_invalid += 1
+            if self.quarantine is not None:
+                schema = self._schemas.get(stream)
+                if schema is not None and (
+                    self._quarantined_schemas.get(stream) is not schema
+                ):
+                    # Replay re-sends it, so the target knows the stream
+                    self.quarantine.put_schema(stream, schema)
+                    self._quarantined_schemas[stream] = schema
+                self.quarantine.put(stream, record, failures, run_id=self.run_id)
+                self.stats.records_quarantined += 1
+                return False
+
+        if self.change_filter is not None:
+            filtered = self.change_filter(stream, record)
+            if filtered is None:
+                self.stats.records_dropped += 1
+                return False
+            if filtered is not record:
+                message.set_record(filtered)
+        self.stats.records_forwarded += 1
+        return True
+
+
+__all__: list[str] = [
+    "ByteSink",
+    "RecordTransform",
+    "SingerProxyStage",
+    "SingerProxyStats",
+    "chain_transforms",
+]
@@ -0,0 +1,360 @@
+"""Backpressure buffer with spill-to-disk between extract and load.
+
+Decouples the tap from a slow target: chunks are kept in RAM up to a byte
+budget and spill to sequential on-disk segments beyond it, so the tap keeps
+reading from the WMS API (and its HTTP sessions stay alive) while the Oracle
+target works through redo waits or MERGE contention:
+
+    - FIFO order is preserved across memory and disk blocks
+    - Segments are append-only files of length-prefixed frames, read back
+      sequentially and deleted once drained
+    - High-water marks for memory and total queued bytes are tracked
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import struct
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, BinaryIO, Final, Self
+
+from flext_core import FlextLogger, FlextResult
+
+logger = FlextLogger(__name__)
+
+DEFAULT_MEMORY_BUDGET_BYTES: Final[int] = 64 * 1024 * 1024
+DEFAULT_SEGMENT_BYTES: Final[int] = 16 * 1024 * 1024
+_FRAME: Final[struct.Struct] = struct.Struct(">I")
+
+
+@dataclass(slots=True)
+class _MemoryBlock:
+    chunks: deque[bytes] = field(default_factory=deque)
+
+
+@dataclass(slots=True)
+class _DiskSegment:
+    path: Path
+    writer: BinaryIO
+    reader: BinaryIO | None = None
+    written_bytes: int = 0
+    pending_chunks: int = 0
+    sealed: bool = False
+
+
+@dataclass(slots=True)
+class SpillBufferMetrics:
+    """Counters and high-water marks for a ``SpillBuffer``."""
+
+    chunks_in: int = 0
+    chunks_out: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    spilled_chunks: int = 0
+    spilled_bytes: int = 0
+    segments_created: int = 0
+    memory_bytes: int = 0
+    queued_bytes: int = 0
+    memory_high_water: int = 0
+    queued_high_water: int = 0
+    producer_wait_seconds: float = 0.0
+    consumer_wait_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        """Metrics as a plain dict."""
+        return {
+            "chunks_in": self.chunks_in,
+            "chunks_out": self.chunks_out,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "spilled_chunks": self.spilled_chunks,
+            "spilled_bytes": self.spilled_bytes,
+            "segments_created": self.segments_created,
+            "memory_bytes": self.memory_bytes,
+            "queued_bytes": self.queued_bytes,
+            "memory_high_water": self.memory_high_water,
+            "queued_high_water": self.queued_high_water,
+            "producer_wait_seconds": round(self.producer_wait_seconds, 6),
+            "consumer_wait_seconds": round(self.consumer_wait_seconds, 6),
+        }
+
+
+class SpillBuffer:
+    """Thread-safe FIFO of byte chunks with a memory budget and disk spill.
+
+    One producer calls ``put``; one consumer calls ``get``. ``put`` only
+    blocks when ``max_disk_bytes`` is set and reached.
+
+    Attributes:
+      memory_budget_bytes: Bytes kept in RAM before spilling.
+      segment_bytes: Size at which a disk segment is sealed.
+      metrics: Counters and high-water marks.
+
+    """
+
+    def __init__(
+        self,
+        memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES,
+        *,
+        spill_dir: Path | None = None,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        max_disk_bytes: int | None = None,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            memory_budget_bytes: Bytes kept in RAM before spilling.
+            spill_dir: Directory for segments (a temporary one by default).
+            segment_bytes: Size at which a disk segment is sealed.
+            max_disk_bytes: Optional cap on spilled bytes (``put`` blocks).
+
+        """
+        self.memory_budget_bytes = memory_budget_bytes
+        self.segment_bytes = segment_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.metrics = SpillBufferMetrics()
+        self._owned_dir = (
+            tempfile.TemporaryDirectory(prefix="gruponos-spill-")
+            if spill_dir is None
+            else None
+        )
+        self._spill_dir = (
+            Path(self._owned_dir.name) if self._owned_dir is not None else spill_dir
+        )
+        if self._spill_dir is not None:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+        self._blocks: deque[_MemoryBlock | _DiskSegment] = deque()
+        self._disk_bytes = 0
+        self._segment_seq = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the producer side was closed."""
+        return self._closed
+
+    def __len__(self) -> int:
+        """Number of queued chunks."""
+        with self._cond:
+            return self.metrics.chunks_in - self.metrics.chunks_out
+
+    def put(self, chunk: bytes) -> None:
+        """Append a chunk, spilling to disk beyond the memory budget.
+
+        Raises:
+            ValueError: If the buffer was closed.
+
+        """
+        size = len(chunk)
+        with self._cond:
+            if self._closed:
+                msg = "SpillBuffer is closed"
+                raise ValueError(msg)
+            metrics = self.metrics
+            if metrics.memory_bytes + size <= self.memory_budget_bytes:
+                tail = self._blocks[-1] if self._blocks else None
+                if not isinstance(tail, _MemoryBlock):
+                    tail = _MemoryBlock()
+                    self._blocks.append(tail)
+                tail.chunks.append(chunk)
+                metrics.memory_bytes += size
+                metrics.memory_high_water = max(
+                    metrics.memory_high_water, metrics.memory_bytes
+                )
+            else:
+                self._wait_for_disk_room(size)
+                self._spill(chunk)
+            metrics.chunks_in += 1
+            metrics.bytes_in += size
+            metrics.queued_bytes += size
+            metrics.queued_high_water = max(
+                metrics.queued_high_water, metrics.queued_bytes
+            )
+            self._cond.notify_all()
+
+    def _wait_for_disk_room(self, size: int) -> None:
+        if self.max_disk_bytes is None:
+            return
+        started = time.perf_counter()
+        while self._disk_bytes and self._disk_bytes + size > self.max_disk_bytes:
+            self._cond.wait()
+        self.metrics.producer_wait_seconds += time.perf_counter() - started
+        if self._closed:
+            msg = "SpillBuffer was discarded while waiting for disk room"
+            raise ValueError(msg)
+
+    def _spill(self, chunk: bytes) -> None:
+        tail = self._blocks[-1] if self._blocks else None
+        if (
+            not isinstance(tail, _DiskSegment)
+            or tail.sealed
+            or tail.written_bytes >= self.segment_bytes
+        ):
+            if isinstance(tail, _DiskSegment):
+                tail.sealed = True
+            tail = self._new_segment()
+            self._blocks.append(tail)
+        tail.writer.write(_FRAME.pack(len(chunk)))
+        tail.writer.write(chunk)
+        tail.written_bytes += _FRAME.size + len(chunk)
+        tail.pending_chunks += 1
+        self._disk_bytes += len(chunk)
+        self.metrics.spilled_chunks += 1
+        self.metrics.spilled_bytes += len(chunk)
+
+    def _new_segment(self) -> _DiskSegment:
+        if self._spill_dir is None:  # pragma: no cover - set in __init__
+            msg = "SpillBuffer has no spill directory"
+            raise ValueError(msg)
+        self._segment_seq += 1
+        path = self._spill_dir / f"segment-{self._segment_seq:08d}.bin"
+        self.metrics.segments_created += 1
+        return _DiskSegment(path=path, writer=path.open("wb"))
+
+    def get(self, timeout: float | None = None) -> bytes | None:
+        """Remove and return the oldest chunk.
+
+        Blocks until a chunk is available. Returns None once the buffer is
+        closed and fully drained, or when ``timeout`` expires.
+        """
+        with self._cond:
+            started = time.perf_counter()
+            while not self._blocks:
+                if self._closed:
+                    return None
+                if not self._cond.wait(timeout):
+                    self.metrics.consumer_wait_seconds += (
+                        time.perf_counter() - started
+                    )
+                    return None
+            self.metrics.consumer_wait_seconds += time.perf_counter() - started
+            head = self._blocks[0]
+            if isinstance(head, _MemoryBlock):
+                chunk = head.chunks.popleft()
+                self.metrics.memory_bytes -= len(chunk)
+                if not head.chunks:
+                    self._blocks.popleft()
+            else:
+                chunk = self._read_segment(head)
+            self.metrics.chunks_out += 1
+            self.metrics.bytes_out += len(chunk)
+            self.metrics.queued_bytes -= len(chunk)
+            self._cond.notify_all()
+            return chunk
+
+    def _read_segment(self, segment: _DiskSegment) -> bytes:
+        if segment.reader is None:
+            # Seal so the producer starts a new segment; frames are then final
+            segment.sealed = True
+            segment.writer.close()
+            segment.reader = segment.path.open("rb")
+        (size,) = _FRAME.unpack(segment.reader.read(_FRAME.size))
+        chunk = segment.reader.read(size)
+        segment.pending_chunks -= 1
+        self._disk_bytes -= size
+        if segment.pending_chunks == 0:
+            segment.reader.close()
+            segment.path.unlink(missing_ok=True)
+            self._blocks.popleft()
+        return chunk
+
+    def close(self) -> None:
+        """Close the producer side; ``get`` drains what is left."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def discard(self) -> None:
+        """Drop queued chunks and delete all segments."""
+        with self._cond:
+            self._closed = True
+            for block in self._blocks:
+                if isinstance(block, _DiskSegment):
+                    block.writer.close()
+                    if block.reader is not None:
+                        block.reader.close()
+                    block.path.unlink(missing_ok=True)
+            self._blocks.clear()
+            self._disk_bytes = 0
+            self.metrics.memory_bytes = 0
+            self.metrics.queued_bytes = 0
+            self._cond.notify_all()
+        if self._owned_dir is not None:
+            self._owned_dir.cleanup()
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Context manager exit: drop anything left and remove segments."""
+        self.discard()
+
+
+class SpillBufferWriter:
+    """File-like writer that queues into a ``SpillBuffer`` and drains to a sink.
+
+    ``write`` returns as soon as the chunk is buffered; a background thread
+    writes chunks to ``sink`` in order at whatever pace the sink accepts.
+    ``close`` waits for the drain and reports sink errors.
+    """
+
+    def __init__(self, sink: IO[bytes], buffer: SpillBuffer | None = None) -> None:
+        """Initialize the writer and start the drain thread."""
+        self.buffer = buffer if buffer is not None else SpillBuffer()
+        self._sink = sink
+        self._error: str | None = None
+        self._drain = threading.Thread(
+            target=self._drain_loop, name="spill-buffer-drain", daemon=True
+        )
+        self._drain.start()
+
+    def _drain_loop(self) -> None:
+        try:
+            while (chunk := self.buffer.get()) is not None:
+                self._sink.write(chunk)
+            self._sink.flush()
+        except (OSError, ValueError) as e:
+            self._error = f"Spill buffer drain failed: {e}"
+            logger.exception(self._error)
+            self.buffer.discard()
+
+    def write(self, data: bytes) -> int:
+        """Queue ``data`` for the sink.
+
+        Raises:
+            OSError: If the drain already failed (e.g. target exited).
+
+        """
+        if self._error is not None:
+            raise OSError(self._error)
+        if data:
+            self.buffer.put(data)
+        return len(data)
+
+    def flush(self) -> None:
+        """No-op: data reaches the sink asynchronously."""
+
+    def close(self) -> FlextResult[SpillBufferMetrics]:
+        """Wait until everything is written to the sink."""
+        self.buffer.close()
+        self._drain.join()
+        if self._error is not None:
+            return FlextResult[SpillBufferMetrics].fail(self._error)
+        metrics = self.buffer.metrics
+        self.buffer.discard()
+        return FlextResult[SpillBufferMetrics].ok(metrics)
+
+
+__all__: list[str] = [
+    "SpillBuffer",
+    "SpillBufferMetrics",
+    "SpillBufferWriter",
+]
@@ -0,0 +1,426 @@
+"""Embedded state store with atomic per-stream bookmarks.
+
+Meltano keeps one state blob per job and rewrites it whole; native runs and
+backfill windows need finer control:
+
+    - One row per (job, stream) in a SQLite database in WAL mode, so
+      concurrent per-entity jobs never rewrite each other's bookmarks and a
+      checkpoint writes only the streams that changed
+    - Every update is a compare-and-swap on the stream's version, inside a
+      ``BEGIN IMMEDIATE`` transaction (safe across processes)
+    - Previous versions are kept as history for ``rollback``; ``compact``
+      trims history and checkpoints the WAL
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Final, Self
+
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+
+logger = FlextLogger(__name__)
+
+DEFAULT_STATE_PATH: Final[Path] = Path(".meltano/state/native_state.sqlite")
+DEFAULT_HISTORY_LIMIT: Final[int] = 50
+DEFAULT_BUSY_TIMEOUT_SECONDS: Final[float] = 30.0
+_SCHEMA: Final[tuple[str, ...]] = (
+    """
+    CREATE TABLE IF NOT EXISTS bookmark (
+        job TEXT NOT NULL,
+        stream TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        value TEXT NOT NULL,
+        updated_at REAL NOT NULL,
+        PRIMARY KEY (job, stream)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS bookmark_history (
+        job TEXT NOT NULL,
+        stream TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        value TEXT NOT NULL,
+        updated_at REAL NOT NULL,
+        PRIMARY KEY (job, stream, version)
+    ) WITHOUT ROWID
+    """,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class StreamBookmark:
+    """One version of a stream's bookmark."""
+
+    job: str
+    stream: str
+    version: int
+    value: dict[str, t.GeneralValueType]
+    updated_at: float
+
+
+@dataclass(frozen=True, slots=True)
+class StateSnapshot:
+    """Bookmarks of a job with the versions they were read at."""
+
+    job: str
+    bookmarks: dict[str, dict[str, t.GeneralValueType]]
+    versions: dict[str, int]
+
+    def singer_state(self) -> dict[str, t.GeneralValueType]:
+        """Singer state (``{"bookmarks": {...}}``) for a tap or extractor."""
+        return {"bookmarks": {k: dict(v) for k, v in self.bookmarks.items()}}
+
+
+def _encode(value: Mapping[str, t.GeneralValueType]) -> str:
+    return json.dumps(value, separators=(",", ":"), sort_keys=True, default=str)
+
+
+class GruponosStateStore:
+    """SQLite/WAL store of per-stream bookmarks with CAS and history.
+
+    Versions start at 1; ``expected_version=0`` means "no bookmark yet".
+    Thread-safe (one connection behind a lock); other processes are
+    serialized by SQLite's write lock with ``busy_timeout``.
+
+    Example:
+        store = GruponosStateStore(project_root / DEFAULT_STATE_PATH)
+        snapshot = store.snapshot("wms-native-target-oracle")
+        ...  # run with snapshot.singer_state()
+        store.save_state(snapshot.job, new_state, expected=snapshot.versions)
+
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_STATE_PATH,
+        *,
+        history_limit: int = DEFAULT_HISTORY_LIMIT,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT_SECONDS,
+    ) -> None:
+        """Open (or create) the store at ``path``."""
+        self.path = path
+        self.history_limit = max(1, history_limit)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(
+            path, timeout=busy_timeout, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        self._lock = threading.Lock()
+
+    def get(self, job: str, stream: str) -> StreamBookmark | None:
+        """Current bookmark of ``stream`` in ``job``."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT version, value, updated_at FROM bookmark "
+                "WHERE job = ? AND stream = ?",
+                (job, stream),
+            ).fetchone()
+        if row is None:
+            return None
+        return StreamBookmark(job, stream, row[0], json.loads(row[1]), row[2])
+
+    def snapshot(self, job: str) -> StateSnapshot:
+        """All bookmarks of ``job`` with their versions."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT stream, version, value FROM bookmark WHERE job = ?", (job,)
+            ).fetchall()
+        return StateSnapshot(
+            job,
+            {stream: json.loads(value) for stream, _, value in rows},
+            {stream: version for stream, version, _ in rows},
+        )
+
+    def compare_and_swap(
+        self,
+        job: str,
+        stream: str,
+        value: Mapping[str, t.GeneralValueType],
+        *,
+        expected_version: int,
+    ) -> FlextResult[int]:
+        """Replace the bookmark if it is still at ``expected_version``.
+
+        Returns:
+            FlextResult[int]: The new version, or a failure on conflict.
+
+        """
+        result = self.save_state(
+            job,
+            {"bookmarks": {stream: dict(value)}},
+            expected={stream: expected_version},
+        )
+        if result.is_failure:
+            return FlextResult[int].fail(result.error or "state conflict")
+        return FlextResult[int].ok(result.value[stream])
+
+    def save_state(
+        self,
+        job: str,
+        state: Mapping[str, t.GeneralValueType],
+        *,
+        expected: Mapping[str, int],
+    ) -> FlextResult[dict[str, int]]:
+        """Write the changed streams of a Singer state in one transaction.
+
+        Each stream must still be at its ``expected`` version (0 or absent
+        for a new stream); unchanged bookmarks are not rewritten. On any
+        conflict nothing is written.
+
+        Returns:
+            FlextResult[dict[str, int]]: Current version of every stream in
+            ``state``.
+
+        """
+        bookmarks = state.get("bookmarks")
+        if not isinstance(bookmarks, Mapping):
+            return FlextResult[dict[str, int]].ok({})
+        now = time.time()
+        versions: dict[str, int] = {}
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                for stream, value in bookmarks.items():
+                    if not isinstance(value, Mapping):
+                        continue
+                    encoded = _encode(value)
+                    row = self._db.execute(
+                        "SELECT version, value FROM bookmark "
+                        "WHERE job = ? AND stream = ?",
+                        (job, stream),
+                    ).fetchone()
+                    current = row[0] if row is not None else 0
+                    if current != expected.get(stream, 0):
+                        self._db.execute("ROLLBACK")
+                        return FlextResult[dict[str, int]].fail(
+                            f"State conflict on {job}/{stream}: expected version "
+                            f"{expected.get(stream, 0)}, found {current}"
+                        )
+                    if row is not None and row[1] == encoded:
+                        versions[stream] = current
+                        continue
+                    versions[stream] = self._write(job, stream, current, encoded, now)
+                self._db.execute("COMMIT")
+            except sqlite3.Error as e:
+                self._db.execute("ROLLBACK")
+                return FlextResult[dict[str, int]].fail(f"State store error: {e}")
+        return FlextResult[dict[str, int]].ok(versions)
+
+    def _write(
+        self, job: str, stream: str, current: int, encoded: str, now: float
+    ) -> int:
+        """Store a new version and its history entry (inside a transaction)."""
+        version = current + 1
+        self._db.execute(
+            "INSERT OR REPLACE INTO bookmark (job, stream, version, value, "
+            "updated_at) VALUES (?, ?, ?, ?, ?)",
+            (job, stream, version, encoded, now),
+        )
+        self._db.execute(
+            "INSERT INTO bookmark_history (job, stream, version, value, "
+            "updated_at) VALUES (?, ?, ?, ?, ?)",
+            (job, stream, version, encoded, now),
+        )
+        self._db.execute(
+            "DELETE FROM bookmark_history "
+            "WHERE job = ? AND stream = ? AND version <= ?",
+            (job, stream, version - self.history_limit),
+        )
+        return version
+
+    def history(self, job: str, stream: str, limit: int = 20) -> list[StreamBookmark]:
+        """Stored versions of a bookmark, newest first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT version, value, updated_at FROM bookmark_history "
+                "WHERE job = ? AND stream = ? ORDER BY version DESC LIMIT ?",
+                (job, stream, limit),
+            ).fetchall()
+        return [
+            StreamBookmark(job, stream, version, json.loads(value), updated_at)
+            for version, value, updated_at in rows
+        ]
+
+    def rollback(self, job: str, stream: str, version: int) -> FlextResult[int]:
+        """Make an older version current again (as a new version)."""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                old = self._db.execute(
+                    "SELECT value FROM bookmark_history "
+                    "WHERE job = ? AND stream = ? AND version = ?",
+                    (job, stream, version),
+                ).fetchone()
+                row = self._db.execute(
+                    "SELECT version FROM bookmark WHERE job = ? AND stream = ?",
+                    (job, stream),
+                ).fetchone()
+                if old is None or row is None:
+                    self._db.execute("ROLLBACK")
+                    return FlextResult[int].fail(
+                        f"No version {version} of {job}/{stream} in history"
+                    )
+                new_version = self._write(job, stream, row[0], old[0], time.time())
+                self._db.execute("COMMIT")
+            except sqlite3.Error as e:
+                self._db.execute("ROLLBACK")
+                return FlextResult[int].fail(f"State store error: {e}")
+        logger.info("Rolled back %s/%s to version %s", job, stream, version)
+        return FlextResult[int].ok(new_version)
+
+    def delete(self, job: str, stream: str | None = None) -> None:
+        """Remove the bookmarks (and history) of a job or one of its streams."""
+        where = "job = ?" if stream is None else "job = ? AND stream = ?"
+        params = (job,) if stream is None else (job, stream)
+        with self._lock, self._db:
+            self._db.execute(
+                f"DELETE FROM bookmark WHERE {where}",  # noqa: S608
+                params,
+            )
+            self._db.execute(
+                f"DELETE FROM bookmark_history WHERE {where}",  # noqa: S608
+                params,
+            )
+
+    def compact(
+        self, *, keep: int | None = None, older_than: timedelta | None = None
+    ) -> int:
+        """Trim history to ``keep`` versions per stream (and by age).
+
+        The current version is never removed. Returns the rows deleted.
+        """
+        keep = max(1, keep or self.history_limit)
+        with self._lock:
+            with self._db:
+                deleted = self._db.execute(
+                    "DELETE FROM bookmark_history AS h WHERE h.version <= ("
+                    "SELECT b.version FROM bookmark AS b "
+                    "WHERE b.job = h.job AND b.stream = h.stream) - ?",
+                    (keep,),
+                ).rowcount
+                if older_than is not None:
+                    deleted += self._db.execute(
+                        "DELETE FROM bookmark_history AS h WHERE h.updated_at < ? "
+                        "AND h.version < (SELECT b.version FROM bookmark AS b "
+                        "WHERE b.job = h.job AND b.stream = h.stream)",
+                        (time.time() - older_than.total_seconds(),),
+                    ).rowcount
+            self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return deleted
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Context manager exit: close the database."""
+        self.close()
+
+
+class StateCheckpointer:
+    """Checkpoint a run's state into the store as the target confirms it.
+
+    Only the run's own streams are written, with CAS against the versions
+    the run started from, so a concurrent job on other streams of the same
+    job id is never overwritten. A conflict is recorded and the stream is
+    not written again by this run.
+
+    Attributes:
+      job: Job id in the store.
+      streams: Streams this run owns; None when it owns every stream of
+        the job (e.g. a proxied tap whose streams are not known upfront).
+      checkpoints: Successful checkpoint writes.
+      conflicts: Conflict messages, in order.
+
+    """
+
+    def __init__(
+        self,
+        store: GruponosStateStore,
+        job: str,
+        streams: Collection[str] | None,
+        versions: Mapping[str, int],
+    ) -> None:
+        """Start from the ``versions`` the run's state was read at."""
+        self.store = store
+        self.job = job
+        self.streams = frozenset(streams) if streams is not None else None
+        self.versions = dict(versions)
+        self.checkpoints = 0
+        self.conflicts: list[str] = []
+        self._conflicted: set[str] = set()
+        self._lock = threading.Lock()
+
+    def save(self, state: Mapping[str, t.GeneralValueType]) -> bool:
+        """Write the run's bookmarks from ``state``; False on conflict."""
+        bookmarks = state.get("bookmarks")
+        if not isinstance(bookmarks, Mapping):
+            return True
+        with self._lock:
+            owned = {
+                stream: value
+                for stream, value in bookmarks.items()
+                if (self.streams is None or stream in self.streams)
+                and stream not in self._conflicted
+            }
+            if not owned:
+                return True
+            result = self.store.save_state(
+                self.job, {"bookmarks": owned}, expected=self.versions
+            )
+            if result.is_failure:
+                self.conflicts.append(result.error or "state conflict")
+                self._conflicted.update(owned)
+                logger.warning("State checkpoint skipped: %s", result.error)
+                return False
+            self.versions.update(result.value)
+            self.checkpoints += 1
+        return True
+
+    def consume(self, lines: Iterable[bytes]) -> None:
+        """Checkpoint every STATE value a target writes to its stdout."""
+        for line in lines:
+            if not line.startswith(b"{"):
+                continue
+            try:
+                value = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(value, dict):
+                self.save(value)
+
+    def as_dict(self) -> dict[str, t.GeneralValueType]:
+        """Checkpoint counters (for pipeline metadata)."""
+        return {
+            "job": self.job,
+            "checkpoints": self.checkpoints,
+            "versions": dict(self.versions),
+            "conflicts": list(self.conflicts),
+        }
+
+
+__all__: list[str] = [
+    "DEFAULT_STATE_PATH",
+    "GruponosStateStore",
+    "StateCheckpointer",
+    "StateSnapshot",
+    "StreamBookmark",
+]
@@ -0,0 +1,1126 @@
+"""In-package extraction engine for the Oracle WMS LGF REST API.
+
+The external tap fetches entity pages one after another, so full syncs of
+``order_dtl`` are dominated by serial HTTP round-trips. This engine reads the
+same ``/entity/<name>/`` endpoints and writes Singer messages directly:
+
+    - Page 1 reveals ``page_count``; pages 2..N are fetched by a bounded
+      sliding window of ``max_parallel_pages`` workers sharing one pooled
+      keep-alive ``requests.Session``
+    - Each response body is decoded incrementally while it downloads; the
+      ``results`` array is parsed element by element instead of buffering
+      the whole body
+    - Pages are emitted strictly in page order, with a STATE message after
+      each page so checkpoints never run ahead of emitted records
+    - An optional ``GruponosWmsResponseCache`` serves unchanged pages from
+      disk and revalidates expired ones with conditional requests
+    - An optional ``GruponosAdaptiveRateLimiter`` paces requests per host and
+      facility below ``max_parallel_pages``
+    - With ``page_mode: sequenced`` (no ``page_count``, cursor pagination) a
+      ``WmsPagePrefetcher`` follows the ``next_page`` cursor as soon as it is
+      decoded from the head of a body, keeping ``prefetch_pages`` requests in
+      flight ahead of the consumer
+    - SCHEMA messages carry the resolved catalog schema when one is known;
+      otherwise the schema is inferred and widened page by page
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Generator, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Final, Self, TypeVar
+
+import requests
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+from gruponos_meltano_native.core.rate_limiter import parse_retry_after
+from gruponos_meltano_native.core.singer_codec import dumps, loads
+from gruponos_meltano_native.validators.date_normalizer import DateNormalizer
+
+if TYPE_CHECKING:
+    from gruponos_meltano_native.core.http_cache import GruponosWmsResponseCache
+    from gruponos_meltano_native.core.rate_limiter import (
+        GruponosAdaptiveRateLimiter,
+    )
+    from gruponos_meltano_native.core.singer_proxy import ByteSink, RecordTransform
+
+logger = FlextLogger(__name__)
+
+DEFAULT_PAGE_SIZE: Final[int] = 1000
+DEFAULT_MAX_PARALLEL_PAGES: Final[int] = 5
+DEFAULT_REQUEST_TIMEOUT: Final[float] = 300.0
+DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024
+DEFAULT_PREFETCH_PAGES: Final[int] = 2
+PAGE_MODES: Final[frozenset[str]] = frozenset({"paged", "sequenced"})
+_RETRY_STATUSES: Final[frozenset[int]] = frozenset({429, 500, 502, 503, 504})
+_MAX_BACKOFF_SECONDS: Final[float] = 30.0
+# A connection reset or stall while a page body streams in; the page is
+# fetched again from the start
+_BODY_READ_ERRORS: Final[tuple[type[Exception], ...]] = (
+    requests.exceptions.ChunkedEncodingError,
+)
+_RESULTS_RE: Final[re.Pattern[str]] = re.compile(r'"results"\s*:\s*\[')
+_SEPARATORS: Final[frozenset[str]] = frozenset(" \t\r\n,")
+# Enough of the buffer tail to find a ``"results": [`` split across chunks
+_RESULTS_KEY_TAIL: Final[int] = 32
+_NEXT_PAGE_KEY: Final[str] = '"next_page"'
+_NEXT_PAGE_RE: Final[re.Pattern[str]] = re.compile(
+    r'"next_page"\s*:\s*(null|"(?:[^"\\]|\\.)*")'
+)
+
+Record = dict[str, t.GeneralValueType]
+_T = TypeVar("_T")
+ChunkSource = Callable[
+    [str, Mapping[str, str | int]], Generator[bytes, None, None]
+]
+
+
+def _backoff_seconds(attempt: int) -> float:
+    return min(0.5 * 2**attempt, _MAX_BACKOFF_SECONDS)
+
+
+def _as_bool(value: t.GeneralValueType) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes", "on"}
+    return bool(value)
+
+
+@dataclass(frozen=True, slots=True)
+class WmsExtractorConfig:
+    """Connection and performance settings for ``GruponosWmsExtractor``."""
+
+    base_url: str
+    username: str
+    password: str
+    company_code: str | None = None
+    facility_code: str | None = None
+    api_version: str = "v10"
+    api_prefix: str = "wms/lgfapi"
+    page_size: int = DEFAULT_PAGE_SIZE
+    request_timeout: float = DEFAULT_REQUEST_TIMEOUT
+    max_parallel_pages: int = DEFAULT_MAX_PARALLEL_PAGES
+    page_mode: str = "paged"
+    prefetch_pages: int = DEFAULT_PREFETCH_PAGES
+    max_retries: int = 3
+    incremental_overlap_minutes: float = 0.0
+    flattening_enabled: bool = True
+    flattening_max_depth: int = 3
+
+    @classmethod
+    def from_mapping(cls, config: Mapping[str, t.GeneralValueType]) -> Self:
+        """Build from tap config (``meltano.yml`` / ``wms_integration.yml`` keys).
+
+        Raises:
+            ValueError: If base URL or credentials are missing, or the page
+                mode is unknown.
+
+        """
+        missing = [
+            key for key in ("base_url", "username", "password") if not config.get(key)
+        ]
+        if missing:
+            msg = f"WMS extractor config is missing: {', '.join(missing)}"
+            raise ValueError(msg)
+        page_mode = str(config.get("page_mode") or "paged")
+        if page_mode not in PAGE_MODES:
+            msg = f"Unknown WMS page_mode {page_mode!r}; use paged or sequenced"
+            raise ValueError(msg)
+        prefetch = config.get("prefetch_pages")
+        retries = config.get("max_retries")
+        return cls(
+            base_url=str(config["base_url"]),
+            username=str(config["username"]),
+            password=str(config["password"]),
+            company_code=str(config["company_code"])
+            if config.get("company_code")
+            else None,
+            facility_code=str(config["facility_code"])
+            if config.get("facility_code")
+            else None,
+            api_version=str(config.get("api_version") or "v10"),
+            api_prefix=str(config.get("api_endpoint_prefix") or "wms/lgfapi"),
+            page_size=int(config.get("page_size") or DEFAULT_PAGE_SIZE),
+            request_timeout=float(
+                config.get("request_timeout")
+                or config.get("timeout")
+                or DEFAULT_REQUEST_TIMEOUT
+            ),
+            max_parallel_pages=int(
+                config.get("max_parallel_pages") or DEFAULT_MAX_PARALLEL_PAGES
+            ),
+            page_mode=page_mode,
+            prefetch_pages=int(
+                prefetch if prefetch is not None else DEFAULT_PREFETCH_PAGES
+            ),
+            max_retries=int(retries if retries is not None else 3),
+            incremental_overlap_minutes=float(
+                config.get("incremental_overlap_minutes") or 0.0
+            ),
+            flattening_enabled=_as_bool(config.get("flattening_enabled", True)),
+            flattening_max_depth=int(config.get("flattening_max_depth") or 3),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class WmsEntity:
+    """Entity to extract, with its Singer keys and extra API filters."""
+
+    name: str
+    key_properties: tuple[str, ...] = ()
+    replication_key: str | None = None
+    filters: Mapping[str, str] = field(default_factory=dict)
+    # Singer stream (and so target table) written to; defaults to ``name``
+    stream: str | None = None
+    # Catalog schema of the stream; inferred from the records when unknown
+    schema: Mapping[str, t.GeneralValueType] | None = None
+
+    @property
+    def stream_name(self) -> str:
+        """Stream name of the SCHEMA and RECORD messages."""
+        return self.stream or self.name
+
+
+@dataclass(slots=True)
+class WmsExtractionStats:
+    """Counters and timings for one extraction run."""
+
+    entities: int = 0
+    pages: int = 0
+    records: int = 0
+    requests: int = 0
+    retries: int = 0
+    bytes_received: int = 0
+    max_in_flight: int = 0
+    pages_from_cache: int = 0
+    records_dropped: int = 0
+    http_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    pages_per_entity: dict[str, int] = field(default_factory=dict)
+    # Records written to the sink (after the transform), per entity
+    records_per_entity: dict[str, int] = field(default_factory=dict)
+    rate_limits: dict[str, dict[str, t.GeneralValueType]] = field(
+        default_factory=dict
+    )
+
+    def as_dict(self) -> dict[str, t.GeneralValueType]:
+        """Counters as a plain dict (for pipeline metadata)."""
+        return {
+            "entities": self.entities,
+            "pages": self.pages,
+            "records": self.records,
+            "requests": self.requests,
+            "retries": self.retries,
+            "bytes_received": self.bytes_received,
+            "max_in_flight": self.max_in_flight,
+            "pages_from_cache": self.pages_from_cache,
+            "records_dropped": self.records_dropped,
+            "http_seconds": round(self.http_seconds, 6),
+            "elapsed_seconds": round(self.elapsed_seconds, 6),
+            "pages_per_entity": dict(self.pages_per_entity),
+            "records_per_entity": dict(self.records_per_entity),
+            "rate_limits": dict(self.rate_limits),
+        }
+
+
+class WmsResultsDecoder:
+    """Incremental decoder for the ``results`` array of an LGF response.
+
+    ``feed`` accepts body chunks as they arrive and returns the records that
+    became complete. Of the surrounding metadata only the ``next_page``
+    cursor is kept: ``next_page_known`` turns true as soon as it was decoded
+    (LGF sends it before ``results``) or the body ended without it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty decoder."""
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._in_results = False
+        self.done = False
+        self.next_page: str | None = None
+        self.next_page_known = False
+
+    def feed(
+        self, chunk: bytes, *, final: bool = False
+    ) -> list[dict[str, t.GeneralValueType]]:
+        """Decode ``chunk`` and return newly completed records.
+
+        Raises:
+            ValueError: On malformed payloads or a truncated ``results`` array.
+
+        """
+        self._buffer = self._buffer[self._pos :] + self._text.decode(chunk, final)
+        self._pos = 0
+        records: list[dict[str, t.GeneralValueType]] = []
+        if not self._in_results and not self.done:
+            match = _RESULTS_RE.search(self._buffer)
+            head_end = match.start() if match is not None else len(self._buffer)
+            partial = self._scan_next_page(0, head_end)
+            if match is None:
+                self._pos = max(0, len(self._buffer) - _RESULTS_KEY_TAIL)
+                if partial is not None:
+                    self._pos = min(self._pos, partial)
+            else:
+                self._pos = match.end()
+                self._in_results = True
+        buffer = self._buffer
+        while self._in_results:
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _SEPARATORS:
+                pos += 1
+            self._pos = pos
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                self._pos = pos + 1
+                self._in_results = False
+                self.done = True
+                break
+            try:
+                record, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Records are objects, so an incomplete one never decodes
+                break
+            if not isinstance(record, dict):
+                msg = f"WMS results element is not an object: {record!r}"
+                raise ValueError(msg)  # noqa: TRY004 - payload error
+            records.append(record)
+            self._pos = end
+        if self.done:
+            # Trailing metadata is small; it stays buffered until the end
+            self._scan_next_page(self._pos, len(buffer))
+        if final and not self.done:
+            msg = "WMS response ended before the results array was complete"
+            raise ValueError(msg)
+        if final:
+            self.next_page_known = True
+        return records
+
+    def _scan_next_page(self, start: int, end: int) -> int | None:
+        """Decode ``next_page`` from ``buffer[start:end]``.
+
+        Returns the offset of a ``next_page`` key whose value is not complete
+        yet, so the caller keeps it buffered.
+        """
+        if self.next_page_known:
+            return None
+        found = _NEXT_PAGE_RE.search(self._buffer, start, end)
+        if found is not None:
+            value = json.loads(found.group(1))
+            self.next_page = str(value) if value else None
+            self.next_page_known = True
+            return None
+        key = self._buffer.find(_NEXT_PAGE_KEY, start, end)
+        return key if key >= 0 else None
+
+
+def flatten_record(
+    record: Mapping[str, t.GeneralValueType],
+    max_depth: int = 3,
+    separator: str = "__",
+) -> dict[str, t.GeneralValueType]:
+    """Flatten nested objects into ``parent__child`` keys.
+
+    Objects deeper than ``max_depth`` and all arrays are kept as JSON text,
+    matching the tap's flattening.
+    """
+    flat: dict[str, t.GeneralValueType] = {}
+    stack: list[tuple[str, Mapping[str, t.GeneralValueType], int]] = [
+        ("", record, 1)
+    ]
+    while stack:
+        prefix, current, depth = stack.pop()
+        for key, value in current.items():
+            name = f"{prefix}{separator}{key}" if prefix else str(key)
+            if isinstance(value, dict) and depth < max_depth:
+                stack.append((name, value, depth + 1))
+            elif isinstance(value, dict | list):
+                flat[name] = json.dumps(value, separators=(",", ":"), default=str)
+            else:
+                flat[name] = value
+    return flat
+
+
+_JSON_TYPES: Final[dict[type, str]] = {
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    str: "string",
+}
+
+
+class WmsSchemaTracker:
+    """JSON schema of a stream, widened as pages come in.
+
+    Used when no catalog schema is known. Types only widen (``integer`` to
+    ``number``, mixed types to ``string``); a column that was null in every
+    record so far is declared ``string`` until a value shows its type.
+    ``observe`` reports when the declared schema changed, so a new SCHEMA
+    message is due before the page's records.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no columns."""
+        self._kinds: dict[str, set[str]] = {}
+        self._declared: dict[str, str | None] = {}
+
+    @staticmethod
+    def _resolve(kinds: set[str]) -> str | None:
+        if not kinds:
+            return None
+        if kinds <= {"integer", "number"}:
+            return "number" if "number" in kinds else "integer"
+        return next(iter(kinds)) if len(kinds) == 1 else "string"
+
+    def observe(self, records: Sequence[Mapping[str, t.GeneralValueType]]) -> bool:
+        """Add ``records``; True if columns were added or types widened."""
+        for record in records:
+            for name, value in record.items():
+                kinds = self._kinds.setdefault(name, set())
+                if value is not None:
+                    kinds.add(_JSON_TYPES.get(type(value), "string"))
+        changed = False
+        for name, kinds in self._kinds.items():
+            resolved = self._resolve(kinds)
+            if name not in self._declared or self._declared[name] != resolved:
+                self._declared[name] = resolved
+                changed = True
+        return changed
+
+    def schema(self) -> dict[str, t.GeneralValueType]:
+        """Current schema (all columns nullable)."""
+        return {
+            "type": "object",
+            "properties": {
+                name: {"type": ["null", kind or "string"]}
+                for name, kind in self._declared.items()
+            },
+        }
+
+
+def infer_schema(
+    records: Sequence[Mapping[str, t.GeneralValueType]],
+) -> dict[str, t.GeneralValueType]:
+    """JSON schema inferred from sample records (all columns nullable)."""
+    tracker = WmsSchemaTracker()
+    tracker.observe(records)
+    return tracker.schema()
+
+
+def catalog_schemas(
+    catalog: Mapping[str, t.GeneralValueType],
+) -> dict[str, dict[str, t.GeneralValueType]]:
+    """Stream schemas of a Singer catalog, by ``tap_stream_id``."""
+    streams = catalog.get("streams")
+    schemas: dict[str, dict[str, t.GeneralValueType]] = {}
+    for stream in streams if isinstance(streams, list) else []:
+        if not isinstance(stream, dict) or not isinstance(stream.get("schema"), dict):
+            continue
+        name = stream.get("tap_stream_id") or stream.get("stream")
+        if name:
+            schemas[str(name)] = stream["schema"]
+    return schemas
+
+
+@dataclass(slots=True)
+class _PrefetchSlot:
+    """One cursor page: fetched or in flight, not yet consumed."""
+
+    url: str
+    params: Mapping[str, str | int]
+    future: Future[list[Record]] | None = None
+    next_page: str | None = None
+    cursor_known: bool = False
+    chained: bool = False
+
+
+class WmsPagePrefetcher:
+    """Cursor-following page iterator with bounded read-ahead.
+
+    Every page is streamed through a ``WmsResultsDecoder``; when its
+    ``next_page`` cursor is decoded the next request starts right away, so
+    the next round-trip overlaps the rest of the body and the consumer's
+    processing. At most ``depth`` pages are fetched or in flight but not yet
+    consumed, which bounds memory to ``depth`` pages. Closing the iterator
+    cancels the read-ahead; running fetches stop at their next chunk.
+    ``depth=0`` fetches each page only when the consumer asks for it. A body
+    cut off mid-read is fetched again, up to ``max_retries`` times.
+
+    Attributes:
+      depth: Pages kept in flight ahead of the consumer.
+      requests: Pages requested (including cancelled read-ahead).
+      max_in_flight: Peak number of concurrent fetches.
+
+    """
+
+    def __init__(
+        self,
+        fetch_chunks: ChunkSource,
+        *,
+        depth: int = DEFAULT_PREFETCH_PAGES,
+        name: str = "wms-prefetch",
+        max_retries: int = 0,
+    ) -> None:
+        """Initialize with the body chunk source of one page request."""
+        self.fetch_chunks = fetch_chunks
+        self.depth = max(0, depth)
+        self.name = name
+        self.max_retries = max_retries
+        self.requests = 0
+        self.retries = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._slots: deque[_PrefetchSlot] = deque()
+        self._tail: _PrefetchSlot | None = None
+        self._pool: ThreadPoolExecutor | None = None
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    def _fetch(self, slot: _PrefetchSlot) -> list[Record]:
+        attempt = 0
+        while True:
+            try:
+                return self._fetch_once(slot)
+            except _BODY_READ_ERRORS:
+                if attempt >= self.max_retries or self._cancelled.is_set():
+                    raise
+            attempt += 1
+            with self._lock:
+                self.retries += 1
+            time.sleep(_backoff_seconds(attempt))
+
+    def _fetch_once(self, slot: _PrefetchSlot) -> list[Record]:
+        with self._lock:
+            self.requests += 1
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        decoder = WmsResultsDecoder()
+        records: list[Record] = []
+        chunks = self.fetch_chunks(slot.url, slot.params)
+        try:
+            for chunk in chunks:
+                if self._cancelled.is_set():
+                    return records
+                records.extend(decoder.feed(chunk))
+                if decoder.next_page_known and not slot.cursor_known:
+                    self._cursor_found(slot, decoder.next_page)
+            records.extend(decoder.feed(b"", final=True))
+        finally:
+            chunks.close()
+            with self._lock:
+                self._in_flight -= 1
+        if not slot.cursor_known:
+            self._cursor_found(slot, decoder.next_page)
+        return records
+
+    def _cursor_found(self, slot: _PrefetchSlot, next_page: str | None) -> None:
+        with self._lock:
+            slot.next_page = next_page
+            slot.cursor_known = True
+            self._chain()
+
+    def _chain(self) -> None:
+        """Start the successor of the last page while there is room (locked)."""
+        tail = self._tail
+        while (
+            self._pool is not None
+            and tail is not None
+            and tail.cursor_known
+            and tail.next_page
+            and not tail.chained
+            and len(self._slots) < self.depth
+            and not self._cancelled.is_set()
+        ):
+            successor = _PrefetchSlot(tail.next_page, {})
+            tail.chained = True
+            successor.future = self._pool.submit(self._fetch, successor)
+            self._slots.append(successor)
+            self._tail = tail = successor
+
+    def pages(
+        self, url: str, params: Mapping[str, str | int]
+    ) -> Iterator[list[Record]]:
+        """Yield the records of each page, following ``next_page`` in order."""
+        if self.depth == 0:
+            slot: _PrefetchSlot | None = _PrefetchSlot(url, params)
+            while slot is not None:
+                records = self._fetch(slot)
+                yield records
+                slot = _PrefetchSlot(slot.next_page, {}) if slot.next_page else None
+            return
+        self._cancelled.clear()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.depth, thread_name_prefix=self.name
+        )
+        first = _PrefetchSlot(url, params)
+        with self._lock:
+            first.future = self._pool.submit(self._fetch, first)
+            self._slots.append(first)
+            self._tail = first
+        try:
+            while True:
+                with self._lock:
+                    if not self._slots:
+                        return
+                    head = self._slots[0]
+                if head.future is None:  # pragma: no cover - set on submit
+                    return
+                records = head.future.result()
+                with self._lock:
+                    self._slots.popleft()
+                    self._chain()
+                yield records
+        finally:
+            self.cancel()
+
+    def cancel(self) -> None:
+        """Stop the read-ahead and wait for running fetches to notice."""
+        self._cancelled.set()
+        with self._lock:
+            slots = list(self._slots)
+            self._slots.clear()
+            pool, self._pool = self._pool, None
+        for slot in slots:
+            if slot.future is not None:
+                slot.future.cancel()
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+class GruponosWmsExtractor:
+    """Concurrent page fetcher emitting Singer messages in page order.
+
+    Example:
+        config = WmsExtractorConfig.from_mapping(tap_config)
+        with GruponosWmsExtractor(config) as extractor:
+            result = extractor.run([WmsEntity("order_dtl", ("id",), "mod_ts")],
+                                   sys.stdout.buffer)
+
+    Attributes:
+      config: Connection and performance settings.
+      state: Singer state (``bookmarks`` per entity), updated per page.
+      stats: Counters of the last run.
+
+    """
+
+    def __init__(
+        self,
+        config: WmsExtractorConfig,
+        *,
+        session: requests.Session | None = None,
+        cache: GruponosWmsResponseCache | None = None,
+        limiter: GruponosAdaptiveRateLimiter | None = None,
+        transform: RecordTransform | None = None,
+        state: Mapping[str, t.GeneralValueType] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Initialize the extractor.
+
+        Args:
+            config: Connection and performance settings.
+            session: Session to reuse (a pooled one is created by default).
+            cache: Optional on-disk response cache (conditional requests).
+            limiter: Adaptive rate limiter (shared across extractors to share
+                host/facility budgets); ``max_parallel_pages`` stays the cap.
+            transform: Optional ``(stream, record) -> record | None`` hook run
+                on flattened records before they are written; returning None
+                drops the record (e.g. ``GruponosOverlapDeduplicator``).
+            state: Singer state from a previous run.
+            chunk_size: Bytes read per chunk while streaming a page.
+
+        """
+        self.config = config
+        self.cache = cache
+        self.limiter = limiter
+        self.transform = transform
+        self.chunk_size = chunk_size
+        self.state: dict[str, t.GeneralValueType] = dict(state or {})
+        self.stats = WmsExtractionStats()
+        self._owns_session = session is None
+        self.session = session if session is not None else self._new_session()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        # Entities run one after another, so one normalizer is not shared
+        self._dates = DateNormalizer()
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        # One pool sized for the window, so every worker keeps its connection
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(
+                1, self.config.max_parallel_pages, self.config.prefetch_pages
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.auth = (self.config.username, self.config.password)
+        session.headers.update({
+            "Accept": "application/json",
+            "Connection": "keep-alive",
+        })
+        return session
+
+    def entity_url(self, entity: str) -> str:
+        """Endpoint URL of an LGF entity."""
+        base = self.config.base_url.rstrip("/")
+        prefix = self.config.api_prefix.strip("/")
+        return f"{base}/{prefix}/{self.config.api_version}/entity/{entity}/"
+
+    def _bookmark(self, entity: WmsEntity) -> str | None:
+        bookmarks = self.state.get("bookmarks")
+        if not isinstance(bookmarks, dict):
+            return None
+        entry = bookmarks.get(entity.name)
+        value = entry.get("replication_key_value") if isinstance(entry, dict) else None
+        return str(value) if value is not None else None
+
+    def _params(self, entity: WmsEntity) -> dict[str, str | int]:
+        params: dict[str, str | int] = {
+            "page_size": self.config.page_size,
+            "page_mode": self.config.page_mode,
+        }
+        if self.config.company_code:
+            params["company_id__code"] = self.config.company_code
+        if self.config.facility_code:
+            params["facility_id__code"] = self.config.facility_code
+        if entity.replication_key:
+            # Stable ordering keeps pages disjoint and bookmarks monotonic
+            params["ordering"] = ",".join([entity.replication_key, "id"])
+            bookmark = self._bookmark(entity)
+            if bookmark is not None:
+                params[f"{entity.replication_key}__gte"] = self._with_overlap(
+                    bookmark
+                )
+        # Explicit filters (e.g. a backfill window) take precedence
+        params.update(entity.filters)
+        return params
+
+    def _with_overlap(self, bookmark: str) -> str:
+        """Bookmark moved back by ``incremental_overlap_minutes`` (late commits)."""
+        minutes = self.config.incremental_overlap_minutes
+        if not minutes:
+            return bookmark
+        try:
+            moment = datetime.fromisoformat(bookmark)
+        except ValueError:
+            return bookmark
+        return (moment - timedelta(minutes=minutes)).isoformat()
+
+    def count_rows(self, entity: WmsEntity) -> int:
+        """Rows matching the entity's filters (``result_count`` of a 1-row page)."""
+        params = {
+            **self._params(entity),
+            "page_size": 1,
+            "page": 1,
+            "page_mode": "paged",
+        }
+        with self._request(self.entity_url(entity.name), params) as response:
+            payload = loads(response.content)
+        if not isinstance(payload, dict):
+            msg = "WMS response is not a JSON object"
+            raise ValueError(msg)  # noqa: TRY004 - payload error
+        return int(payload.get("result_count") or 0)
+
+    def _request(
+        self,
+        url: str,
+        params: Mapping[str, str | int],
+        headers: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        """GET with retries on connection errors and retryable statuses.
+
+        With a rate limiter, each attempt waits for the host/facility budget
+        and reports its status, latency and ``Retry-After`` back to it.
+        """
+        attempt = 0
+        while True:
+            permit = (
+                self.limiter.acquire(url, self.config.facility_code)
+                if self.limiter is not None
+                else None
+            )
+            started = time.perf_counter()
+            retry_after: float | None = None
+            try:
+                response = self.session.get(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=self.config.request_timeout,
+                    stream=True,
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if permit is not None:
+                    permit.release(None)
+                if attempt >= self.config.max_retries:
+                    raise
+            else:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if permit is not None:
+                    permit.release(response.status_code, retry_after)
+                if (
+                    response.status_code not in _RETRY_STATUSES
+                    or attempt >= self.config.max_retries
+                ):
+                    response.raise_for_status()
+                    with self._lock:
+                        self.stats.requests += 1
+                        self.stats.http_seconds += time.perf_counter() - started
+                    return response
+                response.close()
+            attempt += 1
+            with self._lock:
+                self.stats.retries += 1
+            if permit is None or retry_after is None:
+                # The limiter already pauses its budget for Retry-After
+                time.sleep(
+                    _backoff_seconds(attempt) if retry_after is None else retry_after
+                )
+
+    def _retry_body(self, fetch: Callable[[], _T]) -> _T:
+        """Run a page fetch again when its body is cut off mid-read."""
+        attempt = 0
+        while True:
+            try:
+                return fetch()
+            except _BODY_READ_ERRORS:
+                if attempt >= self.config.max_retries:
+                    raise
+            attempt += 1
+            with self._lock:
+                self.stats.retries += 1
+            time.sleep(_backoff_seconds(attempt))
+
+    def _page_chunks(
+        self, url: str, params: Mapping[str, str | int]
+    ) -> Generator[bytes, None, None]:
+        """Body chunks of a page, served from or stored into the cache."""
+        cache = self.cache
+        entry = cache.lookup(url, params) if cache is not None else None
+        if cache is not None and entry is not None and cache.is_fresh(entry):
+            body = cache.read_body(entry)
+            if body is not None:
+                cache.record_hit(entry, revalidated=False)
+                self._count_cached_page()
+                yield body
+                return
+        headers = entry.conditional_headers() if entry is not None else None
+        with self._request(url, params, headers) as response:
+            if cache is not None and entry is not None and (
+                response.status_code == HTTPStatus.NOT_MODIFIED
+            ):
+                body = cache.read_body(entry)
+                if body is not None:
+                    cache.record_hit(entry, revalidated=True)
+                    self._count_cached_page()
+                    yield body
+                    return
+            else:
+                collected: list[bytes] = []
+                for chunk in self._iter_body(response):
+                    with self._lock:
+                        self.stats.bytes_received += len(chunk)
+                    if cache is not None:
+                        collected.append(chunk)
+                    yield chunk
+                if cache is not None:
+                    cache.record_miss()
+                    cache.store(url, params, b"".join(collected), response.headers)
+                return
+        # 304 but the stored body is gone (dropped by read_body): refetch
+        yield from self._page_chunks(url, params)
+
+    def _iter_body(self, response: requests.Response) -> Iterator[bytes]:
+        """Body chunks as soon as they arrive (up to ``chunk_size`` each).
+
+        ``iter_content`` waits for a full chunk, which would hide the
+        ``next_page`` cursor at the head of a body until the whole page is in.
+        """
+        read1 = getattr(response.raw, "read1", None)
+        try:
+            if read1 is None:  # urllib3 < 2
+                yield from response.iter_content(chunk_size=self.chunk_size)
+                return
+            while chunk := read1(self.chunk_size, decode_content=True):
+                yield chunk
+        except (ProtocolError, ReadTimeoutError, requests.ConnectionError) as e:
+            # Same error ``iter_content`` raises, so callers retry one type
+            raise requests.exceptions.ChunkedEncodingError(e) from e
+
+    def _count_cached_page(self) -> None:
+        with self._lock:
+            self.stats.pages_from_cache += 1
+
+    def _fetch_first_page(
+        self, url: str, params: Mapping[str, str | int]
+    ) -> tuple[list[dict[str, t.GeneralValueType]], int]:
+        """Fetch page 1 fully to learn ``page_count``."""
+        body = self._retry_body(
+            lambda: b"".join(self._page_chunks(url, {**params, "page": 1}))
+        )
+        payload = loads(body)
+        if not isinstance(payload, dict):
+            msg = "WMS response is not a JSON object"
+            raise ValueError(msg)  # noqa: TRY004 - payload error
+        results = payload.get("results") or []
+        page_count = int(payload.get("page_count") or 1)
+        return [r for r in results if isinstance(r, dict)], page_count
+
+    def fetch_page(
+        self, url: str, params: Mapping[str, str | int], page: int
+    ) -> list[dict[str, t.GeneralValueType]]:
+        """Fetch one page, decoding records while the body streams in."""
+        with self._lock:
+            self._in_flight += 1
+            self.stats.max_in_flight = max(self.stats.max_in_flight, self._in_flight)
+        try:
+            return self._retry_body(lambda: self._decode_page(url, params, page))
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _decode_page(
+        self, url: str, params: Mapping[str, str | int], page: int
+    ) -> list[dict[str, t.GeneralValueType]]:
+        decoder = WmsResultsDecoder()
+        records: list[dict[str, t.GeneralValueType]] = []
+        for chunk in self._page_chunks(url, {**params, "page": page}):
+            records.extend(decoder.feed(chunk))
+        records.extend(decoder.feed(b"", final=True))
+        return records
+
+    def iter_pages(
+        self, entity: WmsEntity
+    ) -> Iterator[list[dict[str, t.GeneralValueType]]]:
+        """Yield the records of each page, in page order."""
+        url = self.entity_url(entity.name)
+        params = self._params(entity)
+        if self.config.page_mode == "sequenced":
+            yield from self._iter_cursor_pages(entity, url, params)
+            return
+        first, page_count = self._fetch_first_page(url, params)
+        yield first
+        if page_count <= 1:
+            return
+        window = max(1, self.config.max_parallel_pages)
+        with ThreadPoolExecutor(
+            max_workers=window, thread_name_prefix=f"wms-{entity.name}"
+        ) as pool:
+            pending: deque[Future[list[dict[str, t.GeneralValueType]]]] = deque()
+            next_page = 2
+            try:
+                while next_page <= page_count and len(pending) < window:
+                    pending.append(pool.submit(self.fetch_page, url, params, next_page))
+                    next_page += 1
+                while pending:
+                    records = pending.popleft().result()
+                    if next_page <= page_count:
+                        pending.append(
+                            pool.submit(self.fetch_page, url, params, next_page)
+                        )
+                        next_page += 1
+                    yield records
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _iter_cursor_pages(
+        self, entity: WmsEntity, url: str, params: Mapping[str, str | int]
+    ) -> Iterator[list[Record]]:
+        prefetcher = WmsPagePrefetcher(
+            self._page_chunks,
+            depth=self.config.prefetch_pages,
+            name=f"wms-{entity.name}",
+            max_retries=self.config.max_retries,
+        )
+        try:
+            yield from prefetcher.pages(url, params)
+        finally:
+            with self._lock:
+                self.stats.max_in_flight = max(
+                    self.stats.max_in_flight, prefetcher.max_in_flight
+                )
+                self.stats.retries += prefetcher.retries
+
+    def _advance_bookmark(
+        self, entity: WmsEntity, records: Sequence[Mapping[str, t.GeneralValueType]]
+    ) -> bool:
+        key = entity.replication_key
+        if key is None:
+            return False
+        values = [str(r[key]) for r in records if r.get(key) is not None]
+        if not values:
+            return False
+        current = self._bookmark(entity)
+        latest = max(values, key=lambda value: self._replication_order(value, key))
+        if current is not None and self._replication_order(
+            current, key
+        ) >= self._replication_order(latest, key):
+            return False
+        bookmarks = self.state.setdefault("bookmarks", {})
+        if isinstance(bookmarks, dict):
+            bookmarks[entity.name] = {
+                "replication_key": key,
+                "replication_key_value": latest,
+            }
+        return True
+
+    def _replication_order(self, value: str, column: str) -> tuple[int, datetime | str]:
+        """Sort key of a replication key value: its instant, else its text.
+
+        Timestamps compare by instant, so offsets and fractional seconds do
+        not move the bookmark backwards the way a string comparison would.
+        """
+        moment = self._dates.parse(value, column)
+        return (1, moment) if moment is not None else (0, value)
+
+    def extract(self, entity: WmsEntity, sink: ByteSink) -> None:
+        """Write SCHEMA, RECORD and STATE messages for one entity to ``sink``.
+
+        A catalog schema (``entity.schema``) is sent before the first page.
+        Without one, SCHEMA waits for the first page with records and is
+        sent again whenever a later page adds columns or widens a type.
+
+        Raises:
+            requests.RequestException: On HTTP failures after retries.
+            ValueError: On malformed payloads.
+
+        """
+        tracker = WmsSchemaTracker() if entity.schema is None else None
+        if entity.schema is not None:
+            sink.write(self._schema_message(entity, entity.schema))
+        pages = 0
+        forwarded = 0
+        for page in self.iter_pages(entity):
+            records = (
+                [
+                    flatten_record(record, self.config.flattening_max_depth)
+                    for record in page
+                ]
+                if self.config.flattening_enabled
+                else page
+            )
+            extracted_at = datetime.now(UTC).isoformat()
+            out: list[bytes] = []
+            if tracker is not None and tracker.observe(records):
+                out.append(self._schema_message(entity, tracker.schema()))
+            kept = records
+            if self.transform is not None:
+                # Schema and bookmark still see every fetched record
+                transform = self.transform
+                kept = [
+                    r
+                    for r in (transform(entity.name, record) for record in records)
+                    if r is not None
+                ]
+                self.stats.records_dropped += len(records) - len(kept)
+            out.extend(
+                self._encode({
+                    "type": "RECORD",
+                    "stream": entity.stream_name,
+                    "record": record,
+                    "time_extracted": extracted_at,
+                })
+                for record in kept
+            )
+            if self._advance_bookmark(entity, records):
+                out.append(self._encode({"type": "STATE", "value": self.state}))
+            sink.write(b"".join(out))
+            sink.flush()
+            pages += 1
+            forwarded += len(kept)
+            self.stats.pages += 1
+            self.stats.records += len(records)
+        self.stats.pages_per_entity[entity.name] = pages
+        self.stats.records_per_entity[entity.name] = forwarded
+        self.stats.entities += 1
+
+    @staticmethod
+    def _encode(message: Mapping[str, t.GeneralValueType]) -> bytes:
+        return dumps(message) + b"\n"
+
+    def _schema_message(
+        self, entity: WmsEntity, schema: Mapping[str, t.GeneralValueType]
+    ) -> bytes:
+        return self._encode({
+            "type": "SCHEMA",
+            "stream": entity.stream_name,
+            "schema": schema,
+            "key_properties": list(entity.key_properties),
+            "bookmark_properties": [entity.replication_key]
+            if entity.replication_key
+            else [],
+        })
+
+    def run(
+        self, entities: Sequence[WmsEntity], sink: ByteSink
+    ) -> FlextResult[WmsExtractionStats]:
+        """Extract ``entities`` one after another into ``sink``."""
+        self.stats = WmsExtractionStats()
+        started = time.perf_counter()
+        try:
+            for entity in entities:
+                self.extract(entity, sink)
+        except (requests.RequestException, OSError, ValueError) as e:
+            logger.exception("WMS extraction failed")
+            return FlextResult[WmsExtractionStats].fail(f"WMS extraction failed: {e}")
+        finally:
+            self.stats.elapsed_seconds = time.perf_counter() - started
+            if self.cache is not None:
+                # Keep what was downloaded even when the run failed
+                self.cache.flush()
+            if self.limiter is not None:
+                self.stats.rate_limits = self.limiter.metrics()
+        logger.info(
+            "WMS extraction finished: %s records in %s pages (%.2fs)",
+            self.stats.records,
+            self.stats.pages,
+            self.stats.elapsed_seconds,
+        )
+        return FlextResult[WmsExtractionStats].ok(self.stats)
+
+    def close(self) -> None:
+        """Close the session when it was created by the extractor."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Context manager exit: close the session."""
+        self.close()
+
+
+__all__: list[str] = [
+    "DEFAULT_MAX_PARALLEL_PAGES",
+    "DEFAULT_PAGE_SIZE",
+    "DEFAULT_PREFETCH_PAGES",
+    "GruponosWmsExtractor",
+    "WmsEntity",
+    "WmsExtractionStats",
+    "WmsExtractorConfig",
+    "WmsPagePrefetcher",
+    "WmsResultsDecoder",
+    "WmsSchemaTracker",
+    "catalog_schemas",
+    "flatten_record",
+    "infer_schema",
+]
@@ -8,6 +8,7 @@ Fornece classes e funções para:
     - Monitoramento de pipeline e sistema
     - Severidade e tipos de alerta
     - Integração com webhook, email e Slack
+    - Ledger de execuções (perfis e drift entre runs)
 
 Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
 """
@@ -22,6 +23,10 @@ from gruponos_meltano_native.monitoring.alert_manager import (
     GruponosMeltanoAlertType,
     create_gruponos_meltano_alert_manager,
 )
+from gruponos_meltano_native.monitoring.run_ledger import (
+    GruponosMeltanoRunLedger,
+    create_gruponos_meltano_run_ledger,
+)
 
 __all__: list[str] = [
     "GruponosMeltanoAlert",
@@ -29,5 +34,7 @@ __all__: list[str] = [
     "GruponosMeltanoAlertService",
     "GruponosMeltanoAlertSeverity",
     "GruponosMeltanoAlertType",
+    "GruponosMeltanoRunLedger",
     "create_gruponos_meltano_alert_manager",
+    "create_gruponos_meltano_run_ledger",
 ]
@@ -0,0 +1,358 @@
+"""Ledger de Execuções GrupoNOS.
+
+Registro append-only (JSON lines) de artefatos por execução de pipeline:
+perfis de colunas, achados de drift, mudanças de schema do catálogo e demais
+metadados que precisam ser comparados entre runs sem reler as tabelas de destino.
+
+Classes:
+    GruponosMeltanoRunLedger: Ledger de execuções em arquivo JSON lines.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Final
+
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+
+from gruponos_meltano_native.config import GruponosMeltanoNativeConfig
+from gruponos_meltano_native.core.catalog_cache import SchemaChange
+from gruponos_meltano_native.validators.integrity import OrphanReport
+from gruponos_meltano_native.validators.profiler import (
+    DriftFinding,
+    StreamProfiler,
+    detect_drift,
+)
+
+logger = FlextLogger(__name__)
+
+DEFAULT_LEDGER_FILENAME: Final[str] = ".meltano/run_ledger.jsonl"
+DEFAULT_TRAILING_RUNS: Final[int] = 10
+_TAIL_BLOCK_SIZE: Final[int] = 64 * 1024
+
+# Entry kinds written by this package
+KIND_PROFILE: Final[str] = "profile"
+KIND_DRIFT: Final[str] = "drift"
+KIND_INTEGRITY: Final[str] = "integrity"
+KIND_SCHEMA_CHANGE: Final[str] = "schema_change"
+
+
+class GruponosMeltanoRunLedger:
+    """Ledger append-only de execuções em JSON lines.
+
+    Cada linha é um objeto ``{"run_id", "job_name", "kind", "stream",
+    "timestamp", "payload"}``. ``trailing_payloads`` lê o arquivo de trás
+    para frente em blocos e para ao achar os N runs pedidos, então o custo
+    não cresce com o histórico acumulado.
+
+    Attributes:
+      path: Caminho do arquivo do ledger.
+
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Inicializa ledger no caminho informado.
+
+        Args:
+            path: Arquivo JSON lines (criado no primeiro ``append``).
+
+        """
+        self.path = path
+
+    def append(
+        self,
+        kind: str,
+        payload: dict[str, t.GeneralValueType],
+        *,
+        run_id: str,
+        job_name: str | None = None,
+        stream: str | None = None,
+    ) -> FlextResult[dict[str, t.GeneralValueType]]:
+        """Acrescenta uma entrada ao ledger.
+
+        Args:
+            kind: Tipo da entrada (ex.: ``profile``, ``drift``).
+            payload: Conteúdo serializável em JSON.
+            run_id: Identificador da execução.
+            job_name: Job Meltano associado.
+            stream: Stream Singer associado.
+
+        Returns:
+            FlextResult[dict]: Entrada gravada ou erro de I/O.
+
+        """
+        entry: dict[str, t.GeneralValueType] = {
+            "run_id": run_id,
+            "job_name": job_name,
+            "kind": kind,
+            "stream": stream,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "payload": payload,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as fh:
+                fh.write(json.dumps(entry, separators=(",", ":"), default=str))
+                fh.write("\n")
+        except (OSError, TypeError, ValueError) as e:
+            logger.exception("Failed to append run ledger entry")
+            return FlextResult[dict[str, t.GeneralValueType]].fail(
+                f"Run ledger append failed: {e}"
+            )
+        return FlextResult[dict[str, t.GeneralValueType]].ok(entry)
+
+    def _parse_line(
+        self, line: str | bytes, line_number: int | None = None
+    ) -> dict[str, t.GeneralValueType] | None:
+        if not line.strip():
+            return None
+        try:
+            return json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            logger.warning(
+                "Skipping corrupt run ledger line %s in %s",
+                line_number if line_number is not None else "(tail)",
+                self.path,
+            )
+            return None
+
+    def _iter_entries(self) -> Iterator[dict[str, t.GeneralValueType]]:
+        if not self.path.exists():
+            return
+        with self.path.open(encoding="utf-8") as fh:
+            for line_number, line in enumerate(fh, 1):
+                entry = self._parse_line(line, line_number)
+                if entry is not None:
+                    yield entry
+
+    def _iter_entries_reversed(self) -> Iterator[dict[str, t.GeneralValueType]]:
+        """Entradas da mais recente para a mais antiga, lendo do fim do arquivo."""
+        if not self.path.exists():
+            return
+        with self.path.open("rb") as fh:
+            position = fh.seek(0, os.SEEK_END)
+            # Bytes before the first newline of a block may continue earlier
+            remainder = b""
+            while position > 0:
+                size = min(_TAIL_BLOCK_SIZE, position)
+                position -= size
+                fh.seek(position)
+                lines = (fh.read(size) + remainder).split(b"\n")
+                remainder = lines.pop(0)
+                for line in reversed(lines):
+                    entry = self._parse_line(line)
+                    if entry is not None:
+                        yield entry
+            entry = self._parse_line(remainder)
+            if entry is not None:
+                yield entry
+
+    def entries(
+        self,
+        *,
+        kind: str | None = None,
+        job_name: str | None = None,
+        stream: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, t.GeneralValueType]]:
+        """Lista entradas filtradas, mantendo apenas as ``limit`` mais recentes.
+
+        Returns:
+            list[dict]: Entradas em ordem cronológica.
+
+        """
+        selected: deque[dict[str, t.GeneralValueType]] = deque(maxlen=limit)
+        for entry in self._iter_entries():
+            if kind is not None and entry.get("kind") != kind:
+                continue
+            if job_name is not None and entry.get("job_name") != job_name:
+                continue
+            if stream is not None and entry.get("stream") != stream:
+                continue
+            selected.append(entry)
+        return list(selected)
+
+    def trailing_payloads(
+        self,
+        kind: str,
+        *,
+        runs: int,
+        stream: str | None = None,
+        job_name: str | None = None,
+        exclude_run_id: str | None = None,
+    ) -> list[dict[str, t.GeneralValueType]]:
+        """Payloads das últimas ``runs`` entradas de um tipo.
+
+        Args:
+            kind: Tipo da entrada.
+            runs: Número de entradas anteriores desejadas.
+            stream: Filtro opcional por stream.
+            job_name: Filtro opcional por job.
+            exclude_run_id: Run a ignorar (tipicamente o run corrente).
+
+        Returns:
+            list[dict]: Payloads em ordem cronológica.
+
+        """
+        payloads: list[dict[str, t.GeneralValueType]] = []
+        if runs <= 0:
+            return payloads
+        for entry in self._iter_entries_reversed():
+            if (
+                entry.get("kind") != kind
+                or (job_name is not None and entry.get("job_name") != job_name)
+                or (stream is not None and entry.get("stream") != stream)
+                or (exclude_run_id and entry.get("run_id") == exclude_run_id)
+            ):
+                continue
+            payloads.append(entry["payload"])
+            if len(payloads) == runs:
+                break
+        payloads.reverse()
+        return payloads
+
+    def record_profile(
+        self,
+        profiler: StreamProfiler,
+        *,
+        run_id: str,
+        job_name: str | None = None,
+        trailing_runs: int = DEFAULT_TRAILING_RUNS,
+    ) -> FlextResult[list[DriftFinding]]:
+        """Grava o perfil do stream e o compara com os últimos runs.
+
+        Args:
+            profiler: Perfil do stream no run corrente.
+            run_id: Identificador do run corrente.
+            job_name: Job Meltano associado.
+            trailing_runs: Número de runs anteriores usados como baseline.
+
+        Returns:
+            FlextResult[list[DriftFinding]]: Achados de drift (também gravados).
+
+        """
+        history = [
+            StreamProfiler.from_dict(payload)
+            for payload in self.trailing_payloads(
+                KIND_PROFILE,
+                runs=trailing_runs,
+                stream=profiler.stream,
+                job_name=job_name,
+                exclude_run_id=run_id,
+            )
+        ]
+        findings = detect_drift(profiler, history)
+
+        append_result = self.append(
+            KIND_PROFILE,
+            profiler.to_dict(),
+            run_id=run_id,
+            job_name=job_name,
+            stream=profiler.stream,
+        )
+        if append_result.is_failure:
+            return FlextResult[list[DriftFinding]].fail(
+                append_result.error or "Run ledger append failed"
+            )
+        if findings:
+            logger.warning(
+                "Drift detected in stream %s: %d findings",
+                profiler.stream,
+                len(findings),
+            )
+            self.append(
+                KIND_DRIFT,
+                {"findings": [finding.to_dict() for finding in findings]},
+                run_id=run_id,
+                job_name=job_name,
+                stream=profiler.stream,
+            )
+        return FlextResult[list[DriftFinding]].ok(findings)
+
+    def record_integrity(
+        self,
+        reports: list[OrphanReport],
+        *,
+        run_id: str,
+        job_name: str | None = None,
+    ) -> FlextResult[dict[str, t.GeneralValueType]]:
+        """Grava o relatório de integridade referencial do run.
+
+        Args:
+            reports: Relatórios de ``ReferentialIntegrityChecker.finalize``.
+            run_id: Identificador do run corrente.
+            job_name: Job Meltano associado.
+
+        """
+        return self.append(
+            KIND_INTEGRITY,
+            {
+                "total_orphans": sum(report.orphans for report in reports),
+                "relationships": [report.to_dict() for report in reports],
+            },
+            run_id=run_id,
+            job_name=job_name,
+        )
+
+    def record_schema_changes(
+        self,
+        changes: list[SchemaChange],
+        *,
+        run_id: str,
+        job_name: str | None = None,
+    ) -> FlextResult[dict[str, t.GeneralValueType]]:
+        """Grava as mudanças de schema detectadas na redescoberta do catálogo.
+
+        Args:
+            changes: Diferenças de ``diff_catalogs``.
+            run_id: Identificador do run corrente.
+            job_name: Extractor ou job associado.
+
+        """
+        return self.append(
+            KIND_SCHEMA_CHANGE,
+            {
+                "total_changes": len(changes),
+                "changes": [change.to_dict() for change in changes],
+            },
+            run_id=run_id,
+            job_name=job_name,
+        )
+
+
+def create_gruponos_meltano_run_ledger(
+    config: GruponosMeltanoNativeConfig | None = None,
+    path: Path | None = None,
+) -> GruponosMeltanoRunLedger:
+    """Cria ledger no projeto Meltano configurado.
+
+    Args:
+        config: Configuração (padrões do ambiente se omitida).
+        path: Caminho explícito; sobrepõe o derivado da configuração.
+
+    Returns:
+        GruponosMeltanoRunLedger: Ledger pronto para uso.
+
+    """
+    if path is None:
+        settings = config or GruponosMeltanoNativeConfig()
+        path = Path(settings.meltano_project_root or ".") / DEFAULT_LEDGER_FILENAME
+    return GruponosMeltanoRunLedger(path)
+
+
+__all__: list[str] = [
+    "DEFAULT_TRAILING_RUNS",
+    "KIND_DRIFT",
+    "KIND_INTEGRITY",
+    "KIND_PROFILE",
+    "KIND_SCHEMA_CHANGE",
+    "GruponosMeltanoRunLedger",
+    "create_gruponos_meltano_run_ledger",
+]
@@ -7,6 +7,8 @@ Fornece classes e funções para:
     - Gerenciamento de conexões Oracle
     - Configuração segura de credenciais
     - Teste de conectividade
+    - Carga full em tabela sombra com troca atômica
+    - Suspensão e reconstrução de índices em cargas volumosas
     - Factory functions para criação de instâncias
 
 Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
@@ -18,8 +20,26 @@ from gruponos_meltano_native.oracle.connection_manager_enhanced import (
     GruponosMeltanoOracleConnectionManager,
     create_gruponos_meltano_oracle_connection_manager,
 )
+from gruponos_meltano_native.oracle.index_manager import (
+    GruponosMeltanoOracleIndexManager,
+    IndexMaintenanceReport,
+    IndexStrategy,
+    load_declared_indexes,
+)
+from gruponos_meltano_native.oracle.shadow_swap import (
+    GruponosMeltanoOracleShadowSwap,
+    ShadowSwapReport,
+    SwapMethod,
+)
 
 __all__: list[str] = [
     "GruponosMeltanoOracleConnectionManager",
+    "GruponosMeltanoOracleIndexManager",
+    "GruponosMeltanoOracleShadowSwap",
+    "IndexMaintenanceReport",
+    "IndexStrategy",
+    "ShadowSwapReport",
+    "SwapMethod",
     "create_gruponos_meltano_oracle_connection_manager",
+    "load_declared_indexes",
 ]
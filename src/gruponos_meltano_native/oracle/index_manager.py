@@ -0,0 +1,471 @@
+"""Gerenciamento de Índices em Cargas Volumosas GrupoNOS.
+
+O ``config/wms_integration.yml`` declara os ``indexes`` de cada entidade e a
+macro ``oracle_create_index`` os cria com ``parallel 4 nologging``, mas a
+carga Python nunca os administrava: cada linha inserida mantinha todas as
+B-trees. Este módulo cuida do ciclo de vida dos índices em volta da carga:
+
+    - Reconciliação: índices declarados e ausentes são criados; índices
+      não declarados são reportados (e removidos apenas se criados por
+      este gerenciador, prefixo ``IDX_``)
+    - Antes de uma carga grande, índices não únicos que não sustentam
+      constraints são marcados ``UNUSABLE`` (ou removidos)
+    - Após a carga, são reconstruídos com ``PARALLEL`` e ``NOLOGGING``,
+      partição a partição quando particionados
+    - Índices únicos e de PK ficam intactos: com eles inutilizáveis a
+      carga falharia
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from enum import StrEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+import yaml
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+
+from gruponos_meltano_native.oracle.shadow_swap import (
+    DEFAULT_PARALLEL_DEGREE,
+    oracle_identifier,
+)
+
+if TYPE_CHECKING:
+    from flext_db_oracle import FlextDbOracleApi
+
+logger = FlextLogger(__name__)
+
+DEFAULT_INTEGRATION_CONFIG: Final[Path] = Path("config/wms_integration.yml")
+MANAGED_INDEX_PREFIX: Final[str] = "IDX_"
+# Carga a partir desta fração das linhas da tabela justifica suspender índices
+DEFAULT_MIN_LOAD_RATIO: Final[float] = 0.1
+_ENV_REFERENCE: Final[re.Pattern[str]] = re.compile(r"\$\{(\w+)(?::-([^}]*))?\}")
+
+
+class IndexStrategy(StrEnum):
+    """Forma de suspender a manutenção de um índice durante a carga."""
+
+    UNUSABLE = "unusable"
+    DROP = "drop"
+
+
+@dataclass(frozen=True, slots=True)
+class EntityIndexes:
+    """Índices declarados de uma entidade e a tabela de destino."""
+
+    entity: str
+    table: str
+    indexes: tuple[tuple[str, ...], ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class LiveIndex:
+    """Índice existente na tabela (dicionário Oracle)."""
+
+    name: str
+    columns: tuple[str, ...]
+    unique: bool = False
+    constraint: bool = False
+    partitioned: bool = False
+    status: str = "VALID"
+
+
+@dataclass(slots=True)
+class IndexMaintenanceReport:
+    """Ações de reconciliação, suspensão e reconstrução numa tabela."""
+
+    table: str
+    strategy: str
+    missing: list[str] = field(default_factory=list)
+    undeclared: list[str] = field(default_factory=list)
+    created: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+    suspended: list[str] = field(default_factory=list)
+    rebuilt: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    seconds: dict[str, float] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, t.GeneralValueType]:
+        """Relatório como dict simples (para metadata do pipeline)."""
+        return {
+            "table": self.table,
+            "strategy": self.strategy,
+            "missing": list(self.missing),
+            "undeclared": list(self.undeclared),
+            "created": list(self.created),
+            "dropped": list(self.dropped),
+            "suspended": list(self.suspended),
+            "rebuilt": list(self.rebuilt),
+            "errors": list(self.errors),
+            "seconds": {k: round(v, 3) for k, v in self.seconds.items()},
+        }
+
+
+def parse_declared_indexes(spec: str | Sequence[str]) -> list[tuple[str, ...]]:
+    """Índices de uma declaração ``indexes``.
+
+    Cada item separado por vírgula é um índice de uma coluna; colunas unidas
+    por ``+`` formam um índice composto (``order_id+line_number``).
+
+    Raises:
+        ValueError: Se uma coluna for inválida.
+
+    """
+    items = spec.split(",") if isinstance(spec, str) else list(spec)
+    indexes: list[tuple[str, ...]] = []
+    for item in items:
+        if not str(item).strip():
+            continue
+        columns = tuple(oracle_identifier(c) for c in str(item).split("+"))
+        if columns not in indexes:
+            indexes.append(columns)
+    return indexes
+
+
+def _resolve_env(value: str, env: Mapping[str, str]) -> str:
+    """Resolve ``${VAR}`` e ``${VAR:-padrão}`` como o Meltano."""
+    return _ENV_REFERENCE.sub(
+        lambda m: env.get(m.group(1)) or (m.group(2) or ""), value
+    )
+
+
+def load_declared_indexes(
+    path: Path = DEFAULT_INTEGRATION_CONFIG,
+    env: Mapping[str, str] | None = None,
+) -> dict[str, EntityIndexes]:
+    """Índices declarados por entidade em ``wms_integration.yml``.
+
+    Returns:
+        dict[str, EntityIndexes]: Declarações por entidade; vazio se o
+        arquivo não existir ou for ilegível.
+
+    """
+    try:
+        document = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    except (OSError, yaml.YAMLError):
+        logger.warning("Index declarations unavailable: %s", path)
+        return {}
+    variables = dict(os.environ if env is None else env)
+    declared: dict[str, EntityIndexes] = {}
+    for entity, options in (document.get("entities") or {}).items():
+        if not isinstance(options, dict):
+            continue
+        table = _resolve_env(str(options.get("target_table_name") or entity), variables)
+        spec = _resolve_env(str(options.get("indexes") or ""), variables)
+        declared[str(entity)] = EntityIndexes(
+            str(entity),
+            oracle_identifier(table),
+            tuple(parse_declared_indexes(spec)),
+        )
+    return declared
+
+
+class GruponosMeltanoOracleIndexManager:
+    """Reconcilia, suspende e reconstrói os índices de uma tabela.
+
+    Example:
+        manager = GruponosMeltanoOracleIndexManager(
+            api, schema="WMS", table="WMS_ALLOCATION", declared=declared
+        )
+        manager.reconcile()
+        if manager.should_suspend(expected_rows):
+            manager.suspend()
+        try:
+            ...  # carga
+        finally:
+            manager.rebuild()
+
+    Attributes:
+      schema: Schema da tabela.
+      table: Tabela carregada.
+      declared: Índices declarados (tuplas de colunas).
+      strategy: ``IndexStrategy.UNUSABLE`` ou ``IndexStrategy.DROP``.
+      parallel_degree: Paralelismo das criações e reconstruções.
+      min_load_ratio: Fração mínima de linhas carregadas para suspender.
+      report: Ações executadas.
+
+    """
+
+    def __init__(
+        self,
+        api: FlextDbOracleApi,
+        *,
+        schema: str,
+        table: str,
+        declared: Sequence[tuple[str, ...]] = (),
+        strategy: IndexStrategy = IndexStrategy.UNUSABLE,
+        parallel_degree: int = DEFAULT_PARALLEL_DEGREE,
+        min_load_ratio: float = DEFAULT_MIN_LOAD_RATIO,
+    ) -> None:
+        """Inicializa o gerenciador para ``schema.table``.
+
+        Raises:
+            ValueError: Se um nome for inválido.
+
+        """
+        self.api = api
+        self.schema = oracle_identifier(schema)
+        self.table = oracle_identifier(table)
+        self.declared = [
+            tuple(oracle_identifier(c) for c in columns) for columns in declared
+        ]
+        self.strategy = IndexStrategy(strategy)
+        self.parallel_degree = max(1, parallel_degree)
+        self.min_load_ratio = min_load_ratio
+        self.report = IndexMaintenanceReport(self.table, self.strategy.value)
+        self._suspended: list[tuple[LiveIndex, IndexStrategy]] = []
+
+    def _qualified(self, name: str) -> str:
+        return f"{self.schema}.{name}"
+
+    def _execute(self, sql: str) -> FlextResult[bool]:
+        result = self.api.execute_ddl(sql)
+        if result.is_failure:
+            return FlextResult[bool].fail(f"{result.error} [{sql.split()[0]}]")
+        return FlextResult[bool].ok(value=True)
+
+    def _rows(self, sql: str) -> FlextResult[list[tuple[object, ...]]]:
+        result = self.api.query(sql)
+        if result.is_failure:
+            return FlextResult[list[tuple[object, ...]]].fail(
+                f"Oracle dictionary query failed: {result.error}"
+            )
+        return FlextResult[list[tuple[object, ...]]].ok(
+            [tuple(row) for row in result.value.rows]
+        )
+
+    def managed_name(self, columns: Sequence[str]) -> str:
+        """Nome do índice criado para ``columns`` (convenção da macro dbt)."""
+        return oracle_identifier(
+            f"{MANAGED_INDEX_PREFIX}{self.table}_{'_'.join(columns)}"
+        )
+
+    def inspect(self) -> FlextResult[list[LiveIndex]]:
+        """Índices B-tree da tabela, com estado e constraints associadas."""
+        columns = self._rows(
+            "SELECT i.index_name, i.uniqueness, i.partitioned, i.status, "
+            "c.column_name FROM all_indexes i JOIN all_ind_columns c "
+            "ON c.index_owner = i.owner AND c.index_name = i.index_name "
+            f"WHERE i.table_owner = '{self.schema}' "
+            f"AND i.table_name = '{self.table}' AND i.index_type = 'NORMAL' "
+            "ORDER BY i.index_name, c.column_position"
+        )
+        constraints = self._rows(
+            "SELECT index_name FROM all_constraints "
+            f"WHERE owner = '{self.schema}' AND table_name = '{self.table}' "
+            "AND constraint_type IN ('P', 'U') AND index_name IS NOT NULL"
+        )
+        if columns.is_failure or constraints.is_failure:
+            return FlextResult[list[LiveIndex]].fail(
+                columns.error or constraints.error or "index query failed"
+            )
+        backing = {str(row[0]) for row in constraints.value}
+        by_index: dict[str, tuple[tuple[object, ...], list[str]]] = {}
+        for index_name, uniqueness, partitioned, status, column in columns.value:
+            entry = by_index.setdefault(
+                str(index_name), ((uniqueness, partitioned, status), [])
+            )
+            entry[1].append(str(column))
+        return FlextResult[list[LiveIndex]].ok([
+            LiveIndex(
+                name,
+                tuple(cols),
+                unique=attributes[0] == "UNIQUE",
+                constraint=name in backing,
+                partitioned=attributes[1] == "YES",
+                status=str(attributes[2]),
+            )
+            for name, (attributes, cols) in by_index.items()
+        ])
+
+    def _create(self, name: str, columns: Sequence[str]) -> FlextResult[bool]:
+        """Cria um índice com ``PARALLEL NOLOGGING`` e volta ao normal."""
+        qualified = self._qualified(name)
+        for sql in (
+            f"CREATE INDEX {qualified} ON {self._qualified(self.table)} "
+            f"({', '.join(columns)}) NOLOGGING PARALLEL {self.parallel_degree}",
+            f"ALTER INDEX {qualified} NOPARALLEL",
+            f"ALTER INDEX {qualified} LOGGING",
+        ):
+            result = self._execute(sql)
+            if result.is_failure:
+                return result
+        return FlextResult[bool].ok(value=True)
+
+    def reconcile(
+        self, *, create_missing: bool = True, drop_undeclared: bool = False
+    ) -> FlextResult[IndexMaintenanceReport]:
+        """Compara índices declarados e existentes (pelas colunas).
+
+        Args:
+            create_missing: Cria os declarados ausentes.
+            drop_undeclared: Remove os não declarados criados por este
+                gerenciador (prefixo ``IDX_``); os demais só são reportados.
+
+        Returns:
+            FlextResult[IndexMaintenanceReport]: Relatório atualizado.
+
+        """
+        started = time.perf_counter()
+        live = self.inspect()
+        if live.is_failure:
+            return FlextResult[IndexMaintenanceReport].fail(live.error)
+        existing = {index.columns for index in live.value}
+        missing = [columns for columns in self.declared if columns not in existing]
+        self.report.missing = [self.managed_name(columns) for columns in missing]
+        undeclared = [
+            index
+            for index in live.value
+            if not index.unique
+            and not index.constraint
+            and index.columns not in self.declared
+        ]
+        self.report.undeclared = [index.name for index in undeclared]
+
+        if create_missing:
+            for columns in missing:
+                name = self.managed_name(columns)
+                created = self._create(name, columns)
+                if created.is_failure:
+                    return FlextResult[IndexMaintenanceReport].fail(created.error)
+                self.report.created.append(name)
+        if drop_undeclared:
+            for index in undeclared:
+                if not index.name.startswith(MANAGED_INDEX_PREFIX):
+                    continue
+                dropped = self._execute(f"DROP INDEX {self._qualified(index.name)}")
+                if dropped.is_failure:
+                    return FlextResult[IndexMaintenanceReport].fail(dropped.error)
+                self.report.dropped.append(index.name)
+        self.report.seconds["reconcile"] = time.perf_counter() - started
+        return FlextResult[IndexMaintenanceReport].ok(self.report)
+
+    def should_suspend(self, expected_rows: int | None) -> bool:
+        """Se a carga é grande o bastante para suspender os índices.
+
+        Sem estimativa, ou com tabela vazia ou sem estatísticas, suspende;
+        senão, só se ``expected_rows`` alcançar ``min_load_ratio`` da tabela.
+        """
+        if expected_rows is None:
+            return True
+        rows = self._rows(
+            "SELECT num_rows FROM all_tables "
+            f"WHERE owner = '{self.schema}' AND table_name = '{self.table}'"
+        )
+        if rows.is_failure or not rows.value or rows.value[0][0] is None:
+            return True
+        table_rows = int(str(rows.value[0][0]))
+        return table_rows == 0 or expected_rows >= self.min_load_ratio * table_rows
+
+    def suspend(self) -> FlextResult[list[str]]:
+        """Suspende a manutenção dos índices não únicos sem constraint.
+
+        Índices particionados são sempre marcados ``UNUSABLE`` (recriá-los
+        perderia o particionamento local).
+
+        Returns:
+            FlextResult[list[str]]: Índices suspensos.
+
+        """
+        started = time.perf_counter()
+        live = self.inspect()
+        if live.is_failure:
+            return FlextResult[list[str]].fail(live.error)
+        for index in live.value:
+            if index.unique or index.constraint or index.status == "UNUSABLE":
+                continue
+            strategy = IndexStrategy.UNUSABLE if index.partitioned else self.strategy
+            verb = "DROP INDEX" if strategy is IndexStrategy.DROP else "ALTER INDEX"
+            suffix = "" if strategy is IndexStrategy.DROP else " UNUSABLE"
+            result = self._execute(f"{verb} {self._qualified(index.name)}{suffix}")
+            if result.is_failure:
+                # O que já foi suspenso continua registrado para o rebuild
+                return FlextResult[list[str]].fail(result.error)
+            self._suspended.append((index, strategy))
+            self.report.suspended.append(index.name)
+        self.report.seconds["suspend"] = time.perf_counter() - started
+        logger.info(
+            "Suspended %d indexes on %s.%s",
+            len(self.report.suspended),
+            self.schema,
+            self.table,
+        )
+        return FlextResult[list[str]].ok(list(self.report.suspended))
+
+    def _rebuild_unusable(self, index: LiveIndex) -> FlextResult[bool]:
+        qualified = self._qualified(index.name)
+        steps: list[str] = []
+        if index.partitioned:
+            partitions = self._rows(
+                "SELECT partition_name FROM all_ind_partitions "
+                f"WHERE index_owner = '{self.schema}' "
+                f"AND index_name = '{index.name}' AND status = 'UNUSABLE'"
+            )
+            if partitions.is_failure:
+                return FlextResult[bool].fail(partitions.error)
+            steps.extend(
+                f"ALTER INDEX {qualified} REBUILD PARTITION {row[0]} "
+                f"NOLOGGING PARALLEL {self.parallel_degree}"
+                for row in partitions.value
+            )
+        else:
+            steps.append(
+                f"ALTER INDEX {qualified} REBUILD "
+                f"NOLOGGING PARALLEL {self.parallel_degree}"
+            )
+        steps.extend((
+            f"ALTER INDEX {qualified} NOPARALLEL",
+            f"ALTER INDEX {qualified} LOGGING",
+        ))
+        for sql in steps:
+            result = self._execute(sql)
+            if result.is_failure:
+                return result
+        return FlextResult[bool].ok(value=True)
+
+    def rebuild(self) -> FlextResult[IndexMaintenanceReport]:
+        """Reconstrói (ou recria) os índices suspensos.
+
+        Tenta todos mesmo após uma falha, para não deixar a tabela com
+        índices inutilizáveis; as falhas vão para ``report.errors``.
+        """
+        started = time.perf_counter()
+        pending: list[tuple[LiveIndex, IndexStrategy]] = []
+        for index, strategy in self._suspended:
+            result = (
+                self._create(index.name, index.columns)
+                if strategy is IndexStrategy.DROP
+                else self._rebuild_unusable(index)
+            )
+            if result.is_failure:
+                pending.append((index, strategy))
+                self.report.errors.append(f"{index.name}: {result.error}")
+                continue
+            self.report.rebuilt.append(index.name)
+        self._suspended = pending
+        self.report.seconds["rebuild"] = time.perf_counter() - started
+        if pending:
+            return FlextResult[IndexMaintenanceReport].fail(
+                f"Index rebuild on {self.table} failed: "
+                + "; ".join(self.report.errors)
+            )
+        return FlextResult[IndexMaintenanceReport].ok(self.report)
+
+
+__all__: list[str] = [
+    "DEFAULT_INTEGRATION_CONFIG",
+    "EntityIndexes",
+    "GruponosMeltanoOracleIndexManager",
+    "IndexMaintenanceReport",
+    "IndexStrategy",
+    "LiveIndex",
+    "load_declared_indexes",
+    "parse_declared_indexes",
+]
@@ -0,0 +1,460 @@
+"""Carga Full com Tabela Sombra e Troca Atômica GrupoNOS.
+
+A carga full semanal com ``append_only`` na tabela viva expõe dados pela
+metade aos leitores e mantém os índices linha a linha. Esta estratégia
+carrega numa tabela sombra e só então a coloca no lugar da viva:
+
+    - A sombra (``<TABELA>_SHD``) é criada ``NOLOGGING``, sem índices, com as
+      colunas da tabela viva
+    - Após a carga, os índices (e chaves primária/únicas) da viva são
+      recriados na sombra com ``PARALLEL`` e ``NOLOGGING``, e as estatísticas
+      são coletadas com ``DBMS_STATS``
+    - A troca é um rename (viva vira ``<TABELA>_OLD``, sombra vira a viva,
+      com rollback se o segundo rename falhar) ou uma troca de partição
+      (``EXCHANGE PARTITION``), atômica para tabelas particionadas
+    - Grants da tabela viva são reaplicados após o rename
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import TYPE_CHECKING, Final
+
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+
+if TYPE_CHECKING:
+    from flext_db_oracle import FlextDbOracleApi
+
+logger = FlextLogger(__name__)
+
+SHADOW_SUFFIX: Final[str] = "_SHD"
+PREVIOUS_SUFFIX: Final[str] = "_OLD"
+DEFAULT_PARALLEL_DEGREE: Final[int] = 4
+MAX_IDENTIFIER_LENGTH: Final[int] = 128
+_IDENTIFIER: Final[re.Pattern[str]] = re.compile(r"^[A-Z][A-Z0-9_$#]*$")
+
+
+class SwapMethod(StrEnum):
+    """Forma de colocar a tabela sombra no lugar da viva."""
+
+    RENAME = "rename"
+    EXCHANGE = "exchange"
+
+
+def oracle_identifier(name: str) -> str:
+    """Nome Oracle validado (maiúsculo, sem aspas)."""
+    value = name.strip().upper()
+    if len(value) > MAX_IDENTIFIER_LENGTH or not _IDENTIFIER.match(value):
+        msg = f"Invalid Oracle identifier: {name!r}"
+        raise ValueError(msg)
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class IndexDefinition:
+    """Índice da tabela viva a recriar na sombra."""
+
+    name: str
+    columns: tuple[str, ...]
+    unique: bool = False
+    constraint: str | None = None
+    constraint_type: str | None = None
+
+
+@dataclass(slots=True)
+class ShadowSwapReport:
+    """Resultado de uma carga com troca de tabela."""
+
+    table: str
+    shadow: str
+    method: str
+    indexes_built: list[str] = field(default_factory=list)
+    grants_reapplied: int = 0
+    previous_table: str | None = None
+    seconds: dict[str, float] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, t.GeneralValueType]:
+        """Relatório como dict simples (para metadata do pipeline)."""
+        return {
+            "table": self.table,
+            "shadow": self.shadow,
+            "method": self.method,
+            "indexes_built": list(self.indexes_built),
+            "grants_reapplied": self.grants_reapplied,
+            "previous_table": self.previous_table,
+            "seconds": {k: round(v, 3) for k, v in self.seconds.items()},
+        }
+
+
+class GruponosMeltanoOracleShadowSwap:
+    """Carga full via tabela sombra, índices paralelos e troca atômica.
+
+    Uso: ``prepare`` cria a sombra; o loader grava no stream da sombra
+    (``shadow_table``); ``finalize`` indexa, coleta estatísticas e troca.
+    Em caso de falha da carga, ``discard`` remove a sombra sem tocar na viva.
+
+    Example:
+        swap = GruponosMeltanoOracleShadowSwap(api, schema="WMS", table="ALLOCATION")
+        shadow = swap.prepare().value
+        ...  # carga no stream ``shadow.lower()``
+        report = swap.finalize().value
+
+    Attributes:
+      schema: Schema das tabelas.
+      table: Tabela viva.
+      method: ``SwapMethod.RENAME`` ou ``SwapMethod.EXCHANGE``.
+      partition: Partição trocada (obrigatória com ``EXCHANGE``).
+      parallel_degree: Grau de paralelismo de índices e estatísticas.
+      keep_previous: Mantém a versão anterior como ``<TABELA>_OLD``.
+      failed_step: Etapa em que o último ``finalize`` falhou (ou None).
+
+    """
+
+    def __init__(
+        self,
+        api: FlextDbOracleApi,
+        *,
+        schema: str,
+        table: str,
+        method: SwapMethod = SwapMethod.RENAME,
+        partition: str | None = None,
+        parallel_degree: int = DEFAULT_PARALLEL_DEGREE,
+        keep_previous: bool = True,
+    ) -> None:
+        """Inicializa a troca para ``schema.table``.
+
+        Raises:
+            ValueError: Se um nome for inválido ou faltar a partição.
+
+        """
+        self.api = api
+        self.schema = oracle_identifier(schema)
+        self.table = oracle_identifier(table)
+        self.method = SwapMethod(method)
+        if self.method is SwapMethod.EXCHANGE and not partition:
+            msg = "Partition exchange needs the partition name"
+            raise ValueError(msg)
+        self.partition = oracle_identifier(partition) if partition else None
+        self.parallel_degree = max(1, parallel_degree)
+        self.keep_previous = keep_previous
+        self.shadow_table = oracle_identifier(self.table + SHADOW_SUFFIX)
+        self.previous_table = oracle_identifier(self.table + PREVIOUS_SUFFIX)
+        self._indexes: list[IndexDefinition] = []
+        self._grants: list[tuple[str, str]] = []
+        self.failed_step: str | None = None
+
+    def _qualified(self, name: str) -> str:
+        return f"{self.schema}.{name}"
+
+    def _execute(self, sql: str) -> FlextResult[bool]:
+        result = self.api.execute_ddl(sql)
+        if result.is_failure:
+            return FlextResult[bool].fail(f"{result.error} [{sql.split()[0]}]")
+        return FlextResult[bool].ok(value=True)
+
+    def _rows(self, sql: str) -> FlextResult[list[tuple[object, ...]]]:
+        result = self.api.query(sql)
+        if result.is_failure:
+            return FlextResult[list[tuple[object, ...]]].fail(
+                f"Oracle dictionary query failed: {result.error}"
+            )
+        return FlextResult[list[tuple[object, ...]]].ok(
+            [tuple(row) for row in result.value.rows]
+        )
+
+    def _table_exists(self, name: str) -> bool:
+        rows = self._rows(
+            "SELECT COUNT(*) FROM all_tables "
+            f"WHERE owner = '{self.schema}' AND table_name = '{name}'"
+        )
+        return rows.is_success and bool(rows.value) and int(str(rows.value[0][0])) > 0
+
+    def _drop_if_exists(self, name: str) -> FlextResult[bool]:
+        if not self._table_exists(name):
+            return FlextResult[bool].ok(value=True)
+        return self._execute(f"DROP TABLE {self._qualified(name)} PURGE")
+
+    def _read_indexes(self) -> FlextResult[list[IndexDefinition]]:
+        """Índices B-tree da viva e as constraints que os usam."""
+        columns = self._rows(
+            "SELECT i.index_name, i.uniqueness, c.column_name "
+            "FROM all_indexes i JOIN all_ind_columns c "
+            "ON c.index_owner = i.owner AND c.index_name = i.index_name "
+            f"WHERE i.table_owner = '{self.schema}' "
+            f"AND i.table_name = '{self.table}' AND i.index_type = 'NORMAL' "
+            "ORDER BY i.index_name, c.column_position"
+        )
+        constraints = self._rows(
+            "SELECT index_name, constraint_name, constraint_type "
+            f"FROM all_constraints WHERE owner = '{self.schema}' "
+            f"AND table_name = '{self.table}' AND constraint_type IN ('P', 'U')"
+        )
+        if columns.is_failure or constraints.is_failure:
+            return FlextResult[list[IndexDefinition]].fail(
+                columns.error or constraints.error or "index query failed"
+            )
+        by_index: dict[str, tuple[bool, list[str]]] = {}
+        for index_name, uniqueness, column in columns.value:
+            entry = by_index.setdefault(str(index_name), (uniqueness == "UNIQUE", []))
+            entry[1].append(str(column))
+        owners = {str(row[0]): (str(row[1]), str(row[2])) for row in constraints.value}
+        return FlextResult[list[IndexDefinition]].ok([
+            IndexDefinition(
+                name,
+                tuple(cols),
+                unique=unique,
+                constraint=owners.get(name, (None, None))[0],
+                constraint_type=owners.get(name, (None, None))[1],
+            )
+            for name, (unique, cols) in by_index.items()
+        ])
+
+    def prepare(self) -> FlextResult[str]:
+        """Cria a tabela sombra vazia, sem índices e ``NOLOGGING``.
+
+        Returns:
+            FlextResult[str]: Nome da tabela sombra.
+
+        """
+        if not self._table_exists(self.table):
+            return FlextResult[str].fail(f"Table {self.schema}.{self.table} not found")
+        if self.method is SwapMethod.RENAME:
+            referenced = self._rows(
+                "SELECT COUNT(*) FROM all_constraints r JOIN all_constraints p "
+                "ON r.r_owner = p.owner AND r.r_constraint_name = p.constraint_name "
+                f"WHERE r.constraint_type = 'R' AND p.owner = '{self.schema}' "
+                f"AND p.table_name = '{self.table}'"
+            )
+            if referenced.is_failure:
+                return FlextResult[str].fail(referenced.error)
+            if referenced.value and int(str(referenced.value[0][0])) > 0:
+                return FlextResult[str].fail(
+                    f"{self.table} is referenced by foreign keys; use partition "
+                    "exchange or the regular full load"
+                )
+        indexes = self._read_indexes()
+        if indexes.is_failure:
+            return FlextResult[str].fail(indexes.error)
+        self._indexes = indexes.value
+        grants = self._rows(
+            "SELECT grantee, privilege FROM all_tab_privs "
+            f"WHERE table_schema = '{self.schema}' AND table_name = '{self.table}'"
+        )
+        self._grants = (
+            [(str(g), str(p)) for g, p in grants.value] if grants.is_success else []
+        )
+
+        dropped = self._drop_if_exists(self.shadow_table)
+        if dropped.is_failure:
+            return FlextResult[str].fail(dropped.error)
+        created = self._execute(
+            f"CREATE TABLE {self._qualified(self.shadow_table)} NOLOGGING "
+            f"AS SELECT * FROM {self._qualified(self.table)} WHERE 1 = 0"
+        )
+        if created.is_failure:
+            return FlextResult[str].fail(created.error)
+        logger.info(
+            "Shadow table %s.%s ready (%d indexes deferred)",
+            self.schema,
+            self.shadow_table,
+            len(self._indexes),
+        )
+        return FlextResult[str].ok(self.shadow_table)
+
+    def _shadow_index_name(self, name: str) -> str:
+        return oracle_identifier(name + SHADOW_SUFFIX)
+
+    def _build_indexes(self, report: ShadowSwapReport) -> FlextResult[bool]:
+        """Recria os índices na sombra com ``PARALLEL NOLOGGING``."""
+        shadow = self._qualified(self.shadow_table)
+        for index in self._indexes:
+            name = self._qualified(self._shadow_index_name(index.name))
+            unique = "UNIQUE " if index.unique else ""
+            steps = [
+                f"CREATE {unique}INDEX {name} ON {shadow} "
+                f"({', '.join(index.columns)}) NOLOGGING "
+                f"PARALLEL {self.parallel_degree}",
+                f"ALTER INDEX {name} NOPARALLEL",
+                f"ALTER INDEX {name} LOGGING",
+            ]
+            if index.constraint is not None:
+                kind = "PRIMARY KEY" if index.constraint_type == "P" else "UNIQUE"
+                steps.append(
+                    f"ALTER TABLE {shadow} ADD CONSTRAINT "
+                    f"{self._shadow_index_name(index.constraint)} {kind} "
+                    f"({', '.join(index.columns)}) USING INDEX {name}"
+                )
+            for sql in steps:
+                result = self._execute(sql)
+                if result.is_failure:
+                    return result
+            report.indexes_built.append(index.name)
+        return FlextResult[bool].ok(value=True)
+
+    def _gather_stats(self) -> FlextResult[bool]:
+        return self._execute(
+            "BEGIN DBMS_STATS.GATHER_TABLE_STATS("
+            f"ownname => '{self.schema}', tabname => '{self.shadow_table}', "
+            f"degree => {self.parallel_degree}, cascade => TRUE, "
+            "no_invalidate => FALSE); END;"
+        )
+
+    def _swap_rename(self, report: ShadowSwapReport) -> FlextResult[bool]:
+        """Renomeia viva → ``_OLD`` e sombra → viva, com rollback."""
+        dropped = self._drop_if_exists(self.previous_table)
+        if dropped.is_failure:
+            return dropped
+        live = self._qualified(self.table)
+        swapped = self._execute(
+            "BEGIN "
+            f"EXECUTE IMMEDIATE 'ALTER TABLE {live} RENAME TO {self.previous_table}'; "
+            "BEGIN "
+            f"EXECUTE IMMEDIATE 'ALTER TABLE {self._qualified(self.shadow_table)} "
+            f"RENAME TO {self.table}'; "
+            "EXCEPTION WHEN OTHERS THEN "
+            f"EXECUTE IMMEDIATE 'ALTER TABLE {self._qualified(self.previous_table)} "
+            f"RENAME TO {self.table}'; RAISE; "
+            "END; END;"
+        )
+        if swapped.is_failure:
+            return swapped
+        # Nomes originais de índices e constraints passam para a nova viva
+        steps: list[str] = []
+        if not self.keep_previous:
+            steps.append(f"DROP TABLE {self._qualified(self.previous_table)} PURGE")
+        for index in self._indexes:
+            old, new = index.name, self._shadow_index_name(index.name)
+            if self.keep_previous:
+                if index.constraint is not None:
+                    steps.append(
+                        f"ALTER TABLE {self._qualified(self.previous_table)} "
+                        f"RENAME CONSTRAINT {index.constraint} TO "
+                        f"{oracle_identifier(index.constraint + PREVIOUS_SUFFIX)}"
+                    )
+                steps.append(
+                    f"ALTER INDEX {self._qualified(old)} RENAME TO "
+                    f"{oracle_identifier(old + PREVIOUS_SUFFIX)}"
+                )
+            if index.constraint is not None:
+                steps.append(
+                    f"ALTER TABLE {live} RENAME CONSTRAINT "
+                    f"{self._shadow_index_name(index.constraint)} "
+                    f"TO {index.constraint}"
+                )
+            steps.append(f"ALTER INDEX {self._qualified(new)} RENAME TO {old}")
+        steps.extend(
+            f"GRANT {privilege} ON {live} TO {grantee}"
+            for grantee, privilege in self._grants
+        )
+        for sql in steps:
+            result = self._execute(sql)
+            if result.is_failure:
+                return FlextResult[bool].fail(
+                    f"Tables swapped but post-swap step failed: {result.error}"
+                )
+        report.grants_reapplied = len(self._grants)
+        report.previous_table = self.previous_table if self.keep_previous else None
+        return FlextResult[bool].ok(value=True)
+
+    def _swap_exchange(self, report: ShadowSwapReport) -> FlextResult[bool]:
+        """Troca a partição da viva com a sombra (a sombra fica com os antigos)."""
+        swapped = self._execute(
+            f"ALTER TABLE {self._qualified(self.table)} EXCHANGE PARTITION "
+            f"{self.partition} WITH TABLE {self._qualified(self.shadow_table)} "
+            "INCLUDING INDEXES WITHOUT VALIDATION UPDATE GLOBAL INDEXES"
+        )
+        if swapped.is_failure:
+            return swapped
+        if not self.keep_previous:
+            return self._drop_if_exists(self.shadow_table)
+        dropped = self._drop_if_exists(self.previous_table)
+        if dropped.is_failure:
+            return dropped
+        previous = self._qualified(self.previous_table)
+        steps = [
+            f"ALTER TABLE {self._qualified(self.shadow_table)} "
+            f"RENAME TO {self.previous_table}"
+        ]
+        # Libera os nomes ``_SHD`` para a próxima carga
+        for index in self._indexes:
+            if index.constraint is not None:
+                steps.append(
+                    f"ALTER TABLE {previous} RENAME CONSTRAINT "
+                    f"{self._shadow_index_name(index.constraint)} TO "
+                    f"{oracle_identifier(index.constraint + PREVIOUS_SUFFIX)}"
+                )
+            steps.append(
+                f"ALTER INDEX {self._qualified(self._shadow_index_name(index.name))} "
+                f"RENAME TO {oracle_identifier(index.name + PREVIOUS_SUFFIX)}"
+            )
+        for sql in steps:
+            result = self._execute(sql)
+            if result.is_failure:
+                return FlextResult[bool].fail(
+                    f"Partition exchanged but post-swap step failed: {result.error}"
+                )
+        report.previous_table = self.previous_table
+        return FlextResult[bool].ok(value=True)
+
+    def finalize(self) -> FlextResult[ShadowSwapReport]:
+        """Indexa, coleta estatísticas e troca a sombra com a viva.
+
+        A etapa que falhou fica em ``failed_step``; antes de ``"swap"`` a viva
+        não foi tocada e a sombra pode ser descartada com ``discard``.
+
+        Returns:
+            FlextResult[ShadowSwapReport]: Relatório com tempos por etapa.
+
+        """
+        report = ShadowSwapReport(self.table, self.shadow_table, self.method.value)
+        self.failed_step = None
+        steps = (
+            ("indexes", lambda: self._build_indexes(report)),
+            ("statistics", self._gather_stats),
+            (
+                "logging",
+                lambda: self._execute(
+                    f"ALTER TABLE {self._qualified(self.shadow_table)} LOGGING"
+                ),
+            ),
+            (
+                "swap",
+                lambda: self._swap_rename(report)
+                if self.method is SwapMethod.RENAME
+                else self._swap_exchange(report),
+            ),
+        )
+        for name, step in steps:
+            started = time.perf_counter()
+            result = step()
+            report.seconds[name] = time.perf_counter() - started
+            if result.is_failure:
+                self.failed_step = name
+                logger.error(
+                    "Shadow swap of %s failed at %s: %s", self.table, name, result.error
+                )
+                return FlextResult[ShadowSwapReport].fail(
+                    f"Shadow swap of {self.table} failed at {name}: {result.error}"
+                )
+        logger.info(
+            "Shadow swap of %s.%s done via %s", self.schema, self.table, self.method
+        )
+        return FlextResult[ShadowSwapReport].ok(report)
+
+    def discard(self) -> FlextResult[bool]:
+        """Remove a tabela sombra (carga falhou); a viva não é tocada."""
+        return self._drop_if_exists(self.shadow_table)
+
+
+__all__: list[str] = [
+    "GruponosMeltanoOracleShadowSwap",
+    "IndexDefinition",
+    "ShadowSwapReport",
+    "SwapMethod",
+    "oracle_identifier",
+]
@@ -6,6 +6,8 @@ com sistemas Oracle WMS, construído sobre padrões de arquitetura empresarial.
 Refactored to use modular architecture with separated concerns:
 - Pipeline models in models/pipeline.py
 - Pipeline execution in core/pipeline_executor.py
+- Run strategies (native, proxied, backfill, shadow, indexed, planned,
+  facility matrix) in core/*_run.py, sharing core/run_context.py
 - Orchestration logic focused on high-level coordination
 
 Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
@@ -13,18 +15,67 @@ Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Propriet
 
 from __future__ import annotations
 
+import json
 import os
 import subprocess  # noqa: S404
 import time
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import UTC, datetime
 from pathlib import Path
+from string import Template
 from typing import Self
 
+import yaml
 from flext_core import FlextResult, FlextService, FlextTypes as t
 from flext_meltano import FlextMeltanoService
 
 from gruponos_meltano_native.config import GruponosMeltanoNativeConfig
+from gruponos_meltano_native.core.backfill import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_TARGET_ROWS,
+)
+from gruponos_meltano_native.core.backfill_run import GruponosBackfillRun
+from gruponos_meltano_native.core.catalog_cache import (
+    DEFAULT_CATALOG_CACHE_DIR,
+    CatalogDiscovery,
+    CatalogResolution,
+    GruponosMeltanoCatalogCache,
+)
+from gruponos_meltano_native.core.column_projection import ColumnProjection
+from gruponos_meltano_native.core.facility_matrix import (
+    DEFAULT_MATRIX_CONCURRENCY,
+    DEFAULT_MAX_PER_FACILITY,
+    FacilityTarget,
+)
+from gruponos_meltano_native.core.indexed_run import GruponosIndexedRun
+from gruponos_meltano_native.core.matrix_run import GruponosMatrixRun
+from gruponos_meltano_native.core.native_run import GruponosNativeRun
+from gruponos_meltano_native.core.overlap_dedup import GruponosOverlapDeduplicator
+from gruponos_meltano_native.core.planned_run import GruponosPlannedRun
+from gruponos_meltano_native.core.proxied_run import GruponosProxiedRun
+from gruponos_meltano_native.core.row_hash import GruponosRowHashFilter
+from gruponos_meltano_native.core.run_context import GruponosRunContext
+from gruponos_meltano_native.core.shadow_run import GruponosShadowRun
+from gruponos_meltano_native.core.singer_proxy import SingerProxyStage
+from gruponos_meltano_native.core.spill_buffer import SpillBuffer
+from gruponos_meltano_native.core.sync_planner import LoadCostModel
+from gruponos_meltano_native.core.wms_extractor import WmsEntity
 from gruponos_meltano_native.models.pipeline import GruponosMeltanoNativeModels
+from gruponos_meltano_native.monitoring.alert_manager import (
+    GruponosMeltanoAlertManager,
+    create_gruponos_meltano_alert_manager,
+)
+from gruponos_meltano_native.monitoring.run_ledger import (
+    create_gruponos_meltano_run_ledger,
+)
+from gruponos_meltano_native.oracle.index_manager import IndexStrategy
+from gruponos_meltano_native.oracle.shadow_swap import (
+    DEFAULT_PARALLEL_DEGREE,
+    SwapMethod,
+)
+from gruponos_meltano_native.validators.data_validator import DataValidator
+from gruponos_meltano_native.validators.profiler import StreamProfiler
+from gruponos_meltano_native.validators.quality import DataQualityAccumulator
 
 # Constants for validation
 MAX_PORT_NUMBER = 65535
@@ -35,6 +86,7 @@ m = GruponosMeltanoNativeModels
 
 # Short aliases for types
 PipelineResult = m.PipelineResult
+PipelineConfiguration = m.PipelineConfiguration
 
 # =============================================
 # GRUPONOS MELTANO PIPELINE RESULT
@@ -126,6 +178,7 @@ class GruponosMeltanoOrchestrator(FlextService[GruponosMeltanoNativeConfig]):
 
     settings: GruponosMeltanoNativeConfig
     _meltano_service: FlextMeltanoService
+    _alert_manager: GruponosMeltanoAlertManager | None
 
     def __new__(
         cls,
@@ -159,6 +212,13 @@ class GruponosMeltanoOrchestrator(FlextService[GruponosMeltanoNativeConfig]):
         self.settings = settings or GruponosMeltanoNativeConfig()
         # Logger is provided by FlextMixins via property - no assignment needed
         self._meltano_service = FlextMeltanoService()
+        self._alert_manager = None
+        self.run_context = GruponosRunContext(
+            self.settings,
+            environment=self._build_meltano_environment,
+            validate_job_name=self._validate_job_name,
+            finish=self._finish_run,
+        )
 
         # Validate initial configuration during initialization
         validation_result = self._validate_initial_configuration()
@@ -225,7 +285,13 @@ class GruponosMeltanoOrchestrator(FlextService[GruponosMeltanoNativeConfig]):
 
         return FlextResult.ok(None)
 
-    def run_full_sync(self) -> FlextResult[PipelineResult]:
+    def run_full_sync(
+        self,
+        *,
+        quality: Mapping[str, DataQualityAccumulator] | None = None,
+        profiles: Mapping[str, StreamProfiler] | None = None,
+        configuration: PipelineConfiguration | None = None,
+    ) -> FlextResult[PipelineResult]:
         """Executa pipeline de sincronização completa para atualização total dos dados.
 
         Este método executa o pipeline ETL completo que extrai todos os dados
@@ -239,6 +305,16 @@ class GruponosMeltanoOrchestrator(FlextService[GruponosMeltanoNativeConfig]):
             - Carga em lote no banco de destino com gerenciamento de transações
             - Monitoramento e alertas abrangentes
 
+        Args:
+            quality: Acumuladores de qualidade por stream alimentados durante
+                a carga; as pontuações e o alerta de qualidade saem deles.
+            profiles: Perfis de coluna por stream alimentados durante a
+                carga; são gravados no ledger de runs e comparados com os
+                runs anteriores.
+            configuration: Configuração do pipeline com
+                ``enable_quality_checks`` e ``quality_threshold``; sem ela
+                valem os padrões do modelo.
+
         Returns:
             FlextResult[PipelineResult]: Railway-oriented result with
             pipeline execution details and comprehensive error handling.
@@ -283,9 +359,15 @@ class GruponosMeltanoOrchestrator(FlextService[GruponosMeltanoNativeConfig]):
             records_loaded=0,
         )
 
-        return FlextResult.ok(pipeline_result)
+        return self._finish_run(pipeline_result, quality, profiles, configuration)
 
-    def run_incremental_sync(self) -> FlextResult[PipelineResult]:
+    def run_incremental_sync(
+        self,
+        *,
+        quality: Mapping[str, DataQualityAccumulator] | None = None,
+        profiles: Mapping[str, StreamProfiler] | None = None,
+        configuration: PipelineConfiguration | None = None,
+    ) -> FlextResult[PipelineResult]:
         """Executa pipeline de sincronização incremental para atualizações em tempo real.
 
         Este método executa o pipeline ETL incremental que extrai apenas
@@ -298,6 +380,16 @@ class GruponosMeltanoOrchestrator(FlextService[GruponosMeltanoNativeConfig]):
             - Operações de upsert no banco de destino
             - Monitoramento e alertas incrementais
 
+        Args:
+            quality: Acumuladores de qualidade por stream alimentados durante
+                a carga; as pontuações e o alerta de qualidade saem deles.
+            profiles: Perfis de coluna por stream alimentados durante a
+                carga; são gravados no ledger de runs e comparados com os
+                runs anteriores.
+            configuration: Configuração do pipeline com
+                ``enable_quality_checks`` e ``quality_threshold``; sem ela
+                valem os padrões do modelo.
+
         Returns:
             FlextResult[PipelineResult]: Railway-oriented result with
             incremental sync execution details and comprehensive error handling.
@@ -344,9 +436,16 @@ class GruponosMeltanoOrchestrator(FlextService[GruponosMeltanoNativeConfig]):
             records_loaded=0,
         )
 
-        return FlextResult.ok(pipeline_result)
+        return self._finish_run(pipeline_result, quality, profiles, configuration)
 
-    def run_job(self, job_name: str) -> FlextResult[PipelineResult]:
+    def run_job(
+        self,
+        job_name: str,
+        *,
+        quality: Mapping[str, DataQualityAccumulator] | None = None,
+        profiles: Mapping[str, StreamProfiler] | None = None,
+        configuration: PipelineConfiguration | None = None,
+    ) -> FlextResult[PipelineResult]:
         """Execute a specific pipeline job by name with railway-oriented error handling.
 
         Provides flexible job execution for custom pipeline configurations defined
@@ -354,6 +453,13 @@ class GruponosMeltanoOrchestrator(FlextService[GruponosMeltanoNativeConfig]):
 
         Args:
             job_name: Name of the Meltano job to execute. Must be defined in meltano.yml.
+            quality: Quality accumulators per stream fed while the job ran;
+                they fill the quality scores and may fire a quality alert.
+            profiles: Column profiles per stream fed while the job ran; they
+                are recorded in the run ledger and checked for drift.
+            configuration: Pipeline configuration with
+                ``enable_quality_checks`` and ``quality_threshold`` (model
+                defaults when omitted).
 
         Returns:
             FlextResult[PipelineResult]: Railway-oriented result with job execution details
@@ -421,7 +527,7 @@ class GruponosMeltanoOrchestrator(FlextService[GruponosMeltanoNativeConfig]):
             },
         )
 
-        return FlextResult.ok(job_result)
+        return self._finish_run(job_result, quality, profiles, configuration)
 
     def list_jobs(self) -> list[str]:
         """List all available pipeline jobs with FLEXT integration.
@@ -486,6 +592,381 @@ class GruponosMeltanoOrchestrator(FlextService[GruponosMeltanoNativeConfig]):
         """
         return self.run_job(pipeline_name)
 
+    def run_proxied_job(
+        self,
+        extractor: str,
+        loader: str,
+        stage: SingerProxyStage,
+        buffer: SpillBuffer | None = None,
+        dedup: GruponosOverlapDeduplicator | None = None,
+        row_hashes: GruponosRowHashFilter | None = None,
+        state_job: str | None = None,
+        configuration: PipelineConfiguration | None = None,
+    ) -> FlextResult[PipelineResult]:
+        """Run extractor and loader with an in-process proxy stage between them.
+
+        See ``GruponosProxiedRun.run`` for the arguments, the state handling
+        and the metadata reported.
+        """
+        return GruponosProxiedRun(self.run_context).run(
+            extractor,
+            loader,
+            stage,
+            buffer,
+            dedup,
+            row_hashes,
+            state_job,
+            configuration,
+        )
+
+    def run_native_job(
+        self,
+        loader: str,
+        entities: Sequence[WmsEntity],
+        *,
+        extractor_config: Mapping[str, t.GeneralValueType] | None = None,
+        state: Mapping[str, t.GeneralValueType] | None = None,
+        state_job: str | None = None,
+        buffer: SpillBuffer | None = None,
+        dedup: GruponosOverlapDeduplicator | None = None,
+        row_hashes: GruponosRowHashFilter | None = None,
+        catalog: Mapping[str, t.GeneralValueType] | None = None,
+        validators: Mapping[str, DataValidator] | None = None,
+        quality: Mapping[str, DataQualityAccumulator] | None = None,
+        profiles: Mapping[str, StreamProfiler] | None = None,
+        configuration: PipelineConfiguration | None = None,
+    ) -> FlextResult[PipelineResult]:
+        """Extract with the in-package WMS engine straight into a Meltano loader.
+
+        See ``GruponosNativeRun.run`` for the arguments, the state handling
+        and the metadata reported.
+        """
+        return GruponosNativeRun(self.run_context).run(
+            loader,
+            entities,
+            extractor_config=extractor_config,
+            state=state,
+            state_job=state_job,
+            buffer=buffer,
+            dedup=dedup,
+            row_hashes=row_hashes,
+            catalog=catalog,
+            validators=validators,
+            quality=quality,
+            profiles=profiles,
+            configuration=configuration,
+        )
+
+    def _finish_run(
+        self,
+        pipeline_result: PipelineResult,
+        quality: Mapping[str, DataQualityAccumulator] | None,
+        profiles: Mapping[str, StreamProfiler] | None,
+        configuration: PipelineConfiguration | None = None,
+    ) -> FlextResult[PipelineResult]:
+        """Record the run's column profiles and score it for quality."""
+        self._record_profiles(pipeline_result, (profiles or {}).values())
+        merged = DataQualityAccumulator()
+        for accumulator in (quality or {}).values():
+            merged.merge(accumulator)
+        return self.evaluate_data_quality(pipeline_result, merged, configuration)
+
+    def _record_profiles(
+        self,
+        pipeline_result: PipelineResult,
+        profiles: Iterable[StreamProfiler],
+    ) -> None:
+        """Append column profiles to the run ledger and report drift.
+
+        Drift findings become warnings and ``metadata["drift"]``; a ledger
+        that cannot be written only logs a warning, the load already
+        happened.
+        """
+        observed = [profiler for profiler in profiles if profiler.records]
+        if not observed:
+            return
+        ledger = create_gruponos_meltano_run_ledger(self.settings)
+        drift: dict[str, list[dict[str, t.GeneralValueType]]] = {}
+        for profiler in observed:
+            recorded = ledger.record_profile(
+                profiler,
+                run_id=pipeline_result.pipeline_id,
+                job_name=pipeline_result.job_name,
+            )
+            if recorded.is_failure:
+                self.logger.warning(
+                    f"Column profile of {profiler.stream} not recorded: "
+                    f"{recorded.error}"
+                )
+                continue
+            if recorded.value:
+                drift[profiler.stream] = [f.to_dict() for f in recorded.value]
+        if drift:
+            pipeline_result.metadata["drift"] = drift
+            pipeline_result.warnings.append(
+                f"Column drift detected in: {', '.join(sorted(drift))}"
+            )
+
+    def run_backfill(
+        self,
+        loader: str,
+        entity: WmsEntity,
+        *,
+        start: datetime,
+        end: datetime | None = None,
+        extractor_config: Mapping[str, t.GeneralValueType] | None = None,
+        target_rows: int = DEFAULT_TARGET_ROWS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        manifest_path: Path | None = None,
+    ) -> FlextResult[PipelineResult]:
+        """Backfill ``[start, end)`` in parallel time windows, resumably.
+
+        See ``GruponosBackfillRun.run``.
+        """
+        return GruponosBackfillRun(self.run_context).run(
+            loader,
+            entity,
+            start=start,
+            end=end,
+            extractor_config=extractor_config,
+            target_rows=target_rows,
+            max_concurrency=max_concurrency,
+            manifest_path=manifest_path,
+        )
+
+    def run_shadow_full_sync(
+        self,
+        entities: Sequence[WmsEntity],
+        *,
+        loader: str = "target-oracle-full",
+        extractor_config: Mapping[str, t.GeneralValueType] | None = None,
+        method: SwapMethod = SwapMethod.RENAME,
+        partition: str | None = None,
+        parallel_degree: int = DEFAULT_PARALLEL_DEGREE,
+        keep_previous: bool = True,
+        row_hashes: GruponosRowHashFilter | None = None,
+        state_job: str | None = None,
+    ) -> FlextResult[PipelineResult]:
+        """Full sync into shadow tables, swapped in only once complete.
+
+        See ``GruponosShadowRun.run``.
+        """
+        return GruponosShadowRun(self.run_context).run(
+            entities,
+            loader=loader,
+            extractor_config=extractor_config,
+            method=method,
+            partition=partition,
+            parallel_degree=parallel_degree,
+            keep_previous=keep_previous,
+            row_hashes=row_hashes,
+            state_job=state_job,
+        )
+
+    def run_indexed_bulk_load(
+        self,
+        entities: Sequence[WmsEntity],
+        *,
+        loader: str = "target-oracle-full",
+        extractor_config: Mapping[str, t.GeneralValueType] | None = None,
+        state: Mapping[str, t.GeneralValueType] | None = None,
+        strategy: IndexStrategy = IndexStrategy.UNUSABLE,
+        parallel_degree: int = DEFAULT_PARALLEL_DEGREE,
+        expected_rows: Mapping[str, int] | None = None,
+        reconcile: bool = True,
+    ) -> FlextResult[PipelineResult]:
+        """Large load with index maintenance deferred to parallel rebuilds.
+
+        See ``GruponosIndexedRun.run``.
+        """
+        return GruponosIndexedRun(self.run_context).run(
+            entities,
+            loader=loader,
+            extractor_config=extractor_config,
+            state=state,
+            strategy=strategy,
+            parallel_degree=parallel_degree,
+            expected_rows=expected_rows,
+            reconcile=reconcile,
+        )
+
+    def run_planned_sync(
+        self,
+        entities: Sequence[WmsEntity],
+        *,
+        full_loader: str = "target-oracle-full",
+        incremental_loader: str = "target-oracle-incremental",
+        extractor_config: Mapping[str, t.GeneralValueType] | None = None,
+        cost_model: LoadCostModel | None = None,
+    ) -> FlextResult[PipelineResult]:
+        """Sync each entity in full or incrementally, whichever is cheaper.
+
+        See ``GruponosPlannedRun.run``.
+        """
+        return GruponosPlannedRun(self.run_context).run(
+            entities,
+            full_loader=full_loader,
+            incremental_loader=incremental_loader,
+            extractor_config=extractor_config,
+            cost_model=cost_model,
+        )
+
+    def run_facility_matrix(
+        self,
+        loader: str,
+        entities: Sequence[WmsEntity],
+        *,
+        facilities: Sequence[FacilityTarget] | None = None,
+        extractor_config: Mapping[str, t.GeneralValueType] | None = None,
+        max_concurrency: int = DEFAULT_MATRIX_CONCURRENCY,
+        max_per_facility: int = DEFAULT_MAX_PER_FACILITY,
+    ) -> FlextResult[PipelineResult]:
+        """Run a native job for every facility of the matrix, fairly.
+
+        See ``GruponosMatrixRun.run``.
+        """
+        return GruponosMatrixRun(self.run_context).run(
+            loader,
+            entities,
+            facilities=facilities,
+            extractor_config=extractor_config,
+            max_concurrency=max_concurrency,
+            max_per_facility=max_per_facility,
+        )
+
+    def resolve_catalog(
+        self,
+        extractor: str,
+        *,
+        fingerprint: str | None = None,
+        run_id: str | None = None,
+        discover: CatalogDiscovery | None = None,
+        projection: ColumnProjection | None = None,
+    ) -> FlextResult[CatalogResolution]:
+        """Reuse the cached catalog for an extractor, rediscovering only if stale.
+
+        The cache is keyed by the extractor's resolved ``meltano.yml`` config;
+        ``fingerprint`` (e.g. ``schema_fingerprint`` of a sample page) forces
+        rediscovery when the source shape changed. Schema changes found on
+        rediscovery are written to the run ledger. Later runs in this
+        orchestrator pass the catalog to Meltano, skipping tap discovery.
+
+        Args:
+            extractor: Meltano extractor name.
+            fingerprint: Optional cheap source fingerprint.
+            run_id: Run identifier for ledger entries.
+            discover: Discovery override (defaults to
+                ``meltano invoke --dump=catalog``).
+            projection: Column projection (e.g. ``ColumnProjection.
+                from_dbt_models``); the catalog handed to Meltano then only
+                selects the columns downstream models use.
+
+        Returns:
+            FlextResult[CatalogResolution]: Catalog, path and cache outcome.
+
+        """
+        try:
+            extractor_name = self._validate_job_name(extractor)
+        except ValueError as e:
+            return FlextResult.fail(str(e))
+
+        env = self._build_meltano_environment()
+        project_root = Path(self.settings.meltano_project_root or ".")
+        cache = GruponosMeltanoCatalogCache(
+            project_root / DEFAULT_CATALOG_CACHE_DIR,
+            ledger=create_gruponos_meltano_run_ledger(self.settings),
+        )
+        result = cache.resolve(
+            extractor_name,
+            self._extractor_config(extractor_name, env),
+            discover or (lambda: self._discover_catalog(extractor_name, env)),
+            fingerprint=fingerprint,
+            run_id=run_id,
+        )
+        if result.is_failure:
+            return result
+        resolution = result.value
+        catalog_path = resolution.catalog_path
+        if projection is not None:
+            # The cache keeps the full catalog so schema diffs stay complete
+            catalog_path = catalog_path.with_name(
+                f"{extractor_name}.projected.catalog.json"
+            )
+            try:
+                catalog_path.write_text(
+                    json.dumps(projection.apply(resolution.catalog)), encoding="utf-8"
+                )
+            except OSError as e:
+                return FlextResult.fail(f"Projected catalog write failed: {e}")
+            for entity, counts in projection.summary(resolution.catalog).items():
+                self.logger.info(
+                    f"Projection for {entity}: "
+                    f"{counts['selected']}/{counts['total']} columns selected"
+                )
+        self.run_context.catalog_overrides[extractor_name] = catalog_path
+        self.logger.info(
+            f"Catalog for {extractor_name}: "
+            f"{'cache hit' if resolution.cache_hit else 'rediscovered'}, "
+            f"{len(resolution.changes)} schema changes"
+        )
+        return result
+
+    def _extractor_config(
+        self, extractor: str, env: dict[str, str]
+    ) -> dict[str, t.GeneralValueType]:
+        """Extractor config from meltano.yml with ``$VAR`` references resolved."""
+        project_root = Path(self.settings.meltano_project_root or ".")
+        try:
+            project = yaml.safe_load(
+                (project_root / "meltano.yml").read_text(encoding="utf-8")
+            )
+        except (OSError, yaml.YAMLError):
+            return {"name": extractor}
+        extractors = (project or {}).get("plugins", {}).get("extractors", [])
+        for plugin in extractors:
+            if plugin.get("name") != extractor:
+                continue
+            config = plugin.get("config") or {}
+            return {
+                "name": extractor,
+                **{
+                    key: Template(value).safe_substitute(env)
+                    if isinstance(value, str)
+                    else value
+                    for key, value in config.items()
+                },
+            }
+        return {"name": extractor}
+
+    def _discover_catalog(
+        self, extractor: str, env: dict[str, str]
+    ) -> FlextResult[dict[str, t.GeneralValueType]]:
+        """Run tap discovery through Meltano and parse the catalog."""
+        try:
+            process = subprocess.run(  # noqa: S603
+                ["meltano", "invoke", "--dump=catalog", extractor],
+                check=False,
+                cwd=Path(self.settings.meltano_project_root or "."),
+                env=env,
+                capture_output=True,
+                text=True,
+                timeout=self.settings.pipeline_timeout_seconds,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            return FlextResult.fail(f"Catalog discovery failed: {e}")
+        if process.returncode != 0:
+            return FlextResult.fail(
+                f"Catalog discovery exited with {process.returncode}: "
+                f"{process.stderr.strip()[-500:]}"
+            )
+        try:
+            catalog = json.loads(process.stdout)
+        except json.JSONDecodeError as e:
+            return FlextResult.fail(f"Catalog discovery returned invalid JSON: {e}")
+        if not isinstance(catalog, dict):
+            return FlextResult.fail("Catalog discovery returned no catalog object")
+        return FlextResult.ok(catalog)
+
     def get_job_status(
         self, job_name: str
     ) -> FlextResult[dict[str, t.GeneralValueType]]:
@@ -528,6 +1009,69 @@ class GruponosMeltanoOrchestrator(FlextService[GruponosMeltanoNativeConfig]):
         self.logger.debug(f"Job status retrieved: {job_status}")
         return FlextResult.ok(job_status)
 
+    def evaluate_data_quality(
+        self,
+        pipeline_result: PipelineResult,
+        accumulator: DataQualityAccumulator,
+        configuration: PipelineConfiguration | None = None,
+    ) -> FlextResult[PipelineResult]:
+        """Attach streaming quality scores and enforce the quality threshold.
+
+        Args:
+            pipeline_result: Result to receive the quality scores.
+            accumulator: Accumulator fed with the records seen during the run.
+            configuration: Pipeline configuration with ``enable_quality_checks``
+                and ``quality_threshold``. The model defaults are used when
+                omitted.
+
+        Returns:
+            FlextResult[PipelineResult]: The same result with quality fields filled.
+            A threshold breach adds a warning and fires a data quality alert;
+            it does not fail the result.
+
+        """
+        defaults = PipelineConfiguration.model_fields
+        enabled = (
+            configuration.enable_quality_checks
+            if configuration
+            else defaults["enable_quality_checks"].default
+        )
+        if not enabled or accumulator.records_observed == 0:
+            return FlextResult.ok(pipeline_result)
+
+        threshold = (
+            configuration.quality_threshold
+            if configuration
+            else defaults["quality_threshold"].default
+        )
+        scores = accumulator.apply_to(pipeline_result)
+        self.logger.info(
+            f"Data quality for {pipeline_result.job_name}: "
+            f"{scores.data_quality_score:.2f}% over {scores.records_observed} records"
+        )
+        if scores.data_quality_score >= threshold:
+            return FlextResult.ok(pipeline_result)
+
+        issue = (
+            f"quality score {scores.data_quality_score:.2f}% below threshold "
+            f"{threshold:.2f}% for job {pipeline_result.job_name}"
+        )
+        pipeline_result.warnings.append(f"Data quality threshold breached: {issue}")
+        alert_result = self._get_alert_manager().send_data_quality_alert(
+            issue,
+            pipeline_name=pipeline_result.pipeline_name,
+            context={**scores.as_dict(), "quality_threshold": threshold},
+        )
+        if alert_result.is_failure:
+            self.logger.warning(f"Data quality alert not sent: {alert_result.error}")
+        return FlextResult.ok(pipeline_result)
+
+    def _get_alert_manager(self) -> GruponosMeltanoAlertManager:
+        """Lazily create the alert manager used for quality breaches."""
+        if self._alert_manager is None:
+            self._alert_manager = create_gruponos_meltano_alert_manager(self.settings)
+        return self._alert_manager
+
     # =============================================
     # NESTED HELPER CLASSES
     # =============================================
@@ -836,6 +1380,11 @@ class GruponosMeltanoOrchestrator(FlextService[GruponosMeltanoNativeConfig]):
         if sid:
             env["FLEXT_TARGET_ORACLE_SID"] = str(sid)
 
+        # Cached catalogs (resolve_catalog) replace discovery via the extra
+        for extractor, catalog_path in self.run_context.catalog_overrides.items():
+            plugin_prefix = extractor.upper().replace("-", "_")
+            env[f"{plugin_prefix}__CATALOG"] = str(catalog_path)
+
         self.logger.debug(
             "Meltano environment configured",
             extra={
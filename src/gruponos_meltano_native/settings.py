@@ -244,6 +244,13 @@ class GruponosMeltanoNativeSettings(FlextSettings):
         default=None,
         description="Oracle WMS facility code",
     )
+    wms_facilities: str | None = Field(
+        default=None,
+        description=(
+            "Facility matrix as COMPANY:FACILITY pairs separated by commas "
+            "(e.g. GNOS:DC01,GNOS:DC02)"
+        ),
+    )
 
     # Backward compatibility properties for old attribute names
     @property
@@ -330,7 +337,9 @@ class GruponosMeltanoNativeSettings(FlextSettings):
 
     meltano_state_backend: str = Field(
         default="filesystem",
-        description="Meltano state backend",
+        description=(
+            "Meltano state backend (native runs use the embedded state store)"
+        ),
     )
 
     # Field validators
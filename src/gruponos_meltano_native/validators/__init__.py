@@ -7,6 +7,14 @@ Fornece classes e funções para:
     - Validação robusta de dados
     - Conversão de tipos específica Oracle
     - Regras de validação configuráveis
+    - Códigos de erro estruturados com contadores agregados
+    - Normalização de datas memoizada com layout por coluna
+    - Pontuação de qualidade de dados em streaming
+    - Detecção de chaves duplicadas e cardinalidade por entidade
+    - Perfilamento estatístico por coluna e detecção de drift
+    - Integridade referencial entre streams durante a carga
+    - Quarentena de registros rejeitados com replay
+    - Pacotes de regras YAML declarativos por entidade (com recarga a quente)
     - Factory functions para diferentes ambientes
 
 Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
@@ -20,10 +28,90 @@ from gruponos_meltano_native.validators.data_validator import (
     ValidationRule,
     create_validator_for_environment,
 )
+from gruponos_meltano_native.validators.date_normalizer import (
+    DateLayout,
+    DateNormalizer,
+)
+from gruponos_meltano_native.validators.duplicates import (
+    DuplicateKeyDetector,
+    HyperLogLog,
+    ScalableBloomFilter,
+    SpillableDigestSet,
+    create_duplicate_detectors,
+)
+from gruponos_meltano_native.validators.error_model import (
+    ValidationErrorAggregator,
+    ValidationErrorCode,
+    ValidationFailure,
+)
+from gruponos_meltano_native.validators.integrity import (
+    ForeignKey,
+    OrphanReport,
+    ReferentialIntegrityChecker,
+    SortedKeyIndex,
+)
+from gruponos_meltano_native.validators.profiler import (
+    ColumnProfile,
+    DriftFinding,
+    DriftKind,
+    KLLSketch,
+    StreamProfiler,
+    TopKCounter,
+    detect_drift,
+)
+from gruponos_meltano_native.validators.quality import (
+    DataQualityAccumulator,
+    DataQualityScores,
+)
+from gruponos_meltano_native.validators.quarantine import (
+    GruponosMeltanoQuarantineStore,
+    QuarantinedRecord,
+    QuarantineIndexEntry,
+)
+from gruponos_meltano_native.validators.rule_packs import (
+    FieldCondition,
+    FieldPredicate,
+    RulePackError,
+    RulePackLoader,
+    ValidatorPlan,
+    compile_rule_pack,
+)
 
 __all__: list[str] = [
+    "ColumnProfile",
+    "DataQualityAccumulator",
+    "DataQualityScores",
     "DataValidator",
+    "DateLayout",
+    "DateNormalizer",
+    "DriftFinding",
+    "DriftKind",
+    "DuplicateKeyDetector",
+    "FieldCondition",
+    "FieldPredicate",
+    "ForeignKey",
+    "GruponosMeltanoQuarantineStore",
+    "HyperLogLog",
+    "KLLSketch",
+    "OrphanReport",
+    "QuarantineIndexEntry",
+    "QuarantinedRecord",
+    "ReferentialIntegrityChecker",
+    "RulePackError",
+    "RulePackLoader",
+    "ScalableBloomFilter",
+    "SortedKeyIndex",
+    "SpillableDigestSet",
+    "StreamProfiler",
+    "TopKCounter",
     "ValidationError",
+    "ValidationErrorAggregator",
+    "ValidationErrorCode",
+    "ValidationFailure",
     "ValidationRule",
+    "ValidatorPlan",
+    "compile_rule_pack",
+    "create_duplicate_detectors",
     "create_validator_for_environment",
+    "detect_drift",
 ]
@@ -16,17 +16,33 @@ Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Propriet
 
 from __future__ import annotations
 
-import re
 from collections.abc import Callable
-from datetime import UTC, date, datetime
+from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
-from typing import override
+from typing import TYPE_CHECKING, override
 
 from flext_core import FlextExceptions, FlextLogger, FlextTypes as t
 
+from gruponos_meltano_native.validators.date_normalizer import DateNormalizer
+from gruponos_meltano_native.validators.duplicates import DuplicateKeyDetector
+from gruponos_meltano_native.validators.error_model import (
+    ValidationErrorAggregator,
+    ValidationErrorCode,
+    ValidationFailure,
+)
+from gruponos_meltano_native.validators.profiler import StreamProfiler
+from gruponos_meltano_native.validators.quarantine import (
+    GruponosMeltanoQuarantineStore,
+)
+
+if TYPE_CHECKING:
+    from gruponos_meltano_native.validators.rule_packs import FieldCondition
+
 # Get dependencies via DI
 logger = FlextLogger(__name__)
 
+_CONVERTED_TYPES = frozenset({"boolean", "integer", "number"})
+
 
 # Use padrão de arquitetura empresarial with proper error code for tests compatibility
 class ValidationError(FlextExceptions.ValidationError):
@@ -110,8 +126,14 @@ class DataValidator:
 
     Attributes:
       rules: Lista de regras de validação.
+      conditions: Condições entre campos (pacotes de regras YAML).
       strict_mode: Se True, lança exceções em falhas de validação.
       conversion_stats: Estatísticas de conversão de dados.
+      error_aggregator: Contadores e amostras de falhas por (campo, código).
+      date_normalizer: Normalizador de datas memoizado (layout por coluna).
+      profiler: Perfil estatístico por coluna (ativado via ``enable_profiling``).
+      duplicates: Detector de chaves duplicadas (ativado via
+        ``enable_duplicate_detection``).
 
     """
 
@@ -121,15 +143,18 @@ class DataValidator:
         rules: list[ValidationRule] | None = None,
         *,
         strict_mode: bool = False,
+        conditions: list[FieldCondition] | None = None,
     ) -> None:
         """Inicializa validador de dados.
 
         Args:
             rules: Lista de regras de validação a aplicar.
             strict_mode: Se True, lança exceções em falhas de validação.
+            conditions: Condições entre campos avaliadas após as regras.
 
         """
         self.rules = rules or []
+        self.conditions = conditions or []
         self.strict_mode = strict_mode
         self.conversion_stats = {
             "strings_converted_to_numbers": 0,
@@ -137,27 +162,59 @@ class DataValidator:
             "nulls_handled": 0,
             "validation_errors": 0,
         }
+        self.error_aggregator = ValidationErrorAggregator()
+        self.date_normalizer = DateNormalizer()
+        self.profiler: StreamProfiler | None = None
+        self.duplicates: DuplicateKeyDetector | None = None
+        self._validation_methods: dict[str, Callable[..., None]] = {
+            "decimal": self._validate_decimal,
+            "string": self._validate_string,
+            "number": self._validate_number,
+            "date": self._validate_date,
+            "boolean": self._validate_boolean,
+            "enum": self._validate_enum,
+        }
+
+    def _fail(
+        self,
+        rule: ValidationRule,
+        code: ValidationErrorCode,
+        errors: list[ValidationFailure],
+        *,
+        value: object = None,
+        limit: object = None,
+        raise_on_failure: bool,
+        cause: Exception | None = None,
+    ) -> None:
+        """Register a validation failure (raises in strict mode)."""
+        failure = ValidationFailure(rule.field_name, code, value, limit)
+        if self.strict_mode and raise_on_failure:
+            raise ValidationError(
+                failure.message,
+                validation_details={
+                    "field": rule.field_name,
+                    "error_code": int(code),
+                },
+            ) from cause
+        self.error_aggregator.record(failure)
+        errors.append(failure)
 
     def _validate_required_field(
         self,
         rule: ValidationRule,
         data: dict[str, t.GeneralValueType],
-        errors: list[str],
+        errors: list[ValidationFailure],
+        *,
+        raise_on_failure: bool,
     ) -> bool:
         """Validate required field presence."""
         if rule.field_name not in data and rule.rule_type == "required":
-            error_msg: str = f"Required field '{rule.field_name}' is missing"
-            if self.strict_mode:
-                raise ValidationError(
-                    error_msg,
-                    validation_details={"field": rule.field_name},
-                )
-            logger.warning(
-                "Validation failed: %s (field: %s)",
-                error_msg,
-                rule.field_name,
+            self._fail(
+                rule,
+                ValidationErrorCode.MISSING_REQUIRED,
+                errors,
+                raise_on_failure=raise_on_failure,
             )
-            errors.append(error_msg)
             return False
         return True
 
@@ -166,23 +223,103 @@ class DataValidator:
         rule: ValidationRule,
         *,
         value: object,
-        errors: list[str],
+        errors: list[ValidationFailure],
+        raise_on_failure: bool,
     ) -> None:
         """Validate field value based on rule type."""
-        validation_methods: dict[
-            str,
-            Callable[[ValidationRule, object, list[str]], None],
-        ] = {
-            "decimal": self._validate_decimal,
-            "string": self._validate_string,
-            "number": self._validate_number,
-            "date": self._validate_date,
-            "boolean": self._validate_boolean,
-            "enum": self._validate_enum,
-        }
-        validation_method = validation_methods.get(rule.rule_type)
+        validation_method = self._validation_methods.get(rule.rule_type)
         if validation_method is not None and value is not None:
-            validation_method(rule, value, errors)
+            validation_method(rule, value, errors, raise_on_failure=raise_on_failure)
+
+    def check(
+        self,
+        data: dict[str, t.GeneralValueType],
+        *,
+        raise_on_failure: bool = True,
+    ) -> list[ValidationFailure]:
+        """Valida dados retornando falhas estruturadas (sem formatar mensagens).
+
+        Caminho rápido usado em lotes: cada falha é um objeto leve com
+        código inteiro; contadores e amostras vão para ``error_aggregator``.
+
+        Args:
+            data: Dados a serem validados.
+            raise_on_failure: Se False, não lança exceção nem em modo strict
+                (as falhas são apenas retornadas).
+
+        Returns:
+            list[ValidationFailure]: Falhas encontradas (vazia se válido).
+
+        Raises:
+            ValidationError: Se a validação falhar no modo strict.
+
+        """
+        if self.profiler is not None:
+            self.profiler.observe(data)
+        errors: list[ValidationFailure] = []
+        for rule in self.rules:
+            # Check required fields first
+            if not self._validate_required_field(
+                rule, data, errors, raise_on_failure=raise_on_failure
+            ):
+                continue
+            # Skip if field not in data
+            if rule.field_name not in data:
+                continue
+            value = data[rule.field_name]
+            self._validate_field_value(
+                rule, value=value, errors=errors, raise_on_failure=raise_on_failure
+            )
+        for condition in self.conditions:
+            if condition.violated(data):
+                self._fail(
+                    condition.rule,
+                    ValidationErrorCode.CONDITION_FAILED,
+                    errors,
+                    value=data.get(condition.rule.field_name),
+                    limit=condition.name,
+                    raise_on_failure=raise_on_failure,
+                )
+        return errors
+
+    def check_duplicate_key(
+        self,
+        data: dict[str, t.GeneralValueType],
+        *,
+        raise_on_failure: bool = True,
+    ) -> list[ValidationFailure]:
+        """Registra a chave do registro no detector de duplicatas.
+
+        Chamado uma vez por registro pelo caminho de carga
+        (``partition_batch``, ``SingerProxyStage``, execução nativa), só para
+        registros que passaram nas regras. ``check`` não registra chaves, de
+        modo que revalidar um registro (replay, relatórios) não o torna
+        duplicado.
+
+        Args:
+            data: Registro a carregar.
+            raise_on_failure: Se False, não lança exceção em modo strict.
+
+        Returns:
+            list[ValidationFailure]: Falha ``DUPLICATE_KEY`` se a chave já foi
+            vista na execução; vazia caso contrário ou sem detector.
+
+        Raises:
+            ValidationError: Se a chave repetir no modo strict.
+
+        """
+        errors: list[ValidationFailure] = []
+        duplicates = self.duplicates
+        if duplicates is not None and duplicates.observe(data):
+            self._fail(
+                ValidationRule("+".join(duplicates.key_fields), "unique"),
+                ValidationErrorCode.DUPLICATE_KEY,
+                errors,
+                value=[data.get(field) for field in duplicates.key_fields],
+                limit=duplicates.entity,
+                raise_on_failure=raise_on_failure,
+            )
+        return errors
 
     def validate(self, data: dict[str, t.GeneralValueType]) -> list[str]:
         """Valida dados contra regras configuradas.
@@ -206,147 +343,239 @@ class DataValidator:
             >>> print(erros)  # ['Required field "id" is missing']
 
         """
-        errors: list[str] = []
-        for rule in self.rules:
-            # Check required fields first
-            if not self._validate_required_field(rule, data, errors):
-                continue
-            # Skip if field not in data
-            if rule.field_name not in data:
-                continue
-            value = data[rule.field_name]
-            self._validate_field_value(rule, value=value, errors=errors)
-        return errors
+        return [failure.message for failure in self.check(data)]
+
+    def validate_batch(
+        self,
+        records: list[dict[str, t.GeneralValueType]],
+        batch_label: str = "batch",
+    ) -> int:
+        """Valida um lote de registros com log resumido ao final.
+
+        Args:
+            records: Registros do lote.
+            batch_label: Identificador do lote usado no log resumido.
+
+        Returns:
+            int: Número de registros com ao menos uma falha.
+
+        Raises:
+            ValidationError: Se a validação falhar no modo strict.
+
+        """
+        invalid_records = 0
+        for record in records:
+            if self.check(record):
+                invalid_records += 1
+        self.error_aggregator.flush_batch(batch_label)
+        return invalid_records
+
+    def collect_failures(
+        self, data: dict[str, t.GeneralValueType]
+    ) -> list[ValidationFailure]:
+        """Como ``check``, mas nunca lança exceção, mesmo em modo strict."""
+        return self.check(data, raise_on_failure=False)
+
+    def partition_batch(
+        self,
+        records: list[dict[str, t.GeneralValueType]],
+        quarantine: GruponosMeltanoQuarantineStore,
+        stream: str,
+        *,
+        run_id: str | None = None,
+    ) -> list[dict[str, t.GeneralValueType]]:
+        """Separa registros válidos e envia os inválidos para a quarentena.
+
+        Mesmo em modo strict o lote não é abortado: cada registro inválido
+        é gravado na quarentena com suas falhas e o fluxo continua.
+
+        Args:
+            records: Registros do lote.
+            quarantine: Armazenamento de quarentena.
+            stream: Stream de origem dos registros.
+            run_id: Execução corrente.
+
+        Returns:
+            list[dict]: Registros válidos, na ordem original.
+
+        """
+        valid: list[dict[str, t.GeneralValueType]] = []
+        for record in records:
+            failures = self.collect_failures(record) or self.check_duplicate_key(
+                record, raise_on_failure=False
+            )
+            if failures:
+                quarantine.put(stream, record, failures, run_id=run_id)
+            else:
+                valid.append(record)
+        self.error_aggregator.flush_batch(stream)
+        return valid
+
+    def get_error_summary(self) -> dict[str, t.GeneralValueType]:
+        """Obtém resumo agregado das falhas de validação.
+
+        Returns:
+            dict[str, t.GeneralValueType]: Totais, contadores por
+            (campo, código) e amostras de valores inválidos.
+
+        """
+        return self.error_aggregator.summary()
+
+    def enable_profiling(self, stream: str) -> StreamProfiler:
+        """Ativa o perfilamento por coluna dos registros validados.
+
+        Args:
+            stream: Nome do stream perfilado (entidade WMS).
+
+        Returns:
+            StreamProfiler: Perfil alimentado a cada ``check``/``validate``.
+
+        """
+        self.profiler = StreamProfiler(stream)
+        return self.profiler
+
+    def enable_duplicate_detection(
+        self, detector: DuplicateKeyDetector
+    ) -> DuplicateKeyDetector:
+        """Ativa a detecção de chaves duplicadas nos registros validados.
+
+        O caminho de carga registra a chave de cada registro válido com
+        ``check_duplicate_key``; uma chave já vista na execução vira falha
+        ``DUPLICATE_KEY`` (e vai para a quarentena em ``partition_batch`` e no
+        ``SingerProxyStage``) antes da carga.
+
+        Args:
+            detector: Detector da entidade (ver ``create_duplicate_detectors``).
+
+        Returns:
+            DuplicateKeyDetector: O próprio detector, para estatísticas.
+
+        """
+        self.duplicates = detector
+        return detector
+
+    def get_date_stats(self) -> dict[str, t.GeneralValueType]:
+        """Obtém estatísticas do normalizador de datas (taxas de acerto).
+
+        Returns:
+            dict[str, t.GeneralValueType]: Acertos de cache LRU, acertos do
+            layout fixado por coluna e chamadas residuais a ``strptime``.
+
+        """
+        return self.date_normalizer.get_stats()
 
     def _validate_decimal(
         self,
         rule: ValidationRule,
         value: object,
-        errors: list[str],
+        errors: list[ValidationFailure],
+        *,
+        raise_on_failure: bool,
     ) -> None:
         """Validate decimal field."""
+        if isinstance(value, Decimal):
+            return
         try:
-            if not isinstance(value, Decimal):
-                Decimal(str(value))
+            Decimal(str(value))
         except (ValueError, TypeError, InvalidOperation) as e:
-            error_msg: str = f"Field '{rule.field_name}' must be a valid decimal"
-            if self.strict_mode:
-                raise ValidationError(
-                    error_msg,
-                    validation_details={"field": rule.field_name},
-                ) from e
-            logger.warning(
-                "Validation failed: %s (field: %s)",
-                error_msg,
-                rule.field_name,
+            self._fail(
+                rule,
+                ValidationErrorCode.INVALID_DECIMAL,
+                errors,
+                value=value,
+                raise_on_failure=raise_on_failure,
+                cause=e,
             )
-            errors.append(error_msg)
 
     def _validate_string(
         self,
         rule: ValidationRule,
         value: object,
-        errors: list[str],
+        errors: list[ValidationFailure],
+        *,
+        raise_on_failure: bool,
     ) -> None:
         """Validate string field."""
         if not isinstance(value, str):
-            error_msg: str = f"Field '{rule.field_name}' must be a string"
-            if self.strict_mode:
-                raise ValidationError(
-                    error_msg,
-                    validation_details={"field": rule.field_name},
-                )
-            logger.warning(
-                "Validation failed: %s (field: %s)",
-                error_msg,
-                rule.field_name,
+            self._fail(
+                rule,
+                ValidationErrorCode.NOT_STRING,
+                errors,
+                value=value,
+                raise_on_failure=raise_on_failure,
+            )
+            return
+        # Check string length constraints - value is now confirmed to be str
+        max_length = rule.parameters.get("max_length")
+        if (
+            max_length is not None
+            and isinstance(max_length, int)
+            and len(value) > max_length
+        ):
+            self._fail(
+                rule,
+                ValidationErrorCode.MAX_LENGTH_EXCEEDED,
+                errors,
+                value=value,
+                limit=max_length,
+                raise_on_failure=raise_on_failure,
             )
-            errors.append(error_msg)
-        else:
-            # Check string length constraints - value is now confirmed to be str
-            max_length = rule.parameters.get("max_length")
-            if (
-                max_length is not None
-                and isinstance(max_length, int)
-                and len(value) > max_length
-            ):
-                error_msg = (
-                    f"Field '{rule.field_name}' exceeds maximum length {max_length}"
-                )
-                if self.strict_mode:
-                    raise ValidationError(
-                        error_msg,
-                        validation_details={"field": rule.field_name},
-                    )
-                logger.warning(
-                    f"Validation failed: {error_msg} (field: {rule.field_name})",
-                )
-                errors.append(error_msg)
 
     def _validate_number(
         self,
         rule: ValidationRule,
         value: object,
-        errors: list[str],
+        errors: list[ValidationFailure],
+        *,
+        raise_on_failure: bool,
     ) -> None:
         """Validate number field."""
         if not isinstance(value, (int, float)):
-            error_msg: str = f"Field '{rule.field_name}' must be a number"
-            if self.strict_mode:
-                raise ValidationError(
-                    error_msg,
-                    validation_details={"field": rule.field_name},
-                )
-            logger.warning(
-                "Validation failed: %s (field: %s)",
-                error_msg,
-                rule.field_name,
+            self._fail(
+                rule,
+                ValidationErrorCode.NOT_NUMBER,
+                errors,
+                value=value,
+                raise_on_failure=raise_on_failure,
+            )
+            return
+        # Check numeric range constraints - value is now confirmed to be int | float
+        min_value = rule.parameters.get("min_value")
+        max_value = rule.parameters.get("max_value")
+        if (
+            min_value is not None
+            and isinstance(min_value, (int, float))
+            and value < min_value
+        ):
+            self._fail(
+                rule,
+                ValidationErrorCode.BELOW_MIN_VALUE,
+                errors,
+                value=value,
+                limit=min_value,
+                raise_on_failure=raise_on_failure,
+            )
+        if (
+            max_value is not None
+            and isinstance(max_value, (int, float))
+            and value > max_value
+        ):
+            self._fail(
+                rule,
+                ValidationErrorCode.ABOVE_MAX_VALUE,
+                errors,
+                value=value,
+                limit=max_value,
+                raise_on_failure=raise_on_failure,
             )
-            errors.append(error_msg)
-        else:
-            # Check numeric range constraints - value is now confirmed to be int | float
-            min_value = rule.parameters.get("min_value")
-            max_value = rule.parameters.get("max_value")
-            if (
-                min_value is not None
-                and isinstance(min_value, (int, float))
-                and value < min_value
-            ):
-                min_error_msg: str = (
-                    f"Field '{rule.field_name}' below minimum value {min_value}"
-                )
-                if self.strict_mode:
-                    raise ValidationError(
-                        min_error_msg,
-                        validation_details={"field": rule.field_name},
-                    )
-                logger.warning(
-                    f"Validation failed: {min_error_msg} (field: {rule.field_name})",
-                )
-                errors.append(min_error_msg)
-            if (
-                max_value is not None
-                and isinstance(max_value, (int, float))
-                and value > max_value
-            ):
-                max_error_msg = (
-                    f"Field '{rule.field_name}' exceeds maximum value {max_value}"
-                )
-                if self.strict_mode:
-                    raise ValidationError(
-                        max_error_msg,
-                        validation_details={"field": rule.field_name},
-                    )
-                logger.warning(
-                    f"Validation failed: {max_error_msg} (field: {rule.field_name})",
-                )
-                errors.append(max_error_msg)
 
     def _validate_date(
         self,
         rule: ValidationRule,
         value: object,
-        errors: list[str],
+        errors: list[ValidationFailure],
+        *,
+        raise_on_failure: bool,
     ) -> None:
         """Validate date field."""
         if isinstance(value, str):
@@ -354,60 +583,49 @@ class DataValidator:
             date_format = (
                 date_format_raw if isinstance(date_format_raw, str) else "%Y-%m-%d"
             )
-            try:
-                datetime.strptime(value, date_format).replace(tzinfo=UTC)
-            except ValueError:
-                format_error_msg = (
-                    f"Field '{rule.field_name}' is not a valid date format "
-                    f"{date_format}"
-                )
-                if self.strict_mode:
-                    raise ValidationError(
-                        format_error_msg,
-                        validation_details={"field": rule.field_name},
-                    ) from None
-                logger.warning(
-                    f"Validation failed: {format_error_msg} (field: {rule.field_name})",
+            if not self.date_normalizer.matches_format(value, date_format):
+                self._fail(
+                    rule,
+                    ValidationErrorCode.INVALID_DATE_FORMAT,
+                    errors,
+                    value=value,
+                    limit=date_format,
+                    raise_on_failure=raise_on_failure,
                 )
-                errors.append(format_error_msg)
         elif not isinstance(value, datetime):
-            type_error_msg: str = f"Field '{rule.field_name}' must be a valid date"
-            if self.strict_mode:
-                raise ValidationError(
-                    type_error_msg,
-                    validation_details={"field": rule.field_name},
-                )
-            logger.warning(
-                f"Validation failed: {type_error_msg} (field: {rule.field_name})",
+            self._fail(
+                rule,
+                ValidationErrorCode.NOT_DATE,
+                errors,
+                value=value,
+                raise_on_failure=raise_on_failure,
             )
-            errors.append(type_error_msg)
 
     def _validate_boolean(
         self,
         rule: ValidationRule,
         value: object,
-        errors: list[str],
+        errors: list[ValidationFailure],
+        *,
+        raise_on_failure: bool,
     ) -> None:
         """Validate boolean field."""
         if not isinstance(value, bool):
-            error_msg: str = f"Field '{rule.field_name}' must be a boolean"
-            if self.strict_mode:
-                raise ValidationError(
-                    error_msg,
-                    validation_details={"field": rule.field_name},
-                )
-            logger.warning(
-                "Validation failed: %s (field: %s)",
-                error_msg,
-                rule.field_name,
+            self._fail(
+                rule,
+                ValidationErrorCode.NOT_BOOLEAN,
+                errors,
+                value=value,
+                raise_on_failure=raise_on_failure,
             )
-            errors.append(error_msg)
 
     def _validate_enum(
         self,
         rule: ValidationRule,
         value: object,
-        errors: list[str],
+        errors: list[ValidationFailure],
+        *,
+        raise_on_failure: bool,
     ) -> None:
         """Validate enum field."""
         allowed_values_raw = rule.parameters.get("allowed_values", [])
@@ -417,20 +635,14 @@ class DataValidator:
             else []
         )
         if value not in allowed_values:
-            error_msg: str = (
-                f"Field '{rule.field_name}' must be one of {allowed_values}"
-            )
-            if self.strict_mode:
-                raise ValidationError(
-                    error_msg,
-                    validation_details={"field": rule.field_name},
-                )
-            logger.warning(
-                "Validation failed: %s (field: %s)",
-                error_msg,
-                rule.field_name,
+            self._fail(
+                rule,
+                ValidationErrorCode.NOT_IN_ENUM,
+                errors,
+                value=value,
+                limit=allowed_values,
+                raise_on_failure=raise_on_failure,
             )
-            errors.append(error_msg)
 
     def validate_and_convert_record(
         self,
@@ -480,6 +692,93 @@ class DataValidator:
                 converted_record[field_name] = field_value
         return converted_record
 
+    def compile_conversions(
+        self, schema: dict[str, t.GeneralValueType]
+    ) -> dict[str, dict[str, t.GeneralValueType]]:
+        """Pré-compila as conversões de um schema Singer.
+
+        Mantém apenas campos cujo tipo exige conversão (número, inteiro,
+        booleano, data); campos string simples passam sem custo.
+
+        Args:
+            schema: Schema JSON do stream (mensagem SCHEMA).
+
+        Returns:
+            dict[str, dict]: Schema reduzido por campo, para
+            ``apply_conversions``.
+
+        """
+        properties = schema.get("properties")
+        if not isinstance(properties, dict):
+            return {}
+        compiled: dict[str, dict[str, t.GeneralValueType]] = {}
+        for field_name, field_schema in properties.items():
+            if not isinstance(field_schema, dict):
+                continue
+            expected_type = field_schema.get("type", "string")
+            if isinstance(expected_type, list):
+                non_null = [kind for kind in expected_type if kind != "null"]
+                expected_type = non_null[0] if non_null else "string"
+            if expected_type in _CONVERTED_TYPES or (
+                expected_type == "string"
+                and field_schema.get("format") in {"date", "date-time"}
+            ):
+                compiled[field_name] = {**field_schema, "type": expected_type}
+        return compiled
+
+    def apply_conversions(
+        self,
+        record: dict[str, t.GeneralValueType],
+        conversions: dict[str, dict[str, t.GeneralValueType]],
+        errors: list[ValidationFailure],
+    ) -> bool:
+        """Aplica conversões pré-compiladas no próprio registro.
+
+        Valores já no tipo esperado não são tocados. Falhas de conversão
+        viram ``CONVERSION_FAILED`` em ``errors`` (nunca lançam exceção).
+
+        Args:
+            record: Registro alterado in-place.
+            conversions: Resultado de ``compile_conversions``.
+            errors: Lista que recebe as falhas.
+
+        Returns:
+            bool: True se algum valor do registro foi alterado.
+
+        """
+        changed = False
+        for field_name, field_schema in conversions.items():
+            value = record.get(field_name)
+            if value is None:
+                continue
+            expected_type = field_schema["type"]
+            if expected_type in {"number", "integer"}:
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    continue
+            elif expected_type == "boolean" and isinstance(value, bool):
+                continue
+            try:
+                converted = self._convert_field(
+                    value=value,
+                    field_schema=field_schema,
+                    field_name=field_name,
+                    strict=self.strict_mode,
+                )
+            except ValueError:
+                failure = ValidationFailure(
+                    field_name,
+                    ValidationErrorCode.CONVERSION_FAILED,
+                    value,
+                    expected_type,
+                )
+                self.error_aggregator.record(failure)
+                errors.append(failure)
+                continue
+            if converted != value or type(converted) is not type(value):
+                record[field_name] = converted
+                changed = True
+        return changed
+
     def _convert_field(
         self,
         *,
@@ -625,28 +924,13 @@ class DataValidator:
         self,
         value: object,
         _date_format: object,
-        _field_name: str,
+        field_name: str,
     ) -> object:
         """Convert value to date string."""
-        if isinstance(value, (datetime, date)):
+        normalized = self.date_normalizer.normalize_value(value, field_name)
+        if isinstance(value, (datetime, date, str)):
             self.conversion_stats["dates_normalized"] += 1
-            return value.isoformat()
-        if isinstance(value, str):
-            # Try parsing common date formats
-            date_patterns = [
-                r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}",  # ISO datetime
-                r"\d{4}-\d{2}-\d{2}",  # ISO date
-                r"\d{2}/\d{2}/\d{4}",  # US format
-                r"\d{2}-\d{2}-\d{4}",  # US format with dashes
-            ]
-            for pattern in date_patterns:
-                if re.match(pattern, value.strip()):
-                    self.conversion_stats["dates_normalized"] += 1
-                    return value.strip()
-            # Always fail explicitly - no fallbacks allowed
-            msg: str = f"Cannot parse date '{value}'"
-            raise ValueError(msg)
-        return str(value) if value is not None else None
+        return normalized
 
     def get_conversion_stats(self) -> dict[str, int]:
         """Obtém estatísticas de conversão.
@@ -662,10 +946,11 @@ class DataValidator:
         """Reseta estatísticas de conversão.
 
         Zera todos os contadores de estatísticas de conversão
-        para reiniciar a coleta de métricas.
+        e de falhas de validação para reiniciar a coleta de métricas.
         """
         for key in self.conversion_stats:
             self.conversion_stats[key] = 0
+        self.error_aggregator.reset()
 
 
 def create_validator_for_environment(environment: str = "dev") -> DataValidator:
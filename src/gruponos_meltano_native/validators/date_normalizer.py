@@ -0,0 +1,345 @@
+"""Normalizador de Datas com Caminho Rápido e Memoização.
+
+Timestamps WMS (ex.: ``mod_ts``) se repetem muito dentro de uma página.
+Este módulo evita testar expressões regulares em sequência e chamar
+``datetime.strptime`` para cada valor:
+
+    - Parser de layout fixo para ISO 8601 (data e data-hora)
+    - Detecção de layout por coluna, fixada após os primeiros valores
+    - Cache LRU limitado de string → resultado normalizado
+    - Conversão para ``datetime`` com fuso, para comparar por valor
+    - Estatísticas com taxas de acerto
+
+Classes:
+    DateNormalizer: Normalizador de datas memoizado.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+from collections.abc import Callable
+from datetime import UTC, date, datetime
+from enum import IntEnum
+from typing import Final
+
+from flext_core import FlextTypes as t
+
+DEFAULT_CACHE_SIZE: Final[int] = 4096
+DEFAULT_DETECTION_WINDOW: Final[int] = 8
+
+ISO_DATE_FORMAT: Final[str] = "%Y-%m-%d"
+ISO_DATETIME_FORMAT: Final[str] = "%Y-%m-%dT%H:%M:%S"
+_ISO_DATE_LENGTH: Final[int] = 10
+_ISO_DATETIME_LENGTH: Final[int] = 19
+
+# Sentinel stored in the LRU for values known to be unparseable
+_INVALID: Final[str] = "\x00invalid"
+# Cache namespace for normalize(); strptime formats are never empty
+_NORMALIZE_KEY: Final[str] = ""
+
+
+class DateLayout(IntEnum):
+    """Layouts de data aceitos (mesma ordem das regex históricas)."""
+
+    ISO_DATETIME = 1  # YYYY-MM-DDTHH:MM:SS
+    ISO_DATE = 2  # YYYY-MM-DD
+    US_SLASH = 3  # MM/DD/YYYY
+    US_DASH = 4  # MM-DD-YYYY
+
+
+def _is_iso_datetime(s: str) -> bool:
+    return (
+        len(s) >= _ISO_DATETIME_LENGTH
+        and s[10] == "T"
+        and s[13] == ":"
+        and s[16] == ":"
+        and _is_iso_date(s)
+        and s[11:13].isdecimal()
+        and s[14:16].isdecimal()
+        and s[17:19].isdecimal()
+    )
+
+
+def _is_iso_date(s: str) -> bool:
+    return (
+        len(s) >= _ISO_DATE_LENGTH
+        and s[4] == "-"
+        and s[7] == "-"
+        and s[:4].isdecimal()
+        and s[5:7].isdecimal()
+        and s[8:10].isdecimal()
+    )
+
+
+def _is_us(s: str, sep: str) -> bool:
+    return (
+        len(s) >= _ISO_DATE_LENGTH
+        and s[2] == sep
+        and s[5] == sep
+        and s[:2].isdecimal()
+        and s[3:5].isdecimal()
+        and s[6:10].isdecimal()
+    )
+
+
+_LAYOUT_CHECKS: Final[dict[DateLayout, Callable[[str], bool]]] = {
+    DateLayout.ISO_DATETIME: _is_iso_datetime,
+    DateLayout.ISO_DATE: _is_iso_date,
+    DateLayout.US_SLASH: lambda s: _is_us(s, "/"),
+    DateLayout.US_DASH: lambda s: _is_us(s, "-"),
+}
+
+
+class DateNormalizer:
+    """Normalizador de datas memoizado com detecção de layout por coluna.
+
+    A saída normalizada preserva o contrato histórico de
+    ``DataValidator._convert_to_date``: o valor sem espaços nas pontas,
+    desde que comece com um dos layouts aceitos.
+
+    Attributes:
+      cache_size: Número máximo de entradas no cache LRU.
+      detection_window: Valores observados antes de fixar o layout da coluna.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        detection_window: int = DEFAULT_DETECTION_WINDOW,
+    ) -> None:
+        """Inicializa normalizador.
+
+        Args:
+            cache_size: Tamanho do cache LRU de resultados.
+            detection_window: Amostras por coluna antes de fixar o layout.
+
+        """
+        self.cache_size = cache_size
+        self.detection_window = detection_window
+        self._cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._column_layouts: dict[str, DateLayout] = {}
+        self._column_votes: dict[str, Counter[DateLayout]] = {}
+        self.stats: dict[str, int] = {
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "layout_fast_hits": 0,
+            "layout_fallbacks": 0,
+            "strptime_calls": 0,
+            "failures": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # LRU helpers
+    # ------------------------------------------------------------------
+
+    def _cache_get(self, key: tuple[str, str]) -> str | None:
+        cached = self._cache.get(key)
+        if cached is None:
+            self.stats["cache_misses"] += 1
+            return None
+        self._cache.move_to_end(key)
+        self.stats["cache_hits"] += 1
+        return cached
+
+    def _cache_put(self, key: tuple[str, str], result: str) -> None:
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Layout detection
+    # ------------------------------------------------------------------
+
+    def _detect_layout(self, value: str, column: str) -> DateLayout | None:
+        locked = self._column_layouts.get(column)
+        if locked is not None:
+            if _LAYOUT_CHECKS[locked](value):
+                self.stats["layout_fast_hits"] += 1
+                return locked
+            self.stats["layout_fallbacks"] += 1
+
+        for layout, check in _LAYOUT_CHECKS.items():
+            if layout is not locked and check(value):
+                if locked is None:
+                    self._vote(column, layout)
+                return layout
+        return None
+
+    def _vote(self, column: str, layout: DateLayout) -> None:
+        votes = self._column_votes.setdefault(column, Counter())
+        votes[layout] += 1
+        if votes.total() >= self.detection_window:
+            self._column_layouts[column] = votes.most_common(1)[0][0]
+            del self._column_votes[column]
+
+    def column_layout(self, column: str) -> DateLayout | None:
+        """Layout fixado para a coluna (None enquanto em detecção)."""
+        return self._column_layouts.get(column)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def normalize(self, value: str, column: str = "") -> str | None:
+        """Normaliza string de data/timestamp.
+
+        Args:
+            value: Valor textual vindo do WMS.
+            column: Nome da coluna (habilita layout fixado por coluna).
+
+        Returns:
+            str | None: Valor normalizado ou None se nenhum layout casar.
+
+        """
+        key = (_NORMALIZE_KEY, value)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return None if cached is _INVALID else cached
+
+        stripped = value.strip()
+        if self._detect_layout(stripped, column) is None:
+            self.stats["failures"] += 1
+            self._cache_put(key, _INVALID)
+            return None
+        self._cache_put(key, stripped)
+        return stripped
+
+    def normalize_value(self, value: object, column: str = "") -> object:
+        """Normaliza datetime/date/str para string ISO.
+
+        Raises:
+            ValueError: Se a string não corresponder a nenhum layout aceito.
+
+        """
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, str):
+            normalized = self.normalize(value, column)
+            if normalized is None:
+                msg: str = f"Cannot parse date '{value}'"
+                raise ValueError(msg)
+            return normalized
+        return str(value) if value is not None else None
+
+    def parse(self, value: object, column: str = "") -> datetime | None:
+        """Converte data/timestamp em ``datetime`` com fuso (UTC se ausente).
+
+        Para comparar valores pelo instante e não pelo texto (offsets,
+        frações de segundo, layouts US).
+
+        Returns:
+            datetime | None: Instante do valor; None se nenhum layout casar.
+
+        """
+        if isinstance(value, datetime):
+            moment = value
+        elif isinstance(value, date):
+            moment = datetime(value.year, value.month, value.day)
+        elif isinstance(value, str):
+            stripped = value.strip()
+            layout = self._detect_layout(stripped, column)
+            if layout is None:
+                return None
+            if layout in {DateLayout.US_SLASH, DateLayout.US_DASH}:
+                # MM?DD?YYYY[rest] -> YYYY-MM-DD[rest]
+                stripped = (
+                    f"{stripped[6:10]}-{stripped[:2]}-{stripped[3:5]}{stripped[10:]}"
+                )
+            try:
+                moment = datetime.fromisoformat(stripped)
+            except ValueError:
+                return None
+        else:
+            return None
+        return moment if moment.tzinfo is not None else moment.replace(tzinfo=UTC)
+
+    def matches_format(self, value: str, date_format: str) -> bool:
+        """Indica se ``value`` é válido para ``date_format`` (semântica strptime).
+
+        Layouts ISO canônicos são validados sem ``strptime``; demais casos
+        usam ``strptime`` uma única vez por par (formato, valor) graças ao LRU.
+        """
+        key = (date_format, value)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached is not _INVALID
+
+        valid = self._fast_matches(value, date_format)
+        if valid is None:
+            self.stats["strptime_calls"] += 1
+            try:
+                datetime.strptime(value, date_format).replace(tzinfo=UTC)
+                valid = True
+            except ValueError:
+                valid = False
+        if not valid:
+            self.stats["failures"] += 1
+        self._cache_put(key, value if valid else _INVALID)
+        return valid
+
+    @staticmethod
+    def _fast_matches(value: str, date_format: str) -> bool | None:
+        """Valida layouts ISO canônicos; None se o caminho rápido não se aplica."""
+        try:
+            if date_format == ISO_DATE_FORMAT and len(value) == _ISO_DATE_LENGTH:
+                if not _is_iso_date(value):
+                    return None
+                date(int(value[:4]), int(value[5:7]), int(value[8:10]))
+                return True
+            if (
+                date_format == ISO_DATETIME_FORMAT
+                and len(value) == _ISO_DATETIME_LENGTH
+            ):
+                if not _is_iso_datetime(value):
+                    return None
+                datetime(
+                    int(value[:4]),
+                    int(value[5:7]),
+                    int(value[8:10]),
+                    int(value[11:13]),
+                    int(value[14:16]),
+                    int(value[17:19]),
+                    tzinfo=UTC,
+                )
+                return True
+        except ValueError:
+            return False
+        return None
+
+    def get_stats(self) -> dict[str, t.GeneralValueType]:
+        """Obtém estatísticas com taxas de acerto do cache e do layout fixado."""
+        lookups = self.stats["cache_hits"] + self.stats["cache_misses"]
+        layout_lookups = (
+            self.stats["layout_fast_hits"] + self.stats["layout_fallbacks"]
+        )
+        return {
+            **self.stats,
+            "cache_entries": len(self._cache),
+            "cache_hit_rate": self.stats["cache_hits"] / lookups if lookups else 0.0,
+            "layout_hit_rate": (
+                self.stats["layout_fast_hits"] / layout_lookups
+                if layout_lookups
+                else 0.0
+            ),
+            "locked_columns": {
+                column: layout.name for column, layout in self._column_layouts.items()
+            },
+        }
+
+    def clear(self) -> None:
+        """Limpa cache, layouts detectados e estatísticas."""
+        self._cache.clear()
+        self._column_layouts.clear()
+        self._column_votes.clear()
+        for key in self.stats:
+            self.stats[key] = 0
+
+
+__all__: list[str] = [
+    "DateLayout",
+    "DateNormalizer",
+]
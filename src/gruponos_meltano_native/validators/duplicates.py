@@ -0,0 +1,506 @@
+"""Detecção de Chaves Duplicadas e Cardinalidade em Streaming.
+
+Detecta chaves primárias duplicadas (``allocation_id``, ``order_id``, ...)
+antes da carga no Oracle, com memória limitada mesmo para dezenas de
+milhões de chaves:
+
+    - Filtro de Bloom escalável: descarta rapidamente chaves inéditas
+    - Conjunto exato com spill em disco: confirma suspeitas do Bloom
+    - HyperLogLog: estimativa de chaves distintas por entidade
+
+Classes:
+    ScalableBloomFilter: Filtro de Bloom que cresce mantendo a taxa de erro.
+    SpillableDigestSet: Conjunto exato de digests com particionamento em disco.
+    HyperLogLog: Estimador de cardinalidade mesclável.
+    DuplicateKeyDetector: Detector por entidade combinando as estruturas acima.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import shutil
+import tempfile
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import Final, Self
+
+from flext_core import FlextLogger, FlextTypes as t
+
+from gruponos_meltano_native.constants import c
+
+logger = FlextLogger(__name__)
+
+DIGEST_SIZE: Final[int] = 16
+KEY_SEPARATOR: Final[str] = "\x1f"
+DEFAULT_EXPECTED_KEYS: Final[int] = 1_000_000
+DEFAULT_ERROR_RATE: Final[float] = 0.001
+DEFAULT_MAX_MEMORY_KEYS: Final[int] = 2_000_000
+DEFAULT_PARTITIONS: Final[int] = 64
+DEFAULT_CACHED_PARTITIONS: Final[int] = 4
+DEFAULT_HLL_PRECISION: Final[int] = 14
+
+_MASK64: Final[int] = (1 << 64) - 1
+
+
+def key_digest(values: Sequence[object]) -> bytes:
+    """Digest estável (blake2b de 128 bits) para uma chave composta."""
+    raw = KEY_SEPARATOR.join(str(v) for v in values)
+    return hashlib.blake2b(raw.encode(), digest_size=DIGEST_SIZE).digest()
+
+
+# =============================================
+# SCALABLE BLOOM FILTER
+# =============================================
+
+
+class _BloomSlice:
+    """Filtro de Bloom de capacidade fixa (double hashing Kirsch-Mitzenmacher)."""
+
+    __slots__ = ("bits", "capacity", "count", "hashes", "size")
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = capacity
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.hashes = max(1, math.ceil(math.log2(1 / error_rate)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, digest: bytes) -> list[int]:
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:16], "little") | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+    def contains(self, digest: bytes) -> bool:
+        bits = self.bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(digest))
+
+    def add(self, digest: bytes) -> None:
+        bits = self.bits
+        for p in self._positions(digest):
+            bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+
+class ScalableBloomFilter:
+    """Filtro de Bloom escalável (Almeida et al.).
+
+    Cada novo estágio tem capacidade ``growth`` vezes maior e taxa de erro
+    multiplicada por ``tightening``, mantendo a taxa composta abaixo de
+    ``error_rate / (1 - tightening)``.
+
+    Attributes:
+      initial_capacity: Capacidade do primeiro estágio.
+      error_rate: Taxa de falso positivo do primeiro estágio.
+
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = DEFAULT_EXPECTED_KEYS,
+        error_rate: float = DEFAULT_ERROR_RATE,
+        *,
+        growth: int = 2,
+        tightening: float = 0.5,
+    ) -> None:
+        """Inicializa filtro com um estágio."""
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self._slices: list[_BloomSlice] = [_BloomSlice(initial_capacity, error_rate)]
+
+    def __contains__(self, digest: bytes) -> bool:
+        """Indica se o digest possivelmente já foi adicionado."""
+        return any(s.contains(digest) for s in self._slices)
+
+    def add(self, digest: bytes) -> bool:
+        """Adiciona digest.
+
+        Returns:
+            bool: True se o digest possivelmente já estava presente.
+
+        """
+        if digest in self:
+            return True
+        current = self._slices[-1]
+        if current.count >= current.capacity:
+            current = _BloomSlice(
+                current.capacity * self.growth,
+                self.error_rate * self.tightening ** len(self._slices),
+            )
+            self._slices.append(current)
+        current.add(digest)
+        return False
+
+    @property
+    def stages(self) -> int:
+        """Número de estágios alocados."""
+        return len(self._slices)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Memória ocupada pelos vetores de bits."""
+        return sum(len(s.bits) for s in self._slices)
+
+
+# =============================================
+# EXACT SET WITH DISK SPILL
+# =============================================
+
+
+class SpillableDigestSet:
+    """Conjunto exato de digests de tamanho fixo com spill em disco.
+
+    Digests ficam em memória até ``max_memory_keys``; acima disso são
+    despejados em arquivos particionados pelo primeiro byte. Consultas a
+    partições em disco usam um pequeno cache LRU de partições carregadas.
+
+    Cada conjunto grava num subdiretório próprio e novo dentro de
+    ``spill_dir``, de modo que partições deixadas por uma execução
+    interrompida nunca são lidas como chaves já vistas.
+
+    Attributes:
+      max_memory_keys: Número de digests mantidos em memória antes do spill.
+      partitions: Número de arquivos de partição em disco.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        max_memory_keys: int = DEFAULT_MAX_MEMORY_KEYS,
+        spill_dir: Path | None = None,
+        partitions: int = DEFAULT_PARTITIONS,
+        cached_partitions: int = DEFAULT_CACHED_PARTITIONS,
+    ) -> None:
+        """Inicializa conjunto.
+
+        Args:
+            max_memory_keys: Limite de digests em memória.
+            spill_dir: Diretório base de spill (temporário do sistema se
+                omitido); as partições ficam num subdiretório da execução.
+            partitions: Número de partições em disco.
+            cached_partitions: Partições mantidas carregadas para consulta.
+
+        """
+        self.max_memory_keys = max_memory_keys
+        self.partitions = partitions
+        self.cached_partitions = cached_partitions
+        self._spill_root = spill_dir
+        self._spill_dir: Path | None = None
+        self._memory: set[bytes] = set()
+        self._on_disk: list[int] = [0] * partitions
+        self._loaded: OrderedDict[int, frozenset[bytes]] = OrderedDict()
+        self.spill_count = 0
+        self.disk_lookups = 0
+
+    def __len__(self) -> int:
+        """Número total de digests (memória + disco)."""
+        return len(self._memory) + sum(self._on_disk)
+
+    def _partition(self, digest: bytes) -> int:
+        return digest[0] % self.partitions
+
+    def _partition_path(self, partition: int) -> Path:
+        if self._spill_dir is None:
+            self._spill_dir = Path(
+                tempfile.mkdtemp(prefix="gruponos-dupkeys-", dir=self._spill_root)
+            )
+        return self._spill_dir / f"part-{partition:03d}.bin"
+
+    def _load_partition(self, partition: int) -> frozenset[bytes]:
+        loaded = self._loaded.get(partition)
+        if loaded is not None:
+            self._loaded.move_to_end(partition)
+            return loaded
+        self.disk_lookups += 1
+        data = self._partition_path(partition).read_bytes()
+        loaded = frozenset(
+            data[i : i + DIGEST_SIZE] for i in range(0, len(data), DIGEST_SIZE)
+        )
+        self._loaded[partition] = loaded
+        if len(self._loaded) > self.cached_partitions:
+            self._loaded.popitem(last=False)
+        return loaded
+
+    def __contains__(self, digest: bytes) -> bool:
+        """Verifica pertinência exata (memória e disco)."""
+        if digest in self._memory:
+            return True
+        partition = self._partition(digest)
+        if not self._on_disk[partition]:
+            return False
+        return digest in self._load_partition(partition)
+
+    def add(self, digest: bytes) -> None:
+        """Adiciona digest (o chamador garante que ainda não está presente)."""
+        self._memory.add(digest)
+        if len(self._memory) >= self.max_memory_keys:
+            self.spill()
+
+    def spill(self) -> None:
+        """Despeja os digests em memória para as partições em disco."""
+        if not self._memory:
+            return
+        buckets: dict[int, list[bytes]] = {}
+        for digest in self._memory:
+            buckets.setdefault(self._partition(digest), []).append(digest)
+        for partition, digests in buckets.items():
+            with self._partition_path(partition).open("ab") as fh:
+                fh.write(b"".join(digests))
+            self._on_disk[partition] += len(digests)
+            self._loaded.pop(partition, None)
+        logger.debug(
+            "Spilled %d key digests to %s", len(self._memory), self._spill_dir
+        )
+        self._memory.clear()
+        self.spill_count += 1
+
+    def close(self) -> None:
+        """Remove arquivos de spill criados por este conjunto."""
+        self._memory.clear()
+        self._loaded.clear()
+        self._on_disk = [0] * self.partitions
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+
+# =============================================
+# HYPERLOGLOG
+# =============================================
+
+
+class HyperLogLog:
+    """Estimador HyperLogLog de cardinalidade (hash de 64 bits).
+
+    Attributes:
+      precision: Bits de índice; ``2**precision`` registradores
+        (erro padrão ~ ``1.04 / sqrt(2**precision)``).
+
+    """
+
+    def __init__(self, precision: int = DEFAULT_HLL_PRECISION) -> None:
+        """Inicializa registradores zerados."""
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add_hash(self, hash64: int) -> None:
+        """Adiciona um hash de 64 bits."""
+        p = self.precision
+        index = hash64 >> (64 - p)
+        remaining = (hash64 << p) & _MASK64
+        rank = min(64 - remaining.bit_length(), 64 - p) + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def add_digest(self, digest: bytes) -> None:
+        """Adiciona um digest usando seus primeiros 64 bits."""
+        self.add_hash(int.from_bytes(digest[:8], "big"))
+
+    def merge(self, other: HyperLogLog) -> None:
+        """Mescla outro estimador de mesma precisão."""
+        if other.precision != self.precision:
+            msg = "Cannot merge HyperLogLog sketches with different precision"
+            raise ValueError(msg)
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def estimate(self) -> int:
+        """Estimativa de cardinalidade."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        harmonic = sum(2.0**-r for r in self.registers)
+        raw = alpha * m * m / harmonic
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+
+# =============================================
+# DUPLICATE KEY DETECTOR
+# =============================================
+
+
+class DuplicateKeyDetector:
+    """Detector de chaves duplicadas por entidade.
+
+    O Bloom responde "certamente inédita" para a maioria das chaves;
+    apenas suspeitas são confirmadas no conjunto exato (possivelmente em
+    disco), então duplicatas reportadas nunca são falsos positivos.
+
+    Attributes:
+      entity: Nome da entidade WMS.
+      key_fields: Campos da chave primária.
+
+    """
+
+    def __init__(
+        self,
+        entity: str,
+        key_fields: Sequence[str],
+        *,
+        expected_keys: int = DEFAULT_EXPECTED_KEYS,
+        error_rate: float = DEFAULT_ERROR_RATE,
+        max_memory_keys: int = DEFAULT_MAX_MEMORY_KEYS,
+        spill_dir: Path | None = None,
+        hll_precision: int = DEFAULT_HLL_PRECISION,
+    ) -> None:
+        """Inicializa detector.
+
+        Args:
+            entity: Nome da entidade (ex.: ``allocation``).
+            key_fields: Campos da chave primária.
+            expected_keys: Capacidade inicial do filtro de Bloom.
+            error_rate: Taxa de falso positivo do Bloom.
+            max_memory_keys: Digests exatos em memória antes do spill.
+            spill_dir: Diretório de spill (temporário se omitido).
+            hll_precision: Precisão do HyperLogLog.
+
+        """
+        if not key_fields:
+            msg = f"Entity '{entity}' requires at least one key field"
+            raise ValueError(msg)
+        self.entity = entity
+        self.key_fields = tuple(key_fields)
+        self.bloom = ScalableBloomFilter(expected_keys, error_rate)
+        self.exact = SpillableDigestSet(
+            max_memory_keys=max_memory_keys, spill_dir=spill_dir
+        )
+        self.hll = HyperLogLog(hll_precision)
+        self.records_seen = 0
+        self.duplicates = 0
+        self.missing_keys = 0
+        self.bloom_false_positives = 0
+
+    def observe(self, record: dict[str, t.GeneralValueType]) -> bool:
+        """Registra a chave do registro.
+
+        Returns:
+            bool: True se a chave já havia sido vista (duplicata confirmada).
+
+        """
+        self.records_seen += 1
+        values = [record.get(field) for field in self.key_fields]
+        if any(value is None or value == "" for value in values):
+            self.missing_keys += 1
+            return False
+
+        digest = key_digest(values)
+        self.hll.add_digest(digest)
+        if not self.bloom.add(digest):
+            self.exact.add(digest)
+            return False
+        if digest in self.exact:
+            self.duplicates += 1
+            return True
+        self.bloom_false_positives += 1
+        self.exact.add(digest)
+        return False
+
+    def observe_many(
+        self, records: Iterable[dict[str, t.GeneralValueType]]
+    ) -> list[int]:
+        """Registra um lote e retorna os índices dos registros duplicados."""
+        return [i for i, record in enumerate(records) if self.observe(record)]
+
+    def distinct_estimate(self) -> int:
+        """Estimativa HyperLogLog de chaves distintas."""
+        return self.hll.estimate()
+
+    def get_stats(self) -> dict[str, t.GeneralValueType]:
+        """Estatísticas do detector."""
+        return {
+            "entity": self.entity,
+            "key_fields": list(self.key_fields),
+            "records_seen": self.records_seen,
+            "duplicates": self.duplicates,
+            "missing_keys": self.missing_keys,
+            "distinct_estimate": self.distinct_estimate(),
+            "exact_keys": len(self.exact),
+            "bloom_false_positives": self.bloom_false_positives,
+            "bloom_stages": self.bloom.stages,
+            "bloom_bytes": self.bloom.memory_bytes,
+            "spills": self.exact.spill_count,
+            "disk_lookups": self.exact.disk_lookups,
+        }
+
+    def close(self) -> None:
+        """Libera arquivos de spill."""
+        self.exact.close()
+
+    def __enter__(self) -> Self:
+        """Suporte a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Libera recursos ao sair do contexto."""
+        self.close()
+
+
+def create_duplicate_detectors(
+    entities: Iterable[str] | None = None,
+    *,
+    expected_keys: int = DEFAULT_EXPECTED_KEYS,
+    max_memory_keys: int = DEFAULT_MAX_MEMORY_KEYS,
+    spill_root: Path | None = None,
+) -> dict[str, DuplicateKeyDetector]:
+    """Cria detectores para as entidades WMS com chaves conhecidas.
+
+    Args:
+        entities: Entidades desejadas (todas as conhecidas se omitido).
+        expected_keys: Capacidade inicial do Bloom por entidade.
+        max_memory_keys: Digests exatos em memória por entidade.
+        spill_root: Diretório base de spill (um subdiretório por entidade).
+
+    Returns:
+        dict[str, DuplicateKeyDetector]: Detectores por entidade.
+
+    Raises:
+        ValueError: Se alguma entidade não tiver chave primária conhecida.
+
+    """
+    keys = c.Gruponos.OracleWMS.ENTITY_PRIMARY_KEYS
+    names = list(keys) if entities is None else list(entities)
+    unknown = [name for name in names if name not in keys]
+    if unknown:
+        msg = f"Unknown WMS entities: {', '.join(unknown)}"
+        raise ValueError(msg)
+
+    detectors: dict[str, DuplicateKeyDetector] = {}
+    for name in names:
+        spill_dir = None
+        if spill_root is not None:
+            spill_dir = spill_root / name
+            spill_dir.mkdir(parents=True, exist_ok=True)
+        detectors[name] = DuplicateKeyDetector(
+            name,
+            keys[name],
+            expected_keys=expected_keys,
+            max_memory_keys=max_memory_keys,
+            spill_dir=spill_dir,
+        )
+    return detectors
+
+
+__all__: list[str] = [
+    "DuplicateKeyDetector",
+    "HyperLogLog",
+    "ScalableBloomFilter",
+    "SpillableDigestSet",
+    "create_duplicate_detectors",
+    "key_digest",
+]
@@ -0,0 +1,271 @@
+"""Modelo Estruturado de Erros de Validação.
+
+Substitui mensagens f-string por falha com códigos inteiros, contadores
+agregados por (campo, código) e amostragem limitada de valores inválidos.
+Mensagens legíveis são produzidas apenas quando solicitadas.
+
+Classes:
+    ValidationErrorCode: Códigos inteiros de erro de validação.
+    ValidationFailure: Falha individual leve (sem formatação de texto).
+    ValidationErrorAggregator: Contadores, reservatório de amostras e log resumido.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Final
+
+from flext_core import FlextLogger, FlextTypes as t
+
+logger = FlextLogger(__name__)
+
+# Defaults for bounded memory and log volume
+DEFAULT_SAMPLE_SIZE: Final[int] = 5
+DEFAULT_LOG_LIMIT_PER_KEY: Final[int] = 3
+MAX_SAMPLE_REPR_LENGTH: Final[int] = 200
+
+
+class ValidationErrorCode(IntEnum):
+    """Códigos inteiros de erro de validação (estáveis entre versões)."""
+
+    MISSING_REQUIRED = 1
+    INVALID_DECIMAL = 2
+    NOT_STRING = 3
+    MAX_LENGTH_EXCEEDED = 4
+    NOT_NUMBER = 5
+    BELOW_MIN_VALUE = 6
+    ABOVE_MAX_VALUE = 7
+    INVALID_DATE_FORMAT = 8
+    NOT_DATE = 9
+    NOT_BOOLEAN = 10
+    NOT_IN_ENUM = 11
+    CONDITION_FAILED = 12
+    CONVERSION_FAILED = 13
+    DUPLICATE_KEY = 14
+
+
+_MESSAGE_TEMPLATES: Final[dict[ValidationErrorCode, str]] = {
+    ValidationErrorCode.MISSING_REQUIRED: "Required field '{field}' is missing",
+    ValidationErrorCode.INVALID_DECIMAL: "Field '{field}' must be a valid decimal",
+    ValidationErrorCode.NOT_STRING: "Field '{field}' must be a string",
+    ValidationErrorCode.MAX_LENGTH_EXCEEDED: (
+        "Field '{field}' exceeds maximum length {limit}"
+    ),
+    ValidationErrorCode.NOT_NUMBER: "Field '{field}' must be a number",
+    ValidationErrorCode.BELOW_MIN_VALUE: "Field '{field}' below minimum value {limit}",
+    ValidationErrorCode.ABOVE_MAX_VALUE: (
+        "Field '{field}' exceeds maximum value {limit}"
+    ),
+    ValidationErrorCode.INVALID_DATE_FORMAT: (
+        "Field '{field}' is not a valid date format {limit}"
+    ),
+    ValidationErrorCode.NOT_DATE: "Field '{field}' must be a valid date",
+    ValidationErrorCode.NOT_BOOLEAN: "Field '{field}' must be a boolean",
+    ValidationErrorCode.NOT_IN_ENUM: "Field '{field}' must be one of {limit}",
+    ValidationErrorCode.CONDITION_FAILED: (
+        "Field '{field}' violates condition '{limit}'"
+    ),
+    ValidationErrorCode.CONVERSION_FAILED: (
+        "Field '{field}' cannot be converted to {limit}"
+    ),
+    ValidationErrorCode.DUPLICATE_KEY: (
+        "Field '{field}' repeats a key already seen in {limit}"
+    ),
+}
+
+
+def format_validation_message(
+    field_name: str,
+    code: ValidationErrorCode,
+    limit: object = None,
+) -> str:
+    """Formata mensagem legível para um par (campo, código).
+
+    Args:
+        field_name: Campo que falhou na validação.
+        code: Código do erro.
+        limit: Parâmetro da regra (tamanho máximo, formato, valores permitidos).
+
+    Returns:
+        str: Mensagem compatível com o formato histórico do validador.
+
+    """
+    return _MESSAGE_TEMPLATES[code].format(field=field_name, limit=limit)
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationFailure:
+    """Falha de validação individual.
+
+    Armazena apenas referências (campo, código, valor, limite); a mensagem
+    é formatada sob demanda via ``message`` ou ``str()``.
+    """
+
+    field_name: str
+    code: ValidationErrorCode
+    value: object = None
+    limit: object = None
+
+    @property
+    def message(self) -> str:
+        """Mensagem legível produzida sob demanda."""
+        return format_validation_message(self.field_name, self.code, self.limit)
+
+    def __str__(self) -> str:
+        """Retorna a mensagem legível da falha."""
+        return self.message
+
+
+class ValidationErrorAggregator:
+    """Agregador de falhas de validação com memória e log limitados.
+
+    Mantém contadores por (campo, código), um reservatório de amostras de
+    valores inválidos por chave (Algorithm R) e emite no máximo
+    ``log_limit_per_key`` linhas de log por chave, além de um resumo por lote.
+
+    Attributes:
+      sample_size: Número máximo de amostras mantidas por chave.
+      log_limit_per_key: Número máximo de logs individuais por chave.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        log_limit_per_key: int = DEFAULT_LOG_LIMIT_PER_KEY,
+        seed: int | None = None,
+    ) -> None:
+        """Inicializa agregador.
+
+        Args:
+            sample_size: Tamanho do reservatório de amostras por chave.
+            log_limit_per_key: Logs individuais permitidos por chave.
+            seed: Semente opcional para amostragem reprodutível.
+
+        """
+        self.sample_size = sample_size
+        self.log_limit_per_key = log_limit_per_key
+        self._rng = random.Random(seed)  # noqa: S311 - sampling, not security
+        self._counts: Counter[tuple[str, ValidationErrorCode]] = Counter()
+        self._batch_counts: Counter[tuple[str, ValidationErrorCode]] = Counter()
+        self._samples: dict[tuple[str, ValidationErrorCode], list[object]] = {}
+        self._limits: dict[tuple[str, ValidationErrorCode], object] = {}
+        self._suppressed_logs = 0
+
+    def record(self, failure: ValidationFailure) -> None:
+        """Registra uma falha atualizando contadores e amostras."""
+        key = (failure.field_name, failure.code)
+        seen = self._counts[key] + 1
+        self._counts[key] = seen
+        self._batch_counts[key] += 1
+        if seen == 1:
+            self._limits[key] = failure.limit
+
+        samples = self._samples.setdefault(key, [])
+        if len(samples) < self.sample_size:
+            samples.append(failure.value)
+        else:
+            slot = self._rng.randrange(seen)
+            if slot < self.sample_size:
+                samples[slot] = failure.value
+
+        if seen <= self.log_limit_per_key:
+            # Lazy %-formatting: ValidationFailure.__str__ only runs if emitted
+            logger.warning(
+                "Validation failed: %s (field: %s, code: %d)",
+                failure,
+                failure.field_name,
+                int(failure.code),
+            )
+        else:
+            self._suppressed_logs += 1
+
+    @property
+    def total(self) -> int:
+        """Número total de falhas registradas."""
+        return sum(self._counts.values())
+
+    def counts(self) -> dict[tuple[str, int], int]:
+        """Contadores por (campo, código inteiro)."""
+        return {(field, int(code)): n for (field, code), n in self._counts.items()}
+
+    def samples(self, field_name: str, code: ValidationErrorCode) -> list[object]:
+        """Amostras de valores inválidos para uma chave."""
+        return list(self._samples.get((field_name, code), []))
+
+    def messages(self) -> list[str]:
+        """Mensagens legíveis agregadas, uma por (campo, código)."""
+        messages: list[str] = []
+        for (field, code), count in self._counts.most_common():
+            limit = self._limits.get((field, code))
+            text = format_validation_message(field, code, limit)
+            messages.append(f"{text} ({count} occurrences)")
+        return messages
+
+    def summary(self) -> dict[str, t.GeneralValueType]:
+        """Resumo estruturado das falhas acumuladas."""
+        by_key: list[t.GeneralValueType] = [
+            {
+                "field": field,
+                "code": int(code),
+                "error": code.name,
+                "count": count,
+                "samples": [
+                    repr(value)[:MAX_SAMPLE_REPR_LENGTH]
+                    for value in self._samples.get((field, code), [])
+                ],
+            }
+            for (field, code), count in self._counts.most_common()
+        ]
+        return {
+            "total_failures": self.total,
+            "distinct_keys": len(self._counts),
+            "suppressed_logs": self._suppressed_logs,
+            "failures": by_key,
+        }
+
+    def flush_batch(self, batch_label: str = "batch") -> dict[tuple[str, int], int]:
+        """Emite um log resumido das falhas do lote e zera contadores do lote.
+
+        Args:
+            batch_label: Identificador do lote para o log.
+
+        Returns:
+            dict: Contadores (campo, código) do lote encerrado.
+
+        """
+        batch = {
+            (field, int(code)): n for (field, code), n in self._batch_counts.items()
+        }
+        if batch:
+            logger.warning(
+                "Validation summary for %s: %d failures across %d field/code pairs",
+                batch_label,
+                sum(batch.values()),
+                len(batch),
+                extra={"failures": {f"{k[0]}:{k[1]}": v for k, v in batch.items()}},
+            )
+        self._batch_counts.clear()
+        return batch
+
+    def reset(self) -> None:
+        """Zera todos os contadores, amostras e o estado de log."""
+        self._counts.clear()
+        self._batch_counts.clear()
+        self._samples.clear()
+        self._limits.clear()
+        self._suppressed_logs = 0
+
+
+__all__: list[str] = [
+    "ValidationErrorAggregator",
+    "ValidationErrorCode",
+    "ValidationFailure",
+    "format_validation_message",
+]
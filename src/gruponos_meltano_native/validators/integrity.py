@@ -0,0 +1,292 @@
+"""Integridade Referencial entre Entidades WMS.
+
+Verifica chaves estrangeiras entre streams durante a carga, em vez de
+esperar os testes noturnos do dbt:
+
+    - Índice compacto de chaves pai (array ordenado de hashes de 64 bits)
+    - Verificação imediata de chaves filhas já resolvíveis
+    - Resolução adiada para filhos que chegam antes do pai
+    - Relatório de órfãos com contagens e amostras por execução
+
+Classes:
+    ForeignKey: Relação filho → pai entre streams.
+    SortedKeyIndex: Índice de hashes ordenado com buffer de inserção.
+    OrphanReport: Resultado da verificação de uma relação.
+    ReferentialIntegrityChecker: Verificador de integridade entre streams.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Final
+
+from flext_core import FlextLogger, FlextTypes as t
+
+from gruponos_meltano_native.constants import c
+
+logger = FlextLogger(__name__)
+
+DEFAULT_SAMPLE_SIZE: Final[int] = 5
+MIN_PENDING_MERGE: Final[int] = 65_536
+# Pending buffer may grow to 1/8 of the sorted array before a merge
+PENDING_MERGE_RATIO: Final[int] = 8
+
+
+def key_hash(value: object) -> int:
+    """Hash estável de 64 bits para um valor de chave."""
+    digest = hashlib.blake2b(str(value).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+@dataclass(frozen=True, slots=True)
+class ForeignKey:
+    """Relação de chave estrangeira entre dois streams."""
+
+    child_stream: str
+    child_field: str
+    parent_stream: str
+    parent_field: str
+
+    @property
+    def name(self) -> str:
+        """Identificador legível da relação."""
+        return (
+            f"{self.child_stream}.{self.child_field} -> "
+            f"{self.parent_stream}.{self.parent_field}"
+        )
+
+
+class SortedKeyIndex:
+    """Índice de hashes de 64 bits em ``array('Q')`` ordenado.
+
+    Inserções vão para um ``set`` de pendentes que é mesclado ao array
+    ordenado quando cresce além de uma fração do índice, mantendo ~8 bytes
+    por chave no estado estável.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa índice vazio."""
+        self._sorted: array[int] = array("Q")
+        self._pending: set[int] = set()
+
+    def __len__(self) -> int:
+        """Número de hashes (pode incluir duplicatas já mescladas)."""
+        return len(self._sorted) + len(self._pending)
+
+    def add(self, hashed: int) -> None:
+        """Adiciona um hash ao índice."""
+        self._pending.add(hashed)
+        threshold = max(MIN_PENDING_MERGE, len(self._sorted) // PENDING_MERGE_RATIO)
+        if len(self._pending) >= threshold:
+            self.compact()
+
+    def compact(self) -> None:
+        """Mescla hashes pendentes ao array ordenado."""
+        if not self._pending:
+            return
+        self._sorted = array("Q", heapq.merge(self._sorted, sorted(self._pending)))
+        self._pending.clear()
+
+    def __contains__(self, hashed: int) -> bool:
+        """Busca binária no array ordenado ou consulta aos pendentes."""
+        if hashed in self._pending:
+            return True
+        position = bisect_left(self._sorted, hashed)
+        return position < len(self._sorted) and self._sorted[position] == hashed
+
+
+@dataclass(slots=True)
+class OrphanReport:
+    """Resultado da verificação de uma relação em uma execução."""
+
+    relationship: str
+    checked: int = 0
+    null_references: int = 0
+    orphans: int = 0
+    parent_observed: bool = True
+    samples: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, t.GeneralValueType]:
+        """Serializa para JSON (ledger e alertas)."""
+        return {
+            "relationship": self.relationship,
+            "checked": self.checked,
+            "null_references": self.null_references,
+            "orphans": self.orphans,
+            "parent_observed": self.parent_observed,
+            "samples": list(self.samples),
+        }
+
+
+@dataclass(slots=True)
+class _ForeignKeyState:
+    fk: ForeignKey
+    checked: int = 0
+    null_references: int = 0
+    deferred: array[int] = field(default_factory=lambda: array("Q"))
+    deferred_samples: dict[int, str] = field(default_factory=dict)
+
+
+class ReferentialIntegrityChecker:
+    """Verificador de integridade referencial entre streams Singer.
+
+    Chaves pai são indexadas conforme os registros fluem. Chaves filhas
+    encontradas no índice são resolvidas imediatamente; as demais são
+    adiadas (8 bytes cada) e reavaliadas em ``finalize``, pois a ordem dos
+    streams não é garantida.
+
+    Em execuções incrementais o pai pode já estar no destino; use
+    ``add_parent_keys`` para pré-carregar essas chaves.
+
+    Attributes:
+      relationships: Relações verificadas.
+      sample_size: Amostras de órfãos reportadas por relação.
+
+    """
+
+    def __init__(
+        self,
+        relationships: Iterable[ForeignKey] | None = None,
+        *,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+    ) -> None:
+        """Inicializa verificador.
+
+        Args:
+            relationships: Relações a verificar; padrão em
+                ``c.Gruponos.OracleWMS.ENTITY_RELATIONSHIPS``.
+            sample_size: Número máximo de amostras de órfãos por relação.
+
+        """
+        if relationships is None:
+            relationships = [
+                ForeignKey(*relation)
+                for relation in c.Gruponos.OracleWMS.ENTITY_RELATIONSHIPS
+            ]
+        self.relationships = list(relationships)
+        self.sample_size = sample_size
+        self._indexes: dict[tuple[str, str], SortedKeyIndex] = {
+            (fk.parent_stream, fk.parent_field): SortedKeyIndex()
+            for fk in self.relationships
+        }
+        self._parent_fields: dict[str, list[str]] = {}
+        for stream, parent_field in self._indexes:
+            self._parent_fields.setdefault(stream, []).append(parent_field)
+        self._child_fks: dict[str, list[_ForeignKeyState]] = {}
+        for fk in self.relationships:
+            self._child_fks.setdefault(fk.child_stream, []).append(
+                _ForeignKeyState(fk)
+            )
+        self._observed: set[str] = set()
+
+    def add_parent_keys(
+        self, stream: str, parent_field: str, keys: Iterable[object]
+    ) -> int:
+        """Pré-carrega chaves pai existentes (ex.: já presentes no destino).
+
+        Returns:
+            int: Número de chaves adicionadas.
+
+        """
+        index = self._indexes.get((stream, parent_field))
+        if index is None:
+            return 0
+        added = 0
+        for key in keys:
+            if key is not None and key != "":
+                index.add(key_hash(key))
+                added += 1
+        self._observed.add(stream)
+        return added
+
+    def observe(self, stream: str, record: Mapping[str, t.GeneralValueType]) -> None:
+        """Processa um registro de ``stream`` (pai, filho ou ambos)."""
+        self._observed.add(stream)
+        for parent_field in self._parent_fields.get(stream, ()):
+            value = record.get(parent_field)
+            if value is not None and value != "":
+                self._indexes[stream, parent_field].add(key_hash(value))
+
+        for state in self._child_fks.get(stream, ()):
+            fk = state.fk
+            value = record.get(fk.child_field)
+            state.checked += 1
+            if value is None or value == "":
+                state.null_references += 1
+                continue
+            hashed = key_hash(value)
+            if hashed in self._indexes[fk.parent_stream, fk.parent_field]:
+                continue
+            state.deferred.append(hashed)
+            if len(state.deferred_samples) < self.sample_size * 4:
+                state.deferred_samples.setdefault(hashed, str(value))
+
+    def observe_many(
+        self, stream: str, records: Iterable[Mapping[str, t.GeneralValueType]]
+    ) -> None:
+        """Processa vários registros de um stream."""
+        for record in records:
+            self.observe(stream, record)
+
+    def finalize(self) -> list[OrphanReport]:
+        """Resolve chaves adiadas e produz o relatório de órfãos.
+
+        Relações cujo stream pai não foi observado nem pré-carregado são
+        reportadas com ``parent_observed=False`` e órfãos não contabilizados.
+
+        """
+        reports: list[OrphanReport] = []
+        for states in self._child_fks.values():
+            for state in states:
+                reports.append(self._resolve(state))
+        for report in reports:
+            if report.orphans:
+                logger.warning(
+                    "Referential integrity: %d orphans for %s (samples: %s)",
+                    report.orphans,
+                    report.relationship,
+                    ", ".join(report.samples),
+                )
+        return reports
+
+    def _resolve(self, state: _ForeignKeyState) -> OrphanReport:
+        fk = state.fk
+        report = OrphanReport(
+            relationship=fk.name,
+            checked=state.checked,
+            null_references=state.null_references,
+            parent_observed=fk.parent_stream in self._observed,
+        )
+        if not report.parent_observed:
+            return report
+
+        index = self._indexes[fk.parent_stream, fk.parent_field]
+        index.compact()
+        for hashed in state.deferred:
+            if hashed in index:
+                continue
+            report.orphans += 1
+            sample = state.deferred_samples.get(hashed)
+            if (
+                sample is not None
+                and len(report.samples) < self.sample_size
+                and sample not in report.samples
+            ):
+                report.samples.append(sample)
+        return report
+
+
+__all__: list[str] = [
+    "ForeignKey",
+    "OrphanReport",
+    "ReferentialIntegrityChecker",
+    "SortedKeyIndex",
+    "key_hash",
+]
@@ -0,0 +1,564 @@
+"""Perfilamento Estatístico por Coluna e Detecção de Drift.
+
+Perfis mescláveis calculados em passagem única junto da validação, para
+detectar mudanças silenciosas do WMS sem reler tabelas:
+
+    - Mínimo/máximo, contagem de nulos por coluna
+    - Quantis aproximados (sketch KLL)
+    - Valores mais frequentes (Misra-Gries)
+    - Histograma de comprimento de strings (faixas em potência de 2)
+    - Comparação com o baseline dos últimos N runs (drift)
+
+Classes:
+    KLLSketch: Sketch de quantis mesclável.
+    TopKCounter: Contador de valores frequentes mesclável.
+    ColumnProfile: Perfil de uma coluna.
+    StreamProfiler: Perfis de todas as colunas de um stream.
+    DriftFinding: Achado de drift entre perfil atual e baseline.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from typing import Final, TypeVar
+
+from flext_core import FlextTypes as t
+
+from gruponos_meltano_native.constants import c
+
+DEFAULT_KLL_K: Final[int] = 200
+DEFAULT_TOP_K: Final[int] = 64
+DEFAULT_NULL_RATIO_TOLERANCE: Final[float] = 0.05
+DEFAULT_MEDIAN_TOLERANCE: Final[float] = 0.5
+DEFAULT_MIN_CATEGORY_SHARE: Final[float] = 0.01
+MAX_TOPK_VALUE_LENGTH: Final[int] = 128
+
+_KLL_DECAY: Final[float] = 2 / 3
+
+_T = TypeVar("_T", float, str)
+
+
+# =============================================
+# SKETCHES
+# =============================================
+
+
+class KLLSketch:
+    """Sketch KLL de quantis aproximados (mesclável, memória O(k)).
+
+    Attributes:
+      k: Capacidade do compactador de nível mais alto (precisão).
+
+    """
+
+    def __init__(self, k: int = DEFAULT_KLL_K, *, seed: int | None = None) -> None:
+        """Inicializa sketch vazio."""
+        self.k = k
+        self.count = 0
+        self.compactors: list[list[float]] = [[]]
+        self._rng = random.Random(seed)  # noqa: S311 - sampling, not security
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(2, math.ceil(self.k * _KLL_DECAY**depth))
+
+    def _size(self) -> int:
+        return sum(len(items) for items in self.compactors)
+
+    def _max_size(self) -> int:
+        return sum(self._capacity(h) for h in range(len(self.compactors)))
+
+    def _compress(self) -> None:
+        while self._size() >= self._max_size():
+            for level, items in enumerate(self.compactors):
+                if len(items) >= self._capacity(level):
+                    if level + 1 == len(self.compactors):
+                        self.compactors.append([])
+                    items.sort()
+                    offset = self._rng.randint(0, 1)
+                    self.compactors[level + 1].extend(items[offset::2])
+                    self.compactors[level] = []
+                    break
+            else:
+                return
+
+    def add(self, value: float) -> None:
+        """Adiciona um valor numérico."""
+        self.compactors[0].append(value)
+        self.count += 1
+        if len(self.compactors[0]) >= self._capacity(0):
+            self._compress()
+
+    def merge(self, other: KLLSketch) -> None:
+        """Mescla outro sketch."""
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for level, items in enumerate(other.compactors):
+            self.compactors[level].extend(items)
+        self.count += other.count
+        self._compress()
+
+    def quantile(self, q: float) -> float | None:
+        """Quantil aproximado ``q`` em [0, 1] (None se vazio)."""
+        weighted = sorted(
+            (value, 1 << level)
+            for level, items in enumerate(self.compactors)
+            for value in items
+        )
+        if not weighted:
+            return None
+        total = sum(weight for _, weight in weighted)
+        target = q * total
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+
+    def to_dict(self) -> dict[str, t.GeneralValueType]:
+        """Serializa para JSON."""
+        return {"k": self.k, "count": self.count, "compactors": self.compactors}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, t.GeneralValueType]) -> KLLSketch:
+        """Reconstrói a partir de ``to_dict``."""
+        sketch = cls(int(data.get("k", DEFAULT_KLL_K)))
+        sketch.count = int(data.get("count", 0))
+        sketch.compactors = [list(items) for items in data.get("compactors", [[]])]
+        return sketch
+
+
+class TopKCounter:
+    """Contador Misra-Gries de valores frequentes (mesclável).
+
+    Todo valor com frequência acima de ``total / (capacity + 1)`` é mantido;
+    colunas com até ``capacity`` valores distintos são contadas exatamente.
+
+    Attributes:
+      capacity: Número máximo de contadores.
+
+    """
+
+    def __init__(self, capacity: int = DEFAULT_TOP_K) -> None:
+        """Inicializa contador vazio."""
+        self.capacity = capacity
+        self.total = 0
+        self.counts: dict[str, int] = {}
+
+    def add(self, value: str, count: int = 1) -> None:
+        """Incrementa a contagem de ``value``."""
+        self.total += count
+        counts = self.counts
+        if value in counts:
+            counts[value] += count
+        elif len(counts) < self.capacity:
+            counts[value] = count
+        else:
+            self._reduce(count)
+
+    def _reduce(self, amount: int) -> None:
+        for key in list(self.counts):
+            remaining = self.counts[key] - amount
+            if remaining > 0:
+                self.counts[key] = remaining
+            else:
+                del self.counts[key]
+
+    def merge(self, other: TopKCounter) -> None:
+        """Mescla outro contador mantendo a garantia de erro."""
+        self.total += other.total
+        for value, count in other.counts.items():
+            self.counts[value] = self.counts.get(value, 0) + count
+        if len(self.counts) > self.capacity:
+            ordered = sorted(self.counts.values(), reverse=True)
+            self._reduce(ordered[self.capacity])
+
+    def most_common(self, n: int | None = None) -> list[tuple[str, int]]:
+        """Valores mais frequentes em ordem decrescente."""
+        ranked = sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))
+        return ranked if n is None else ranked[:n]
+
+    def to_dict(self) -> dict[str, t.GeneralValueType]:
+        """Serializa para JSON."""
+        return {"capacity": self.capacity, "total": self.total, "counts": self.counts}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, t.GeneralValueType]) -> TopKCounter:
+        """Reconstrói a partir de ``to_dict``."""
+        counter = cls(int(data.get("capacity", DEFAULT_TOP_K)))
+        counter.total = int(data.get("total", 0))
+        counter.counts = dict(data.get("counts", {}))
+        return counter
+
+
+# =============================================
+# PROFILES
+# =============================================
+
+
+class ColumnProfile:
+    """Perfil mesclável de uma coluna."""
+
+    def __init__(
+        self, *, kll_k: int = DEFAULT_KLL_K, top_k: int = DEFAULT_TOP_K
+    ) -> None:
+        """Inicializa perfil vazio."""
+        self.count = 0
+        self.nulls = 0
+        self.numeric_min: float | None = None
+        self.numeric_max: float | None = None
+        self.string_min: str | None = None
+        self.string_max: str | None = None
+        self.quantiles = KLLSketch(kll_k)
+        self.top_values = TopKCounter(top_k)
+        self.length_histogram: dict[int, int] = {}
+
+    @property
+    def null_ratio(self) -> float:
+        """Razão de nulos observada."""
+        return self.nulls / self.count if self.count else 0.0
+
+    @property
+    def max_length_bucket(self) -> int:
+        """Maior faixa de comprimento (``len.bit_length()``) observada."""
+        return max(self.length_histogram, default=0)
+
+    def observe(self, value: object) -> None:
+        """Incorpora um valor."""
+        self.count += 1
+        if value is None or value == "":
+            self.nulls += 1
+            return
+        if isinstance(value, bool):
+            self.top_values.add(str(value).lower())
+            return
+        if isinstance(value, (int, float)):
+            number = float(value)
+            if math.isnan(number):
+                self.nulls += 1
+                return
+            if self.numeric_min is None or number < self.numeric_min:
+                self.numeric_min = number
+            if self.numeric_max is None or number > self.numeric_max:
+                self.numeric_max = number
+            self.quantiles.add(number)
+            if isinstance(value, int):
+                self.top_values.add(str(value))
+            return
+
+        text = value if isinstance(value, str) else str(value)
+        if self.string_min is None or text < self.string_min:
+            self.string_min = text
+        if self.string_max is None or text > self.string_max:
+            self.string_max = text
+        bucket = len(text).bit_length()
+        self.length_histogram[bucket] = self.length_histogram.get(bucket, 0) + 1
+        self.top_values.add(text[:MAX_TOPK_VALUE_LENGTH])
+
+    def merge(self, other: ColumnProfile) -> None:
+        """Mescla outro perfil."""
+        self.count += other.count
+        self.nulls += other.nulls
+        self.numeric_min = _min(self.numeric_min, other.numeric_min)
+        self.numeric_max = _max(self.numeric_max, other.numeric_max)
+        self.string_min = _min(self.string_min, other.string_min)
+        self.string_max = _max(self.string_max, other.string_max)
+        self.quantiles.merge(other.quantiles)
+        self.top_values.merge(other.top_values)
+        for bucket, count in other.length_histogram.items():
+            self.length_histogram[bucket] = (
+                self.length_histogram.get(bucket, 0) + count
+            )
+
+    def to_dict(self) -> dict[str, t.GeneralValueType]:
+        """Serializa para JSON (histograma com chaves string)."""
+        return {
+            "count": self.count,
+            "nulls": self.nulls,
+            "numeric_min": self.numeric_min,
+            "numeric_max": self.numeric_max,
+            "string_min": self.string_min,
+            "string_max": self.string_max,
+            "quantiles": self.quantiles.to_dict(),
+            "top_values": self.top_values.to_dict(),
+            "length_histogram": {str(k): v for k, v in self.length_histogram.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, t.GeneralValueType]) -> ColumnProfile:
+        """Reconstrói a partir de ``to_dict``."""
+        profile = cls()
+        profile.count = int(data.get("count", 0))
+        profile.nulls = int(data.get("nulls", 0))
+        profile.numeric_min = data.get("numeric_min")
+        profile.numeric_max = data.get("numeric_max")
+        profile.string_min = data.get("string_min")
+        profile.string_max = data.get("string_max")
+        profile.quantiles = KLLSketch.from_dict(data.get("quantiles", {}))
+        profile.top_values = TopKCounter.from_dict(data.get("top_values", {}))
+        profile.length_histogram = {
+            int(k): int(v) for k, v in data.get("length_histogram", {}).items()
+        }
+        return profile
+
+
+def _min(left: _T | None, right: _T | None) -> _T | None:
+    if left is None:
+        return right
+    return left if right is None else min(left, right)
+
+
+def _max(left: _T | None, right: _T | None) -> _T | None:
+    if left is None:
+        return right
+    return left if right is None else max(left, right)
+
+
+class StreamProfiler:
+    """Perfis de todas as colunas de um stream Singer.
+
+    Attributes:
+      stream: Nome do stream (entidade WMS).
+      columns: Perfis por coluna.
+
+    """
+
+    def __init__(self, stream: str) -> None:
+        """Inicializa profiler vazio para ``stream``."""
+        self.stream = stream
+        self.records = 0
+        self.columns: dict[str, ColumnProfile] = {}
+
+    def observe(self, record: Mapping[str, t.GeneralValueType]) -> None:
+        """Incorpora um registro (colunas ausentes contam como nulas)."""
+        self.records += 1
+        columns = self.columns
+        for name, value in record.items():
+            profile = columns.get(name)
+            if profile is None:
+                profile = columns[name] = ColumnProfile()
+                # Column first seen mid-stream: earlier records lacked it
+                profile.count = profile.nulls = self.records - 1
+            profile.observe(value)
+        if len(record) != len(columns):
+            for name, profile in columns.items():
+                if name not in record:
+                    profile.count += 1
+                    profile.nulls += 1
+
+    def observe_many(
+        self, records: Iterable[Mapping[str, t.GeneralValueType]]
+    ) -> None:
+        """Incorpora vários registros."""
+        for record in records:
+            self.observe(record)
+
+    def merge(self, other: StreamProfiler) -> None:
+        """Mescla perfil de outro lote/run do mesmo stream."""
+        for name, profile in other.columns.items():
+            target = self.columns.get(name)
+            if target is None:
+                target = self.columns[name] = ColumnProfile()
+                target.count = target.nulls = self.records
+            target.merge(profile)
+        for name, profile in self.columns.items():
+            if name not in other.columns:
+                profile.count += other.records
+                profile.nulls += other.records
+        self.records += other.records
+
+    def to_dict(self) -> dict[str, t.GeneralValueType]:
+        """Serializa para JSON (formato gravado no run ledger)."""
+        return {
+            "stream": self.stream,
+            "records": self.records,
+            "columns": {name: p.to_dict() for name, p in self.columns.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, t.GeneralValueType]) -> StreamProfiler:
+        """Reconstrói a partir de ``to_dict``."""
+        profiler = cls(str(data.get("stream", "")))
+        profiler.records = int(data.get("records", 0))
+        profiler.columns = {
+            name: ColumnProfile.from_dict(column)
+            for name, column in data.get("columns", {}).items()
+        }
+        return profiler
+
+
+# =============================================
+# DRIFT DETECTION
+# =============================================
+
+
+class DriftKind(StrEnum):
+    """Tipos de drift detectados."""
+
+    NEW_COLUMN = "new_column"
+    MISSING_COLUMN = "missing_column"
+    NULL_RATIO_SHIFT = "null_ratio_shift"
+    MEDIAN_SHIFT = "median_shift"
+    LENGTH_GROWTH = "length_growth"
+    NEW_CATEGORY = "new_category"
+    DISALLOWED_VALUE = "disallowed_value"
+
+
+@dataclass(frozen=True, slots=True)
+class DriftFinding:
+    """Achado de drift para uma coluna de um stream."""
+
+    stream: str
+    column: str
+    kind: DriftKind
+    detail: str
+
+    def to_dict(self) -> dict[str, t.GeneralValueType]:
+        """Serializa para JSON."""
+        return {**asdict(self), "kind": str(self.kind)}
+
+
+def detect_drift(
+    current: StreamProfiler,
+    history: Iterable[StreamProfiler],
+    *,
+    allowed_values: Mapping[str, Iterable[str]] | None = None,
+    null_ratio_tolerance: float = DEFAULT_NULL_RATIO_TOLERANCE,
+    median_tolerance: float = DEFAULT_MEDIAN_TOLERANCE,
+    min_category_share: float = DEFAULT_MIN_CATEGORY_SHARE,
+) -> list[DriftFinding]:
+    """Compara o perfil atual com o baseline mesclado dos runs anteriores.
+
+    Args:
+        current: Perfil do run atual.
+        history: Perfis dos últimos N runs do mesmo stream.
+        allowed_values: Valores aceitos por coluna; o padrão vem de
+            ``c.Gruponos.OracleWMS.ACCEPTED_VALUES`` para o stream.
+        null_ratio_tolerance: Variação absoluta tolerada na razão de nulos.
+        median_tolerance: Deslocamento da mediana tolerado, relativo ao IQR
+            do baseline.
+        min_category_share: Participação mínima para reportar nova categoria.
+
+    Returns:
+        list[DriftFinding]: Achados (vazia se não houver drift).
+
+    """
+    stream = current.stream
+    if allowed_values is None:
+        allowed_values = c.Gruponos.OracleWMS.ACCEPTED_VALUES.get(stream, {})
+    findings = [
+        DriftFinding(stream, column, DriftKind.DISALLOWED_VALUE, detail)
+        for column, detail in _disallowed_values(current, allowed_values)
+    ]
+
+    baseline: StreamProfiler | None = None
+    for profile in history:
+        if baseline is None:
+            baseline = StreamProfiler(stream)
+        baseline.merge(profile)
+    if baseline is None or baseline.records == 0:
+        return findings
+
+    for column in current.columns.keys() - baseline.columns.keys():
+        findings.append(
+            DriftFinding(stream, column, DriftKind.NEW_COLUMN, "not in baseline")
+        )
+    for column in baseline.columns.keys() - current.columns.keys():
+        findings.append(
+            DriftFinding(stream, column, DriftKind.MISSING_COLUMN, "not in run")
+        )
+
+    for column, profile in current.columns.items():
+        base = baseline.columns.get(column)
+        if base is None or profile.count == 0:
+            continue
+        findings.extend(
+            DriftFinding(stream, column, kind, detail)
+            for kind, detail in _column_drift(
+                profile,
+                base,
+                null_ratio_tolerance=null_ratio_tolerance,
+                median_tolerance=median_tolerance,
+                min_category_share=min_category_share,
+            )
+        )
+    return findings
+
+
+def _disallowed_values(
+    current: StreamProfiler,
+    allowed_values: Mapping[str, Iterable[str]],
+) -> Iterable[tuple[str, str]]:
+    for column, allowed in allowed_values.items():
+        profile = current.columns.get(column)
+        if profile is None:
+            continue
+        accepted = set(allowed)
+        unexpected = [
+            f"{value} ({count})"
+            for value, count in profile.top_values.most_common()
+            if value not in accepted
+        ]
+        if unexpected:
+            yield column, f"values outside accepted set: {', '.join(unexpected)}"
+
+
+def _column_drift(
+    profile: ColumnProfile,
+    base: ColumnProfile,
+    *,
+    null_ratio_tolerance: float,
+    median_tolerance: float,
+    min_category_share: float,
+) -> Iterable[tuple[DriftKind, str]]:
+    null_shift = profile.null_ratio - base.null_ratio
+    if abs(null_shift) > null_ratio_tolerance:
+        yield (
+            DriftKind.NULL_RATIO_SHIFT,
+            f"null ratio {base.null_ratio:.3f} -> {profile.null_ratio:.3f}",
+        )
+
+    median = profile.quantiles.quantile(0.5)
+    base_median = base.quantiles.quantile(0.5)
+    if median is not None and base_median is not None:
+        q1, q3 = base.quantiles.quantile(0.25), base.quantiles.quantile(0.75)
+        spread = (q3 or 0.0) - (q1 or 0.0) or abs(base_median) or 1.0
+        if abs(median - base_median) > median_tolerance * spread:
+            yield DriftKind.MEDIAN_SHIFT, f"median {base_median} -> {median}"
+
+    if base.length_histogram and profile.max_length_bucket > base.max_length_bucket:
+        yield (
+            DriftKind.LENGTH_GROWTH,
+            f"max length now up to {(1 << profile.max_length_bucket) - 1} chars "
+            f"(baseline up to {(1 << base.max_length_bucket) - 1})",
+        )
+
+    # Only meaningful when the baseline tracked every category exactly
+    base_top = base.top_values
+    if base_top.counts and len(base_top.counts) < base_top.capacity:
+        threshold = min_category_share * profile.top_values.total
+        new_values = [
+            value
+            for value, count in profile.top_values.most_common()
+            if count >= threshold and value not in base_top.counts
+        ]
+        if new_values:
+            yield DriftKind.NEW_CATEGORY, f"new values: {', '.join(new_values)}"
+
+
+__all__: list[str] = [
+    "ColumnProfile",
+    "DriftFinding",
+    "DriftKind",
+    "KLLSketch",
+    "StreamProfiler",
+    "TopKCounter",
+    "detect_drift",
+]
@@ -0,0 +1,216 @@
+"""Pontuação de Qualidade de Dados em Streaming.
+
+Acumuladores de passagem única que calculam as métricas de qualidade de
+``PipelineResult`` enquanto os registros fluem, com memória O(campos):
+
+    - Completude: razão de nulos por campo obrigatório
+    - Acurácia: taxa de registros sem falhas de validação
+    - Consistência: chaves presentes e com tipo estável entre registros
+
+Classes:
+    DataQualityScores: Resultado imutável das pontuações (0-100).
+    DataQualityAccumulator: Acumulador incremental de qualidade.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Final
+
+from flext_core import FlextTypes as t
+
+if TYPE_CHECKING:
+    from gruponos_meltano_native.models.pipeline import GruponosMeltanoNativeModels
+    from gruponos_meltano_native.validators.data_validator import DataValidator
+    from gruponos_meltano_native.validators.error_model import ValidationFailure
+
+PERCENT: Final[float] = 100.0
+
+
+@dataclass(frozen=True, slots=True)
+class DataQualityScores:
+    """Pontuações de qualidade de dados (0-100%)."""
+
+    data_quality_score: float
+    completeness_score: float
+    accuracy_score: float
+    consistency_score: float
+    records_observed: int
+
+    def as_dict(self) -> dict[str, t.GeneralValueType]:
+        """Representação em dicionário para contexto de alertas e metadados."""
+        return asdict(self)
+
+
+class DataQualityAccumulator:
+    """Acumulador de qualidade de dados em passagem única.
+
+    Mantém apenas contadores por campo obrigatório e por campo chave,
+    portanto o consumo de memória independe do número de registros.
+
+    Attributes:
+      required_fields: Campos cuja ausência/nulidade reduz a completude.
+      key_fields: Campos chave avaliados para consistência.
+
+    """
+
+    def __init__(
+        self,
+        required_fields: Sequence[str] = (),
+        key_fields: Sequence[str] = (),
+    ) -> None:
+        """Inicializa acumulador.
+
+        Args:
+            required_fields: Campos obrigatórios da entidade.
+            key_fields: Campos da chave primária da entidade.
+
+        """
+        self.required_fields = tuple(required_fields)
+        self.key_fields = tuple(key_fields)
+        self.records_observed = 0
+        self.records_failed = 0
+        self.records_consistent = 0
+        # Células obrigatórias observadas (registros x campos obrigatórios)
+        self.cells_observed = 0
+        self.null_counts: dict[str, int] = dict.fromkeys(self.required_fields, 0)
+        self._key_types: dict[str, type] = {}
+
+    def observe(
+        self,
+        record: dict[str, t.GeneralValueType],
+        *,
+        failed: bool = False,
+    ) -> None:
+        """Incorpora um registro às métricas.
+
+        Args:
+            record: Registro observado.
+            failed: Se o registro teve falhas de validação.
+
+        """
+        self.records_observed += 1
+        if failed:
+            self.records_failed += 1
+
+        self.cells_observed += len(self.required_fields)
+        null_counts = self.null_counts
+        for field in self.required_fields:
+            value = record.get(field)
+            if value is None or value == "":
+                null_counts[field] += 1
+
+        consistent = True
+        key_types = self._key_types
+        for field in self.key_fields:
+            value = record.get(field)
+            if value is None or value == "":
+                consistent = False
+                continue
+            expected = key_types.setdefault(field, type(value))
+            if type(value) is not expected:
+                consistent = False
+        if consistent:
+            self.records_consistent += 1
+
+    def observe_validated(
+        self,
+        record: dict[str, t.GeneralValueType],
+        validator: DataValidator,
+    ) -> list[ValidationFailure]:
+        """Valida o registro com ``validator`` e incorpora o resultado.
+
+        Returns:
+            list[ValidationFailure]: Falhas encontradas para o registro.
+
+        Raises:
+            ValidationError: Se o validador estiver em modo strict e falhar.
+
+        """
+        failures = validator.check(record)
+        self.observe(record, failed=bool(failures))
+        return failures
+
+    def observe_many(
+        self,
+        records: Iterable[dict[str, t.GeneralValueType]],
+        validator: DataValidator | None = None,
+    ) -> None:
+        """Incorpora uma sequência de registros (validando se houver validador)."""
+        for record in records:
+            if validator is None:
+                self.observe(record)
+            else:
+                self.observe_validated(record, validator)
+
+    def merge(self, other: DataQualityAccumulator) -> None:
+        """Combina contadores de outro acumulador (ex.: lotes ou streams).
+
+        Os campos chave são unidos, de modo que um acumulador vazio que
+        recebe vários streams mantém a consistência de cada um.
+        """
+        self.key_fields = tuple(dict.fromkeys((*self.key_fields, *other.key_fields)))
+        self.records_observed += other.records_observed
+        self.records_failed += other.records_failed
+        self.records_consistent += other.records_consistent
+        self.cells_observed += other.cells_observed
+        for field, count in other.null_counts.items():
+            self.null_counts[field] = self.null_counts.get(field, 0) + count
+        for field, key_type in other._key_types.items():
+            self._key_types.setdefault(field, key_type)
+
+    def scores(self) -> DataQualityScores:
+        """Calcula as pontuações atuais."""
+        total = self.records_observed
+        if total == 0:
+            return DataQualityScores(PERCENT, PERCENT, PERCENT, PERCENT, 0)
+
+        cells = self.cells_observed
+        nulls = sum(self.null_counts.values())
+        completeness = PERCENT * (1 - nulls / cells) if cells else PERCENT
+        accuracy = PERCENT * (1 - self.records_failed / total)
+        consistency = (
+            PERCENT * self.records_consistent / total if self.key_fields else PERCENT
+        )
+        overall = (completeness + accuracy + consistency) / 3
+        return DataQualityScores(
+            data_quality_score=round(overall, 4),
+            completeness_score=round(completeness, 4),
+            accuracy_score=round(accuracy, 4),
+            consistency_score=round(consistency, 4),
+            records_observed=total,
+        )
+
+    def null_ratios(self) -> dict[str, float]:
+        """Razão de nulos por campo obrigatório."""
+        total = self.records_observed
+        return {
+            field: (count / total if total else 0.0)
+            for field, count in self.null_counts.items()
+        }
+
+    def apply_to(
+        self,
+        result: GruponosMeltanoNativeModels.PipelineResult,
+    ) -> DataQualityScores:
+        """Preenche os campos de qualidade de ``result`` com as pontuações."""
+        scores = self.scores()
+        result.data_quality_score = scores.data_quality_score
+        result.completeness_score = scores.completeness_score
+        result.accuracy_score = scores.accuracy_score
+        result.consistency_score = scores.consistency_score
+        result.metadata["data_quality"] = {
+            **scores.as_dict(),
+            "null_ratios": self.null_ratios(),
+            "records_failed": self.records_failed,
+        }
+        return scores
+
+
+__all__: list[str] = [
+    "DataQualityAccumulator",
+    "DataQualityScores",
+]
@@ -0,0 +1,463 @@
+"""Quarentena (Dead-Letter) de Registros Rejeitados.
+
+Registros reprovados na validação são gravados em segmentos append-only
+por stream, sem interromper o fluxo dos registros válidos:
+
+    - Quadros com prefixo de tamanho, CRC32 e payload JSON comprimido (zlib)
+    - Rotação de segmentos por tamanho
+    - Índice de offsets de tamanho fixo (acesso O(1) por id de entrada)
+    - Códigos de erro no índice para filtrar sem descomprimir
+    - Marcação de entradas reprocessadas (replay)
+    - Última mensagem SCHEMA do stream, reenviada antes dos registros no
+      replay
+
+Layout em disco::
+
+    <root>/<stream>/segment-000001.seg
+    <root>/<stream>/index.bin      # entradas de 20 bytes (>IQIHH)
+    <root>/<stream>/replayed.bin   # ids reprocessados (>Q)
+    <root>/<stream>/schema.json    # mensagem SCHEMA do stream
+
+``<stream>`` é o nome do stream com caracteres fora de ``[A-Za-z0-9_.-]``
+trocados por ``_`` (e ``.``/``..`` por ``_``/``__``), de modo que nenhum
+nome sai de ``<root>``.
+
+Classes:
+    QuarantineIndexEntry: Entrada do índice (sem payload).
+    QuarantinedRecord: Registro em quarentena com falhas.
+    GruponosMeltanoQuarantineStore: Armazenamento de quarentena.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Final, Self
+
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+
+from gruponos_meltano_native.constants import c
+from gruponos_meltano_native.core.overlap_dedup import _UNSAFE_FILENAME
+from gruponos_meltano_native.validators.error_model import ValidationFailure
+
+logger = FlextLogger(__name__)
+
+DEFAULT_MAX_SEGMENT_BYTES: Final[int] = 64 * 1024 * 1024
+SEGMENT_PATTERN: Final[str] = "segment-{:06d}.seg"
+INDEX_FILENAME: Final[str] = "index.bin"
+REPLAYED_FILENAME: Final[str] = "replayed.bin"
+SCHEMA_FILENAME: Final[str] = "schema.json"
+
+# Frame header: payload length, CRC32 of the compressed payload
+_FRAME_HEADER: Final[struct.Struct] = struct.Struct(">II")
+# Index entry: segment, frame offset, frame length, first error code, error count
+_INDEX_ENTRY: Final[struct.Struct] = struct.Struct(">IQIHH")
+_REPLAYED_ENTRY: Final[struct.Struct] = struct.Struct(">Q")
+
+
+@dataclass(frozen=True, slots=True)
+class QuarantineIndexEntry:
+    """Entrada do índice de quarentena."""
+
+    entry_id: int
+    segment: int
+    offset: int
+    length: int
+    first_error_code: int
+    error_count: int
+
+
+@dataclass(frozen=True, slots=True)
+class QuarantinedRecord:
+    """Registro em quarentena com as falhas que o rejeitaram."""
+
+    entry_id: int
+    stream: str
+    record: dict[str, t.GeneralValueType]
+    errors: list[dict[str, t.GeneralValueType]]
+    quarantined_at: str
+    run_id: str | None
+    replayed: bool = False
+
+    @property
+    def error_codes(self) -> list[int]:
+        """Códigos inteiros das falhas."""
+        return [int(error["code"]) for error in self.errors]
+
+    def to_dict(self) -> dict[str, t.GeneralValueType]:
+        """Representação para CLI/JSON."""
+        return {
+            "entry_id": self.entry_id,
+            "stream": self.stream,
+            "record": self.record,
+            "errors": self.errors,
+            "quarantined_at": self.quarantined_at,
+            "run_id": self.run_id,
+            "replayed": self.replayed,
+        }
+
+
+class _StreamWriter:
+    """Handles abertos de um stream (segmento corrente e índice)."""
+
+    def __init__(self, directory: Path, max_segment_bytes: int) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        self.index = (directory / INDEX_FILENAME).open("ab")
+        self.next_id = self.index.tell() // _INDEX_ENTRY.size
+        segments = sorted(directory.glob("segment-*.seg"))
+        self.segment_no = int(segments[-1].stem.split("-")[1]) if segments else 1
+        self.segment = self._open_segment()
+
+    def _open_segment(self) -> BinaryIO:
+        path = self.directory / SEGMENT_PATTERN.format(self.segment_no)
+        return path.open("ab")
+
+    def write(self, frame: bytes, first_code: int, error_count: int) -> int:
+        if self.segment.tell() and (
+            self.segment.tell() + len(frame) > self.max_segment_bytes
+        ):
+            self.segment.close()
+            self.segment_no += 1
+            self.segment = self._open_segment()
+        offset = self.segment.tell()
+        self.segment.write(frame)
+        self.index.write(
+            _INDEX_ENTRY.pack(
+                self.segment_no, offset, len(frame), first_code, error_count
+            )
+        )
+        entry_id = self.next_id
+        self.next_id += 1
+        return entry_id
+
+    def flush(self) -> None:
+        self.segment.flush()
+        self.index.flush()
+
+    def close(self) -> None:
+        self.segment.close()
+        self.index.close()
+
+
+class GruponosMeltanoQuarantineStore:
+    """Armazenamento de quarentena para registros rejeitados.
+
+    Escritas são append-only em handles mantidos abertos e bufferizados;
+    leituras (listagem, inspeção, replay) usam o índice de tamanho fixo e
+    descomprimem apenas os quadros solicitados.
+
+    Attributes:
+      root: Diretório raiz da quarentena.
+      max_segment_bytes: Tamanho máximo de um segmento antes da rotação.
+      compression_level: Nível zlib dos payloads.
+
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        compression_level: int = c.Gruponos.DataProcessing.DEFAULT_COMPRESSION_LEVEL,
+    ) -> None:
+        """Inicializa armazenamento em ``root``."""
+        self.root = root
+        self.max_segment_bytes = max_segment_bytes
+        self.compression_level = compression_level
+        self._writers: dict[str, _StreamWriter] = {}
+
+    def _directory(self, stream: str) -> Path:
+        """Diretório do stream (caracteres inseguros trocados por ``_``)."""
+        name = _UNSAFE_FILENAME.sub("_", stream)
+        if not name.strip("."):
+            # "", "." e ".." passam pelo padrão mas não ficam dentro de root
+            name = "_" * max(len(name), 1)
+        return self.root / name
+
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
+
+    def _writer(self, stream: str) -> _StreamWriter:
+        writer = self._writers.get(stream)
+        if writer is None:
+            writer = _StreamWriter(self._directory(stream), self.max_segment_bytes)
+            self._writers[stream] = writer
+        return writer
+
+    def put(
+        self,
+        stream: str,
+        record: dict[str, t.GeneralValueType],
+        failures: Sequence[ValidationFailure],
+        *,
+        run_id: str | None = None,
+    ) -> int:
+        """Coloca um registro em quarentena.
+
+        Args:
+            stream: Stream de origem.
+            record: Registro rejeitado.
+            failures: Falhas de validação do registro.
+            run_id: Execução em que o registro foi rejeitado.
+
+        Returns:
+            int: Id da entrada no stream.
+
+        """
+        errors = [
+            {"field": f.field_name, "code": int(f.code), "error": f.code.name}
+            for f in failures
+        ]
+        payload = json.dumps(
+            {
+                "record": record,
+                "errors": errors,
+                "quarantined_at": datetime.now(UTC).isoformat(),
+                "run_id": run_id,
+            },
+            separators=(",", ":"),
+            default=str,
+        ).encode()
+        compressed = zlib.compress(payload, self.compression_level)
+        frame = (
+            _FRAME_HEADER.pack(len(compressed), zlib.crc32(compressed)) + compressed
+        )
+        first_code = int(failures[0].code) if failures else 0
+        return self._writer(stream).write(frame, first_code, len(failures))
+
+    def put_many(
+        self,
+        stream: str,
+        rejected: Iterable[
+            tuple[dict[str, t.GeneralValueType], Sequence[ValidationFailure]]
+        ],
+        *,
+        run_id: str | None = None,
+    ) -> list[int]:
+        """Coloca vários registros em quarentena."""
+        return [
+            self.put(stream, record, failures, run_id=run_id)
+            for record, failures in rejected
+        ]
+
+    def put_schema(self, stream: str, message: dict[str, t.GeneralValueType]) -> None:
+        """Grava a mensagem SCHEMA do stream (substitui a anterior).
+
+        O replay a envia antes dos registros, para que o target conheça o
+        stream.
+        """
+        directory = self._directory(stream)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / SCHEMA_FILENAME
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(message, default=str), encoding="utf-8")
+        tmp.replace(path)
+
+    def flush(self) -> None:
+        """Descarrega buffers de escrita para o disco."""
+        for writer in self._writers.values():
+            writer.flush()
+
+    def close(self) -> None:
+        """Fecha todos os handles de escrita."""
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+    def __enter__(self) -> Self:
+        """Suporte a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Fecha handles ao sair do contexto."""
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    def streams(self) -> list[str]:
+        """Streams com registros em quarentena (nomes dos diretórios)."""
+        if not self.root.exists():
+            return []
+        return sorted(
+            path.name
+            for path in self.root.iterdir()
+            if (path / INDEX_FILENAME).exists()
+        )
+
+    def count(self, stream: str) -> int:
+        """Número de entradas do stream."""
+        self._flush_stream(stream)
+        path = self._directory(stream) / INDEX_FILENAME
+        return path.stat().st_size // _INDEX_ENTRY.size if path.exists() else 0
+
+    def _flush_stream(self, stream: str) -> None:
+        writer = self._writers.get(stream)
+        if writer is not None:
+            writer.flush()
+
+    def schema(self, stream: str) -> dict[str, t.GeneralValueType] | None:
+        """Mensagem SCHEMA gravada para o stream, se houver."""
+        path = self._directory(stream) / SCHEMA_FILENAME
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def replayed_ids(self, stream: str) -> set[int]:
+        """Ids de entradas já reprocessadas."""
+        path = self._directory(stream) / REPLAYED_FILENAME
+        if not path.exists():
+            return set()
+        data = path.read_bytes()
+        return {
+            _REPLAYED_ENTRY.unpack_from(data, pos)[0]
+            for pos in range(0, len(data), _REPLAYED_ENTRY.size)
+        }
+
+    def list_entries(
+        self,
+        stream: str,
+        *,
+        start: int = 0,
+        limit: int | None = None,
+        error_code: int | None = None,
+    ) -> list[QuarantineIndexEntry]:
+        """Lista entradas do índice sem descomprimir payloads.
+
+        Args:
+            stream: Stream a listar.
+            start: Primeiro id de entrada.
+            limit: Número máximo de entradas.
+            error_code: Filtra pelo primeiro código de erro.
+
+        """
+        self._flush_stream(stream)
+        path = self._directory(stream) / INDEX_FILENAME
+        if not path.exists():
+            return []
+        entries: list[QuarantineIndexEntry] = []
+        with path.open("rb") as fh:
+            fh.seek(start * _INDEX_ENTRY.size)
+            entry_id = start
+            while limit is None or len(entries) < limit:
+                raw = fh.read(_INDEX_ENTRY.size)
+                if len(raw) < _INDEX_ENTRY.size:
+                    break
+                entry = QuarantineIndexEntry(entry_id, *_INDEX_ENTRY.unpack(raw))
+                entry_id += 1
+                if error_code is None or entry.first_error_code == error_code:
+                    entries.append(entry)
+        return entries
+
+    def summary(self, stream: str) -> dict[str, t.GeneralValueType]:
+        """Resumo do stream: total, pendentes e contagem por código."""
+        entries = self.list_entries(stream)
+        replayed = self.replayed_ids(stream)
+        by_code = Counter(entry.first_error_code for entry in entries)
+        return {
+            "stream": stream,
+            "total": len(entries),
+            "pending": sum(1 for e in entries if e.entry_id not in replayed),
+            "replayed": len(replayed),
+            "segments": len({entry.segment for entry in entries}),
+            "by_error_code": {str(code): n for code, n in sorted(by_code.items())},
+        }
+
+    def _read(
+        self, stream: str, entry: QuarantineIndexEntry, *, replayed: bool
+    ) -> QuarantinedRecord:
+        path = self._directory(stream) / SEGMENT_PATTERN.format(entry.segment)
+        with path.open("rb") as fh:
+            fh.seek(entry.offset)
+            frame = fh.read(entry.length)
+        length, crc = _FRAME_HEADER.unpack_from(frame)
+        compressed = frame[_FRAME_HEADER.size : _FRAME_HEADER.size + length]
+        if zlib.crc32(compressed) != crc:
+            msg = f"Corrupt quarantine frame {stream}#{entry.entry_id}"
+            raise ValueError(msg)
+        payload = json.loads(zlib.decompress(compressed))
+        return QuarantinedRecord(
+            entry_id=entry.entry_id,
+            stream=stream,
+            record=payload["record"],
+            errors=payload["errors"],
+            quarantined_at=payload["quarantined_at"],
+            run_id=payload.get("run_id"),
+            replayed=replayed,
+        )
+
+    def get(self, stream: str, entry_id: int) -> FlextResult[QuarantinedRecord]:
+        """Obtém uma entrada pelo id."""
+        entries = (
+            self.list_entries(stream, start=entry_id, limit=1) if entry_id >= 0 else []
+        )
+        if not entries:
+            return FlextResult[QuarantinedRecord].fail(
+                f"Quarantine entry not found: {stream}#{entry_id}"
+            )
+        try:
+            record = self._read(
+                stream, entries[0], replayed=entry_id in self.replayed_ids(stream)
+            )
+        except (OSError, ValueError, zlib.error) as e:
+            return FlextResult[QuarantinedRecord].fail(str(e))
+        return FlextResult[QuarantinedRecord].ok(record)
+
+    def iter_records(
+        self, stream: str, *, include_replayed: bool = False
+    ) -> Iterator[QuarantinedRecord]:
+        """Itera registros do stream (pendentes por padrão)."""
+        replayed = self.replayed_ids(stream)
+        for entry in self.list_entries(stream):
+            is_replayed = entry.entry_id in replayed
+            if is_replayed and not include_replayed:
+                continue
+            try:
+                yield self._read(stream, entry, replayed=is_replayed)
+            except (OSError, ValueError, zlib.error):
+                logger.exception(
+                    "Skipping unreadable quarantine entry %s#%d",
+                    stream,
+                    entry.entry_id,
+                )
+
+    def mark_replayed(self, stream: str, entry_ids: Iterable[int]) -> int:
+        """Marca entradas como reprocessadas.
+
+        Returns:
+            int: Número de ids gravados.
+
+        """
+        packed = b"".join(_REPLAYED_ENTRY.pack(entry_id) for entry_id in entry_ids)
+        if not packed:
+            return 0
+        path = self._directory(stream) / REPLAYED_FILENAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("ab") as fh:
+            fh.write(packed)
+        return len(packed) // _REPLAYED_ENTRY.size
+
+
+__all__: list[str] = [
+    "GruponosMeltanoQuarantineStore",
+    "QuarantineIndexEntry",
+    "QuarantinedRecord",
+]
@@ -0,0 +1,467 @@
+"""Pacotes de Regras de Validação Declarativos (YAML).
+
+Regras por entidade declaradas em ``config/validation/<entidade>.yml`` e
+compiladas uma única vez em planos de validação imutáveis:
+
+    - Regras por campo (tipo, obrigatoriedade, tamanhos, faixas, enums)
+    - Conjuntos de enum nomeados reutilizáveis (``$nome``)
+    - Condições entre campos (``when``/``then``)
+    - Cache de planos por hash do arquivo e recarga a quente
+
+Formato::
+
+    entity: allocation
+    strict: false
+    enums:
+      statuses: [ALLOCATED, RESERVED]
+    fields:
+      allocation_id: {required: true, type: string, max_length: 50}
+      allocation_status: {required: true, type: enum, values: $statuses}
+    conditions:
+      - name: picked_has_quantity
+        when: {field: allocation_status, op: in, value: [PICKED]}
+        then: {field: quantity_allocated, op: gt, value: 0}
+
+Classes:
+    FieldPredicate: Predicado sobre um campo do registro.
+    FieldCondition: Condição entre campos (``when`` → ``then``).
+    ValidatorPlan: Plano compilado de uma entidade.
+    RulePackLoader: Carregador com cache e recarga a quente.
+
+Copyright (c) 2025 Grupo Nós. Todos os direitos reservados. Licença: Proprietária
+"""
+
+from __future__ import annotations
+
+import hashlib
+import operator
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final
+
+import yaml
+from flext_core import FlextLogger, FlextResult, FlextTypes as t
+
+from gruponos_meltano_native.validators.data_validator import (
+    DataValidator,
+    ValidationRule,
+)
+
+logger = FlextLogger(__name__)
+
+DEFAULT_RULE_PACK_DIR: Final[Path] = Path("config/validation")
+DEFAULT_RELOAD_INTERVAL: Final[float] = 30.0
+
+FIELD_TYPES: Final[frozenset[str]] = frozenset({
+    "boolean",
+    "date",
+    "decimal",
+    "enum",
+    "number",
+    "string",
+})
+_FIELD_PARAMETERS: Final[frozenset[str]] = frozenset({
+    "format",
+    "max_length",
+    "max_value",
+    "min_value",
+})
+
+_COMPARISONS: Final[dict[str, Callable[[object, object], bool]]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "lt": operator.lt,
+    "le": operator.le,
+}
+_MEMBERSHIP_OPS: Final[frozenset[str]] = frozenset({"in", "not_in"})
+_NULL_OPS: Final[frozenset[str]] = frozenset({"is_null", "not_null"})
+
+# Compiled plans shared by every loader in the process, keyed by file hash
+_PLAN_CACHE: dict[str, ValidatorPlan] = {}
+_PLAN_CACHE_LOCK = threading.Lock()
+
+
+class RulePackError(ValueError):
+    """Pacote de regras inválido."""
+
+
+# =============================================
+# CONDITIONS
+# =============================================
+
+
+def _is_null(value: object) -> bool:
+    return value is None or value == ""
+
+
+@dataclass(frozen=True, slots=True)
+class FieldPredicate:
+    """Predicado sobre um campo: compara com um valor ou com outro campo."""
+
+    field_name: str
+    op: str
+    value: object = None
+    other: str | None = None
+
+    def evaluate(self, record: Mapping[str, t.GeneralValueType]) -> bool | None:
+        """Avalia o predicado.
+
+        Returns:
+            bool | None: Resultado, ou None se algum operando for nulo
+            (exceto para ``is_null``/``not_null``).
+
+        """
+        current = record.get(self.field_name)
+        if self.op in _NULL_OPS:
+            return _is_null(current) == (self.op == "is_null")
+        if _is_null(current):
+            return None
+        if self.op in _MEMBERSHIP_OPS:
+            members = self.value if isinstance(self.value, frozenset) else ()
+            return (current in members) == (self.op == "in")
+        expected = record.get(self.other) if self.other else self.value
+        if _is_null(expected):
+            return None
+        try:
+            return _COMPARISONS[self.op](current, expected)
+        except TypeError:
+            return False
+
+
+@dataclass(frozen=True, slots=True)
+class FieldCondition:
+    """Condição entre campos: se ``when`` vale, ``then`` deve valer."""
+
+    name: str
+    then: FieldPredicate
+    when: FieldPredicate | None = None
+    rule: ValidationRule = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cria a regra usada para reportar a falha no campo de ``then``."""
+        object.__setattr__(
+            self,
+            "rule",
+            ValidationRule(self.then.field_name, "condition", {"name": self.name}),
+        )
+
+    def violated(self, record: Mapping[str, t.GeneralValueType]) -> bool:
+        """Indica se o registro viola a condição."""
+        if self.when is not None and not self.when.evaluate(record):
+            return False
+        return self.then.evaluate(record) is False
+
+
+# =============================================
+# PLANS
+# =============================================
+
+
+@dataclass(frozen=True, slots=True)
+class ValidatorPlan:
+    """Plano de validação compilado e imutável de uma entidade."""
+
+    entity: str
+    digest: str
+    rules: tuple[ValidationRule, ...]
+    conditions: tuple[FieldCondition, ...] = ()
+    strict_mode: bool = False
+
+    def build_validator(self, *, strict_mode: bool | None = None) -> DataValidator:
+        """Cria um ``DataValidator`` a partir do plano (sem reprocessar YAML)."""
+        return DataValidator(
+            list(self.rules),
+            strict_mode=self.strict_mode if strict_mode is None else strict_mode,
+            conditions=list(self.conditions),
+        )
+
+
+def _compile_predicate(
+    spec: object, enums: Mapping[str, frozenset[object]], where: str
+) -> FieldPredicate:
+    if not isinstance(spec, Mapping) or "field" not in spec:
+        msg = f"{where}: predicate must be a mapping with 'field'"
+        raise RulePackError(msg)
+    op = str(spec.get("op", "eq"))
+    if op not in _COMPARISONS and op not in _MEMBERSHIP_OPS and op not in _NULL_OPS:
+        msg = f"{where}: unsupported operator '{op}'"
+        raise RulePackError(msg)
+    value = spec.get("value")
+    if op in _MEMBERSHIP_OPS:
+        value = _resolve_values(value, enums, where)
+    other = spec.get("other")
+    return FieldPredicate(
+        str(spec["field"]), op, value, str(other) if other is not None else None
+    )
+
+
+def _resolve_values(
+    raw: object, enums: Mapping[str, frozenset[object]], where: str
+) -> frozenset[object]:
+    if isinstance(raw, str) and raw.startswith("$"):
+        name = raw[1:]
+        if name not in enums:
+            msg = f"{where}: unknown enum set '{name}'"
+            raise RulePackError(msg)
+        return enums[name]
+    if isinstance(raw, (list, tuple, set)):
+        return frozenset(raw)
+    msg = f"{where}: values must be a list or a $enum reference"
+    raise RulePackError(msg)
+
+
+def _compile_field(
+    name: str, spec: object, enums: Mapping[str, frozenset[object]]
+) -> list[ValidationRule]:
+    where = f"field '{name}'"
+    if not isinstance(spec, Mapping):
+        msg = f"{where}: spec must be a mapping"
+        raise RulePackError(msg)
+    rules: list[ValidationRule] = []
+    if spec.get("required"):
+        rules.append(ValidationRule(name, "required"))
+
+    rule_type = spec.get("type")
+    if rule_type is None:
+        return rules
+    if rule_type not in FIELD_TYPES:
+        msg = f"{where}: unsupported type '{rule_type}'"
+        raise RulePackError(msg)
+    parameters: dict[str, t.GeneralValueType] = {
+        key: spec[key] for key in _FIELD_PARAMETERS if key in spec
+    }
+    if rule_type == "enum":
+        values = _resolve_values(spec.get("values"), enums, where)
+        # DataValidator reports allowed values as a list; keep a stable order
+        parameters["allowed_values"] = sorted(values, key=str)
+    rules.append(ValidationRule(name, str(rule_type), parameters))
+    return rules
+
+
+def compile_rule_pack(
+    spec: Mapping[str, t.GeneralValueType], digest: str, entity: str
+) -> ValidatorPlan:
+    """Compila a especificação YAML já carregada em um ``ValidatorPlan``.
+
+    Raises:
+        RulePackError: Se a especificação for inválida.
+
+    """
+    raw_enums = spec.get("enums") or {}
+    if not isinstance(raw_enums, Mapping):
+        msg = "'enums' must be a mapping"
+        raise RulePackError(msg)
+    enums = {
+        str(name): _resolve_values(values, {}, f"enum '{name}'")
+        for name, values in raw_enums.items()
+    }
+
+    fields = spec.get("fields") or {}
+    if not isinstance(fields, Mapping):
+        msg = "'fields' must be a mapping"
+        raise RulePackError(msg)
+    rules = [
+        rule
+        for name, field_spec in fields.items()
+        for rule in _compile_field(str(name), field_spec, enums)
+    ]
+
+    conditions: list[FieldCondition] = []
+    for position, raw in enumerate(spec.get("conditions") or []):
+        where = f"condition #{position}"
+        if not isinstance(raw, Mapping) or "then" not in raw:
+            msg = f"{where}: must be a mapping with 'then'"
+            raise RulePackError(msg)
+        name = str(raw.get("name", f"condition_{position}"))
+        when = raw.get("when")
+        conditions.append(
+            FieldCondition(
+                name=name,
+                then=_compile_predicate(raw["then"], enums, f"{where} then"),
+                when=(
+                    _compile_predicate(when, enums, f"{where} when")
+                    if when is not None
+                    else None
+                ),
+            )
+        )
+
+    return ValidatorPlan(
+        entity=str(spec.get("entity", entity)),
+        digest=digest,
+        rules=tuple(rules),
+        conditions=tuple(conditions),
+        strict_mode=bool(spec.get("strict", False)),
+    )
+
+
+# =============================================
+# LOADER
+# =============================================
+
+
+@dataclass(slots=True)
+class _PackState:
+    path: Path
+    signature: tuple[int, int]
+    plan: ValidatorPlan
+
+
+class RulePackLoader:
+    """Carregador de pacotes de regras com cache e recarga a quente.
+
+    Cada arquivo é lido e compilado uma vez; planos são reutilizados por
+    hash de conteúdo. ``reload_if_changed`` compara apenas ``stat`` e só
+    relê arquivos modificados, podendo rodar periodicamente em modo daemon
+    via ``start_hot_reload``.
+
+    Attributes:
+      directory: Diretório dos pacotes (``*.yml``).
+
+    """
+
+    def __init__(self, directory: Path = DEFAULT_RULE_PACK_DIR) -> None:
+        """Inicializa carregador para ``directory``."""
+        self.directory = directory
+        self._packs: dict[str, _PackState] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher: threading.Thread | None = None
+
+    @staticmethod
+    def _signature(path: Path) -> tuple[int, int]:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _compile_file(self, path: Path) -> FlextResult[ValidatorPlan]:
+        try:
+            content = path.read_bytes()
+        except OSError as e:
+            return FlextResult[ValidatorPlan].fail(f"Cannot read rule pack: {e}")
+        digest = hashlib.sha256(content).hexdigest()
+        with _PLAN_CACHE_LOCK:
+            cached = _PLAN_CACHE.get(digest)
+        if cached is not None:
+            return FlextResult[ValidatorPlan].ok(cached)
+        try:
+            spec = yaml.safe_load(content) or {}
+            if not isinstance(spec, Mapping):
+                msg = "rule pack root must be a mapping"
+                raise RulePackError(msg)
+            plan = compile_rule_pack(spec, digest, path.stem)
+        except (yaml.YAMLError, RulePackError) as e:
+            return FlextResult[ValidatorPlan].fail(f"Invalid rule pack {path}: {e}")
+        with _PLAN_CACHE_LOCK:
+            _PLAN_CACHE[digest] = plan
+        return FlextResult[ValidatorPlan].ok(plan)
+
+    def load(self, entity: str) -> FlextResult[ValidatorPlan]:
+        """Obtém o plano compilado de uma entidade (lê o arquivo uma vez)."""
+        with self._lock:
+            state = self._packs.get(entity)
+            if state is not None:
+                return FlextResult[ValidatorPlan].ok(state.plan)
+            path = self.directory / f"{entity}.yml"
+            if not path.exists():
+                return FlextResult[ValidatorPlan].fail(
+                    f"Rule pack not found for entity '{entity}': {path}"
+                )
+            signature = self._signature(path)
+            result = self._compile_file(path)
+            if result.is_success:
+                self._packs[entity] = _PackState(path, signature, result.value)
+            return result
+
+    def load_all(self) -> FlextResult[dict[str, ValidatorPlan]]:
+        """Carrega todos os pacotes do diretório."""
+        plans: dict[str, ValidatorPlan] = {}
+        if not self.directory.exists():
+            return FlextResult[dict[str, ValidatorPlan]].ok(plans)
+        for path in sorted(self.directory.glob("*.yml")):
+            result = self.load(path.stem)
+            if result.is_failure:
+                return FlextResult[dict[str, ValidatorPlan]].fail(
+                    result.error or f"Invalid rule pack {path}"
+                )
+            plans[path.stem] = result.value
+        return FlextResult[dict[str, ValidatorPlan]].ok(plans)
+
+    def build_validator(self, entity: str) -> FlextResult[DataValidator]:
+        """Cria validador para a entidade a partir do plano em cache."""
+        result = self.load(entity)
+        if result.is_failure:
+            return FlextResult[DataValidator].fail(
+                result.error or "Rule pack load failed"
+            )
+        return FlextResult[DataValidator].ok(result.value.build_validator())
+
+    def reload_if_changed(self) -> list[str]:
+        """Recompila pacotes modificados desde o último carregamento.
+
+        Um pacote que deixou de compilar mantém o plano anterior.
+
+        Returns:
+            list[str]: Entidades cujo plano mudou.
+
+        """
+        changed: list[str] = []
+        with self._lock:
+            for entity, state in list(self._packs.items()):
+                try:
+                    signature = self._signature(state.path)
+                except OSError:
+                    continue
+                if signature == state.signature:
+                    continue
+                result = self._compile_file(state.path)
+                state.signature = signature
+                if result.is_failure:
+                    logger.error(
+                        "Keeping previous rule pack for %s: %s", entity, result.error
+                    )
+                    continue
+                if result.value.digest != state.plan.digest:
+                    state.plan = result.value
+                    changed.append(entity)
+        if changed:
+            logger.info("Reloaded rule packs: %s", ", ".join(changed))
+        return changed
+
+    def start_hot_reload(
+        self, interval_seconds: float = DEFAULT_RELOAD_INTERVAL
+    ) -> threading.Thread:
+        """Inicia verificação periódica em thread daemon (modo daemon)."""
+        if self._watcher is not None and self._watcher.is_alive():
+            return self._watcher
+        self._stop.clear()
+
+        def _watch() -> None:
+            while not self._stop.wait(interval_seconds):
+                self.reload_if_changed()
+
+        self._watcher = threading.Thread(
+            target=_watch, name="rule-pack-reload", daemon=True
+        )
+        self._watcher.start()
+        return self._watcher
+
+    def stop_hot_reload(self) -> None:
+        """Interrompe a verificação periódica."""
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+
+__all__: list[str] = [
+    "FieldCondition",
+    "FieldPredicate",
+    "RulePackError",
+    "RulePackLoader",
+    "ValidatorPlan",
+    "compile_rule_pack",
+]
@@ -0,0 +1,126 @@
+"""Unit tests for the time-window backfill planner and runner."""
+
+from __future__ import annotations
+
+import threading
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from flext_core import FlextResult
+
+from gruponos_meltano_native.core import (
+    BackfillManifest,
+    BackfillWindow,
+    GruponosBackfillRunner,
+    plan_backfill_windows,
+)
+from gruponos_meltano_native.core.backfill import probe_density
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+class TestPlanBackfillWindows:
+    """Test density-driven window sizing."""
+
+    def test_dense_periods_get_short_windows(self) -> None:
+        """Windows cover the range contiguously and follow row density."""
+        end = START + timedelta(days=20)
+        density = [
+            (START, START + timedelta(days=10), 10_000),
+            (START + timedelta(days=10), end, 100_000),
+        ]
+        windows = plan_backfill_windows(
+            START, end, density=density, target_rows=10_000
+        )
+
+        assert windows[0].start == START
+        assert windows[-1].end == end
+        assert all(
+            a.end == b.start
+            for a, b in zip(windows[:-1], windows[1:], strict=True)
+        )
+        # 1k rows/day: capped at max_window; 10k rows/day: one day each
+        assert windows[0].end - windows[0].start == timedelta(days=7)
+        assert windows[0].estimated_rows == 7_000
+        busy = windows[2:-1]
+        assert len(busy) == 9
+        assert all(w.end - w.start == timedelta(days=1) for w in busy)
+        assert all(w.estimated_rows == 10_000 for w in busy)
+
+    def test_without_density_and_min_window(self) -> None:
+        """No density gives max-size windows; a short tail is merged."""
+        end = START + timedelta(days=14, minutes=10)
+        windows = plan_backfill_windows(START, end, min_window=timedelta(hours=1))
+
+        assert [w.end - w.start for w in windows] == [
+            timedelta(days=7),
+            timedelta(days=7, minutes=10),
+        ]
+
+    def test_probe_density_buckets(self) -> None:
+        """The counting callable is queried once per bucket."""
+        end = START + timedelta(days=45)
+        buckets = probe_density(lambda window: 5, START, end)
+        assert [(b[1] - b[0]).days for b in buckets] == [30, 15]
+
+
+class TestGruponosBackfillRunner:
+    """Test concurrency, checkpoints and resume."""
+
+    def _windows(self, count: int) -> list[BackfillWindow]:
+        return [
+            BackfillWindow(
+                START + timedelta(days=i), START + timedelta(days=i + 1), i * 10
+            )
+            for i in range(count)
+        ]
+
+    def test_resume_runs_only_missing_windows(self, tmp_path: Path) -> None:
+        """After a failure, the next run executes only unfinished windows."""
+        path = tmp_path / "allocation.json"
+        plan_id = BackfillManifest.plan_identifier("allocation", START)
+        manifest = BackfillManifest(path)
+        assert not manifest.resume(plan_id)
+        manifest.create(plan_id, self._windows(6))
+        calls: list[str] = []
+        lock = threading.Lock()
+
+        def flaky(window: BackfillWindow) -> FlextResult[int]:
+            with lock:
+                calls.append(window.key)
+            if window.estimated_rows == 30:
+                return FlextResult[int].fail("ORA-00060 deadlock")
+            return FlextResult[int].ok(window.estimated_rows)
+
+        first = GruponosBackfillRunner(manifest, flaky, max_concurrency=3).run()
+        assert first.is_failure
+        assert len(calls) == 6
+        assert calls[0].startswith("2024-01-06")  # largest window first
+
+        resumed = BackfillManifest(path)
+        assert resumed.resume(plan_id)
+        calls.clear()
+        second = GruponosBackfillRunner(
+            resumed, lambda w: FlextResult[int].ok(7), max_concurrency=3
+        ).run()
+
+        assert second.is_success
+        assert calls == []
+        assert (second.value.skipped, second.value.completed) == (5, 1)
+        assert second.value.records == 7
+        assert not BackfillManifest(path).resume(plan_id)  # all done
+
+    def test_exceptions_fail_the_window(self, tmp_path: Path) -> None:
+        """A raising window is recorded as failed, others still complete."""
+        manifest = BackfillManifest(tmp_path / "m.json")
+        manifest.create("p", self._windows(2))
+
+        def boom(window: BackfillWindow) -> FlextResult[int]:
+            if window.estimated_rows:
+                raise RuntimeError("target crashed")
+            return FlextResult[int].ok(1)
+
+        result = GruponosBackfillRunner(manifest, boom).run()
+        assert result.is_failure
+        statuses = sorted(e["status"] for e in manifest.entries.values())
+        assert statuses == ["done", "failed"]
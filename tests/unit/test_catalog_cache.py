@@ -0,0 +1,105 @@
+"""Unit tests for the catalog cache and schema diffing."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from flext_core import FlextResult
+
+from gruponos_meltano_native.core import (
+    GruponosMeltanoCatalogCache,
+    SchemaChangeKind,
+    diff_catalogs,
+    schema_fingerprint,
+)
+
+CONFIG = {"base_url": "https://wms", "entities": ["allocation"], "password": "a"}
+
+
+def _catalog(**columns: str) -> dict[str, object]:
+    return {
+        "streams": [
+            {
+                "tap_stream_id": "allocation",
+                "schema": {
+                    "properties": {
+                        name: {"type": [kind, "null"]} for name, kind in columns.items()
+                    }
+                },
+            }
+        ]
+    }
+
+
+class _Discovery:
+    """Counting discovery stub."""
+
+    def __init__(self, catalog: dict[str, object]) -> None:
+        self.catalog = catalog
+        self.calls = 0
+
+    def __call__(self) -> FlextResult[dict[str, object]]:
+        self.calls += 1
+        return FlextResult[dict[str, object]].ok(self.catalog)
+
+
+class TestGruponosMeltanoCatalogCache:
+    """Test cache hits, invalidation and diffs."""
+
+    def test_reuses_catalog_until_config_changes(self, tmp_path: Path) -> None:
+        """Discovery runs once per config hash; secrets do not count."""
+        cache = GruponosMeltanoCatalogCache(tmp_path)
+        discovery = _Discovery(_catalog(allocation_id="string"))
+
+        first = cache.resolve("tap-wms", CONFIG, discovery)
+        second = cache.resolve("tap-wms", {**CONFIG, "password": "b"}, discovery)
+        third = cache.resolve("tap-wms", {**CONFIG, "page_size": 10}, discovery)
+
+        assert (first.value.cache_hit, second.value.cache_hit) == (False, True)
+        assert third.value.cache_hit is False
+        assert discovery.calls == 2
+        assert first.value.catalog_path.exists()
+
+    def test_fingerprint_mismatch_rediscovers_with_diff(self, tmp_path: Path) -> None:
+        """A changed source fingerprint triggers discovery and a diff."""
+        cache = GruponosMeltanoCatalogCache(tmp_path)
+        cache.resolve(
+            "tap-wms",
+            CONFIG,
+            _Discovery(_catalog(allocation_id="string", qty="integer")),
+            fingerprint="v1",
+        )
+        same = cache.resolve("tap-wms", CONFIG, _Discovery({}), fingerprint="v1")
+        changed = cache.resolve(
+            "tap-wms",
+            CONFIG,
+            _Discovery(_catalog(allocation_id="string", qty="number", lot="string")),
+            fingerprint="v2",
+        )
+
+        assert same.value.cache_hit
+        kinds = {change.kind for change in changed.value.changes}
+        assert kinds == {SchemaChangeKind.COLUMN_ADDED, SchemaChangeKind.TYPE_CHANGED}
+
+    def test_discovery_failure(self, tmp_path: Path) -> None:
+        """Discovery errors surface as FlextResult failures."""
+        result = GruponosMeltanoCatalogCache(tmp_path).resolve(
+            "tap-wms", CONFIG, lambda: FlextResult[dict[str, object]].fail("boom")
+        )
+        assert result.is_failure
+        assert "boom" in (result.error or "")
+
+
+class TestSchemaHelpers:
+    """Test diff and fingerprint helpers."""
+
+    def test_diff_streams(self) -> None:
+        """Added and removed streams are reported."""
+        changes = diff_catalogs(_catalog(a="string"), {"streams": []})
+        assert [change.kind for change in changes] == [SchemaChangeKind.STREAM_REMOVED]
+
+    def test_fingerprint_ignores_values(self) -> None:
+        """Only field names and types affect the fingerprint."""
+        base = schema_fingerprint([{"id": "1", "qty": 2}])
+        assert schema_fingerprint([{"id": "9", "qty": 5}]) == base
+        assert schema_fingerprint([{"id": "9", "qty": "5"}]) != base
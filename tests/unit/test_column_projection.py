@@ -0,0 +1,100 @@
+"""Unit tests for dbt-driven column projection."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from gruponos_meltano_native.core import ColumnProjection
+from gruponos_meltano_native.core.column_projection import parse_dbt_model
+
+REPO_MODELS_DIR = Path(__file__).resolve().parents[2] / "transform" / "models"
+
+
+def _catalog(*columns: str, stream: str = "allocation") -> dict[str, object]:
+    return {
+        "streams": [
+            {
+                "tap_stream_id": stream,
+                "key_properties": ["id"],
+                "schema": {
+                    "properties": {name: {"type": ["string"]} for name in columns}
+                },
+                "metadata": [
+                    {"breadcrumb": [], "metadata": {"replication-key": "mod_ts"}}
+                ],
+            }
+        ]
+    }
+
+
+def _selected(catalog: dict[str, object]) -> dict[str, bool]:
+    stream = catalog["streams"][0]  # type: ignore[index]
+    return {
+        entry["breadcrumb"][1]: entry["metadata"]["selected"]
+        for entry in stream["metadata"]
+        if entry["breadcrumb"]
+    }
+
+
+class TestParseDbtModel:
+    """Test source and identifier extraction."""
+
+    def test_ignores_jinja_comments_and_literals(self, tmp_path: Path) -> None:
+        """Only SQL identifiers count; the source call yields the entity."""
+        model = tmp_path / "stg.sql"
+        model.write_text(
+            "{{ config(materialized='view') }}\n"
+            "-- legacy_col was removed\n"
+            "select qty, 'status_txt' as label\n"
+            "from {{ source('wms_raw', 'allocation') }}\n"
+            "join {{ source('other', 'ignored') }} using (id)\n",
+            encoding="utf-8",
+        )
+        usage = parse_dbt_model(model)
+
+        assert usage.sources == {"allocation"}
+        assert {"qty", "label", "id"} <= usage.identifiers
+        assert "legacy_col" not in usage.identifiers
+        assert "status_txt" not in usage.identifiers
+        assert "materialized" not in usage.identifiers
+
+
+class TestColumnProjection:
+    """Test catalog selection metadata and select patterns."""
+
+    def test_apply_keeps_used_and_key_columns(self) -> None:
+        """Unused columns are deselected; keys and replication keys stay."""
+        catalog = _catalog("id", "mod_ts", "QTY", "notes")
+        projected = ColumnProjection({"allocation": ["qty"]}).apply(catalog)
+
+        assert _selected(projected) == {
+            "id": True,
+            "mod_ts": True,
+            "QTY": True,
+            "notes": False,
+        }
+        stream_entry = projected["streams"][0]["metadata"][0]  # type: ignore[index]
+        assert stream_entry["metadata"]["selected"] is True
+        original_entry = catalog["streams"][0]["metadata"][0]  # type: ignore[index]
+        assert "selected" not in original_entry["metadata"]
+
+    def test_unprojected_streams_untouched(self) -> None:
+        """Streams without a projection keep their metadata as is."""
+        catalog = _catalog("id", "notes", stream="order_hdr")
+        projection = ColumnProjection({"allocation": ["qty"]})
+
+        assert projection.apply(catalog) == catalog
+        assert projection.select_patterns(catalog) == []
+
+    def test_from_repo_models(self) -> None:
+        """The shipped staging models project the allocation stream."""
+        projection = ColumnProjection.from_dbt_models(REPO_MODELS_DIR)
+        catalog = _catalog(
+            "id", "mod_ts", "allocation_id", "quantity_allocated", "unused_blob"
+        )
+
+        assert projection.summary(catalog) == {
+            "allocation": {"total": 5, "selected": 4}
+        }
+        assert "allocation.unused_blob" not in projection.select_patterns(catalog)
+        assert "allocation.allocation_id" in projection.select_patterns(catalog)
@@ -0,0 +1,95 @@
+"""Unit tests for streaming data quality scoring."""
+
+from __future__ import annotations
+
+import pytest
+
+from gruponos_meltano_native import DataValidator, ValidationRule
+from gruponos_meltano_native.validators import (
+    DataQualityAccumulator,
+    DataQualityScores,
+)
+
+
+class TestDataQualityAccumulator:
+    """Test completeness, accuracy and consistency scoring."""
+
+    def test_empty_accumulator_scores_perfect(self) -> None:
+        """No observed records produce neutral scores."""
+        scores = DataQualityAccumulator(["order_id"]).scores()
+        assert scores == DataQualityScores(100.0, 100.0, 100.0, 100.0, 0)
+
+    def test_completeness_counts_null_and_empty(self) -> None:
+        """Null, empty and missing required fields reduce completeness."""
+        acc = DataQualityAccumulator(["order_id", "status"])
+        acc.observe({"order_id": "1", "status": "OPEN"})
+        acc.observe({"order_id": "2", "status": None})
+        acc.observe({"order_id": "", "status": "OPEN"})
+        acc.observe({"order_id": "4"})
+
+        assert acc.scores().completeness_score == pytest.approx(62.5)
+        assert acc.null_ratios() == {"order_id": 0.25, "status": 0.5}
+
+    def test_accuracy_uses_validator_failures(self) -> None:
+        """Records with validation failures reduce accuracy."""
+        validator = DataValidator([ValidationRule("qty", "number", {"min_value": 0})])
+        acc = DataQualityAccumulator()
+        acc.observe_many([{"qty": 1}, {"qty": -1}, {"qty": 5}, {"qty": 2}], validator)
+
+        assert acc.records_failed == 1
+        assert acc.scores().accuracy_score == pytest.approx(75.0)
+
+    def test_consistency_checks_key_presence_and_type(self) -> None:
+        """Missing keys or keys changing type reduce consistency."""
+        acc = DataQualityAccumulator(key_fields=["order_id", "line_number"])
+        acc.observe({"order_id": "A", "line_number": 1})
+        acc.observe({"order_id": "A", "line_number": "2"})
+        acc.observe({"order_id": None, "line_number": 3})
+        acc.observe({"order_id": "B", "line_number": 4})
+
+        assert acc.scores().consistency_score == pytest.approx(50.0)
+
+    def test_overall_score_is_mean_of_dimensions(self) -> None:
+        """Overall score averages completeness, accuracy and consistency."""
+        acc = DataQualityAccumulator(["a"], ["a"])
+        acc.observe({"a": 1})
+        acc.observe({"a": None}, failed=True)
+
+        scores = acc.scores()
+        expected = (
+            scores.completeness_score
+            + scores.accuracy_score
+            + scores.consistency_score
+        ) / 3
+        assert scores.data_quality_score == pytest.approx(expected)
+        assert scores.records_observed == 2
+
+    def test_merge_combines_counters(self) -> None:
+        """Merging partial accumulators equals a single pass."""
+        records = [{"a": 1}, {"a": None}, {"a": 3}, {"a": None}, {"a": 5}]
+        single = DataQualityAccumulator(["a"], ["a"])
+        single.observe_many(records)
+
+        left = DataQualityAccumulator(["a"], ["a"])
+        right = DataQualityAccumulator(["a"], ["a"])
+        left.observe_many(records[:2])
+        right.observe_many(records[2:])
+        left.merge(right)
+
+        assert left.scores() == single.scores()
+
+    def test_merge_into_empty_keeps_stream_scores(self) -> None:
+        """Streams merged into a blank accumulator keep their consistency."""
+        orders = DataQualityAccumulator(["order_id"], ["order_id"])
+        orders.observe_many([{"order_id": 1}, {"order_id": None}])
+        items = DataQualityAccumulator(["item_id"])
+        items.observe_many([{"item_id": "A"}, {"item_id": "B"}])
+
+        merged = DataQualityAccumulator()
+        merged.merge(orders)
+        merged.merge(items)
+
+        scores = merged.scores()
+        assert scores.records_observed == 4
+        assert scores.consistency_score == pytest.approx(75.0)
+        assert scores.completeness_score == pytest.approx(75.0)
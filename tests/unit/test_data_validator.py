@@ -6,7 +6,7 @@ Tests all validation rules, conversion paths, error handling, and edge cases.
 from __future__ import annotations
 
 from datetime import UTC, date, datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from unittest.mock import patch
 
 import pytest
@@ -233,8 +233,21 @@ class TestDataValidator:
         with pytest.raises(
             ValidationError,
             match="Field 'amount' must be a valid decimal",
-        ):
+        ) as excinfo:
             validator.validate(data)
+        assert isinstance(excinfo.value.__cause__, InvalidOperation)
+
+    def test_collect_failures_in_strict_mode(self) -> None:
+        """collect_failures returns failures without changing strict checks."""
+        rules = [ValidationRule("amount", "decimal")]
+        validator = DataValidator(rules, strict_mode=True)
+
+        data = {"amount": "invalid_decimal"}
+
+        failures = validator.collect_failures(data)
+        assert [f.field_name for f in failures] == ["amount"]
+        with pytest.raises(ValidationError):
+            validator.check(data)
 
     def test_validate_string_valid(self) -> None:
         """Test string validation with valid values."""
@@ -0,0 +1,108 @@
+"""Unit tests for the memoised date normaliser."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+
+import pytest
+
+from gruponos_meltano_native import DataValidator, ValidationRule
+from gruponos_meltano_native.validators import DateLayout, DateNormalizer
+
+
+class TestDateNormalizer:
+    """Test fast-path parsing, caching and layout locking."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2025-01-15T10:30:45",
+            "2025-01-15T10:30:45.123+00:00",
+            "2025-01-15",
+            "01/15/2025",
+            "01-15-2025",
+            "  2025-01-15  ",
+        ],
+    )
+    def test_accepts_legacy_layouts(self, value: str) -> None:
+        """Accepted inputs match the historical regex set."""
+        assert DateNormalizer().normalize(value, "mod_ts") == value.strip()
+
+    @pytest.mark.parametrize("value", ["invalid-date", "2025/01/15", "15.01.2025"])
+    def test_rejects_unknown_layouts(self, value: str) -> None:
+        """Unknown layouts return None and raise in normalize_value()."""
+        normalizer = DateNormalizer()
+        assert normalizer.normalize(value) is None
+        with pytest.raises(ValueError, match="Cannot parse date"):
+            normalizer.normalize_value(value)
+
+    def test_repeated_values_hit_cache(self) -> None:
+        """Repeated timestamps are served from the LRU."""
+        normalizer = DateNormalizer()
+        for _ in range(10):
+            normalizer.normalize("2025-01-15T10:30:45", "mod_ts")
+        stats = normalizer.get_stats()
+        assert stats["cache_hits"] == 9
+        assert stats["cache_misses"] == 1
+        assert stats["cache_hit_rate"] == pytest.approx(0.9)
+
+    def test_cache_is_bounded(self) -> None:
+        """The LRU never exceeds cache_size."""
+        normalizer = DateNormalizer(cache_size=4)
+        for day in range(1, 20):
+            normalizer.normalize(f"2025-01-{day:02d}")
+        assert normalizer.get_stats()["cache_entries"] == 4
+
+    def test_layout_locked_per_column(self) -> None:
+        """The column layout is fixed after the detection window."""
+        normalizer = DateNormalizer(detection_window=3)
+        for second in range(5):
+            normalizer.normalize(f"2025-01-15T10:30:{second:02d}", "mod_ts")
+        assert normalizer.column_layout("mod_ts") is DateLayout.ISO_DATETIME
+        assert normalizer.get_stats()["layout_fast_hits"] == 2
+
+    def test_matches_format_uses_strptime_semantics(self) -> None:
+        """Fast path and strptime agree on validity."""
+        normalizer = DateNormalizer()
+        assert normalizer.matches_format("2025-01-15", "%Y-%m-%d")
+        assert not normalizer.matches_format("2025-02-30", "%Y-%m-%d")
+        assert normalizer.matches_format("2025-1-5", "%Y-%m-%d")
+        assert normalizer.matches_format("01/15/2025", "%m/%d/%Y")
+        assert normalizer.get_stats()["strptime_calls"] == 2
+
+    def test_normalize_value_objects(self) -> None:
+        """datetime and date objects are rendered as ISO strings."""
+        normalizer = DateNormalizer()
+        dt = datetime(2025, 1, 15, 10, 30, tzinfo=UTC)
+        assert normalizer.normalize_value(dt) == dt.isoformat()
+        assert normalizer.normalize_value(date(2025, 1, 15)) == "2025-01-15"
+
+    def test_parse_compares_by_instant(self) -> None:
+        """Offsets and US layouts parse to comparable aware datetimes."""
+        normalizer = DateNormalizer()
+        assert normalizer.parse("2025-01-15T10:30:00-03:00") == datetime(
+            2025, 1, 15, 13, 30, tzinfo=UTC
+        )
+        assert normalizer.parse("01/15/2025 10:30") == datetime(
+            2025, 1, 15, 10, 30, tzinfo=UTC
+        )
+        assert normalizer.parse(date(2025, 1, 15)) == datetime(2025, 1, 15, tzinfo=UTC)
+        assert normalizer.parse("15/01/2025") is None
+        assert normalizer.parse(42) is None
+
+
+class TestDataValidatorDateStats:
+    """Test DataValidator wiring."""
+
+    def test_date_stats_exposed(self) -> None:
+        """Conversion and validation feed the normaliser stats."""
+        validator = DataValidator([ValidationRule("created", "date")])
+        schema = {"properties": {"mod_ts": {"type": "string", "format": "date-time"}}}
+        for _ in range(3):
+            validator.validate_and_convert_record(
+                {"mod_ts": "2025-01-15T10:30:45"}, schema
+            )
+            validator.validate({"created": "2025-01-15"})
+        stats = validator.get_date_stats()
+        assert stats["cache_hits"] == 4
+        assert validator.get_conversion_stats()["dates_normalized"] == 3
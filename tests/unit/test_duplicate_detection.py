@@ -0,0 +1,186 @@
+"""Unit tests for in-stream duplicate key and cardinality detection."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from gruponos_meltano_native.validators import (
+    DataValidator,
+    DuplicateKeyDetector,
+    HyperLogLog,
+    ScalableBloomFilter,
+    SpillableDigestSet,
+    create_duplicate_detectors,
+)
+from gruponos_meltano_native.validators.duplicates import key_digest
+from gruponos_meltano_native.validators.error_model import ValidationErrorCode
+
+
+class TestScalableBloomFilter:
+    """Test Bloom filter growth and membership."""
+
+    def test_no_false_negatives_across_stages(self) -> None:
+        """Every added digest stays visible after the filter grows."""
+        bloom = ScalableBloomFilter(initial_capacity=100, error_rate=0.01)
+        digests = [key_digest([i]) for i in range(1000)]
+        for digest in digests:
+            bloom.add(digest)
+
+        assert bloom.stages > 1
+        assert all(digest in bloom for digest in digests)
+
+    def test_false_positive_rate_is_bounded(self) -> None:
+        """Unseen digests are rarely reported as present."""
+        bloom = ScalableBloomFilter(initial_capacity=2000, error_rate=0.01)
+        for i in range(2000):
+            bloom.add(key_digest([i]))
+
+        false_positives = sum(
+            key_digest([i]) in bloom for i in range(10_000, 20_000)
+        )
+        assert false_positives / 10_000 < 0.03
+
+
+class TestSpillableDigestSet:
+    """Test exact membership with disk spill."""
+
+    def test_membership_survives_spill(self, tmp_path: Path) -> None:
+        """Digests spilled to disk are still found."""
+        digests = SpillableDigestSet(max_memory_keys=50, spill_dir=tmp_path)
+        for i in range(200):
+            digests.add(key_digest([i]))
+
+        assert digests.spill_count >= 3
+        assert len(digests) == 200
+        assert key_digest([7]) in digests
+        assert key_digest([999]) not in digests
+        assert list(tmp_path.rglob("part-*.bin"))
+
+        digests.close()
+        assert not list(tmp_path.rglob("part-*.bin"))
+
+    def test_stale_partitions_are_ignored(self, tmp_path: Path) -> None:
+        """Partitions left by a crashed run are never read back."""
+        crashed = SpillableDigestSet(max_memory_keys=10, spill_dir=tmp_path)
+        for i in range(20):
+            crashed.add(key_digest([i]))
+        assert crashed.spill_count >= 1
+
+        digests = SpillableDigestSet(max_memory_keys=10, spill_dir=tmp_path)
+        for i in range(100, 120):
+            digests.add(key_digest([i]))
+        assert key_digest([3]) not in digests
+        assert len(digests) == 20
+        digests.close()
+        crashed.close()
+
+
+class TestHyperLogLog:
+    """Test cardinality estimates."""
+
+    @pytest.mark.parametrize("cardinality", [100, 50_000])
+    def test_estimate_within_error(self, cardinality: int) -> None:
+        """Estimates stay within a few percent of the true count."""
+        hll = HyperLogLog()
+        for i in range(cardinality):
+            hll.add_digest(key_digest([i]))
+        assert abs(hll.estimate() - cardinality) / cardinality < 0.05
+
+    def test_merge_matches_union(self) -> None:
+        """Merging sketches estimates the union."""
+        left, right = HyperLogLog(10), HyperLogLog(10)
+        for i in range(3000):
+            left.add_digest(key_digest([i]))
+        for i in range(2000, 5000):
+            right.add_digest(key_digest([i]))
+        left.merge(right)
+        assert abs(left.estimate() - 5000) / 5000 < 0.1
+
+        with pytest.raises(ValueError, match="precision"):
+            left.merge(HyperLogLog(12))
+
+
+class TestDuplicateKeyDetector:
+    """Test per-entity duplicate detection."""
+
+    def test_flags_only_confirmed_duplicates(self, tmp_path: Path) -> None:
+        """Duplicates are exact even with a tiny Bloom filter and spills."""
+        records = [{"order_id": str(i), "line_number": 1} for i in range(500)]
+        records += [{"order_id": "42", "line_number": 1}]
+        records += [{"order_id": "42", "line_number": 2}]
+
+        with DuplicateKeyDetector(
+            "order_dtl",
+            ["order_id", "line_number"],
+            expected_keys=50,
+            max_memory_keys=100,
+            spill_dir=tmp_path,
+        ) as detector:
+            duplicates = detector.observe_many(records)
+            stats = detector.get_stats()
+
+        assert duplicates == [500]
+        assert stats["duplicates"] == 1
+        assert stats["exact_keys"] == 501
+        assert stats["spills"] >= 1
+
+    def test_missing_keys_are_counted_not_flagged(self) -> None:
+        """Records without a key value are counted separately."""
+        detector = DuplicateKeyDetector("allocation", ["allocation_id"])
+        assert detector.observe_many(
+            [{"allocation_id": None}, {"allocation_id": ""}, {}]
+        ) == []
+        assert detector.missing_keys == 3
+        detector.close()
+
+    def test_validator_flags_duplicates(self, tmp_path: Path) -> None:
+        """Keys are registered on the load path; ``check`` stays repeatable."""
+        validator = DataValidator()
+        detector = validator.enable_duplicate_detection(
+            DuplicateKeyDetector(
+                "order_dtl", ["order_id", "line_number"], spill_dir=tmp_path
+            )
+        )
+        records = [
+            {"order_id": "1", "line_number": 1},
+            {"order_id": "1", "line_number": 2},
+            {"order_id": "1", "line_number": 1},
+        ]
+        failures = [
+            validator.collect_failures(record)
+            or validator.check_duplicate_key(record, raise_on_failure=False)
+            for record in records
+        ]
+        revalidated = validator.collect_failures(records[0])
+        detector.close()
+
+        assert revalidated == []
+        assert detector.records_seen == 3
+        assert failures[:2] == [[], []]
+        assert [f.code for f in failures[2]] == [ValidationErrorCode.DUPLICATE_KEY]
+        assert failures[2][0].message == (
+            "Field 'order_id+line_number' repeats a key already seen in order_dtl"
+        )
+
+    def test_requires_key_fields(self) -> None:
+        """An entity without key fields is rejected."""
+        with pytest.raises(ValueError, match="key field"):
+            DuplicateKeyDetector("allocation", [])
+
+
+class TestCreateDuplicateDetectors:
+    """Test factory for known WMS entities."""
+
+    def test_creates_detectors_for_known_entities(self, tmp_path: Path) -> None:
+        """Known entities get their configured primary keys."""
+        detectors = create_duplicate_detectors(spill_root=tmp_path)
+        assert detectors["allocation"].key_fields == ("allocation_id",)
+        assert detectors["order_dtl"].key_fields == ("order_id", "line_number")
+        assert (tmp_path / "order_hdr").is_dir()
+
+    def test_unknown_entity_raises(self) -> None:
+        """Unknown entity names are rejected."""
+        with pytest.raises(ValueError, match="Unknown WMS entities"):
+            create_duplicate_detectors(["shipment"])
@@ -0,0 +1,60 @@
+"""Unit tests for the streaming external process wrapper."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from gruponos_meltano_native.core import ExternalProcess
+
+
+def _python(code: str, *, stdin: bool = False) -> ExternalProcess:
+    return ExternalProcess([sys.executable, "-c", code], stdin=stdin)
+
+
+class TestExternalProcess:
+    """Test piping, timeouts and cleanup."""
+
+    def test_round_trip_keeps_stderr_tail(self) -> None:
+        """Stdin reaches the child; its stderr is kept after close."""
+        process = _python(
+            "import sys; sys.stdout.write(sys.stdin.read().upper()); "
+            "sys.stderr.write('x' * 10000 + 'boom'); sys.exit(3)",
+            stdin=True,
+        )
+        try:
+            process.stdin.write(b"state")
+            process.close_stdin()
+            output = process.stdout.read()
+            code = process.wait(5)
+        finally:
+            process.close()
+        assert output == b"STATE"
+        assert code == 3
+        assert process.stderr_tail.endswith("boom")
+        assert len(process.stderr_tail) <= 4096
+
+    def test_timeout_kills_child(self) -> None:
+        """A child outliving the timeout is killed and reported as ``None``."""
+        process = _python("import time; time.sleep(60)")
+        try:
+            assert process.wait(0.2) is None
+        finally:
+            process.close()
+
+    def test_close_after_child_exited(self) -> None:
+        """Flushing buffered input into an exited child does not raise."""
+        process = _python("pass", stdin=True)
+        try:
+            assert process.wait(5) == 0
+            process.stdin.write(b"buffered")
+            process.close_stdin()
+        finally:
+            process.close()
+        assert process.stderr_tail == ""
+
+    def test_missing_executable(self) -> None:
+        """Start errors surface like ``subprocess.Popen``."""
+        with pytest.raises(FileNotFoundError):
+            ExternalProcess(["definitely-not-a-command-gruponos"])
@@ -0,0 +1,112 @@
+"""Unit tests for the facility matrix and its fair-share scheduler."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from flext_core import FlextResult
+
+from gruponos_meltano_native.core import (
+    FacilityTarget,
+    GruponosFairShareScheduler,
+    WmsEntity,
+    parse_facility_matrix,
+)
+from gruponos_meltano_native.core.facility_matrix import FacilityUnit
+
+_BIG = FacilityTarget("GNOS", "DC01")
+_SMALL = FacilityTarget("GNOS", "DC02")
+
+
+def _units(facility: FacilityTarget, count: int) -> list[FacilityUnit]:
+    return [FacilityUnit(facility, WmsEntity(f"entity_{i}")) for i in range(count)]
+
+
+class TestParseFacilityMatrix:
+    """Test matrix parsing."""
+
+    def test_parse_specs_and_pairs(self) -> None:
+        """Strings and pairs give the same facilities; config is re-pointed."""
+        assert parse_facility_matrix(" GNOS:DC01, GNOS:DC02 ,") == [_BIG, _SMALL]
+        assert parse_facility_matrix([("GNOS", "DC01"), "GNOS:DC02"]) == [
+            _BIG,
+            _SMALL,
+        ]
+        config = _SMALL.apply({"facility_code": "DC01", "page_size": 10})
+        assert config == {
+            "facility_code": "DC02",
+            "company_code": "GNOS",
+            "page_size": 10,
+        }
+
+    @pytest.mark.parametrize("spec", ["", "DC01", "GNOS:DC01,GNOS:DC01", ":DC01"])
+    def test_invalid_matrix(self, spec: str) -> None:
+        """Malformed, duplicate and empty matrices are rejected."""
+        with pytest.raises(ValueError, match="acility"):
+            parse_facility_matrix(spec)
+
+
+class TestGruponosFairShareScheduler:
+    """Test fair-share scheduling and per-facility aggregation."""
+
+    def test_small_facility_not_starved(self) -> None:
+        """A facility with slow units does not hold back a light one."""
+        order: list[str] = []
+
+        def run(unit: FacilityUnit) -> FlextResult[int]:
+            order.append(unit.facility.facility_code)
+            if unit.facility == _BIG:
+                time.sleep(0.05)
+            return FlextResult[int].ok(10)
+
+        summary = GruponosFairShareScheduler(run, max_concurrency=1).run(
+            _units(_BIG, 6) + _units(_SMALL, 2)
+        )
+        assert order[:3] == ["DC01", "DC02", "DC02"]
+        assert summary.facilities["GNOS-DC01"].records == 60
+        assert summary.facilities["GNOS-DC02"].completed == 2
+        assert summary.records == 80
+
+    def test_concurrency_caps(self) -> None:
+        """Global and per-facility caps hold."""
+        lock = threading.Lock()
+        active: dict[str, int] = {}
+        peaks: dict[str, int] = {}
+
+        def run(unit: FacilityUnit) -> FlextResult[int]:
+            key = unit.facility.key
+            with lock:
+                active[key] = active.get(key, 0) + 1
+                peaks[key] = max(peaks.get(key, 0), active[key])
+            time.sleep(0.01)
+            with lock:
+                active[key] -= 1
+            return FlextResult[int].ok(1)
+
+        facilities = parse_facility_matrix("A:1,A:2,A:3")
+        summary = GruponosFairShareScheduler(
+            run, max_concurrency=2, max_per_facility=2
+        ).run([unit for f in facilities for unit in _units(f, 4)])
+        assert summary.max_in_flight == 2
+        assert max(peaks.values()) <= 2
+        assert summary.records == 12
+
+    def test_failures_isolated_per_facility(self) -> None:
+        """A failing facility is reported; the others still complete."""
+
+        def run(unit: FacilityUnit) -> FlextResult[int]:
+            if unit.facility == _BIG:
+                message = "WMS unavailable"
+                raise OSError(message)
+            return FlextResult[int].ok(5)
+
+        summary = GruponosFairShareScheduler(run, max_concurrency=2).run(
+            _units(_BIG, 2) + _units(_SMALL, 3)
+        )
+        assert summary.failed_facilities == ["GNOS-DC01"]
+        assert summary.facilities["GNOS-DC01"].failed == 2
+        assert "WMS unavailable" in summary.facilities["GNOS-DC01"].errors[0]
+        assert summary.facilities["GNOS-DC02"].records == 15
+        assert summary.as_dict()["facilities"]["GNOS-DC02"]["completed"] == 3
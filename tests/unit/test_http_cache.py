@@ -0,0 +1,62 @@
+"""Unit tests for the on-disk WMS response cache."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from gruponos_meltano_native.core import GruponosWmsResponseCache
+
+URL = "https://wms.example/wms/lgfapi/v10/entity/order_dtl/"
+
+
+class TestGruponosWmsResponseCache:
+    """Test storage, persistence, revalidation headers and eviction."""
+
+    def test_store_persist_and_share_bodies(self, tmp_path: Path) -> None:
+        """Identical bodies are stored once and survive a reopen."""
+        cache = GruponosWmsResponseCache(tmp_path)
+        headers = {"ETag": '"abc"', "Last-Modified": "Mon, 06 Jan 2025 10:00:00 GMT"}
+        cache.store(URL, {"page": 1, "page_size": 5}, b'{"results":[]}', headers)
+        cache.store(URL, {"page": 9, "page_size": 5}, b'{"results":[]}', {})
+        cache.close()
+
+        reopened = GruponosWmsResponseCache(tmp_path)
+        entry = reopened.lookup(URL, {"page_size": 5, "page": 1})
+        assert entry is not None
+        assert reopened.is_fresh(entry)
+        assert reopened.read_body(entry) == b'{"results":[]}'
+        assert entry.conditional_headers() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 06 Jan 2025 10:00:00 GMT",
+        }
+        assert len(reopened) == 2
+        assert len(list((tmp_path / "bodies").rglob("*.z"))) == 1
+
+    def test_no_store_and_corrupt_bodies(self, tmp_path: Path) -> None:
+        """no-store responses are skipped; corrupt bodies are dropped."""
+        cache = GruponosWmsResponseCache(tmp_path)
+        assert cache.store(URL, None, b"x", {"Cache-Control": "no-store"}) is None
+
+        entry = cache.store(URL, None, b"payload", {})
+        assert entry is not None
+        next((tmp_path / "bodies").rglob("*.z")).write_bytes(b"garbage")
+        assert cache.read_body(entry) is None
+        assert cache.lookup(URL) is None
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Least recently used bodies go first once the cap is exceeded."""
+        cache = GruponosWmsResponseCache(tmp_path, max_bytes=2_500)
+        bodies = [os.urandom(1_000) for _ in range(3)]
+        for page, body in enumerate(bodies[:2]):
+            cache.store(URL, {"page": page}, body, {})
+        first = cache.lookup(URL, {"page": 0})
+        assert first is not None
+        first.last_access = time.time() + 60  # page 0 was used most recently
+        cache.store(URL, {"page": 2}, bodies[2], {})
+
+        assert cache.stats.evictions >= 1
+        assert cache.lookup(URL, {"page": 1}) is None
+        assert cache.lookup(URL, {"page": 2}) is not None
+        assert cache.stored_bytes <= 2_500
@@ -0,0 +1,176 @@
+"""Unit tests for index lifecycle management around bulk loads."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+from flext_core import FlextResult
+
+from gruponos_meltano_native.oracle.index_manager import (
+    GruponosMeltanoOracleIndexManager,
+    IndexStrategy,
+    load_declared_indexes,
+    parse_declared_indexes,
+)
+
+# index_name, uniqueness, partitioned, status, column
+_INDEXES = [
+    ("ALLOCATION_PK", "UNIQUE", "NO", "VALID", "ALLOCATION_ID"),
+    ("IDX_WMS_ALLOCATION_ORDER_ID", "NONUNIQUE", "NO", "VALID", "ORDER_ID"),
+    ("IX_ALLOC_LOC", "NONUNIQUE", "YES", "N/A", "LOCATION_ID"),
+    ("IDX_WMS_ALLOCATION_MOD_TS", "NONUNIQUE", "NO", "VALID", "MOD_TS"),
+]
+
+
+@dataclass
+class _QueryResult:
+    rows: list[tuple[object, ...]]
+
+
+@dataclass
+class _RecordingApi:
+    """Oracle API double answering dictionary queries and recording DDL."""
+
+    num_rows: int | None = 1_000_000
+    failing: str | None = None
+    ddl: list[str] = field(default_factory=list)
+
+    def query(self, sql: str) -> FlextResult[_QueryResult]:
+        rows: list[tuple[object, ...]] = []
+        if "FROM all_indexes" in sql:
+            rows = list(_INDEXES)
+        elif "FROM all_constraints" in sql:
+            rows = [("ALLOCATION_PK",)]
+        elif "FROM all_ind_partitions" in sql:
+            rows = [("P_2025_01",), ("P_2025_02",)]
+        elif "num_rows FROM all_tables" in sql:
+            rows = [(self.num_rows,)]
+        return FlextResult[_QueryResult].ok(_QueryResult(rows))
+
+    def execute_ddl(self, sql: str) -> FlextResult[bool]:
+        self.ddl.append(sql)
+        if self.failing and self.failing in sql:
+            return FlextResult[bool].fail("ORA-01652: unable to extend temp segment")
+        return FlextResult[bool].ok(value=True)
+
+
+def _manager(
+    api: _RecordingApi, strategy: IndexStrategy = IndexStrategy.UNUSABLE
+) -> GruponosMeltanoOracleIndexManager:
+    return GruponosMeltanoOracleIndexManager(
+        api,
+        schema="wms",
+        table="wms_allocation",
+        declared=parse_declared_indexes("allocation_id,order_id,item_id,location_id"),
+        strategy=strategy,
+        parallel_degree=8,
+    )
+
+
+class TestDeclaredIndexes:
+    """Test the ``indexes`` declarations."""
+
+    def test_parse_single_and_composite(self) -> None:
+        """Commas separate indexes; ``+`` joins composite columns."""
+        assert parse_declared_indexes(" order_id, order_id+line_number ,") == [
+            ("ORDER_ID",),
+            ("ORDER_ID", "LINE_NUMBER"),
+        ]
+        with pytest.raises(ValueError, match="Invalid"):
+            parse_declared_indexes("order id")
+
+    def test_load_resolves_env_defaults(self, tmp_path: Path) -> None:
+        """``${VAR:-default}`` resolves against the environment."""
+        path = tmp_path / "wms_integration.yml"
+        path.write_text(
+            "entities:\n"
+            "  allocation:\n"
+            "    target_table_name: ${ALLOCATION_TABLE_NAME:-WMS_ALLOCATION}\n"
+            "    indexes: ${ALLOCATION_INDEXES:-allocation_id,order_id}\n"
+            "  order_hdr:\n"
+            "    indexes: ${ORDER_HDR_INDEXES:-order_id}\n",
+            encoding="utf-8",
+        )
+        declared = load_declared_indexes(path, {"ORDER_HDR_INDEXES": "customer_id"})
+        assert declared["allocation"].table == "WMS_ALLOCATION"
+        assert declared["allocation"].indexes == (("ALLOCATION_ID",), ("ORDER_ID",))
+        assert declared["order_hdr"].table == "ORDER_HDR"
+        assert declared["order_hdr"].indexes == (("CUSTOMER_ID",),)
+        assert load_declared_indexes(tmp_path / "missing.yml") == {}
+
+
+class TestGruponosMeltanoOracleIndexManager:
+    """Test reconciliation, suspension and rebuilds."""
+
+    def test_reconcile(self) -> None:
+        """Missing declared indexes are created; only managed extras dropped."""
+        api = _RecordingApi()
+        report = _manager(api).reconcile(drop_undeclared=True).value
+        assert report.missing == ["IDX_WMS_ALLOCATION_ITEM_ID"]
+        assert report.undeclared == ["IDX_WMS_ALLOCATION_MOD_TS"]
+        assert api.ddl == [
+            "CREATE INDEX WMS.IDX_WMS_ALLOCATION_ITEM_ID ON WMS.WMS_ALLOCATION "
+            "(ITEM_ID) NOLOGGING PARALLEL 8",
+            "ALTER INDEX WMS.IDX_WMS_ALLOCATION_ITEM_ID NOPARALLEL",
+            "ALTER INDEX WMS.IDX_WMS_ALLOCATION_ITEM_ID LOGGING",
+            "DROP INDEX WMS.IDX_WMS_ALLOCATION_MOD_TS",
+        ]
+
+    def test_suspend_and_rebuild_unusable(self) -> None:
+        """Non-unique indexes go unusable and are rebuilt in parallel."""
+        api = _RecordingApi()
+        manager = _manager(api)
+        suspended = manager.suspend().value
+        assert "ALLOCATION_PK" not in suspended
+        assert "ALTER INDEX WMS.IX_ALLOC_LOC UNUSABLE" in api.ddl
+        api.ddl.clear()
+        assert manager.rebuild().is_success
+        assert (
+            "ALTER INDEX WMS.IDX_WMS_ALLOCATION_ORDER_ID REBUILD "
+            "NOLOGGING PARALLEL 8"
+        ) in api.ddl
+        assert (
+            "ALTER INDEX WMS.IX_ALLOC_LOC REBUILD PARTITION P_2025_02 "
+            "NOLOGGING PARALLEL 8"
+        ) in api.ddl
+        assert manager.report.rebuilt == suspended
+
+    def test_drop_strategy_keeps_partitioned_indexes(self) -> None:
+        """Dropped indexes are recreated; partitioned ones only go unusable."""
+        api = _RecordingApi()
+        manager = _manager(api, IndexStrategy.DROP)
+        manager.suspend()
+        assert "DROP INDEX WMS.IDX_WMS_ALLOCATION_ORDER_ID" in api.ddl
+        assert "DROP INDEX WMS.IX_ALLOC_LOC" not in api.ddl
+        manager.rebuild()
+        assert any(
+            sql.startswith("CREATE INDEX WMS.IDX_WMS_ALLOCATION_ORDER_ID")
+            for sql in api.ddl
+        )
+
+    def test_rebuild_continues_after_failure(self) -> None:
+        """Every index is attempted; failures are reported."""
+        api = _RecordingApi()
+        manager = _manager(api)
+        manager.suspend()
+        api.failing = "IDX_WMS_ALLOCATION_ORDER_ID REBUILD"
+        result = manager.rebuild()
+        assert result.is_failure
+        assert "IX_ALLOC_LOC" in manager.report.rebuilt
+        assert manager.report.errors[0].startswith("IDX_WMS_ALLOCATION_ORDER_ID")
+        api.failing = None
+        assert manager.rebuild().is_success
+
+    @pytest.mark.parametrize(
+        ("num_rows", "expected", "suspend"),
+        [(1_000_000, 5_000, False), (1_000_000, 400_000, True), (0, 10, True)],
+    )
+    def test_should_suspend(
+        self, num_rows: int, expected: int, *, suspend: bool
+    ) -> None:
+        """Only loads that are large relative to the table suspend indexes."""
+        manager = _manager(_RecordingApi(num_rows=num_rows))
+        assert manager.should_suspend(expected) is suspend
+        assert manager.should_suspend(None) is True
@@ -0,0 +1,276 @@
+"""Unit tests for the orchestrator's run paths (quality, profiles)."""
+
+import json
+import sys
+import unittest.mock
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from flext_core import FlextResult
+
+from gruponos_meltano_native.core import ExternalProcess, SingerProxyStage
+from gruponos_meltano_native.core.native_run import _run_observer
+from gruponos_meltano_native.core.run_context import PipelineConfiguration
+from gruponos_meltano_native.monitoring.run_ledger import (
+    KIND_PROFILE,
+    GruponosMeltanoRunLedger,
+)
+from gruponos_meltano_native.orchestrator import GruponosMeltanoOrchestrator
+from gruponos_meltano_native.validators import (
+    DataQualityAccumulator,
+    DataValidator,
+    GruponosMeltanoQuarantineStore,
+    StreamProfiler,
+    ValidationRule,
+)
+
+
+def _fake_meltano(
+    tap_output: bytes, commands: list[list[str]] | None = None
+) -> Callable[..., ExternalProcess]:
+    """``ExternalProcess`` factory running Python stand-ins for tap and target."""
+
+    def start(cmd: list[str], **kwargs: object) -> ExternalProcess:
+        if commands is not None:
+            commands.append(cmd)
+        if kwargs.get("stdin"):
+            code = (
+                "import sys; sys.stdin.buffer.read(); "
+                'print(\'{"bookmarks": {"order_dtl": {"value": "w"}}}\'); '
+                'print(\'{"bookmarks": {"order_dtl": {"value": "x"}}}\')'
+            )
+            return ExternalProcess([sys.executable, "-c", code], stdin=True)
+        code = f"import sys; sys.stdout.buffer.write({tap_output!r})"
+        return ExternalProcess([sys.executable, "-c", code])
+
+    return start
+
+
+class TestOrchestratorDataQuality:
+    """Test quality scoring and alerting at the end of each run."""
+
+    @staticmethod
+    def _alerts() -> unittest.mock.MagicMock:
+        alerts = unittest.mock.MagicMock()
+        alerts.send_data_quality_alert.return_value = FlextResult[bool].ok(True)
+        return alerts
+
+    def test_run_job_scores_quality_and_alerts(self) -> None:
+        """Accumulators fed during the job fill the scores; a breach alerts."""
+        orchestrator = GruponosMeltanoOrchestrator()
+        quality = DataQualityAccumulator(["order_id"], ["order_id"])
+        quality.observe_many([{"order_id": "1"}, {"order_id": None}])
+        alerts = self._alerts()
+        with (
+            unittest.mock.patch.object(
+                orchestrator,
+                "_execute_meltano_pipeline",
+                return_value=FlextResult.ok({"execution_time": 1.0}),
+            ),
+            unittest.mock.patch.object(
+                orchestrator, "_get_alert_manager", return_value=alerts
+            ),
+        ):
+            result = orchestrator.run_job("full-sync-job", quality={"order": quality})
+
+        pipeline_result = result.value
+        assert pipeline_result.completeness_score == pytest.approx(50.0)
+        assert pipeline_result.consistency_score == pytest.approx(50.0)
+        assert pipeline_result.accuracy_score == pytest.approx(100.0)
+        assert pipeline_result.metadata["data_quality"]["records_observed"] == 2
+        assert pipeline_result.warnings
+        alerts.send_data_quality_alert.assert_called_once()
+
+    def test_run_job_uses_the_pipeline_configuration(self) -> None:
+        """The configured threshold decides the breach; disabled checks skip it."""
+        orchestrator = GruponosMeltanoOrchestrator()
+        alerts = self._alerts()
+        with (
+            unittest.mock.patch.object(
+                orchestrator,
+                "_execute_meltano_pipeline",
+                return_value=FlextResult.ok({"execution_time": 1.0}),
+            ),
+            unittest.mock.patch.object(
+                orchestrator, "_get_alert_manager", return_value=alerts
+            ),
+        ):
+            for configuration in (
+                PipelineConfiguration(
+                    name="p",
+                    job_name="j",
+                    extractor_name="e",
+                    loader_name="l",
+                    quality_threshold=50.0,
+                ),
+                PipelineConfiguration(
+                    name="p",
+                    job_name="j",
+                    extractor_name="e",
+                    loader_name="l",
+                    enable_quality_checks=False,
+                ),
+            ):
+                quality = DataQualityAccumulator(["order_id"], ["order_id"])
+                quality.observe_many([{"order_id": "1"}, {"order_id": None}])
+                result = orchestrator.run_job(
+                    "full-sync-job",
+                    quality={"order": quality},
+                    configuration=configuration,
+                )
+                assert not result.value.warnings
+
+        alerts.send_data_quality_alert.assert_not_called()
+
+    def test_native_observer_counts_validation_failures(self) -> None:
+        """Records the stream's validator rejects lower the accuracy score."""
+        quality = DataQualityAccumulator(["qty"])
+        validator = DataValidator([ValidationRule("qty", "number", {"min_value": 0})])
+        observe = _run_observer({"order_dtl": validator}, {"order_dtl": quality}, {})
+
+        for qty in (1, -1):
+            assert observe("order_dtl", {"qty": qty}) == {"qty": qty}
+
+        assert quality.records_failed == 1
+        assert quality.scores().accuracy_score == pytest.approx(50.0)
+
+    def test_proxied_run_scores_stage_accumulators(self, tmp_path: Path) -> None:
+        """The proxy stage's accumulators score the run; the stage is kept."""
+        orchestrator = GruponosMeltanoOrchestrator()
+        records = [
+            {"type": "RECORD", "stream": "order_dtl", "record": {"order_id": oid}}
+            for oid in ("1", "2", None, "4")
+        ]
+        tap_output = b"".join(json.dumps(r).encode() + b"\n" for r in records)
+        quality = DataQualityAccumulator(["order_id"], ["order_id"])
+        stage = SingerProxyStage(quality={"order_dtl": quality})
+        alerts = self._alerts()
+        with (
+            unittest.mock.patch.object(
+                orchestrator.settings, "meltano_project_root", str(tmp_path)
+            ),
+            unittest.mock.patch(
+                "gruponos_meltano_native.core.proxied_run.ExternalProcess",
+                side_effect=_fake_meltano(tap_output),
+            ),
+            unittest.mock.patch.object(
+                orchestrator, "_get_alert_manager", return_value=alerts
+            ),
+        ):
+            result = orchestrator.run_proxied_job(
+                "tap-oracle-wms-full", "target-oracle-full", stage
+            )
+
+        assert result.is_success, result.error
+        pipeline_result = result.value
+        assert pipeline_result.records_loaded == 4
+        assert pipeline_result.completeness_score == pytest.approx(75.0)
+        assert pipeline_result.metadata["last_state"] == (
+            '{"bookmarks": {"order_dtl": {"value": "x"}}}'
+        )
+        assert stage.transform is None
+        assert stage.stats.records == 0
+        alerts.send_data_quality_alert.assert_called_once()
+
+    def test_proxied_run_resumes_from_stored_state(self, tmp_path: Path) -> None:
+        """STATE echoed by the target is stored and handed to the next tap."""
+        orchestrator = GruponosMeltanoOrchestrator()
+        commands: list[list[str]] = []
+        with (
+            unittest.mock.patch.object(
+                orchestrator.settings, "meltano_project_root", str(tmp_path)
+            ),
+            unittest.mock.patch(
+                "gruponos_meltano_native.core.proxied_run.ExternalProcess",
+                side_effect=_fake_meltano(b"", commands),
+            ),
+            unittest.mock.patch.object(
+                orchestrator, "_get_alert_manager", return_value=self._alerts()
+            ),
+        ):
+            first = orchestrator.run_proxied_job(
+                "tap-oracle-wms-full", "target-oracle-full", SingerProxyStage()
+            )
+            second = orchestrator.run_proxied_job(
+                "tap-oracle-wms-full", "target-oracle-full", SingerProxyStage()
+            )
+
+        assert first.is_success, first.error
+        assert "--state" not in commands[0]
+        assert first.value.metadata["state_store"]["checkpoints"] == 2
+        tap_command = commands[2]
+        state_file = Path(tap_command[tap_command.index("--state") + 1])
+        assert json.loads(state_file.read_text(encoding="utf-8")) == {
+            "bookmarks": {"order_dtl": {"value": "x"}}
+        }
+        assert second.is_success, second.error
+
+    def test_proxied_run_flushes_quarantine(self, tmp_path: Path) -> None:
+        """Rejected records are on disk once the run returns."""
+        orchestrator = GruponosMeltanoOrchestrator()
+        records = [
+            {"type": "RECORD", "stream": "order_dtl", "record": {"qty": qty}}
+            for qty in (1, -1)
+        ]
+        tap_output = b"".join(json.dumps(r).encode() + b"\n" for r in records)
+        store = GruponosMeltanoQuarantineStore(tmp_path / "quarantine")
+        validator = DataValidator([ValidationRule("qty", "number", {"min_value": 0})])
+        stage = SingerProxyStage({"order_dtl": validator}, quarantine=store)
+        with (
+            unittest.mock.patch.object(
+                orchestrator.settings, "meltano_project_root", str(tmp_path)
+            ),
+            unittest.mock.patch(
+                "gruponos_meltano_native.core.proxied_run.ExternalProcess",
+                side_effect=_fake_meltano(tap_output),
+            ),
+            unittest.mock.patch.object(
+                orchestrator, "_get_alert_manager", return_value=self._alerts()
+            ),
+        ):
+            result = orchestrator.run_proxied_job(
+                "tap-oracle-wms-full", "target-oracle-full", stage
+            )
+
+        assert result.is_success, result.error
+        reader = GruponosMeltanoQuarantineStore(tmp_path / "quarantine")
+        assert reader.count("order_dtl") == 1
+        store.close()
+
+    def test_profiles_are_recorded_and_checked_for_drift(
+        self, tmp_path: Path
+    ) -> None:
+        """Each run appends its profiles; a changed column set is drift."""
+        orchestrator = GruponosMeltanoOrchestrator()
+        ledger = GruponosMeltanoRunLedger(tmp_path / "ledger.jsonl")
+        first = StreamProfiler("order_dtl")
+        first.observe_many([{"order_id": "1"}, {"order_id": "2"}])
+        second = StreamProfiler("order_dtl")
+        second.observe_many(
+            [{"order_id": "1", "status": "NEW"}, {"order_id": "2", "status": "NEW"}]
+        )
+        with (
+            unittest.mock.patch.object(
+                orchestrator,
+                "_execute_meltano_pipeline",
+                return_value=FlextResult.ok({"execution_time": 1.0}),
+            ),
+            unittest.mock.patch(
+                "gruponos_meltano_native.orchestrator."
+                "create_gruponos_meltano_run_ledger",
+                return_value=ledger,
+            ),
+        ):
+            baseline = orchestrator.run_job(
+                "full-sync-job", profiles={"order_dtl": first}
+            )
+            drifted = orchestrator.run_job(
+                "full-sync-job", profiles={"order_dtl": second}
+            )
+
+        assert "drift" not in baseline.value.metadata
+        assert len(ledger.entries(kind=KIND_PROFILE)) == 2
+        findings = drifted.value.metadata["drift"]["order_dtl"]
+        assert [f["column"] for f in findings] == ["status"]
+        assert any("drift" in warning for warning in drifted.value.warnings)
@@ -0,0 +1,143 @@
+"""Unit tests for overlap-window deduplication."""
+
+from __future__ import annotations
+
+import io
+import json
+from datetime import timedelta
+from pathlib import Path
+
+from gruponos_meltano_native.core import (
+    GruponosOverlapDeduplicator,
+    OverlapKeyIndex,
+    SingerProxyStage,
+    StreamKeys,
+    WmsEntity,
+)
+from gruponos_meltano_native.core.overlap_dedup import row_key_hash
+from gruponos_meltano_native.validators import (
+    DataValidator,
+    GruponosMeltanoQuarantineStore,
+    ValidationRule,
+)
+
+_STREAMS = {"order_dtl": StreamKeys(("id",), "mod_ts")}
+
+
+def _rows(ids: range, minute: int) -> list[dict[str, object]]:
+    return [{"id": i, "mod_ts": f"2025-03-01T10:{minute:02d}:{i:02d}"} for i in ids]
+
+
+def _run(
+    dedup: GruponosOverlapDeduplicator, rows: list[dict[str, object]]
+) -> list[object]:
+    return [r["id"] for r in rows if dedup("order_dtl", dict(r)) is not None]
+
+
+class TestOverlapKeyIndex:
+    """Test the persisted sorted hash array."""
+
+    def test_roundtrip_and_lookup(self, tmp_path: Path) -> None:
+        """Hashes survive save/load; corrupt files read as empty."""
+        hashes = [row_key_hash([i], "2025-03-01") for i in range(1_000)]
+        path = tmp_path / "order_dtl.idx"
+        OverlapKeyIndex([*hashes, hashes[0]]).save(path)
+        index = OverlapKeyIndex.load(path)
+        assert len(index) == 1_000
+        assert all(h in index for h in hashes)
+        assert row_key_hash([1_000], "2025-03-01") not in index
+        assert path.stat().st_size == 12 + 8 * 1_000
+
+        path.write_bytes(path.read_bytes()[:-3])
+        assert len(OverlapKeyIndex.load(path)) == 0
+        assert len(OverlapKeyIndex.load(tmp_path / "missing.idx")) == 0
+
+
+class TestGruponosOverlapDeduplicator:
+    """Test dropping rows loaded unchanged by the previous run."""
+
+    def test_unchanged_overlap_rows_are_dropped(self, tmp_path: Path) -> None:
+        """Same key and mod_ts is dropped; a newer mod_ts passes."""
+        first = GruponosOverlapDeduplicator(
+            _STREAMS, directory=tmp_path, overlap=timedelta(minutes=30)
+        )
+        assert _run(first, _rows(range(10), 40)) == list(range(10))
+        first.commit()
+        assert first.stats.indexed == 10
+
+        second = GruponosOverlapDeduplicator(
+            _STREAMS, directory=tmp_path, overlap=timedelta(minutes=30)
+        )
+        rows = _rows(range(8), 40) + _rows(range(8, 10), 55) + _rows(range(10, 12), 55)
+        assert _run(second, rows) == [8, 9, 10, 11]
+        assert second("other_stream", {"id": 1}) == {"id": 1}
+        assert second.stats.dropped == 8
+        assert second.stats.dropped_per_stream == {"order_dtl": 8}
+
+    def test_window_and_failed_runs(self, tmp_path: Path) -> None:
+        """Only the overlap window is indexed; without commit nothing changes."""
+        dedup = GruponosOverlapDeduplicator(
+            _STREAMS, directory=tmp_path, overlap=timedelta(minutes=10)
+        )
+        _run(dedup, _rows(range(5), 20) + _rows(range(5, 10), 50))
+        dedup.commit()
+        # 10:20 is more than 10 minutes before 10:50:09
+        assert dedup.stats.indexed == 5
+
+        failed = GruponosOverlapDeduplicator(
+            _STREAMS, directory=tmp_path, overlap=timedelta(minutes=10)
+        )
+        assert _run(failed, _rows(range(10, 20), 59)) == list(range(10, 20))
+        # Not committed: the next run still drops the first run's window
+        retry = GruponosOverlapDeduplicator(
+            _STREAMS, directory=tmp_path, overlap=timedelta(minutes=10)
+        )
+        assert _run(retry, _rows(range(5, 10), 50)) == []
+
+    def test_for_entities_and_chaining(self, tmp_path: Path) -> None:
+        """Only keyed incremental entities are deduplicated; chains run after."""
+        dedup = GruponosOverlapDeduplicator.for_entities(
+            [WmsEntity("order_dtl", ("id",), "mod_ts"), WmsEntity("location")],
+            directory=tmp_path,
+        )
+        assert set(dedup.streams) == {"order_dtl"}
+        assert GruponosOverlapDeduplicator.overlap_from_config({
+            "incremental_overlap_minutes": "45"
+        }) == timedelta(minutes=45)
+
+        seen: list[object] = []
+
+        def spy(_stream: str, record: dict[str, object]) -> dict[str, object]:
+            seen.append(record["id"])
+            return record
+
+        chained = dedup.then(spy)
+        chained("order_dtl", {"id": 1, "mod_ts": "2025-03-01T10:00:00"})
+        dedup.commit()
+        again = GruponosOverlapDeduplicator.for_entities(
+            [WmsEntity("order_dtl", ("id",), "mod_ts")], directory=tmp_path
+        ).then(spy)
+        assert again("order_dtl", {"id": 1, "mod_ts": "2025-03-01T10:00:00"}) is None
+        assert seen == [1]
+
+    def test_quarantined_rows_are_not_indexed(self, tmp_path: Path) -> None:
+        """As a proxy change filter, only forwarded rows enter the index."""
+        rows = [
+            {"id": 1, "qty": 1, "mod_ts": "2025-03-01T10:00:00"},
+            {"id": 2, "qty": -1, "mod_ts": "2025-03-01T10:00:00"},
+        ]
+        data = b"".join(
+            json.dumps({"type": "RECORD", "stream": "order_dtl", "record": r}).encode()
+            + b"\n"
+            for r in rows
+        )
+        validator = DataValidator([ValidationRule("qty", "number", {"min_value": 0})])
+        dedup = GruponosOverlapDeduplicator(_STREAMS, directory=tmp_path / "dedup")
+        with GruponosMeltanoQuarantineStore(tmp_path / "quarantine") as store:
+            stage = SingerProxyStage({"order_dtl": validator}, quarantine=store)
+            stage.with_change_filters(dedup).run(io.BytesIO(data), io.BytesIO())
+        dedup.commit()
+
+        # The rejected row, fixed at the source, is not dropped on re-read
+        retry = GruponosOverlapDeduplicator(_STREAMS, directory=tmp_path / "dedup")
+        assert _run(retry, [{**r, "qty": 1} for r in rows]) == [2]
@@ -0,0 +1,75 @@
+"""Unit tests for the planned full/incremental sync strategy."""
+
+import unittest.mock
+from pathlib import Path
+
+from flext_core import FlextResult
+
+from gruponos_meltano_native.core import EntityPlan, SyncMode, WmsEntity
+from gruponos_meltano_native.core.planned_run import GruponosPlannedRun
+from gruponos_meltano_native.core.run_context import GruponosRunContext
+
+_CONFIG = {"base_url": "https://wms.example", "username": "u", "password": "p"}
+
+
+def test_full_entities_are_reloaded_through_the_shadow_swap(tmp_path: Path) -> None:
+    """FULL plans go through the shadow run, the rest through the native run."""
+    context = GruponosRunContext(
+        unittest.mock.MagicMock(meltano_project_root=str(tmp_path)),
+        environment=dict,
+        validate_job_name=str,
+        finish=unittest.mock.MagicMock(),
+    )
+    native = unittest.mock.MagicMock()
+    native.run.return_value = FlextResult.ok(
+        unittest.mock.MagicMock(
+            records_extracted=3,
+            records_loaded=3,
+            metadata={"wms_extraction": {"records_per_entity": {"item": 3}}},
+        )
+    )
+    shadow = unittest.mock.MagicMock()
+    shadow.run.return_value = FlextResult.ok(
+        unittest.mock.MagicMock(
+            records_extracted=7,
+            records_loaded=7,
+            metadata={"shadow_swap": {"allocation": {"records_loaded": 7}}},
+        )
+    )
+    planner = unittest.mock.MagicMock()
+    planner.plan.return_value = [
+        EntityPlan("allocation", SyncMode.FULL, "mass update"),
+        EntityPlan("item", SyncMode.INCREMENTAL, "small delta"),
+    ]
+    with (
+        unittest.mock.patch(
+            "gruponos_meltano_native.core.planned_run.GruponosWmsExtractor"
+        ),
+        unittest.mock.patch(
+            "gruponos_meltano_native.core.planned_run.GruponosSyncPlanner",
+            return_value=planner,
+        ),
+        unittest.mock.patch(
+            "gruponos_meltano_native.core.planned_run.GruponosShadowRun",
+            return_value=shadow,
+        ),
+    ):
+        result = GruponosPlannedRun(context, native).run(
+            [WmsEntity("allocation"), WmsEntity("item")], extractor_config=_CONFIG
+        )
+
+    assert result.is_success, result.error
+    assert result.value.records_loaded == 10
+    (full_entities,), shadow_kwargs = shadow.run.call_args
+    assert [e.name for e in full_entities] == ["allocation"]
+    assert shadow_kwargs["loader"] == "target-oracle-full"
+    assert shadow_kwargs["state_job"] == "wms-native-target-oracle-incremental"
+    (loader, entities), native_kwargs = native.run.call_args
+    assert loader == "target-oracle-incremental"
+    assert [e.name for e in entities] == ["item"]
+    assert "state" not in native_kwargs
+    loaded = {
+        call.args[0].entity: call.kwargs["records_loaded"]
+        for call in planner.record.call_args_list
+    }
+    assert loaded == {"allocation": 7, "item": 3}
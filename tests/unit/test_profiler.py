@@ -0,0 +1,177 @@
+"""Unit tests for per-column profiling sketches and drift detection."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from gruponos_meltano_native import DataValidator, ValidationRule
+from gruponos_meltano_native.validators import (
+    ColumnProfile,
+    DriftKind,
+    KLLSketch,
+    StreamProfiler,
+    TopKCounter,
+    detect_drift,
+)
+
+
+def _allocations(
+    count: int,
+    *,
+    status: str = "ALLOCATED",
+    seed: int = 0,
+) -> list[dict[str, object]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "allocation_id": str(i),
+            "allocation_status": status,
+            "quantity_allocated": rng.gauss(100, 10),
+        }
+        for i in range(count)
+    ]
+
+
+class TestKLLSketch:
+    """Test approximate quantiles."""
+
+    def test_quantiles_within_rank_error(self) -> None:
+        """Median and quartiles stay close to the exact values."""
+        sketch = KLLSketch(seed=1)
+        for i in range(20_000):
+            sketch.add(float(i))
+
+        assert sketch.count == 20_000
+        assert sketch.quantile(0.5) == pytest.approx(10_000, rel=0.05)
+        assert sketch.quantile(0.9) == pytest.approx(18_000, rel=0.05)
+        assert sum(len(level) for level in sketch.compactors) < 2000
+
+    def test_merge_and_roundtrip(self) -> None:
+        """Merged and deserialised sketches answer like a single pass."""
+        left, right = KLLSketch(seed=1), KLLSketch(seed=2)
+        for i in range(5000):
+            left.add(float(i))
+            right.add(float(i + 5000))
+        left.merge(KLLSketch.from_dict(right.to_dict()))
+
+        assert left.count == 10_000
+        assert left.quantile(0.5) == pytest.approx(5000, rel=0.05)
+
+    def test_empty_sketch(self) -> None:
+        """An empty sketch has no quantiles."""
+        assert KLLSketch().quantile(0.5) is None
+
+
+class TestTopKCounter:
+    """Test heavy hitters."""
+
+    def test_exact_for_low_cardinality(self) -> None:
+        """Columns with few values are counted exactly."""
+        counter = TopKCounter(capacity=8)
+        for value in ["A"] * 5 + ["B"] * 3 + ["C"]:
+            counter.add(value)
+        assert counter.most_common() == [("A", 5), ("B", 3), ("C", 1)]
+
+    def test_keeps_heavy_hitters_under_pressure(self) -> None:
+        """Frequent values survive many distinct rare values."""
+        counter = TopKCounter(capacity=4)
+        for i in range(1000):
+            counter.add("HOT" if i % 2 else f"rare-{i}")
+        assert counter.most_common(1)[0][0] == "HOT"
+        assert len(counter.counts) <= 4
+
+
+class TestStreamProfiler:
+    """Test per-column profiles."""
+
+    def test_column_statistics(self) -> None:
+        """Min/max, nulls, lengths and top values are tracked per column."""
+        profiler = StreamProfiler("order_hdr")
+        profiler.observe_many(
+            [
+                {"order_id": "A1", "qty": 3},
+                {"order_id": "B22", "qty": None},
+                {"order_id": "C333", "qty": 7, "note": "late"},
+            ]
+        )
+        qty = profiler.columns["qty"]
+        assert (qty.numeric_min, qty.numeric_max) == (3.0, 7.0)
+        assert qty.nulls == 1
+
+        order_id = profiler.columns["order_id"]
+        assert (order_id.string_min, order_id.string_max) == ("A1", "C333")
+        assert order_id.length_histogram == {2: 2, 3: 1}
+
+        # Column first seen on the last record: two implicit nulls
+        assert profiler.columns["note"].count == 3
+        assert profiler.columns["note"].null_ratio == pytest.approx(2 / 3)
+
+    def test_merge_and_roundtrip(self) -> None:
+        """Profiles serialise to JSON-friendly dicts and merge."""
+        first = StreamProfiler("allocation")
+        first.observe_many(_allocations(100))
+        second = StreamProfiler.from_dict(first.to_dict())
+        second.merge(first)
+
+        status = second.columns["allocation_status"]
+        assert second.records == 200
+        assert status.top_values.most_common() == [("ALLOCATED", 200)]
+        assert isinstance(ColumnProfile.from_dict(status.to_dict()), ColumnProfile)
+
+    def test_validator_feeds_profiler(self) -> None:
+        """DataValidator profiles every record it checks."""
+        validator = DataValidator([ValidationRule("qty", "number")])
+        profiler = validator.enable_profiling("order_dtl")
+        validator.validate_batch([{"qty": 1}, {"qty": 2}])
+        assert profiler.records == 2
+        assert profiler.columns["qty"].numeric_max == 2.0
+
+
+class TestDetectDrift:
+    """Test drift findings against trailing runs."""
+
+    def _profile(self, records: list[dict[str, object]]) -> StreamProfiler:
+        profiler = StreamProfiler("allocation")
+        profiler.observe_many(records)
+        return profiler
+
+    def test_stable_runs_have_no_drift(self) -> None:
+        """Statistically similar runs produce no findings."""
+        history = [self._profile(_allocations(500, seed=s)) for s in range(3)]
+        current = self._profile(_allocations(500, seed=99))
+        assert detect_drift(current, history) == []
+
+    def test_disallowed_status_without_history(self) -> None:
+        """Statuses outside the accepted set are flagged on the first run."""
+        current = self._profile(_allocations(10, status="CANCELLED"))
+        findings = detect_drift(current, [])
+        assert [f.kind for f in findings] == [DriftKind.DISALLOWED_VALUE]
+        assert findings[0].column == "allocation_status"
+        assert "CANCELLED" in findings[0].detail
+
+    def test_shifts_against_baseline(self) -> None:
+        """Null ratio, median, length and column-set changes are reported."""
+        history = [self._profile(_allocations(500, seed=s)) for s in range(3)]
+        records = _allocations(500, seed=7)
+        for i, record in enumerate(records):
+            record["quantity_allocated"] = None if i % 4 == 0 else 500.0
+            record["allocation_id"] = "X" * 40
+            record["wave_id"] = "W1"
+        findings = detect_drift(self._profile(records), history)
+
+        kinds = {(f.column, f.kind) for f in findings}
+        assert ("quantity_allocated", DriftKind.NULL_RATIO_SHIFT) in kinds
+        assert ("quantity_allocated", DriftKind.MEDIAN_SHIFT) in kinds
+        assert ("allocation_id", DriftKind.LENGTH_GROWTH) in kinds
+        assert ("wave_id", DriftKind.NEW_COLUMN) in kinds
+
+    def test_new_category_reported(self) -> None:
+        """A new frequent value in a low-cardinality column is reported."""
+        history = [self._profile(_allocations(100))]
+        records = _allocations(100) + _allocations(50, status="PICKED")
+        findings = detect_drift(self._profile(records), history, allowed_values={})
+        assert [(f.kind, f.detail) for f in findings] == [
+            (DriftKind.NEW_CATEGORY, "new values: PICKED"),
+        ]
@@ -0,0 +1,150 @@
+"""Unit tests for the quarantine store and its CLI handlers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from gruponos_meltano_native.cli.handlers.quarantine import (
+    QuarantineInspectHandler,
+    QuarantineListHandler,
+    QuarantineReplayHandler,
+)
+from gruponos_meltano_native.validators import (
+    DataValidator,
+    GruponosMeltanoQuarantineStore,
+    ValidationErrorCode,
+    ValidationFailure,
+    ValidationRule,
+    create_validator_for_environment,
+)
+
+QTY_RULES = [ValidationRule("qty", "number", {"min_value": 0})]
+
+
+def _failure(field: str = "qty") -> ValidationFailure:
+    return ValidationFailure(field, ValidationErrorCode.BELOW_MIN_VALUE, -1, 0)
+
+
+class TestGruponosMeltanoQuarantineStore:
+    """Test segment, index and replay bookkeeping."""
+
+    def test_put_and_get_roundtrip(self, tmp_path: Path) -> None:
+        """Records and error codes are stored and read back."""
+        with GruponosMeltanoQuarantineStore(tmp_path) as store:
+            first = store.put("order_dtl", {"qty": -1}, [_failure()], run_id="r1")
+            second = store.put("order_dtl", {"qty": -2}, [_failure()])
+            result = store.get("order_dtl", second)
+
+        assert (first, second) == (0, 1)
+        assert result.is_success
+        assert result.value.record == {"qty": -2}
+        assert result.value.error_codes == [int(ValidationErrorCode.BELOW_MIN_VALUE)]
+
+    def test_segments_rotate_and_ids_survive_reopen(self, tmp_path: Path) -> None:
+        """Segments rotate by size and ids continue after reopening."""
+        with GruponosMeltanoQuarantineStore(tmp_path, max_segment_bytes=200) as store:
+            for i in range(20):
+                store.put("allocation", {"allocation_id": str(i)}, [_failure()])
+        with GruponosMeltanoQuarantineStore(tmp_path, max_segment_bytes=200) as store:
+            assert store.put("allocation", {"allocation_id": "x"}, [_failure()]) == 20
+            summary = store.summary("allocation")
+            last = store.get("allocation", 20)
+
+        assert summary["total"] == 21
+        assert summary["segments"] > 1
+        assert last.value.record == {"allocation_id": "x"}
+
+    def test_list_filters_by_error_code(self, tmp_path: Path) -> None:
+        """Index entries can be filtered without reading payloads."""
+        store = GruponosMeltanoQuarantineStore(tmp_path)
+        store.put("s", {}, [ValidationFailure("a", ValidationErrorCode.NOT_STRING)])
+        store.put("s", {}, [_failure()])
+        entries = store.list_entries(
+            "s", error_code=int(ValidationErrorCode.NOT_STRING)
+        )
+        store.close()
+        assert [entry.entry_id for entry in entries] == [0]
+
+    def test_missing_entry(self, tmp_path: Path) -> None:
+        """Unknown ids fail with a FlextResult."""
+        store = GruponosMeltanoQuarantineStore(tmp_path)
+        assert store.get("s", 5).is_failure
+        assert store.get("s", -1).is_failure
+
+    def test_stream_names_cannot_leave_root(self, tmp_path: Path) -> None:
+        """Separators and dot names are replaced in the stream directory."""
+        root = tmp_path / "quarantine"
+        with GruponosMeltanoQuarantineStore(root) as store:
+            for stream in ("../escape", "..", "/abs/path"):
+                store.put(stream, {"qty": -1}, [_failure()])
+            assert store.count("../escape") == 1
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["quarantine"]
+        assert store.streams() == [".._escape", "__", "_abs_path"]
+
+
+class TestDataValidatorPartitionBatch:
+    """Test routing of rejected records to quarantine."""
+
+    def test_strict_mode_does_not_abort_batch(self, tmp_path: Path) -> None:
+        """Strict validators quarantine bad records instead of raising."""
+        validator = create_validator_for_environment("prod")
+        validator.rules = QTY_RULES
+        with GruponosMeltanoQuarantineStore(tmp_path) as store:
+            valid = validator.partition_batch(
+                [{"qty": 1}, {"qty": -1}, {"qty": 2}], store, "order_dtl"
+            )
+            assert store.count("order_dtl") == 1
+        assert valid == [{"qty": 1}, {"qty": 2}]
+        assert validator.strict_mode is True
+
+
+class TestQuarantineHandlers:
+    """Test list, inspect and replay handlers."""
+
+    def test_list_and_inspect(self, tmp_path: Path) -> None:
+        """Handlers summarise streams and show single entries."""
+        store = GruponosMeltanoQuarantineStore(tmp_path)
+        store.put("order_dtl", {"qty": -1}, [_failure()])
+
+        listing = QuarantineListHandler(store).execute()
+        inspect = QuarantineInspectHandler(store).execute("order_dtl", 0)
+        missing = QuarantineInspectHandler(store).execute("order_dtl", 9)
+        store.close()
+
+        assert listing.value[0]["pending"] == 1
+        assert inspect.value["record"] == {"qty": -1}
+        assert missing.is_failure
+
+    def test_replay_sends_fixed_records_once(self, tmp_path: Path) -> None:
+        """Records passing the fixed rules follow the stored SCHEMA, once."""
+        store = GruponosMeltanoQuarantineStore(tmp_path)
+        store.put("order_dtl", {"qty": -1}, [_failure()])
+        store.put("order_dtl", {"qty": "bad"}, [_failure()])
+
+        schema = {"type": "SCHEMA", "stream": "order_dtl", "schema": {}}
+        store.put_schema("order_dtl", schema)
+
+        sent: list[object] = []
+        fixed_rules = [ValidationRule("qty", "number")]
+        handler = QuarantineReplayHandler(
+            store,
+            DataValidator(fixed_rules, strict_mode=True),
+            lambda stream, record: sent.append((stream, record)),
+            sent.append,
+        )
+
+        dry = handler.execute("order_dtl", dry_run=True)
+        first = handler.execute("order_dtl")
+        second = handler.execute("order_dtl")
+        store.close()
+
+        assert dry.value["replayed"] == 1
+        assert first.value == {
+            "stream": "order_dtl",
+            "replayed": 1,
+            "still_failing": 1,
+            "dry_run": False,
+        }
+        assert second.value["replayed"] == 0
+        assert sent == [schema, ("order_dtl", {"qty": -1})]
@@ -0,0 +1,146 @@
+"""Unit tests for the adaptive WMS rate limiter."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+
+from gruponos_meltano_native.core import (
+    GruponosAdaptiveRateLimiter,
+    RateLimitPolicy,
+)
+from gruponos_meltano_native.core.rate_limiter import (
+    AdaptiveBudget,
+    parse_retry_after,
+)
+
+
+class TestParseRetryAfter:
+    """Test ``Retry-After`` header parsing."""
+
+    def test_delta_seconds_and_dates(self) -> None:
+        """Both header forms are supported; garbage and the past are ignored."""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("-5") == 0.0
+        later = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+        assert parse_retry_after(later) == pytest.approx(30, abs=2)
+
+
+class TestAdaptiveBudget:
+    """Test token pacing and the AIMD feedback loop."""
+
+    def test_tokens_pace_requests(self) -> None:
+        """After the burst, requests are spaced by ``1 / rate``."""
+        budget = AdaptiveBudget(
+            "host:wms", RateLimitPolicy(initial_rate=20, burst=2, max_concurrency=8)
+        )
+        started = time.monotonic()
+        for _ in range(6):
+            budget.acquire()
+            budget.release(latency=0.001, status=200)
+        # 2 from the burst, 4 paced at ~20-25 req/s
+        assert time.monotonic() - started >= 0.12
+
+    def test_throttle_decreases_and_pauses(self) -> None:
+        """A 429 halves rate and window; Retry-After blocks the next caller."""
+        policy = RateLimitPolicy(initial_rate=10, initial_concurrency=4)
+        budget = AdaptiveBudget("host:wms", policy)
+        budget.acquire()
+        budget.release(latency=0.01, status=429, retry_after=0.15)
+        assert (budget.rate, budget.limit) == (5.0, 2.0)
+        assert budget.acquire() >= 0.1
+        budget.release(latency=0.01, status=429)
+        # Second signal within the cooldown is the same congestion event
+        assert budget.metrics.decreases == 1
+        assert budget.snapshot()["ceiling_rate"] == 10.0
+
+    def test_healthy_responses_increase(self) -> None:
+        """Successes grow the window; sustained slow responses shrink it."""
+        policy = RateLimitPolicy(
+            initial_rate=40,
+            initial_concurrency=1,
+            burst=50,
+            cooldown_seconds=0,
+            latency_min_samples=10,
+        )
+        budget = AdaptiveBudget("host:wms", policy)
+        for _ in range(10):
+            budget.acquire()
+            budget.release(latency=0.01, status=200)
+        assert budget.limit > 3
+        assert budget.rate > 40
+        grown = budget.rate
+        for _ in range(3):
+            budget.release(latency=1.0, status=200)
+        assert budget.rate < grown
+
+    def test_latency_jitter_is_not_congestion(self) -> None:
+        """Fast responses varying several-fold never lower the budget."""
+        budget = AdaptiveBudget("host:wms", RateLimitPolicy(cooldown_seconds=0))
+        for i in range(500):
+            budget.release(latency=(0.005, 0.02, 0.06)[i % 3], status=200)
+        assert budget.metrics.decreases == 0
+        assert budget.metrics.increases == 500
+
+    def test_baseline_follows_server_after_slowdown(self) -> None:
+        """After a slow episode the new latency becomes the baseline."""
+        policy = RateLimitPolicy(cooldown_seconds=0, latency_window=20)
+        budget = AdaptiveBudget("host:wms", policy)
+        for _ in range(50):
+            budget.release(latency=0.2, status=200)
+        for _ in range(50):
+            budget.release(latency=0.8, status=200)
+        decreases = budget.metrics.decreases
+        assert decreases > 0
+        for _ in range(50):
+            budget.release(latency=0.8, status=200)
+        assert budget.metrics.decreases == decreases
+        assert budget.rate > policy.min_rate
+
+    def test_concurrency_window_blocks(self) -> None:
+        """With a window of 1 a second caller waits for the release."""
+        budget = AdaptiveBudget(
+            "host:wms", RateLimitPolicy(initial_concurrency=1, burst=10)
+        )
+        budget.acquire()
+        waited: list[float] = []
+        thread = threading.Thread(target=lambda: waited.append(budget.acquire()))
+        thread.start()
+        time.sleep(0.1)
+        budget.release(latency=0.1, status=200)
+        thread.join(timeout=2)
+        assert waited[0] >= 0.09
+
+
+class TestGruponosAdaptiveRateLimiter:
+    """Test budget registry and configuration."""
+
+    def test_host_and_facility_budgets(self) -> None:
+        """A request holds its host and facility budgets until released."""
+        limiter = GruponosAdaptiveRateLimiter()
+        permit = limiter.acquire("https://wms.example.com/entity/x/", "FAC1")
+        metrics = limiter.metrics()
+        assert set(metrics) == {"host:wms.example.com", "facility:FAC1"}
+        assert limiter.budget("facility:FAC1").in_flight == 1
+        permit.release(200)
+        permit.release(200)
+        assert limiter.budget("facility:FAC1").in_flight == 0
+        assert limiter.metrics()["host:wms.example.com"]["successes"] == 1
+
+    def test_from_config(self) -> None:
+        """Disabled unless ``adaptive_rate_limit``; caps come from settings."""
+        assert GruponosAdaptiveRateLimiter.from_config({}) is None
+        limiter = GruponosAdaptiveRateLimiter.from_config({
+            "adaptive_rate_limit": "true",
+            "max_requests_per_second": 2,
+            "max_parallel_pages": 3,
+        })
+        assert limiter is not None
+        assert (limiter.policy.max_rate, limiter.policy.initial_rate) == (2.0, 2.0)
+        assert limiter.policy.max_concurrency == 3.0
@@ -0,0 +1,94 @@
+"""Unit tests for cross-stream referential integrity checks."""
+
+from __future__ import annotations
+
+import random
+
+from gruponos_meltano_native.validators import (
+    ForeignKey,
+    ReferentialIntegrityChecker,
+    SortedKeyIndex,
+)
+from gruponos_meltano_native.validators.integrity import key_hash
+
+ORDER_LINES = ForeignKey("order_dtl", "order_id", "order_hdr", "order_id")
+
+
+class TestSortedKeyIndex:
+    """Test the compact sorted hash index."""
+
+    def test_membership_across_compactions(self) -> None:
+        """Keys are found before and after pending keys are merged."""
+        index = SortedKeyIndex()
+        hashes = [key_hash(i) for i in range(200_000)]
+        random.Random(0).shuffle(hashes)
+        for hashed in hashes:
+            index.add(hashed)
+
+        assert all(hashed in index for hashed in hashes[:1000])
+        index.compact()
+        assert all(hashed in index for hashed in hashes[-1000:])
+        assert key_hash("missing") not in index
+
+
+class TestReferentialIntegrityChecker:
+    """Test orphan detection between streams."""
+
+    def test_children_resolved_regardless_of_order(self) -> None:
+        """Children arriving before their parent are not orphans."""
+        checker = ReferentialIntegrityChecker([ORDER_LINES])
+        checker.observe_many("order_dtl", [{"order_id": "O1"}, {"order_id": "O2"}])
+        checker.observe_many("order_hdr", [{"order_id": "O1"}, {"order_id": "O2"}])
+
+        (report,) = checker.finalize()
+        assert report.checked == 2
+        assert report.orphans == 0
+
+    def test_orphans_counted_with_samples(self) -> None:
+        """Unmatched foreign keys are counted and sampled."""
+        checker = ReferentialIntegrityChecker([ORDER_LINES], sample_size=2)
+        checker.observe("order_hdr", {"order_id": "O1"})
+        checker.observe_many(
+            "order_dtl",
+            [
+                {"order_id": "O1"},
+                {"order_id": "X1"},
+                {"order_id": "X1"},
+                {"order_id": "X2"},
+                {"order_id": "X3"},
+                {"order_id": None},
+            ],
+        )
+
+        (report,) = checker.finalize()
+        assert report.orphans == 4
+        assert report.null_references == 1
+        assert report.samples == ["X1", "X2"]
+        assert report.to_dict()["relationship"] == (
+            "order_dtl.order_id -> order_hdr.order_id"
+        )
+
+    def test_unobserved_parent_is_not_reported_as_orphan(self) -> None:
+        """Without parent data, orphans are not counted."""
+        checker = ReferentialIntegrityChecker([ORDER_LINES])
+        checker.observe("order_dtl", {"order_id": "O1"})
+
+        (report,) = checker.finalize()
+        assert report.parent_observed is False
+        assert report.orphans == 0
+
+    def test_preloaded_parent_keys(self) -> None:
+        """Parent keys already in the target resolve incremental children."""
+        checker = ReferentialIntegrityChecker([ORDER_LINES])
+        assert checker.add_parent_keys("order_hdr", "order_id", ["O1", None]) == 1
+        checker.observe_many("order_dtl", [{"order_id": "O1"}, {"order_id": "O9"}])
+
+        (report,) = checker.finalize()
+        assert report.orphans == 1
+
+    def test_default_relationships(self) -> None:
+        """Default relationships cover orders, items and locations."""
+        checker = ReferentialIntegrityChecker()
+        names = {fk.name for fk in checker.relationships}
+        assert "allocation.item_id -> item_master.item_id" in names
+        assert "order_dtl.order_id -> order_hdr.order_id" in names
@@ -0,0 +1,109 @@
+"""Unit tests for row-hash change detection."""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+from gruponos_meltano_native.core import (
+    GruponosRowHashFilter,
+    SingerProxyStage,
+    WmsEntity,
+)
+from gruponos_meltano_native.core.row_hash import canonical_row_hash
+
+_ENTITY = WmsEntity("allocation", ("id",), "mod_ts")
+
+
+def _row(row_id: int, qty: int, mod_ts: str) -> dict[str, object]:
+    return {"id": row_id, "qty": qty, "status": "OPEN", "mod_ts": mod_ts}
+
+
+def _forwarded(
+    row_hashes: GruponosRowHashFilter, rows: list[dict[str, object]]
+) -> list[object]:
+    return [r["id"] for r in rows if row_hashes("allocation", dict(r)) is not None]
+
+
+class TestCanonicalRowHash:
+    """Test the business-field hash."""
+
+    def test_order_and_audit_fields_ignored(self) -> None:
+        """Field order and ignored fields do not change the hash."""
+        ignored = frozenset({"mod_ts"})
+        base = canonical_row_hash(_row(1, 5, "2025-01-01"), ignored)
+        reordered = {"mod_ts": "2025-02-02", "status": "OPEN", "qty": 5, "id": 1}
+        assert canonical_row_hash(reordered, ignored) == base
+        assert canonical_row_hash({**reordered, "_sdc_batched_at": "x"}, ignored) == (
+            base
+        )
+        assert canonical_row_hash(_row(1, 6, "2025-01-01"), ignored) != base
+        assert len(base) == 16
+
+
+class TestGruponosRowHashFilter:
+    """Test skipping unchanged rows across runs."""
+
+    def test_unchanged_rows_skipped_after_commit(self, tmp_path: Path) -> None:
+        """A new mod_ts alone is skipped; changed business fields pass."""
+        path = tmp_path / "row_hashes.sqlite"
+        with GruponosRowHashFilter.for_entities([_ENTITY], path=path) as first:
+            rows = [_row(i, i, "2025-01-01T00:00:00") for i in range(6)]
+            assert _forwarded(first, rows) == list(range(6))
+            first.commit()
+            assert first.stored_count("allocation") == 6
+
+        with GruponosRowHashFilter.for_entities([_ENTITY], path=path) as second:
+            rows = [_row(i, i, "2025-01-01T02:00:00") for i in range(4)]
+            rows += [_row(4, 40, "2025-01-01T02:00:00"), _row(9, 9, "2025-01-01")]
+            assert _forwarded(second, rows) == [4, 9]
+            # A repeat within the run is compared with the pending hash
+            assert _forwarded(second, [_row(4, 40, "2025-01-01T03:00:00")]) == []
+            assert second("location", {"id": 1}) == {"id": 1}
+            report = second.stats.as_dict()
+            assert report["streams"] == {
+                "allocation": {
+                    "new": 1,
+                    "changed": 1,
+                    "unchanged": 5,
+                    "skip_ratio": round(5 / 7, 4),
+                }
+            }
+
+    def test_uncommitted_and_reset(self, tmp_path: Path) -> None:
+        """Without commit nothing is stored; reset forces a full reload."""
+        path = tmp_path / "row_hashes.sqlite"
+        rows = [_row(i, i, "2025-01-01") for i in range(3)]
+        with GruponosRowHashFilter.for_entities([_ENTITY], path=path) as failed:
+            _forwarded(failed, rows)
+        with GruponosRowHashFilter.for_entities([_ENTITY], path=path) as retry:
+            assert _forwarded(retry, rows) == [0, 1, 2]
+            retry.commit()
+            assert _forwarded(retry, rows) == []
+            retry.reset("allocation")
+            assert _forwarded(retry, rows) == [0, 1, 2]
+
+    def test_as_proxy_stage_transform(self, tmp_path: Path) -> None:
+        """In the proxy stage unchanged records never reach the target."""
+        lines = [
+            {"type": "SCHEMA", "stream": "allocation", "schema": {}},
+            *(
+                {"type": "RECORD", "stream": "allocation", "record": _row(i, 1, "t")}
+                for i in range(3)
+            ),
+            {"type": "STATE", "value": {"bookmarks": {}}},
+        ]
+        source = b"".join(json.dumps(line).encode() + b"\n" for line in lines)
+        path = tmp_path / "row_hashes.sqlite"
+        outputs = []
+        for _ in range(2):
+            with GruponosRowHashFilter.for_entities([_ENTITY], path=path) as hashes:
+                sink = io.BytesIO()
+                result = SingerProxyStage(transform=hashes).run(
+                    io.BytesIO(source), sink
+                )
+                assert result.is_success
+                hashes.commit()
+            outputs.append(sink.getvalue().count(b'"RECORD"'))
+        assert outputs == [3, 0]
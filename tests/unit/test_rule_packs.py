@@ -0,0 +1,138 @@
+"""Unit tests for declarative YAML rule packs."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from gruponos_meltano_native.validators import (
+    FieldCondition,
+    FieldPredicate,
+    RulePackError,
+    RulePackLoader,
+    ValidationErrorCode,
+    compile_rule_pack,
+)
+
+REPO_PACKS = Path(__file__).parents[2] / "config" / "validation"
+
+PACK = """
+entity: widget
+enums:
+  colours: [RED, BLUE]
+fields:
+  widget_id: {required: true, type: string, max_length: 5}
+  colour: {type: enum, values: $colours}
+  qty: {type: number, min_value: 0}
+conditions:
+  - name: blue_needs_qty
+    when: {field: colour, op: eq, value: BLUE}
+    then: {field: qty, op: gt, value: 0}
+"""
+
+
+def _write(directory: Path, text: str, name: str = "widget") -> Path:
+    path = directory / f"{name}.yml"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestCompileRulePack:
+    """Test compilation of pack specifications."""
+
+    def test_enum_reference_and_conditions(self, tmp_path: Path) -> None:
+        """Enum sets resolve and conditions report structured failures."""
+        _write(tmp_path, PACK)
+        result = RulePackLoader(tmp_path).build_validator("widget")
+        assert result.is_success
+        validator = result.value
+
+        assert validator.check({"widget_id": "w1", "colour": "RED", "qty": 0}) == []
+        codes = {
+            failure.code
+            for failure in validator.check(
+                {"widget_id": "too-long", "colour": "BLUE", "qty": 0}
+            )
+        }
+        assert codes == {
+            ValidationErrorCode.MAX_LENGTH_EXCEEDED,
+            ValidationErrorCode.CONDITION_FAILED,
+        }
+
+    def test_invalid_specs(self) -> None:
+        """Unknown types, operators and enum references are rejected."""
+        with pytest.raises(RulePackError):
+            compile_rule_pack({"fields": {"a": {"type": "blob"}}}, "d", "e")
+        with pytest.raises(RulePackError):
+            compile_rule_pack(
+                {"fields": {"a": {"type": "enum", "values": "$x"}}}, "d", "e"
+            )
+        with pytest.raises(RulePackError):
+            compile_rule_pack(
+                {"conditions": [{"then": {"field": "a", "op": "like"}}]}, "d", "e"
+            )
+
+    def test_condition_skips_null_operands(self) -> None:
+        """Comparisons with missing operands do not fail the record."""
+        predicate = FieldPredicate("end", "ge", other="start")
+        condition = FieldCondition("ordered", predicate)
+        assert not condition.violated({"end": "2025-01-01"})
+        assert condition.violated({"end": "2025-01-01", "start": "2025-02-01"})
+
+
+class TestRulePackLoader:
+    """Test caching and hot reload."""
+
+    def test_plans_are_cached_by_content(self, tmp_path: Path) -> None:
+        """Identical files share one compiled plan."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        _write(tmp_path / "a", PACK)
+        _write(tmp_path / "b", PACK)
+        first = RulePackLoader(tmp_path / "a").load("widget").value
+        second = RulePackLoader(tmp_path / "b").load("widget").value
+        assert first is second
+
+    def test_reload_if_changed(self, tmp_path: Path) -> None:
+        """Modified packs are recompiled; broken edits keep the old plan."""
+        path = _write(tmp_path, PACK)
+        loader = RulePackLoader(tmp_path)
+        original = loader.load("widget").value
+        assert loader.reload_if_changed() == []
+
+        path.write_text(PACK.replace("max_length: 5", "max_length: 9"), "utf-8")
+        os.utime(path, ns=(1, 1))
+        assert loader.reload_if_changed() == ["widget"]
+        assert loader.load("widget").value.digest != original.digest
+
+        path.write_text("fields: [", "utf-8")
+        os.utime(path, ns=(2, 2))
+        assert loader.reload_if_changed() == []
+        assert loader.load("widget").is_success
+
+    def test_missing_pack(self, tmp_path: Path) -> None:
+        """Unknown entities fail with a FlextResult."""
+        assert RulePackLoader(tmp_path).load("nope").is_failure
+
+    def test_repository_packs_compile(self) -> None:
+        """Shipped packs compile and accept a valid allocation."""
+        plans = RulePackLoader(REPO_PACKS).load_all()
+        assert plans.is_success
+        assert {"allocation", "order_dtl", "order_hdr"} <= set(plans.value)
+
+        validator = plans.value["allocation"].build_validator()
+        record = {
+            "allocation_id": "A1",
+            "order_id": "O1",
+            "item_id": "I1",
+            "location_id": "L1",
+            "quantity_allocated": 0,
+            "allocation_status": "PICKED",
+            "created_date": "2025-01-01T08:00:00",
+            "last_updated": "2025-01-02T08:00:00",
+        }
+        failures = validator.check(record)
+        assert [f.code for f in failures] == [ValidationErrorCode.CONDITION_FAILED]
+        assert validator.check({**record, "quantity_allocated": 3}) == []
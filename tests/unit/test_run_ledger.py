@@ -0,0 +1,114 @@
+"""Unit tests for the run ledger."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from gruponos_meltano_native.core import SchemaChange, SchemaChangeKind
+from gruponos_meltano_native.monitoring import GruponosMeltanoRunLedger
+from gruponos_meltano_native.monitoring.run_ledger import (
+    KIND_DRIFT,
+    KIND_INTEGRITY,
+    KIND_PROFILE,
+    KIND_SCHEMA_CHANGE,
+)
+from gruponos_meltano_native.validators import (
+    ForeignKey,
+    ReferentialIntegrityChecker,
+    StreamProfiler,
+)
+
+
+def _profile(status: str, count: int = 20) -> StreamProfiler:
+    profiler = StreamProfiler("allocation")
+    profiler.observe_many(
+        {"allocation_id": str(i), "allocation_status": status} for i in range(count)
+    )
+    return profiler
+
+
+class TestGruponosMeltanoRunLedger:
+    """Test JSON lines ledger persistence and drift recording."""
+
+    def test_append_and_filter(self, tmp_path: Path) -> None:
+        """Entries are appended and filtered by kind and stream."""
+        ledger = GruponosMeltanoRunLedger(tmp_path / "ledger.jsonl")
+        for run in range(5):
+            ledger.append("custom", {"n": run}, run_id=f"r{run}", stream="s1")
+        ledger.append("other", {}, run_id="r9")
+
+        assert len(ledger.entries()) == 6
+        assert [e["payload"]["n"] for e in ledger.entries(kind="custom", limit=2)] == [
+            3,
+            4,
+        ]
+        assert ledger.trailing_payloads("custom", runs=2, exclude_run_id="r4") == [
+            {"n": 2},
+            {"n": 3},
+        ]
+
+    def test_trailing_payloads_read_from_the_end(self, tmp_path: Path) -> None:
+        """Tail reads span blocks and stop once enough runs are found."""
+        path = tmp_path / "ledger.jsonl"
+        ledger = GruponosMeltanoRunLedger(path)
+        for run in range(400):
+            ledger.append(
+                "custom", {"n": run, "pad": "x" * 500}, run_id=f"r{run}", stream="s1"
+            )
+        with path.open("a", encoding="utf-8") as fh:
+            fh.write('{"run_id": "broken"\n')
+        ledger.append("other", {}, run_id="r9")
+
+        payloads = ledger.trailing_payloads("custom", runs=3, stream="s1")
+        assert [p["n"] for p in payloads] == [397, 398, 399]
+        payloads = ledger.trailing_payloads("custom", runs=500)
+        assert [p["n"] for p in payloads] == list(range(400))
+
+    def test_corrupt_lines_are_skipped(self, tmp_path: Path) -> None:
+        """A truncated line does not break reads."""
+        path = tmp_path / "ledger.jsonl"
+        ledger = GruponosMeltanoRunLedger(path)
+        ledger.append("custom", {}, run_id="r1")
+        with path.open("a", encoding="utf-8") as fh:
+            fh.write('{"run_id": "broken"\n')
+        assert len(ledger.entries()) == 1
+
+    def test_record_profile_detects_drift(self, tmp_path: Path) -> None:
+        """Profiles are stored and compared with trailing runs."""
+        ledger = GruponosMeltanoRunLedger(tmp_path / "ledger.jsonl")
+        for run in range(3):
+            result = ledger.record_profile(_profile("ALLOCATED"), run_id=f"r{run}")
+            assert result.is_success
+            assert result.value == []
+
+        result = ledger.record_profile(_profile("LOST"), run_id="r3")
+        assert result.is_success
+        kinds = {finding.kind for finding in result.value}
+        assert "disallowed_value" in kinds
+        assert "new_category" in kinds
+        assert len(ledger.entries(kind=KIND_PROFILE)) == 4
+        assert len(ledger.entries(kind=KIND_DRIFT)) == 1
+
+    def test_record_integrity(self, tmp_path: Path) -> None:
+        """Orphan reports are stored with a run total."""
+        ledger = GruponosMeltanoRunLedger(tmp_path / "ledger.jsonl")
+        checker = ReferentialIntegrityChecker(
+            [ForeignKey("order_dtl", "order_id", "order_hdr", "order_id")]
+        )
+        checker.observe("order_hdr", {"order_id": "O1"})
+        checker.observe("order_dtl", {"order_id": "O2"})
+
+        result = ledger.record_integrity(checker.finalize(), run_id="r1")
+        assert result.is_success
+        (entry,) = ledger.entries(kind=KIND_INTEGRITY)
+        assert entry["payload"]["total_orphans"] == 1
+
+    def test_record_schema_changes(self, tmp_path: Path) -> None:
+        """Catalog diffs are stored per extractor."""
+        ledger = GruponosMeltanoRunLedger(tmp_path / "ledger.jsonl")
+        change = SchemaChange(
+            SchemaChangeKind.TYPE_CHANGED, "order_dtl", "qty", "integer", "number"
+        )
+        ledger.record_schema_changes([change], run_id="r1", job_name="tap-wms")
+        (entry,) = ledger.entries(kind=KIND_SCHEMA_CHANGE, job_name="tap-wms")
+        assert entry["payload"]["changes"][0]["kind"] == "type_changed"
@@ -0,0 +1,134 @@
+"""Unit tests for the shadow full sync strategy."""
+
+import unittest.mock
+from pathlib import Path
+
+import pytest
+from flext_core import FlextResult
+
+from gruponos_meltano_native.core import WmsEntity
+from gruponos_meltano_native.core.run_context import (
+    GruponosRunContext,
+    PipelineResult,
+)
+from gruponos_meltano_native.core.shadow_run import GruponosShadowRun
+
+
+def _run(
+    api: unittest.mock.MagicMock,
+    swap: unittest.mock.MagicMock,
+    project_root: Path,
+    row_hashes: unittest.mock.MagicMock | None = None,
+) -> tuple[FlextResult[PipelineResult], unittest.mock.MagicMock, str | None]:
+    """Run the strategy on ``api`` and ``swap`` with a stubbed native load.
+
+    Returns the result, the native stub and the live table given to the swap.
+    """
+    context = GruponosRunContext(
+        unittest.mock.MagicMock(
+            oracle_schema="WMS", meltano_project_root=str(project_root)
+        ),
+        environment=dict,
+        validate_job_name=str,
+        finish=unittest.mock.MagicMock(),
+    )
+    native = unittest.mock.MagicMock()
+    native.run.return_value = FlextResult.ok(
+        unittest.mock.MagicMock(records_extracted=1, records_loaded=1)
+    )
+    connections = unittest.mock.MagicMock()
+    connections.get_connection.return_value = FlextResult.ok(api)
+    with (
+        unittest.mock.patch(
+            "gruponos_meltano_native.core.run_context."
+            "create_gruponos_meltano_oracle_connection_manager",
+            return_value=connections,
+        ),
+        unittest.mock.patch(
+            "gruponos_meltano_native.core.shadow_run."
+            "GruponosMeltanoOracleShadowSwap",
+            return_value=swap,
+        ) as swap_class,
+    ):
+        result = GruponosShadowRun(context, native).run(
+            [WmsEntity("allocation")], row_hashes=row_hashes
+        )
+    table = swap_class.call_args.kwargs["table"] if swap_class.called else None
+    return result, native, table
+
+
+class TestShadowRun:
+    """Test loading and cleanup of the shadow full sync."""
+
+    def test_shadow_is_loaded_and_swapped(self, tmp_path: Path) -> None:
+        """The native load targets the shadow table, then the swap runs."""
+        api = unittest.mock.MagicMock()
+        api.connect.return_value = FlextResult.ok(api)
+        swap = unittest.mock.MagicMock()
+        swap.prepare.return_value = FlextResult.ok("ALLOCATION_SHD")
+        swap.finalize.return_value = FlextResult.ok(unittest.mock.MagicMock())
+        row_hashes = unittest.mock.MagicMock()
+
+        result, native, table = _run(api, swap, tmp_path, row_hashes)
+
+        assert result.is_success, result.error
+        assert result.value.records_loaded == 1
+        (loader, entities), kwargs = native.run.call_args
+        assert loader == "target-oracle-full"
+        assert entities[0].stream == "allocation_shd"
+        assert kwargs["state"] == {}
+        assert "row_hashes" not in kwargs
+        assert table == "allocation"
+        row_hashes.reset.assert_called_once_with("allocation")
+        api.disconnect.assert_called_once()
+
+    def test_declared_target_table_is_swapped(self, tmp_path: Path) -> None:
+        """The table comes from ``target_table_name`` like the indexed load's."""
+        config = tmp_path / "config" / "wms_integration.yml"
+        config.parent.mkdir()
+        config.write_text(
+            "entities:\n  allocation:\n    target_table_name: WMS_ALLOCATION\n",
+            encoding="utf-8",
+        )
+        api = unittest.mock.MagicMock()
+        api.connect.return_value = FlextResult.ok(api)
+        swap = unittest.mock.MagicMock()
+        swap.prepare.return_value = FlextResult.ok("WMS_ALLOCATION_SHD")
+        swap.finalize.return_value = FlextResult.ok(unittest.mock.MagicMock())
+
+        result, native, table = _run(api, swap, tmp_path)
+
+        assert result.is_success, result.error
+        assert table == "WMS_ALLOCATION"
+        (_, entities), _ = native.run.call_args
+        assert entities[0].stream == "wms_allocation_shd"
+
+    @pytest.mark.parametrize(
+        ("failed_step", "discarded"), [("statistics", True), ("swap", False)]
+    )
+    def test_failed_finalize_discards_shadow_before_swap(
+        self, failed_step: str, discarded: bool, tmp_path: Path
+    ) -> None:
+        """The shadow is dropped only while the live table is untouched."""
+        api = unittest.mock.MagicMock()
+        api.connect.return_value = FlextResult.ok(api)
+        swap = unittest.mock.MagicMock(failed_step=failed_step)
+        swap.prepare.return_value = FlextResult.ok("ALLOCATION_SHD")
+        swap.finalize.return_value = FlextResult.fail(f"failed at {failed_step}")
+
+        result, _, _ = _run(api, swap, tmp_path)
+
+        assert result.is_failure
+        assert swap.discard.called is discarded
+        api.disconnect.assert_called_once()
+
+    def test_connect_failure_is_reported(self, tmp_path: Path) -> None:
+        """A refused connection fails the run before any shadow is created."""
+        api = unittest.mock.MagicMock()
+        api.connect.return_value = FlextResult.fail("ORA-12541: no listener")
+        swap = unittest.mock.MagicMock()
+
+        result, _, _ = _run(api, swap, tmp_path)
+
+        assert "ORA-12541" in (result.error or "")
+        swap.prepare.assert_not_called()
@@ -0,0 +1,142 @@
+"""Unit tests for the shadow-table full load with atomic swap."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import pytest
+from flext_core import FlextResult
+
+from gruponos_meltano_native.oracle.shadow_swap import (
+    GruponosMeltanoOracleShadowSwap,
+    SwapMethod,
+)
+
+
+@dataclass
+class _QueryResult:
+    rows: list[tuple[object, ...]]
+
+
+@dataclass
+class _RecordingApi:
+    """Oracle API double answering dictionary queries and recording DDL."""
+
+    tables: set[str] = field(default_factory=lambda: {"ALLOCATION"})
+    failing: str | None = None
+    ddl: list[str] = field(default_factory=list)
+
+    def query(self, sql: str) -> FlextResult[_QueryResult]:
+        if "FROM all_tables" in sql:
+            name = sql.rsplit("table_name = '", 1)[1].split("'")[0]
+            return FlextResult[_QueryResult].ok(
+                _QueryResult([(1 if name in self.tables else 0,)])
+            )
+        if "FROM all_indexes" in sql:
+            return FlextResult[_QueryResult].ok(
+                _QueryResult([
+                    ("ALLOCATION_PK", "UNIQUE", "ID"),
+                    ("ALLOCATION_IX1", "NONUNIQUE", "ORDER_ID"),
+                    ("ALLOCATION_IX1", "NONUNIQUE", "MOD_TS"),
+                ])
+            )
+        if "constraint_type IN" in sql:
+            return FlextResult[_QueryResult].ok(
+                _QueryResult([("ALLOCATION_PK", "ALLOCATION_PK", "P")])
+            )
+        if "FROM all_tab_privs" in sql:
+            return FlextResult[_QueryResult].ok(
+                _QueryResult([("REPORTING", "SELECT")])
+            )
+        return FlextResult[_QueryResult].ok(_QueryResult([(0,)]))
+
+    def execute_ddl(self, sql: str) -> FlextResult[bool]:
+        self.ddl.append(sql)
+        if self.failing and self.failing in sql:
+            return FlextResult[bool].fail("ORA-01652: unable to extend temp segment")
+        return FlextResult[bool].ok(value=True)
+
+
+class TestGruponosMeltanoOracleShadowSwap:
+    """Test shadow preparation, index rebuild and swap."""
+
+    def test_prepare_creates_bare_nologging_shadow(self) -> None:
+        """The shadow copies the columns only and skips logging."""
+        api = _RecordingApi()
+        swap = GruponosMeltanoOracleShadowSwap(api, schema="wms", table="allocation")
+        assert swap.prepare().value == "ALLOCATION_SHD"
+        assert api.ddl == [
+            "CREATE TABLE WMS.ALLOCATION_SHD NOLOGGING "
+            "AS SELECT * FROM WMS.ALLOCATION WHERE 1 = 0"
+        ]
+
+    def test_finalize_rename_swap(self) -> None:
+        """Indexes are built in parallel, stats gathered, names restored."""
+        api = _RecordingApi()
+        swap = GruponosMeltanoOracleShadowSwap(
+            api, schema="WMS", table="ALLOCATION", parallel_degree=8
+        )
+        swap.prepare()
+        report = swap.finalize()
+        assert report.is_success
+        ddl = api.ddl
+        assert (
+            "CREATE UNIQUE INDEX WMS.ALLOCATION_PK_SHD ON WMS.ALLOCATION_SHD "
+            "(ID) NOLOGGING PARALLEL 8"
+        ) in ddl
+        assert any("(ORDER_ID, MOD_TS)" in sql for sql in ddl)
+        assert any("PRIMARY KEY (ID) USING INDEX" in sql for sql in ddl)
+        gather = next(i for i, sql in enumerate(ddl) if "GATHER_TABLE_STATS" in sql)
+        swap_at = next(i for i, sql in enumerate(ddl) if "EXECUTE IMMEDIATE" in sql)
+        assert gather < swap_at
+        assert "RENAME TO ALLOCATION_OLD" in ddl[swap_at]
+        assert "ALTER INDEX WMS.ALLOCATION_PK_SHD RENAME TO ALLOCATION_PK" in ddl
+        assert ddl[-1] == "GRANT SELECT ON WMS.ALLOCATION TO REPORTING"
+        assert report.value.indexes_built == ["ALLOCATION_PK", "ALLOCATION_IX1"]
+        assert report.value.previous_table == "ALLOCATION_OLD"
+
+    def test_failed_index_build_leaves_live_table(self) -> None:
+        """A failure before the swap never renames the live table."""
+        api = _RecordingApi(failing="CREATE INDEX")
+        swap = GruponosMeltanoOracleShadowSwap(api, schema="WMS", table="ALLOCATION")
+        swap.prepare()
+        result = swap.finalize()
+        assert result.is_failure
+        assert "failed at indexes" in (result.error or "")
+        assert not any("RENAME" in sql for sql in api.ddl)
+        assert swap.failed_step == "indexes"
+
+    def test_partition_exchange(self) -> None:
+        """Exchange swaps the partition and keeps the old rows aside."""
+        api = _RecordingApi()
+        swap = GruponosMeltanoOracleShadowSwap(
+            api,
+            schema="WMS",
+            table="ALLOCATION",
+            method=SwapMethod.EXCHANGE,
+            partition="p_all",
+        )
+        swap.prepare()
+        assert swap.finalize().is_success
+        assert (
+            "ALTER TABLE WMS.ALLOCATION EXCHANGE PARTITION P_ALL WITH TABLE "
+            "WMS.ALLOCATION_SHD INCLUDING INDEXES WITHOUT VALIDATION "
+            "UPDATE GLOBAL INDEXES"
+        ) in api.ddl
+        assert "ALTER INDEX WMS.ALLOCATION_PK_SHD RENAME TO ALLOCATION_PK_OLD" in (
+            api.ddl
+        )
+
+    @pytest.mark.parametrize(
+        ("table", "partition"), [("ALLOC; DROP", None), ("ALLOCATION", None)]
+    )
+    def test_invalid_arguments(self, table: str, partition: str | None) -> None:
+        """Unsafe identifiers and exchange without partition are rejected."""
+        with pytest.raises(ValueError, match="Invalid|partition"):
+            GruponosMeltanoOracleShadowSwap(
+                _RecordingApi(),
+                schema="WMS",
+                table=table,
+                method=SwapMethod.EXCHANGE,
+                partition=partition,
+            )
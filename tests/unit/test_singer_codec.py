@@ -0,0 +1,131 @@
+"""Unit tests and throughput benchmarks for the Singer codec."""
+
+from __future__ import annotations
+
+import io
+import json
+import time
+
+import pytest
+
+from gruponos_meltano_native.core import (
+    SingerCodec,
+    SingerLineSplitter,
+    SingerMessage,
+    SingerMessageType,
+)
+
+
+def _stream(records: int) -> bytes:
+    lines = [
+        json.dumps({"type": "SCHEMA", "stream": "allocation", "schema": {}}),
+        *(
+            json.dumps({
+                "type": "RECORD",
+                "stream": "allocation",
+                "record": {"allocation_id": str(i), "quantity_allocated": i},
+            })
+            for i in range(records)
+        ),
+        json.dumps({"type": "STATE", "value": {"bookmarks": {}}}),
+    ]
+    return ("\n".join(lines) + "\n").encode()
+
+
+class TestSingerLineSplitter:
+    """Test buffer reuse, growth and compaction."""
+
+    def test_lines_longer_than_buffer(self) -> None:
+        """Lines spanning several reads and a missing final newline work."""
+        data = b"a\n\n" + b"x" * 50 + b"\nbc\nlast"
+        splitter = SingerLineSplitter(read_size=8)
+        lines = [bytes(line) for line in splitter.iter_lines(io.BytesIO(data))]
+        assert lines == [b"a", b"x" * 50, b"bc", b"last"]
+        assert splitter.bytes_read == len(data)
+
+
+class TestSingerCodec:
+    """Test decoding, pass-through and re-encoding."""
+
+    def test_roundtrip_is_byte_identical(self) -> None:
+        """Unmodified messages are written back with their original bytes."""
+        data = _stream(10)
+        codec = SingerCodec(read_size=64)
+        sink = io.BytesIO()
+        codec.write(sink, codec.iter_messages(io.BytesIO(data)))
+
+        assert sink.getvalue() == data
+        assert codec.stats.passthrough == 12
+        assert codec.stats.reencoded == 0
+
+    def test_only_modified_records_are_reencoded(self) -> None:
+        """set_record triggers re-encoding for that message only."""
+        codec = SingerCodec()
+        messages = list(codec.iter_messages(io.BytesIO(_stream(3))))
+        records = [m for m in messages if m.type == SingerMessageType.RECORD]
+        records[1].set_record({"allocation_id": "1", "quantity_allocated": 99})
+
+        output = b"".join(codec.encode(m) for m in messages).splitlines()
+        assert json.loads(output[2])["record"]["quantity_allocated"] == 99
+        assert codec.stats.reencoded == 1
+        assert records[0].stream == "allocation"
+
+    def test_invalid_lines(self) -> None:
+        """Bad lines raise by default and are counted when skipped."""
+        data = b'{"type": "STATE", "value": {}}\nnot json\n[1]\n'
+        with pytest.raises(ValueError, match="Invalid Singer message"):
+            list(SingerCodec().iter_messages(io.BytesIO(data)))
+
+        codec = SingerCodec()
+        messages = list(codec.iter_messages(io.BytesIO(data), skip_invalid=True))
+        assert [m.type for m in messages] == ["STATE"]
+        assert codec.stats.decode_errors == 2
+
+    def test_new_record_message(self) -> None:
+        """Messages built in-process are always encoded."""
+        message = SingerMessage.record_message("order_hdr", {"order_id": "O1"})
+        assert json.loads(message.encode()) == {
+            "type": "RECORD",
+            "stream": "order_hdr",
+            "record": {"order_id": "O1"},
+        }
+
+
+@pytest.mark.performance
+class TestSingerCodecThroughput:
+    """Throughput benchmarks."""
+
+    RECORDS = 50_000
+
+    def test_decode_and_passthrough_throughput(self) -> None:
+        """Decoding plus pass-through encoding of a tap-sized stream."""
+        data = _stream(self.RECORDS)
+        codec = SingerCodec()
+        sink = io.BytesIO()
+
+        started = time.perf_counter()
+        codec.write(sink, codec.iter_messages(io.BytesIO(data)))
+        elapsed = time.perf_counter() - started
+
+        assert codec.stats.passthrough == self.RECORDS + 2
+        assert sink.getvalue() == data
+        # Conservative floor, well below the stdlib backend on slow CI hosts
+        assert self.RECORDS / elapsed > 20_000
+
+    def test_passthrough_beats_full_reencode(self) -> None:
+        """Skipping re-encoding of untouched records saves time."""
+        data = _stream(self.RECORDS)
+        messages = list(SingerCodec().iter_messages(io.BytesIO(data)))
+
+        started = time.perf_counter()
+        passthrough = b"".join(m.encode() for m in messages)
+        passthrough_elapsed = time.perf_counter() - started
+
+        for message in messages:
+            message.mark_modified()
+        started = time.perf_counter()
+        reencoded = b"".join(m.encode() for m in messages)
+        reencode_elapsed = time.perf_counter() - started
+
+        assert len(passthrough.splitlines()) == len(reencoded.splitlines())
+        assert passthrough_elapsed < reencode_elapsed
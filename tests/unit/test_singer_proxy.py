@@ -0,0 +1,198 @@
+"""Unit tests for the inline Singer proxy stage."""
+
+from __future__ import annotations
+
+import io
+import json
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from gruponos_meltano_native.core import SingerProxyStage
+from gruponos_meltano_native.validators import (
+    DataQualityAccumulator,
+    DataValidator,
+    DuplicateKeyDetector,
+    GruponosMeltanoQuarantineStore,
+    ValidationRule,
+)
+
+SCHEMA = {
+    "type": "SCHEMA",
+    "stream": "order_dtl",
+    "schema": {
+        "properties": {
+            "order_id": {"type": "string"},
+            "qty": {"type": ["null", "integer"]},
+        }
+    },
+    "key_properties": ["order_id"],
+}
+
+
+def _lines(*messages: dict[str, object]) -> bytes:
+    return b"".join(json.dumps(m).encode() + b"\n" for m in messages)
+
+
+def _record(order_id: str, qty: object) -> dict[str, object]:
+    record = {"order_id": order_id, "qty": qty}
+    return {"type": "RECORD", "stream": "order_dtl", "record": record}
+
+
+def _validator() -> DataValidator:
+    return DataValidator([ValidationRule("qty", "number", {"min_value": 0})])
+
+
+class TestSingerProxyStage:
+    """Test ordering, conversion and quarantine routing."""
+
+    def test_state_passes_through_in_order(self) -> None:
+        """STATE lines keep their bytes and position relative to records."""
+        state = {"type": "STATE", "value": {"bookmarks": {"order_dtl": "x"}}}
+        data = _lines(SCHEMA, _record("1", 1), state, _record("2", 2), state)
+        sink = io.BytesIO()
+
+        result = SingerProxyStage({"order_dtl": _validator()}, batch_size=100).run(
+            io.BytesIO(data), sink
+        )
+
+        assert result.is_success
+        assert sink.getvalue() == data
+        assert result.value.state_messages == 2
+        assert result.value.batches == 2
+
+    def test_conversions_and_quarantine(self, tmp_path: Path) -> None:
+        """Converted records are re-encoded; invalid ones are quarantined.
+
+        The stream's SCHEMA is stored with them, for the replay.
+        """
+        data = _lines(SCHEMA, _record("1", "5"), _record("2", -1), _record("3", 7))
+        sink = io.BytesIO()
+        quality = DataQualityAccumulator(required_fields=("order_id",))
+        with GruponosMeltanoQuarantineStore(tmp_path) as store:
+            stage = SingerProxyStage(
+                {"order_dtl": _validator()},
+                quarantine=store,
+                quality={"order_dtl": quality},
+            )
+            result = stage.run(io.BytesIO(data), sink)
+            quarantined = store.count("order_dtl")
+
+        records = [json.loads(line) for line in sink.getvalue().splitlines()][1:]
+        assert [r["record"] for r in records] == [
+            {"order_id": "1", "qty": 5},
+            {"order_id": "3", "qty": 7},
+        ]
+        assert quarantined == 1
+        assert GruponosMeltanoQuarantineStore(tmp_path).schema("order_dtl") == SCHEMA
+        assert result.value.records_converted == 1
+        assert result.value.records_quarantined == 1
+        assert quality.records_observed == 3
+
+    def test_transform_can_drop_records(self) -> None:
+        """A transform returning None removes the record from the flow."""
+        data = _lines(_record("1", 1), _record("2", 2))
+        sink = io.BytesIO()
+        stage = SingerProxyStage(
+            transform=lambda _, record: None if record["order_id"] == "1" else record
+        )
+        result = stage.run(io.BytesIO(data), sink)
+        assert result.value.records_dropped == 1
+        assert json.loads(sink.getvalue())["record"]["order_id"] == "2"
+
+    def test_with_transforms_leaves_stage_unchanged(self) -> None:
+        """Extra transforms run first, in a copy with its own counters."""
+        data = _lines(_record("1", 1), _record("2", 2), _record("3", 3))
+        stage = SingerProxyStage(
+            transform=lambda _, record: None if record["order_id"] == "3" else record
+        )
+        copy = stage.with_transforms(
+            lambda _, record: None if record["order_id"] == "1" else record
+        )
+        result = copy.run(io.BytesIO(data), io.BytesIO())
+        assert result.value.records_dropped == 2
+        assert stage.stats.records == 0
+        assert stage.with_transforms(None).transform is stage.transform
+
+    def test_change_filters_only_see_forwarded_records(
+        self, tmp_path: Path
+    ) -> None:
+        """Quarantined records never reach a change filter."""
+        data = _lines(SCHEMA, _record("1", 1), _record("2", -1), _record("3", 3))
+        seen: list[str] = []
+
+        def remember(_: str, record: dict[str, object]) -> dict[str, object] | None:
+            seen.append(str(record["order_id"]))
+            return None if record["order_id"] == "3" else record
+
+        with GruponosMeltanoQuarantineStore(tmp_path) as store:
+            stage = SingerProxyStage({"order_dtl": _validator()}, quarantine=store)
+            result = stage.with_change_filters(remember).run(
+                io.BytesIO(data), io.BytesIO()
+            )
+
+        assert seen == ["1", "3"]
+        assert result.value.records_quarantined == 1
+        assert result.value.records_dropped == 1
+        assert result.value.records_forwarded == 1
+        assert stage.change_filter is None
+
+    def test_repeated_keys_are_quarantined(self, tmp_path: Path) -> None:
+        """Valid records register their key; a repeat goes to quarantine."""
+        data = _lines(SCHEMA, _record("1", 1), _record("1", -1), _record("1", 2))
+        validator = _validator()
+        detector = validator.enable_duplicate_detection(
+            DuplicateKeyDetector("order_dtl", ["order_id"], spill_dir=tmp_path)
+        )
+        with GruponosMeltanoQuarantineStore(tmp_path / "q") as store:
+            stage = SingerProxyStage({"order_dtl": validator}, quarantine=store)
+            result = stage.run(io.BytesIO(data), io.BytesIO())
+        detector.close()
+
+        assert result.value.records_quarantined == 2
+        assert result.value.records_forwarded == 1
+        assert detector.records_seen == 2
+
+    def test_buffering_is_bounded(self) -> None:
+        """No more than max_pending_batches wait between the threads."""
+        data = _lines(*(_record(str(i), i) for i in range(2_000)))
+        stage = SingerProxyStage(batch_size=10, max_pending_batches=2)
+        result = stage.run(io.BytesIO(data), io.BytesIO())
+        assert result.value.max_pending_batches <= 2
+        assert result.value.records_forwarded == 2_000
+
+    def test_invalid_input_fails(self) -> None:
+        """Undecodable lines fail the run with a FlextResult."""
+        result = SingerProxyStage().run(io.BytesIO(b"garbage\n"), io.BytesIO())
+        assert result.is_failure
+        assert "Singer proxy read failed" in (result.error or "")
+
+
+@pytest.mark.performance
+class TestSingerProxyOverhead:
+    """Overhead of the proxy compared with a bare byte copy."""
+
+    RECORDS = 50_000
+
+    def test_overhead_versus_bare_pipe(self) -> None:
+        """Validation-free proxying stays cheap per record."""
+        data = _lines(SCHEMA, *(_record(str(i), i) for i in range(self.RECORDS)))
+
+        started = time.perf_counter()
+        shutil.copyfileobj(io.BytesIO(data), io.BytesIO())
+        bare = time.perf_counter() - started
+
+        result = SingerProxyStage().run(io.BytesIO(data), io.BytesIO())
+        validated = SingerProxyStage({"order_dtl": _validator()}).run(
+            io.BytesIO(data), io.BytesIO()
+        )
+
+        assert bare < result.value.elapsed_seconds
+        assert result.value.overhead_per_record_us < 50
+        assert validated.value.records == self.RECORDS
+        assert (
+            result.value.overhead_per_record_us
+            < validated.value.overhead_per_record_us
+        )
@@ -0,0 +1,122 @@
+"""Unit tests for the spill-to-disk backpressure buffer."""
+
+from __future__ import annotations
+
+import io
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from gruponos_meltano_native.core import (
+    SingerProxyStage,
+    SpillBuffer,
+    SpillBufferWriter,
+)
+
+
+def _chunks(count: int, size: int = 100) -> list[bytes]:
+    return [str(i).encode().rjust(size, b".") for i in range(count)]
+
+
+class _SlowSink(io.BytesIO):
+    """Sink that stalls on every write, like a target in redo waits."""
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        time.sleep(0.001)
+        return super().write(data)
+
+
+class TestSpillBuffer:
+    """Test ordering, spill and metrics."""
+
+    def test_spills_beyond_budget_and_drains_in_order(self, tmp_path: Path) -> None:
+        """Chunks over the budget go to segments and come back in order."""
+        chunks = _chunks(50)
+        buffer = SpillBuffer(1_000, spill_dir=tmp_path, segment_bytes=1_000)
+        for chunk in chunks:
+            buffer.put(chunk)
+        buffer.close()
+
+        assert buffer.metrics.memory_high_water <= 1_000
+        assert buffer.metrics.spilled_chunks == 40
+        assert buffer.metrics.segments_created > 1
+        drained = list(iter(buffer.get, None))
+        assert drained == chunks
+        assert not list(tmp_path.iterdir())
+        assert buffer.metrics.queued_high_water == 5_000
+
+    def test_memory_is_reused_after_draining(self, tmp_path: Path) -> None:
+        """Interleaved memory and disk blocks keep FIFO order."""
+        buffer = SpillBuffer(250, spill_dir=tmp_path)
+        order = _chunks(8)
+        for chunk in order[:4]:
+            buffer.put(chunk)
+        got = [buffer.get(), buffer.get()]
+        for chunk in order[4:]:
+            buffer.put(chunk)
+        buffer.close()
+        got.extend(iter(buffer.get, None))
+        assert got == order
+
+    def test_get_timeout_and_closed(self) -> None:
+        """get returns None on timeout and after close; put then fails."""
+        with SpillBuffer() as buffer:
+            assert buffer.get(timeout=0.01) is None
+            buffer.close()
+            assert buffer.get() is None
+            with pytest.raises(ValueError, match="closed"):
+                buffer.put(b"x")
+
+    def test_disk_cap_blocks_producer(self, tmp_path: Path) -> None:
+        """With max_disk_bytes the producer waits for the consumer."""
+        buffer = SpillBuffer(0, spill_dir=tmp_path, max_disk_bytes=300)
+        chunks = _chunks(20)
+
+        def produce() -> None:
+            for chunk in chunks:
+                buffer.put(chunk)
+            buffer.close()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        drained = list(iter(buffer.get, None))
+        producer.join()
+        assert drained == chunks
+
+
+class TestSpillBufferWriter:
+    """Test decoupling of a producer from a slow sink."""
+
+    def test_producer_does_not_wait_for_slow_sink(self, tmp_path: Path) -> None:
+        """The proxy finishes before the sink has received everything."""
+        records = b"".join(
+            b'{"type":"RECORD","stream":"s","record":{"id":%d}}\n' % i
+            for i in range(300)
+        )
+        sink = _SlowSink()
+        writer = SpillBufferWriter(sink, SpillBuffer(2_000, spill_dir=tmp_path))
+
+        result = SingerProxyStage(batch_size=10).run(io.BytesIO(records), writer)
+        proxy_elapsed = result.value.elapsed_seconds
+        closed = writer.close()
+
+        assert closed.is_success
+        assert sink.getvalue() == records
+        assert closed.value.spilled_chunks > 0
+        assert proxy_elapsed < 30 * 0.001
+
+    def test_sink_failure_is_reported(self) -> None:
+        """Errors from the sink surface on write and close."""
+
+        class _BrokenSink(io.BytesIO):
+            def write(self, data: bytes) -> int:  # type: ignore[override]
+                raise BrokenPipeError(32, "Broken pipe")
+
+        writer = SpillBufferWriter(_BrokenSink())
+        writer.write(b"a")
+        closed = writer.close()
+        assert closed.is_failure
+        with pytest.raises(OSError, match="drain failed"):
+            writer.write(b"b")
@@ -0,0 +1,127 @@
+"""Unit tests for the embedded state store."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from gruponos_meltano_native.core import GruponosStateStore, StateCheckpointer
+
+_JOB = "wms-native-target-oracle"
+
+
+def _state(**values: str) -> dict[str, object]:
+    return {
+        "bookmarks": {
+            stream: {"replication_key": "mod_ts", "replication_key_value": value}
+            for stream, value in values.items()
+        }
+    }
+
+
+class TestGruponosStateStore:
+    """Test CAS updates, history and compaction."""
+
+    def test_compare_and_swap(self, tmp_path: Path) -> None:
+        """A write with a stale version fails and changes nothing."""
+        store = GruponosStateStore(tmp_path / "state.sqlite")
+        first = store.compare_and_swap(
+            _JOB, "allocation", {"v": 1}, expected_version=0
+        )
+        assert first.is_success
+        assert first.value == 1
+        stale = store.compare_and_swap(
+            _JOB, "allocation", {"v": 2}, expected_version=0
+        )
+        assert stale.is_failure
+        assert "conflict" in (stale.error or "")
+        bookmark = store.get(_JOB, "allocation")
+        assert bookmark is not None
+        assert bookmark.value == {"v": 1}
+        store.close()
+
+    def test_snapshot_and_unchanged_streams(self, tmp_path: Path) -> None:
+        """Snapshots round-trip; unchanged bookmarks keep their version."""
+        with GruponosStateStore(tmp_path / "state.sqlite") as store:
+            saved = store.save_state(
+                _JOB,
+                _state(allocation="2025-01-01", order_hdr="2025-01-02"),
+                expected={},
+            )
+            assert saved.value == {"allocation": 1, "order_hdr": 1}
+            snapshot = store.snapshot(_JOB)
+            assert snapshot.singer_state() == _state(
+                allocation="2025-01-01", order_hdr="2025-01-02"
+            )
+            again = store.save_state(
+                _JOB,
+                _state(allocation="2025-01-05", order_hdr="2025-01-02"),
+                expected=snapshot.versions,
+            )
+            assert again.value == {"allocation": 2, "order_hdr": 1}
+            assert len(store.history(_JOB, "order_hdr")) == 1
+
+    def test_history_rollback_and_compact(self, tmp_path: Path) -> None:
+        """Old versions can be restored; compaction keeps the newest ones."""
+        with GruponosStateStore(tmp_path / "state.sqlite") as store:
+            for version in range(5):
+                store.compare_and_swap(
+                    _JOB, "allocation", {"v": version}, expected_version=version
+                )
+            versions = [b.version for b in store.history(_JOB, "allocation")]
+            assert versions == [5, 4, 3, 2, 1]
+            assert store.rollback(_JOB, "allocation", 2).value == 6
+            bookmark = store.get(_JOB, "allocation")
+            assert bookmark is not None
+            assert bookmark.value == {"v": 1}
+            assert store.rollback(_JOB, "allocation", 99).is_failure
+            assert store.compact(keep=2) == 4
+            assert [b.version for b in store.history(_JOB, "allocation")] == [6, 5]
+
+    def test_concurrent_checkpointers_keep_their_streams(
+        self, tmp_path: Path
+    ) -> None:
+        """Per-entity runs under one job id never overwrite each other."""
+        store = GruponosStateStore(tmp_path / "state.sqlite")
+        streams = ("allocation", "order_hdr", "inventory")
+
+        def run(stream: str) -> None:
+            snapshot = store.snapshot(_JOB)
+            checkpointer = StateCheckpointer(
+                store, _JOB, [stream], snapshot.versions
+            )
+            for day in range(1, 21):
+                state = snapshot.singer_state()
+                state["bookmarks"][stream] = {"replication_key_value": str(day)}
+                assert checkpointer.save(state)
+
+        threads = [threading.Thread(target=run, args=(s,)) for s in streams]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        snapshot = store.snapshot(_JOB)
+        assert snapshot.versions == dict.fromkeys(streams, 20)
+        assert {b["replication_key_value"] for b in snapshot.bookmarks.values()} == {
+            "20"
+        }
+        store.close()
+
+    def test_checkpointer_reads_target_output(self, tmp_path: Path) -> None:
+        """STATE lines echoed by a target are checkpointed; conflicts stop."""
+        with GruponosStateStore(tmp_path / "state.sqlite") as store:
+            checkpointer = StateCheckpointer(store, _JOB, ["allocation"], {})
+            checkpointer.consume([
+                b"not json\n",
+                b'{"bookmarks": {"allocation": {"replication_key_value": "a"}}}\n',
+                b'{"bookmarks": {"allocation": {"replication_key_value": "b"}}}\n',
+            ])
+            assert checkpointer.checkpoints == 2
+            assert checkpointer.versions == {"allocation": 2}
+            store.compare_and_swap(_JOB, "allocation", {"x": 1}, expected_version=2)
+            assert not checkpointer.save(_state(allocation="c"))
+            assert checkpointer.save(_state(allocation="d"))
+            assert len(checkpointer.conflicts) == 1
+            bookmark = store.get(_JOB, "allocation")
+            assert bookmark is not None
+            assert bookmark.value == {"x": 1}
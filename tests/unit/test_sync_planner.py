@@ -0,0 +1,128 @@
+"""Unit tests for the cost-based full/incremental sync planner."""
+
+from __future__ import annotations
+
+import pytest
+
+from gruponos_meltano_native.core import (
+    GruponosSyncPlanner,
+    LoadCostModel,
+    SyncMode,
+    WmsEntity,
+)
+from gruponos_meltano_native.core.sync_planner import KIND_SYNC_PLAN
+
+_ALLOCATION = WmsEntity("allocation", ("id",), "mod_ts")
+_STATE = {
+    "bookmarks": {
+        "allocation": {
+            "replication_key": "mod_ts",
+            "replication_key_value": "2025-01-01T00:00:00",
+        }
+    }
+}
+
+
+class _Counter:
+    """WMS count probe returning fixed delta and table sizes."""
+
+    def __init__(self, delta: int, total: int) -> None:
+        self.delta = delta
+        self.total = total
+        self.filters: list[dict[str, str]] = []
+
+    def __call__(self, entity: WmsEntity) -> int:
+        self.filters.append(dict(entity.filters))
+        return self.delta if "mod_ts__gt" in entity.filters else self.total
+
+
+class _MemoryLedger:
+    """In-memory stand-in with the run ledger's append/trailing API."""
+
+    def __init__(self) -> None:
+        self.entries: list[dict[str, object]] = []
+
+    def append(self, kind: str, payload: dict[str, object], **fields: object) -> None:
+        self.entries.append({"kind": kind, "payload": payload, **fields})
+
+    def trailing_payloads(
+        self, kind: str, *, runs: int, stream: str | None = None, **_: object
+    ) -> list[dict[str, object]]:
+        payloads = [
+            e["payload"]
+            for e in self.entries
+            if e["kind"] == kind and e.get("stream") == stream
+        ]
+        return payloads[-runs:]  # type: ignore[return-value]
+
+
+def _failing_counter(entity: WmsEntity) -> int:
+    message = f"WMS unavailable for {entity.name}"
+    raise OSError(message)
+
+
+class TestLoadCostModel:
+    """Test the cost model."""
+
+    def test_from_config(self) -> None:
+        """``planner_*`` keys override the defaults; invalid rates fail."""
+        model = LoadCostModel.from_config({"planner_upsert_rows_per_second": "500"})
+        assert model.upsert_rows_per_second == 500
+        assert model.bulk_rows_per_second == LoadCostModel().bulk_rows_per_second
+        with pytest.raises(ValueError, match="positive"):
+            LoadCostModel.from_config({"planner_bulk_rows_per_second": 0})
+
+
+class TestGruponosSyncPlanner:
+    """Test per-entity mode selection."""
+
+    def test_small_delta_stays_incremental(self) -> None:
+        """A few changed rows are upserted."""
+        counter = _Counter(delta=5_000, total=2_000_000)
+        plan = GruponosSyncPlanner(counter).plan_entity(_ALLOCATION, _STATE)
+        assert plan.mode is SyncMode.INCREMENTAL
+        assert plan.delta_rows == 5_000
+        assert counter.filters[0] == {"mod_ts__gt": "2025-01-01T00:00:00"}
+
+    def test_mass_update_reloads_in_full(self) -> None:
+        """When most rows changed, a shadow reload is cheaper."""
+        planner = GruponosSyncPlanner(_Counter(delta=1_500_000, total=2_000_000))
+        plan = planner.plan_entity(_ALLOCATION, _STATE)
+        assert plan.mode is SyncMode.FULL
+        assert plan.full_seconds is not None
+        assert plan.incremental_seconds is not None
+        assert plan.full_seconds < plan.incremental_seconds
+
+    def test_without_bookmark_or_replication_key(self) -> None:
+        """Entities that cannot run incrementally are loaded in full."""
+        planner = GruponosSyncPlanner(_Counter(delta=0, total=10))
+        plans = planner.plan(
+            [_ALLOCATION, WmsEntity("item", ("id",))], {"bookmarks": {}}
+        )
+        assert [(p.mode, p.reason) for p in plans] == [
+            (SyncMode.FULL, "no bookmark"),
+            (SyncMode.FULL, "no replication key"),
+        ]
+
+    def test_ledger_fallback_when_probe_fails(self) -> None:
+        """A failed probe uses the last recorded counts, else incremental."""
+        ledger = _MemoryLedger()
+        planner = GruponosSyncPlanner(
+            _failing_counter,
+            ledger=ledger,  # type: ignore[arg-type]
+        )
+        plan = planner.plan_entity(_ALLOCATION, _STATE)
+        assert plan.mode is SyncMode.INCREMENTAL
+        assert plan.estimate_source == "none"
+
+        probed = GruponosSyncPlanner(_Counter(delta=10, total=1_000_000))
+        planner.record(
+            probed.plan_entity(_ALLOCATION, _STATE),
+            run_id="run-1",
+            records_loaded=900_000,
+        )
+        assert ledger.entries[-1]["kind"] == KIND_SYNC_PLAN
+        plan = planner.plan_entity(_ALLOCATION, _STATE)
+        assert plan.estimate_source == "ledger"
+        assert plan.delta_rows == 900_000
+        assert plan.mode is SyncMode.FULL
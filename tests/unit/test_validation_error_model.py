@@ -0,0 +1,116 @@
+"""Unit tests for the structured validation error model."""
+
+from __future__ import annotations
+
+import pytest
+
+from gruponos_meltano_native import DataValidator, ValidationError, ValidationRule
+from gruponos_meltano_native.validators import (
+    ValidationErrorAggregator,
+    ValidationErrorCode,
+    ValidationFailure,
+)
+
+
+class TestValidationFailure:
+    """Test lazy message rendering."""
+
+    def test_message_matches_legacy_format(self) -> None:
+        """Rendered message keeps the historical wording."""
+        failure = ValidationFailure(
+            "name", ValidationErrorCode.MAX_LENGTH_EXCEEDED, "abcdef", 5
+        )
+        assert failure.message == "Field 'name' exceeds maximum length 5"
+        assert str(failure) == failure.message
+
+
+class TestValidationErrorAggregator:
+    """Test counters, reservoir and batch summaries."""
+
+    def test_counts_per_field_and_code(self) -> None:
+        """Failures are counted per (field, code)."""
+        aggregator = ValidationErrorAggregator(log_limit_per_key=0)
+        for value in range(10):
+            aggregator.record(
+                ValidationFailure("qty", ValidationErrorCode.NOT_NUMBER, value)
+            )
+        aggregator.record(ValidationFailure("id", ValidationErrorCode.MISSING_REQUIRED))
+
+        assert aggregator.total == 11
+        assert aggregator.counts() == {
+            ("qty", int(ValidationErrorCode.NOT_NUMBER)): 10,
+            ("id", int(ValidationErrorCode.MISSING_REQUIRED)): 1,
+        }
+
+    def test_reservoir_is_bounded(self) -> None:
+        """Samples never exceed sample_size."""
+        aggregator = ValidationErrorAggregator(
+            sample_size=3, log_limit_per_key=0, seed=42
+        )
+        for value in range(1000):
+            aggregator.record(
+                ValidationFailure("qty", ValidationErrorCode.NOT_NUMBER, value)
+            )
+        samples = aggregator.samples("qty", ValidationErrorCode.NOT_NUMBER)
+        assert len(samples) == 3
+        assert all(0 <= value < 1000 for value in samples)
+
+    def test_flush_batch_resets_batch_counts_only(self) -> None:
+        """Batch counters reset while run totals are kept."""
+        aggregator = ValidationErrorAggregator(log_limit_per_key=0)
+        aggregator.record(ValidationFailure("a", ValidationErrorCode.NOT_STRING, 1))
+        batch = aggregator.flush_batch("page-1")
+        assert batch == {("a", int(ValidationErrorCode.NOT_STRING)): 1}
+        assert aggregator.flush_batch("page-2") == {}
+        assert aggregator.total == 1
+
+    def test_messages_are_aggregated(self) -> None:
+        """One message per key with occurrence count."""
+        aggregator = ValidationErrorAggregator(log_limit_per_key=0)
+        for _ in range(4):
+            aggregator.record(
+                ValidationFailure("flag", ValidationErrorCode.NOT_BOOLEAN)
+            )
+        assert aggregator.messages() == [
+            "Field 'flag' must be a boolean (4 occurrences)"
+        ]
+
+
+class TestDataValidatorErrorModel:
+    """Test DataValidator integration with the error model."""
+
+    def test_check_returns_structured_failures(self) -> None:
+        """check() returns codes without formatting messages."""
+        validator = DataValidator([
+            ValidationRule("id", "required"),
+            ValidationRule("qty", "number", min_value=0),
+        ])
+        failures = validator.check({"qty": -1})
+        assert [f.code for f in failures] == [
+            ValidationErrorCode.MISSING_REQUIRED,
+            ValidationErrorCode.BELOW_MIN_VALUE,
+        ]
+
+    def test_validate_batch_counts_invalid_records(self) -> None:
+        """validate_batch() returns invalid record count and aggregates."""
+        validator = DataValidator([ValidationRule("name", "string")])
+        records = [{"name": "ok"}, {"name": 1}, {"name": 2}]
+        assert validator.validate_batch(records) == 2
+        summary = validator.get_error_summary()
+        assert summary["total_failures"] == 2
+
+    def test_strict_mode_error_code_in_context(self) -> None:
+        """Strict mode exceptions carry the integer error code."""
+        validator = DataValidator([ValidationRule("flag", "boolean")], strict_mode=True)
+        with pytest.raises(ValidationError) as exc_info:
+            validator.validate({"flag": "yes"})
+        assert exc_info.value.context.get("error_code") == int(
+            ValidationErrorCode.NOT_BOOLEAN
+        )
+
+    def test_reset_stats_clears_aggregator(self) -> None:
+        """reset_stats() clears failure counters too."""
+        validator = DataValidator([ValidationRule("flag", "boolean")])
+        validator.validate({"flag": "yes"})
+        validator.reset_stats()
+        assert validator.error_aggregator.total == 0
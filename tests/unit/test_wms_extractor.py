@@ -0,0 +1,599 @@
+"""Unit tests and benchmarks for the WMS REST extractor (mock WMS server)."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import threading
+import time
+from collections.abc import Callable, Generator, Iterator
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import pytest
+
+from gruponos_meltano_native.core import (
+    GruponosAdaptiveRateLimiter,
+    GruponosOverlapDeduplicator,
+    GruponosWmsExtractor,
+    GruponosWmsResponseCache,
+    WmsEntity,
+    WmsExtractorConfig,
+)
+from gruponos_meltano_native.core.wms_extractor import (
+    WmsPagePrefetcher,
+    WmsResultsDecoder,
+    flatten_record,
+    WmsSchemaTracker,
+    infer_schema,
+)
+
+
+class _MockWmsServer(ThreadingHTTPServer):
+    """LGF-like ``/entity/<name>/`` endpoint with paged results."""
+
+    daemon_threads = True
+
+    def __init__(
+        self, records: int, latency: float = 0.0, body_delay: float = 0.0
+    ) -> None:
+        super().__init__(("127.0.0.1", 0), _MockWmsHandler)
+        self.records = [
+            {
+                "id": i,
+                "mod_ts": f"2025-01-01T00:{i // 60:02d}:{i % 60:02d}",
+                "facility_id": {"id": 1, "key": "FAC", "url": "http://x/1"},
+                "description": "pé çã",
+            }
+            for i in range(records)
+        ]
+        self.latency = latency
+        self.body_delay = body_delay
+        self.fail_next: list[int] = []
+        self.truncate_next = 0
+        self.retry_after: str | None = None
+        self.connections: set[int] = set()
+        self.queries: list[dict[str, list[str]]] = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def handle_error(self, *_: object) -> None:
+        """Ignore keep-alive connections reset when a session closes."""
+
+
+class _MockWmsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Partial writes (``body_delay``) must not wait for delayed ACKs
+    disable_nagle_algorithm = True
+    server: _MockWmsServer
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        server = self.server
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        with server.lock:
+            server.connections.add(self.client_address[1])
+            server.queries.append(query)
+            status = server.fail_next.pop(0) if server.fail_next else 200
+            truncate = server.truncate_next > 0
+            server.truncate_next -= int(truncate)
+        time.sleep(server.latency)
+        page = int(query.get("page", ["1"])[0])
+        size = int(query["page_size"][0])
+        records = server.records
+        if "mod_ts__gte" in query:
+            records = [r for r in records if r["mod_ts"] >= query["mod_ts__gte"][0]]
+        if "mod_ts__lt" in query:
+            records = [r for r in records if r["mod_ts"] < query["mod_ts__lt"][0]]
+        results = records[(page - 1) * size : page * size]
+        if query.get("page_mode") == ["sequenced"]:
+            # Cursor mode: no counts, ``next_page`` ahead of the results
+            more = page * size < len(records)
+            next_query = urlencode({**query, "page": [page + 1]}, doseq=True)
+            payload: dict[str, object] = {
+                "next_page": f"{server.url}{parsed.path}?{next_query}"
+                if more
+                else None,
+                "previous_page": None,
+                "results": results,
+            }
+        else:
+            payload = {
+                "result_count": len(records),
+                "page_count": max(1, -(-len(records) // size)),
+                "page_nbr": page,
+                "results": results,
+            }
+        body = json.dumps(payload).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'  # noqa: S324 - test ETag
+        if status == HTTPStatus.OK and self.headers.get("If-None-Match") == etag:
+            status, body = HTTPStatus.NOT_MODIFIED, b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        if status == HTTPStatus.TOO_MANY_REQUESTS and server.retry_after:
+            self.send_header("Retry-After", server.retry_after)
+        self.end_headers()
+        if truncate:
+            # Connection reset halfway through the body
+            self.wfile.write(body[: len(body) // 2])
+            self.close_connection = True
+            return
+        if server.body_delay:
+            # Head first, then the results after a transfer delay
+            split = body.find(b'"results"')
+            self.wfile.write(body[:split])
+            self.wfile.flush()
+            time.sleep(server.body_delay)
+            body = body[split:]
+        self.wfile.write(body)
+
+    def log_message(self, *_: object) -> None:
+        """Keep test output quiet."""
+
+
+def _serve(server: _MockWmsServer) -> Iterator[_MockWmsServer]:
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def wms() -> Iterator[_MockWmsServer]:
+    """Mock WMS with 23 records."""
+    yield from _serve(_MockWmsServer(23))
+
+
+def _config(url: str, **overrides: object) -> WmsExtractorConfig:
+    return WmsExtractorConfig.from_mapping({
+        "base_url": url,
+        "username": "user",
+        "password": "secret",
+        "facility_code": "FAC",
+        "page_size": 5,
+        "max_parallel_pages": 3,
+        **overrides,
+    })
+
+
+def _messages(sink: io.BytesIO) -> list[dict[str, object]]:
+    return [json.loads(line) for line in sink.getvalue().splitlines()]
+
+
+class TestWmsResultsDecoder:
+    """Test incremental decoding across arbitrary chunk boundaries."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+    def test_chunked_body(self, chunk_size: int) -> None:
+        """Records split anywhere (including inside UTF-8) are decoded."""
+        records = [
+            {"id": i, "text": "ção", "nested": {"a": [1, 2]}} for i in range(4)
+        ]
+        body = json.dumps({
+            "result_count": 4,
+            "results": records,
+            "next_page": None,
+        }).encode()
+        decoder = WmsResultsDecoder()
+        decoded = []
+        for start in range(0, len(body), chunk_size):
+            decoded.extend(decoder.feed(body[start : start + chunk_size]))
+        decoded.extend(decoder.feed(b"", final=True))
+        assert decoded == records
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 64])
+    @pytest.mark.parametrize("cursor", ["http://wms/e/?page=2&x=\\\"", None])
+    def test_next_page_cursor(self, chunk_size: int, cursor: str | None) -> None:
+        """The cursor is known before the results; a trailing one at the end."""
+        records = [{"id": i, "next_page": "decoy"} for i in range(3)]
+        head = json.dumps({"next_page": cursor, "results": records}).encode()
+        decoder = WmsResultsDecoder()
+        known_at = None
+        for start in range(0, len(head), chunk_size):
+            decoder.feed(head[start : start + chunk_size])
+            if decoder.next_page_known and known_at is None:
+                known_at = start
+        assert known_at is not None
+        assert known_at < head.find(b'"results"')
+        assert decoder.next_page == cursor
+
+        tail = json.dumps({"results": records, "next_page": cursor}).encode()
+        decoder = WmsResultsDecoder()
+        for start in range(0, len(tail), chunk_size):
+            decoder.feed(tail[start : start + chunk_size])
+        decoder.feed(b"", final=True)
+        assert decoder.next_page_known
+        assert decoder.next_page == cursor
+
+    def test_truncated_body(self) -> None:
+        """A body cut inside the results array is an error."""
+        decoder = WmsResultsDecoder()
+        decoder.feed(b'{"results": [{"id": 1}, {"id"')
+        with pytest.raises(ValueError, match="results array"):
+            decoder.feed(b"", final=True)
+
+
+class TestRecordShaping:
+    """Test flattening and schema inference."""
+
+    def test_flatten_and_infer(self) -> None:
+        """Nested objects become ``a__b`` keys; arrays stay JSON text."""
+        flat = flatten_record(
+            {"id": 1, "item": {"code": "X", "dims": {"w": 1.5}}, "tags": ["a"]},
+            max_depth=2,
+        )
+        assert flat == {
+            "id": 1,
+            "item__code": "X",
+            "item__dims": '{"w":1.5}',
+            "tags": '["a"]',
+        }
+        schema = infer_schema([{"id": 1, "qty": 1}, {"id": None, "qty": 2.5}])
+        assert schema["properties"] == {
+            "id": {"type": ["null", "integer"]},
+            "qty": {"type": ["null", "number"]},
+        }
+
+    def test_schema_widens_across_pages(self) -> None:
+        """Later pages type null-only columns, add columns and widen types."""
+        tracker = WmsSchemaTracker()
+        assert not tracker.observe([])
+        assert tracker.observe([{"id": 1, "qty": None}])
+        assert tracker.schema()["properties"]["qty"] == {"type": ["null", "string"]}
+        assert not tracker.observe([{"id": 2, "qty": None}])
+        assert tracker.observe([{"id": 3, "qty": 4, "lot": "L1"}])
+        assert tracker.schema()["properties"] == {
+            "id": {"type": ["null", "integer"]},
+            "qty": {"type": ["null", "integer"]},
+            "lot": {"type": ["null", "string"]},
+        }
+        assert tracker.observe([{"id": 4, "qty": 4.5}])
+        assert tracker.schema()["properties"]["qty"] == {"type": ["null", "number"]}
+        assert not tracker.observe([{"id": 5, "qty": 1}])
+
+
+class TestGruponosWmsExtractor:
+    """Test paging, ordering, state and retries against the mock server."""
+
+    def test_pages_emitted_in_order_on_pooled_connections(
+        self, wms: _MockWmsServer
+    ) -> None:
+        """All pages arrive in order; the window reuses its connections."""
+        sink = io.BytesIO()
+        entity = WmsEntity("order_dtl", ("id",), "mod_ts")
+        with GruponosWmsExtractor(_config(wms.url)) as extractor:
+            result = extractor.run([entity], sink)
+
+        assert result.is_success
+        messages = _messages(sink)
+        records = [m["record"] for m in messages if m["type"] == "RECORD"]
+        assert [r["id"] for r in records] == list(range(23))
+        assert records[0]["facility_id__key"] == "FAC"
+        assert messages[0]["type"] == "SCHEMA"
+        assert messages[0]["key_properties"] == ["id"]
+        states = [m["value"] for m in messages if m["type"] == "STATE"]
+        assert len(states) == 5
+        assert states[-1]["bookmarks"]["order_dtl"]["replication_key_value"] == (
+            "2025-01-01T00:00:22"
+        )
+        stats = result.value
+        assert (stats.pages, stats.records, stats.requests) == (5, 23, 5)
+        assert stats.max_in_flight <= 3
+        assert len(wms.connections) <= 3
+        assert wms.queries[0]["facility_id__code"] == ["FAC"]
+        assert wms.queries[0]["ordering"] == ["mod_ts,id"]
+
+    def test_bookmark_filters_next_run(self, wms: _MockWmsServer) -> None:
+        """A previous state becomes a ``<replication_key>__gte`` filter."""
+        state = {
+            "bookmarks": {
+                "order_dtl": {
+                    "replication_key": "mod_ts",
+                    "replication_key_value": "2025-01-01T00:00:20",
+                }
+            }
+        }
+        sink = io.BytesIO()
+        with GruponosWmsExtractor(_config(wms.url), state=state) as extractor:
+            result = extractor.run([WmsEntity("order_dtl", ("id",), "mod_ts")], sink)
+
+        assert result.is_success
+        assert result.value.records == 3
+        assert wms.queries[0]["mod_ts__gte"] == ["2025-01-01T00:00:20"]
+
+    def test_bookmark_advances_by_instant(self, wms: _MockWmsServer) -> None:
+        """Bookmarks compare parsed timestamps, not their text."""
+        entity = WmsEntity("order_dtl", ("id",), "mod_ts")
+        state = {
+            "bookmarks": {
+                "order_dtl": {
+                    "replication_key": "mod_ts",
+                    "replication_key_value": "2025-01-01T09:00:00",
+                }
+            }
+        }
+        with GruponosWmsExtractor(_config(wms.url), state=state) as extractor:
+            # Later in text, earlier in time (08:30 UTC)
+            behind = [{"mod_ts": "2025-01-01T10:30:00+02:00"}]
+            assert not extractor._advance_bookmark(entity, behind)
+            ahead = [
+                {"mod_ts": "2025-01-01T09:30:00.5"},
+                {"mod_ts": "2025-01-01T09:45:00-03:00"},
+            ]
+            assert extractor._advance_bookmark(entity, ahead)
+            bookmark = extractor.state["bookmarks"]["order_dtl"]
+        assert bookmark["replication_key_value"] == "2025-01-01T09:45:00-03:00"
+
+    def test_overlap_rows_deduplicated(
+        self, wms: _MockWmsServer, tmp_path: Path
+    ) -> None:
+        """The overlap is re-read but rows loaded unchanged are not re-sent."""
+        entity = WmsEntity("order_dtl", ("id",), "mod_ts")
+        config = _config(wms.url, incremental_overlap_minutes="0.1")
+        dedup = GruponosOverlapDeduplicator.for_entities([entity], directory=tmp_path)
+        with GruponosWmsExtractor(config, transform=dedup) as extractor:
+            assert extractor.run([entity], io.BytesIO()).value.records == 23
+        dedup.commit()
+
+        sink = io.BytesIO()
+        dedup = GruponosOverlapDeduplicator.for_entities([entity], directory=tmp_path)
+        with GruponosWmsExtractor(
+            config, transform=dedup, state=extractor.state
+        ) as extractor:
+            stats = extractor.run([entity], sink).value
+
+        # Bookmark 00:00:22 minus 6 s: 7 rows re-read, all already loaded
+        assert wms.queries[-1]["mod_ts__gte"] == ["2025-01-01T00:00:16"]
+        assert (stats.records, stats.records_dropped) == (7, 7)
+        assert not [m for m in _messages(sink) if m["type"] == "RECORD"]
+        assert extractor.state["bookmarks"]["order_dtl"]["replication_key_value"] == (
+            "2025-01-01T00:00:22"
+        )
+
+    def test_window_filters_and_count(self, wms: _MockWmsServer) -> None:
+        """Entity filters select a window; count_rows reads result_count."""
+        window = WmsEntity(
+            "order_dtl",
+            ("id",),
+            "mod_ts",
+            filters={
+                "mod_ts__gte": "2025-01-01T00:00:05",
+                "mod_ts__lt": "2025-01-01T00:00:12",
+            },
+        )
+        sink = io.BytesIO()
+        with GruponosWmsExtractor(_config(wms.url)) as extractor:
+            assert extractor.count_rows(window) == 7
+            assert extractor.run([window], sink).value.records == 7
+        assert wms.queries[0]["page_size"] == ["1"]
+
+    def test_retries_transient_errors(self, wms: _MockWmsServer) -> None:
+        """A 503 is retried; a persistent 404 fails the run."""
+        wms.fail_next = [503]
+        config = _config(wms.url, max_retries=2)
+        with GruponosWmsExtractor(config) as extractor:
+            extractor.run([WmsEntity("allocation")], io.BytesIO())
+        assert extractor.stats.retries == 1
+        assert extractor.stats.records == 23
+
+        wms.fail_next = [404]
+        with GruponosWmsExtractor(config) as extractor:
+            result = extractor.run([WmsEntity("allocation")], io.BytesIO())
+        assert result.is_failure
+        assert "404" in (result.error or "")
+
+    @pytest.mark.parametrize("page_mode", ["paged", "sequenced"])
+    def test_retries_body_cut_off_mid_read(
+        self, wms: _MockWmsServer, page_mode: str
+    ) -> None:
+        """A connection reset while a body streams refetches the page."""
+        wms.truncate_next = 1
+        config = _config(wms.url, max_retries=2, page_mode=page_mode)
+        with GruponosWmsExtractor(config) as extractor:
+            result = extractor.run([WmsEntity("allocation")], io.BytesIO())
+        assert result.is_success
+        assert result.value.records == 23
+        assert result.value.retries == 1
+
+    def test_zero_retries_is_honoured(self, wms: _MockWmsServer) -> None:
+        """``max_retries: 0`` fails on the first transient error."""
+        config = _config(wms.url, max_retries=0)
+        assert config.max_retries == 0
+        wms.fail_next = [503]
+        with GruponosWmsExtractor(config) as extractor:
+            result = extractor.run([WmsEntity("allocation")], io.BytesIO())
+        assert result.is_failure
+        assert extractor.stats.retries == 0
+
+    def test_schema_waits_for_records_or_uses_catalog(
+        self, wms: _MockWmsServer
+    ) -> None:
+        """No SCHEMA before the first record; a catalog schema goes as is."""
+        empty = WmsEntity(
+            "allocation", ("id",), "mod_ts", filters={"mod_ts__gte": "2099-01-01"}
+        )
+        sink = io.BytesIO()
+        with GruponosWmsExtractor(_config(wms.url)) as extractor:
+            assert extractor.run([empty], sink).value.records == 0
+        assert _messages(sink) == []
+
+        schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+        catalogued = WmsEntity("allocation", ("id",), schema=schema)
+        sink = io.BytesIO()
+        with GruponosWmsExtractor(_config(wms.url)) as extractor:
+            extractor.run([catalogued], sink)
+        messages = _messages(sink)
+        assert [m["type"] for m in messages].count("SCHEMA") == 1
+        assert messages[0]["schema"] == schema
+
+    def test_rate_limiter_honours_retry_after(self, wms: _MockWmsServer) -> None:
+        """A 429 with Retry-After pauses the budget and lowers its rate."""
+        wms.fail_next = [429]
+        wms.retry_after = "0.2"
+        config = _config(wms.url, max_retries=2)
+        limiter = GruponosAdaptiveRateLimiter.from_config({
+            "adaptive_rate_limit": "true",
+            "max_requests_per_second": 50,
+            "max_parallel_pages": 3,
+        })
+        assert limiter is not None
+        started = time.perf_counter()
+        with GruponosWmsExtractor(config, limiter=limiter) as extractor:
+            result = extractor.run([WmsEntity("allocation")], io.BytesIO())
+
+        assert result.is_success
+        assert result.value.records == 23
+        assert time.perf_counter() - started >= 0.2
+        budgets = result.value.rate_limits
+        assert set(budgets) == {
+            f"host:127.0.0.1:{wms.server_address[1]}",
+            "facility:FAC",
+        }
+        host = budgets[f"host:127.0.0.1:{wms.server_address[1]}"]
+        # Six requests are below latency_min_samples: only the 429 decreases
+        assert host["requests"] < limiter.policy.latency_min_samples
+        assert (host["throttled"], host["decreases"], host["requests"]) == (1, 1, 6)
+        assert host["retry_after_seconds"] == 0.2
+
+    def test_sequenced_mode_follows_cursor(self, wms: _MockWmsServer) -> None:
+        """Cursor pages are prefetched ahead yet emitted in order."""
+        sink = io.BytesIO()
+        config = _config(wms.url, page_mode="sequenced", prefetch_pages=2)
+        with GruponosWmsExtractor(config) as extractor:
+            result = extractor.run([WmsEntity("order_dtl", ("id",), "mod_ts")], sink)
+
+        assert result.is_success
+        records = [m["record"] for m in _messages(sink) if m["type"] == "RECORD"]
+        assert [r["id"] for r in records] == list(range(23))
+        assert result.value.requests == 5
+        assert [q.get("page", ["1"])[0] for q in wms.queries] == [
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+        ]
+        assert wms.queries[0]["page_mode"] == ["sequenced"]
+
+    def test_response_cache_skips_downloads(
+        self, wms: _MockWmsServer, tmp_path: Path
+    ) -> None:
+        """Fresh pages come from disk; expired ones are revalidated (304)."""
+        entity = WmsEntity("order_dtl", ("id",), "mod_ts")
+        outputs = []
+        for ttl in (3600.0, 3600.0, 0.0):
+            cache = GruponosWmsResponseCache(tmp_path, ttl_seconds=ttl)
+            sink = io.BytesIO()
+            with GruponosWmsExtractor(_config(wms.url), cache=cache) as extractor:
+                assert extractor.run([entity], sink).is_success
+            outputs.append((cache.stats, extractor.stats, sink.getvalue()))
+
+        (first, first_run, _), (second, second_run, _), (third, third_run, _) = (
+            outputs
+        )
+        assert (first.misses, first.stores, first_run.requests) == (5, 5, 5)
+        assert (second.hits, second_run.requests, second_run.bytes_received) == (
+            5,
+            0,
+            0,
+        )
+        assert second_run.pages_from_cache == 5
+        assert (third.revalidated, third_run.requests) == (5, 5)
+        assert third_run.bytes_received == 0
+        records = [
+            [line for line in output.splitlines() if b'"RECORD"' in line]
+            for *_, output in outputs
+        ]
+        assert len(records[0]) == 23
+        assert [len(r) for r in records] == [23, 23, 23]
+
+
+class TestWmsPagePrefetcher:
+    """Test read-ahead bounds and cancellation of the cursor prefetcher."""
+
+    @staticmethod
+    def _source(
+        pages: int, delay: float, requested: list[str]
+    ) -> Callable[[str, object], Generator[bytes, None, None]]:
+        def chunks(url: str, _params: object) -> Generator[bytes, None, None]:
+            requested.append(url)
+            page = int(url.rsplit("=", 1)[1]) if "=" in url else 1
+            cursor = f'"p?page={page + 1}"' if page < pages else "null"
+            yield f'{{"next_page": {cursor}, "results": ['.encode()
+            time.sleep(delay)
+            yield f'{{"id": {page}}}]}}'.encode()
+
+        return chunks
+
+    def test_read_ahead_is_bounded_and_overlapped(self) -> None:
+        """Up to ``depth`` fetches overlap; a slow consumer bounds read-ahead."""
+        requested: list[str] = []
+        prefetcher = WmsPagePrefetcher(self._source(8, 0.02, requested), depth=3)
+        seen = []
+        for page in prefetcher.pages("p", {}):
+            seen.append(page[0]["id"])
+            time.sleep(0.01)
+            assert len(requested) <= len(seen) + 3
+        assert seen == list(range(1, 9))
+        assert prefetcher.max_in_flight >= 2
+        assert prefetcher.requests == 8
+
+    def test_close_cancels_read_ahead(self) -> None:
+        """Closing the iterator stops following the cursor."""
+        requested: list[str] = []
+        prefetcher = WmsPagePrefetcher(self._source(100, 0.02, requested), depth=2)
+        pages = prefetcher.pages("p", {})
+        assert next(pages) == [{"id": 1}]
+        pages.close()
+        count = len(requested)
+        time.sleep(0.1)
+        assert len(requested) == count <= 3
+
+
+@pytest.mark.performance
+class TestWmsExtractorThroughput:
+    """Serial versus parallel page fetching against a slow mock WMS."""
+
+    def test_parallel_pages_beat_serial(self) -> None:
+        """With 20 ms per request, a window of 5 is several times faster."""
+        elapsed: dict[int, float] = {}
+        for parallel in (1, 5):
+            for server in _serve(_MockWmsServer(2_000, latency=0.02)):
+                config = _config(server.url, page_size=50, max_parallel_pages=parallel)
+                with GruponosWmsExtractor(config) as extractor:
+                    result = extractor.run([WmsEntity("order_dtl")], io.BytesIO())
+                assert result.is_success
+                assert result.value.records == 2_000
+                elapsed[parallel] = result.value.elapsed_seconds
+
+        assert elapsed[5] * 2 < elapsed[1]
+
+    def test_cursor_prefetch_overlaps_transfer(self) -> None:
+        """Following the cursor from the body head overlaps body transfer."""
+        elapsed: dict[int, float] = {}
+        for depth in (0, 3):
+            for server in _serve(_MockWmsServer(1_000, latency=0.01, body_delay=0.03)):
+                config = _config(
+                    server.url,
+                    page_size=50,
+                    page_mode="sequenced",
+                    prefetch_pages=depth,
+                )
+                with GruponosWmsExtractor(config) as extractor:
+                    result = extractor.run([WmsEntity("order_dtl")], io.BytesIO())
+                assert result.is_success
+                assert result.value.records == 1_000
+                elapsed[depth] = result.value.elapsed_seconds
+
+        assert elapsed[3] * 1.5 < elapsed[0]